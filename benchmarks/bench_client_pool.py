@@ -0,0 +1,71 @@
+"""
+Per call latency of the api functions with and without the client pool, against a local server.
+
+    python -m benchmarks.bench_client_pool
+
+The local server speaks plain http, so only the tcp handshake is saved here.
+Against the real api every fresh client also pays a tls handshake.
+"""
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from src.three_commas import api, configuration
+from src.three_commas.client_pool import client_pool
+from src.three_commas.rate_limiting import rate_limiter
+
+
+CALLS = 500
+BOTS_RESPONSE = json.dumps([{'id': 1, 'name': 'bot', 'base_order_volume': '10.0'}]).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BOTS_RESPONSE)))
+        self.end_headers()
+        self.wfile.write(BOTS_RESPONSE)
+
+    def log_message(self, *args):
+        pass
+
+
+def measure(calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        error, bots = api.ver1.bots.get(api_key='bench_key', api_secret='bench_secret')
+        assert not error and bots
+    return (time.perf_counter() - start) / calls
+
+
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    configuration.THREE_COMMAS_API_URL = f'http://127.0.0.1:{server.server_port}'
+    # the local server has no rate limit
+    rate_limiter_enabled = rate_limiter.enabled
+    rate_limiter.enabled = False
+    try:
+        configuration.THREE_COMMAS_POOL_CLIENTS = False
+        measure(10)
+        fresh = measure(CALLS)
+
+        configuration.THREE_COMMAS_POOL_CLIENTS = True
+        measure(10)
+        pooled = measure(CALLS)
+    finally:
+        rate_limiter.enabled = rate_limiter_enabled
+        client_pool.clear()
+        server.shutdown()
+
+    print(f'fresh client per call: {fresh * 1e6:8.1f} us/call')
+    print(f'pooled client:         {pooled * 1e6:8.1f} us/call')
+    print(f'speedup:               {fresh / pooled:8.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Decoding and encoding speed of the installed json codecs on recorded deal payloads, and the time of a sync
+api.ver1.deals.get of the page from a local server with every codec, and with the stdlib json of py3cw.
+
+    python -m benchmarks.bench_codec
+"""
+import json
+import threading
+import time
+import timeit
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from py3cw.request import Py3CW
+from src.three_commas import api, codec, configuration
+from src.three_commas.client_pool import client_pool, PooledPy3cw
+from src.three_commas.rate_limiting import rate_limiter
+
+
+DEAL_FILE = 'test/sample_data/deals/usdt/deal_show_usdt.json'
+PAGE_SIZE = 1000
+NUMBER = 20
+CALLS = 20
+
+
+def serve(body: bytes) -> ThreadingHTTPServer:
+    class PageHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def measure_sync_get() -> float:
+    client_pool.clear()
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        error, deals = api.ver1.deals.get(limit=PAGE_SIZE, api_key='bench_key', api_secret='bench_secret')
+        assert not error and len(deals) == PAGE_SIZE
+    return (time.perf_counter() - start) / CALLS
+
+
+def sync_path(page: str):
+    server = serve(page.encode())
+    configuration.THREE_COMMAS_API_URL = f'http://127.0.0.1:{server.server_port}'
+    # the local server has no rate limit
+    rate_limiter_enabled = rate_limiter.enabled
+    rate_limiter.enabled = False
+    configured = codec.codec.name
+    try:
+        for name in codec.CODEC_FACTORIES:
+            try:
+                codec.set_codec(name)
+            except ImportError:
+                continue
+            print(f'{name:8} sync deals.get {measure_sync_get() * 1e3:7.2f} ms')
+
+        # the request of py3cw itself, decoded with the stdlib json
+        pooled_make_request = PooledPy3cw._Py3CW__make_request
+        PooledPy3cw._Py3CW__make_request = Py3CW._Py3CW__make_request
+        try:
+            print(f'{"py3cw":8} sync deals.get {measure_sync_get() * 1e3:7.2f} ms')
+        finally:
+            PooledPy3cw._Py3CW__make_request = pooled_make_request
+    finally:
+        rate_limiter.enabled = rate_limiter_enabled
+        codec.set_codec(configured)
+        server.shutdown()
+        client_pool.clear()
+
+
+def main():
+    with open(DEAL_FILE) as f:
+        deal = json.load(f)
+    page = json.dumps([{**deal, 'id': deal['id'] + i} for i in range(PAGE_SIZE)])
+    frame = json.dumps({'identifier': json.dumps({'channel': 'DealsChannel'}), 'message': deal})
+    print(f'page of {PAGE_SIZE} deals: {len(page) / 1024:.0f} KiB, stream frame: {len(frame)} bytes')
+
+    for name in codec.CODEC_FACTORIES:
+        try:
+            json_codec = codec.get_codec(name)
+        except ImportError:
+            print(f'{name:8} not installed')
+            continue
+        decoded_page = json_codec.loads(page)
+        loads_page = min(timeit.repeat(lambda: json_codec.loads(page), number=NUMBER, repeat=5)) / NUMBER
+        dumps_page = min(timeit.repeat(lambda: json_codec.dumps(decoded_page), number=NUMBER, repeat=5)) / NUMBER
+        loads_frame = min(timeit.repeat(lambda: json_codec.loads(frame), number=NUMBER * 100, repeat=5)) / (NUMBER * 100)
+        print(f'{name:8} loads page {loads_page * 1e3:7.2f} ms, dumps page {dumps_page * 1e3:7.2f} ms, '
+              f'loads frame {loads_frame * 1e6:7.2f} us')
+
+    sync_path(page)
+
+
+if __name__ == '__main__':
+    main()
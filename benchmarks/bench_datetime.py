@@ -0,0 +1,42 @@
+"""
+Parsing the closed_at of 200k deals: strptime against parse_datetime and parse_many,
+with unique timestamps and with the repeated ones of the deals closed in the same seconds.
+
+    python -m benchmarks.bench_datetime
+"""
+import datetime
+import time
+from src.three_commas.model.models import parse_datetime, parse_many, DatetimeParser, \
+    _parse_naive_datetime, _parse_utc_datetime
+
+
+DEALS = 200_000
+
+
+def create_timestamps(distinct: int) -> list:
+    start = datetime.datetime(2022, 1, 1)
+    return [(start + datetime.timedelta(seconds=i % distinct, microseconds=(i % distinct) * 1000 % 1_000_000))
+            .strftime('%Y-%m-%dT%H:%M:%S.%f')[:-3] + 'Z' for i in range(DEALS)]
+
+
+def measure(function, timestamps: list) -> float:
+    _parse_naive_datetime.cache_clear()
+    _parse_utc_datetime.cache_clear()
+    start = time.perf_counter()
+    function(timestamps)
+    return time.perf_counter() - start
+
+
+def main():
+    parsers = {
+        'strptime': lambda ts: [datetime.datetime.strptime(t, DatetimeParser.DATETIME_PATTERN) for t in ts],
+        'parse_datetime': lambda ts: [parse_datetime(t, utc=False) for t in ts],
+        'parse_many': lambda ts: parse_many(ts, utc=False),
+    }
+    for name, timestamps in (('unique', create_timestamps(DEALS)), ('1000 distinct', create_timestamps(1000))):
+        for parser_name, function in parsers.items():
+            print(f'{name:14} {parser_name:15} {measure(function, timestamps) * 1e3:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Profit per bot, per pair and per day of 200k deals, with dict loops over the deals and with a DealFrame.
+The frame is built once, with the columns used, and answers all questions. Its build time is reported separately.
+
+    python -m benchmarks.bench_deal_frame
+"""
+import json
+import time
+import datetime
+from collections import defaultdict
+from src.three_commas.frames import DealFrame, get_backend
+from src.three_commas.model.models import parse_datetime
+
+
+DEALS = 200_000
+REPEAT = 5
+COLUMNS = dict(float_columns=['usd_final_profit'],
+               category_columns=['bot_id', 'pair', 'status'],
+               time_columns=['closed_at'])
+
+
+def create_deals() -> list:
+    with open('test/sample_data/deals/usdt/deal_show_usdt.json', 'r') as f:
+        deal = json.load(f)
+    deal.pop('bot_events', None)
+    start = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+    return [{**deal,
+             'id': i,
+             'bot_id': 1000 + i % 50,
+             'pair': ('USDT_BTC', 'USDT_ETH', 'USDT_ADA', 'USDT_SOL')[i % 4],
+             'status': 'completed' if i % 10 else 'failed',
+             'usd_final_profit': f'{(i % 97 - 40) / 13:.8f}',
+             'closed_at': (start + datetime.timedelta(minutes=7 * i)).strftime('%Y-%m-%dT%H:%M:%S.000Z')}
+            for i in range(DEALS)]
+
+
+def with_dict_loops(deals: list):
+    per_bot = defaultdict(float)
+    per_pair = defaultdict(float)
+    per_day = defaultdict(float)
+    for deal in deals:
+        if deal['status'] != 'completed':
+            continue
+        profit = float(deal['usd_final_profit'])
+        per_bot[deal['bot_id']] += profit
+        per_pair[deal['pair']] += profit
+        per_day[parse_datetime(deal['closed_at'], utc=True).date()] += profit
+    return per_bot, per_pair, per_day
+
+
+def with_frame(frame: DealFrame):
+    completed = frame.filter(frame.where(status='completed'))
+    return completed.group_by('bot_id', 'usd_final_profit'), \
+        completed.group_by('pair', 'usd_final_profit'), \
+        completed.group_by_time('usd_final_profit')
+
+
+def measure(func, *args, **kwargs) -> float:
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    deals = create_deals()
+    print(f'dict loops  {measure(with_dict_loops, deals) * 1000:8.1f} ms')
+    for use_numpy in (False, True):
+        try:
+            backend = get_backend(use_numpy).name
+        except ImportError:
+            print('numpy       not installed')
+            continue
+        build_all = measure(DealFrame.of_deals, deals, use_numpy=use_numpy)
+        build = measure(DealFrame.of_deals, deals, use_numpy=use_numpy, **COLUMNS)
+        frame = DealFrame.of_deals(deals, use_numpy=use_numpy, **COLUMNS)
+        print(f'{backend:11} {measure(with_frame, frame) * 1000:8.1f} ms, built in {build * 1000:.1f} ms '
+              f'({build_all * 1000:.1f} ms with all columns)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,33 @@
+"""
+Import time of the package and of a single endpoint, each in a fresh interpreter.
+Use python -X importtime -c "import src.three_commas" for the time per module.
+
+    python -m benchmarks.bench_import
+"""
+import statistics
+import subprocess
+import sys
+
+
+RUNS = 10
+SCENARIOS = {
+    'import three_commas': 'import src.three_commas',
+    'three_commas.api.ver1.bots': 'import src.three_commas as t; t.api.ver1.bots',
+    'every ver1 module': 'import src.three_commas.api.ver1 as v; [getattr(v, m) for m in dir(v) if not m.startswith("_")]',
+}
+
+
+def measure(code: str) -> float:
+    timed_code = f'import time; start = time.perf_counter(); {code}; print(time.perf_counter() - start)'
+    process = subprocess.run([sys.executable, '-c', timed_code], capture_output=True, text=True, check=True)
+    return float(process.stdout)
+
+
+def main():
+    for name, code in SCENARIOS.items():
+        seconds = statistics.median(measure(code) for _ in range(RUNS))
+        print(f'{name:30} {seconds * 1e3:8.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
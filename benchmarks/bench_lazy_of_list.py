@@ -0,0 +1,48 @@
+"""
+DealEntity.of_list of a 10k deal response, eager and lazy, when only a part of the deals is used:
+the first page of 20, every 100th deal, the deal with a given id and all deals.
+
+    python -m benchmarks.bench_lazy_of_list
+"""
+import json
+import time
+from src.three_commas.model import DealEntity
+
+
+DEALS = 10_000
+REPEAT = 20
+
+
+def create_deals() -> list:
+    with open('test/sample_data/deals/usdt/deal_show_usdt.json', 'r') as f:
+        deal = json.load(f)
+    return [{**deal, 'id': i} for i in range(DEALS)]
+
+
+USES = {
+    'first 20': lambda deals: [deal.id for deal in deals[:20]],
+    'every 100th': lambda deals: [deal.bought_volume for deal in deals[::100]],
+    'find by id': lambda deals: next(deal for deal in deals if deal.id == DEALS // 2),
+    'all': lambda deals: [deal.bought_volume for deal in deals],
+}
+
+
+def measure(use, raw_deals: list, lazy: bool) -> float:
+    best = float('inf')
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        use(DealEntity.of_list(raw_deals, lazy=lazy))
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    raw_deals = create_deals()
+    for name, use in USES.items():
+        eager = measure(use, raw_deals, lazy=False)
+        lazy = measure(use, raw_deals, lazy=True)
+        print(f'{name:12} eager {eager * 1000:7.2f} ms, lazy {lazy * 1000:7.2f} ms ({eager / lazy:5.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Load test of the client against the local stand-in server: threaded and asyncio bulk requests,
+with injected server errors that the retry policy has to recover.
+
+    python -m benchmarks.bench_load
+"""
+import asyncio
+from src.three_commas import api, configuration, retry
+from src.three_commas.api.aio import ver1 as aio_ver1
+from src.three_commas.aio_client import aio_client_pool
+from src.three_commas.bulk import bulk_by_id, aio_bulk_by_id
+from src.three_commas.client_pool import client_pool
+from src.three_commas.rate_limiting import rate_limiter
+from src.three_commas.retry import RetryPolicy, retry_counters
+from src.three_commas.stand_in_server import StandInServer, StandInConfig, SERVER_ERRORS
+
+
+BOTS = 2000
+KEY = 'bench_key'
+SECRET = 'bench_secret'
+
+
+def print_stats(name: str, result, server: StandInServer):
+    stats = result.stats
+    print(f'{name:8} {stats.calls / stats.total_seconds:8.0f} calls/s, '
+          f'mean {stats.mean_call_seconds * 1e3:6.2f} ms, max {stats.max_call_seconds * 1e3:7.2f} ms, '
+          f'{stats.errors} errors, {server.stats().requests} http requests')
+
+
+async def aio_load():
+    try:
+        return await aio_bulk_by_id(aio_ver1.bots.get_show_by_id, range(7_000_000, 7_000_000 + BOTS),
+                                    max_concurrency=64, api_key=KEY, api_secret=SECRET)
+    finally:
+        await aio_client_pool.close()
+
+
+def main():
+    # the stand-in has no rate limit, the injected errors are retried without waiting
+    rate_limiter_enabled, retry_policy = rate_limiter.enabled, retry.default_retry_policy
+    rate_limiter.enabled = False
+    retry.default_retry_policy = RetryPolicy(max_attempts=10, base_delay=0.0, max_delay=0.0)
+    config = StandInConfig(bots=BOTS, deals=0, latency=0.002, error_rate=0.02, injected_errors=SERVER_ERRORS,
+                           secrets={KEY: SECRET})
+    with StandInServer(config) as server:
+        configuration.THREE_COMMAS_API_URL = server.url
+        configuration.THREE_COMMAS_POOL_SIZE = 32
+        try:
+            result = bulk_by_id(api.ver1.bots.get_show_by_id, range(7_000_000, 7_000_000 + BOTS),
+                                max_workers=32, api_key=KEY, api_secret=SECRET)
+            print_stats('threads', result, server)
+
+            server.reset_stats()
+            result = asyncio.run(aio_load())
+            print_stats('asyncio', result, server)
+        finally:
+            rate_limiter.enabled, retry.default_retry_policy = rate_limiter_enabled, retry_policy
+            client_pool.clear()
+
+    counter = retry_counters.get().get('bots.show')
+    print(f'retries: {counter.retries}, recovered: {counter.recovered}, exhausted: {counter.exhausted}')
+
+
+if __name__ == '__main__':
+    main()
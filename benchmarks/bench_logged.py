@@ -0,0 +1,44 @@
+"""
+Overhead per call of the logged decorator.
+
+    python -m benchmarks.bench_logged
+"""
+import logging
+import timeit
+from src.three_commas.sys_utils import logged
+
+
+CALLS = 200_000
+bench_logger = logging.getLogger('bench_logged')
+bench_logger.addHandler(logging.NullHandler())
+bench_logger.propagate = False
+
+
+def plain(bot_id, api_key=None, api_secret=None):
+    return bot_id
+
+
+decorated = logged(with_logger=bench_logger)(plain)
+
+
+def measure(function) -> float:
+    timer = timeit.Timer(lambda: function(12345, api_key='bench_key', api_secret='bench_secret'))
+    return min(timer.repeat(repeat=5, number=CALLS)) / CALLS
+
+
+def main():
+    undecorated_seconds = measure(plain)
+    bench_logger.setLevel(logging.INFO)
+    info_seconds = measure(decorated)
+    bench_logger.setLevel(logging.DEBUG)
+    debug_seconds = measure(decorated)
+
+    print(f'undecorated:          {undecorated_seconds * 1e9:8.1f} ns/call')
+    print(f'logged, debug off:    {info_seconds * 1e9:8.1f} ns/call '
+          f'(+{(info_seconds - undecorated_seconds) * 1e9:.1f} ns)')
+    print(f'logged, debug on:     {debug_seconds * 1e9:8.1f} ns/call '
+          f'(+{(debug_seconds - undecorated_seconds) * 1e9:.1f} ns)')
+
+
+if __name__ == '__main__':
+    main()
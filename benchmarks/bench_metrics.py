@@ -0,0 +1,47 @@
+"""
+Overhead per call of the metrics on the request path, with a py3cw client that answers without any io.
+
+    python -m benchmarks.bench_metrics
+"""
+import timeit
+from src.three_commas.metrics import metrics, registry
+from src.three_commas.rate_limiting import rate_limiter
+from src.three_commas.sys_utils import Py3cwClosure
+
+
+CALLS = 100_000
+
+
+class InstantPy3cw:
+    key = 'bench_key'
+    secret = 'bench_secret'
+
+    def request(self, entity, action='', action_id=None, action_sub_id=None, payload=None, additional_headers=None):
+        return {}, {'id': 1}
+
+
+def measure() -> float:
+    closure = Py3cwClosure(py3cw=InstantPy3cw(), additional_headers={})
+    timer = timeit.Timer(lambda: closure.request(entity='bots', action='show', action_id='1'))
+    return min(timer.repeat(repeat=5, number=CALLS)) / CALLS
+
+
+def main():
+    rate_limiter_enabled, metrics_enabled = rate_limiter.enabled, metrics.enabled
+    rate_limiter.enabled = False
+    try:
+        metrics.enabled = False
+        disabled_seconds = measure()
+        metrics.enabled = True
+        enabled_seconds = measure()
+    finally:
+        rate_limiter.enabled, metrics.enabled = rate_limiter_enabled, metrics_enabled
+        registry.reset()
+
+    print(f'metrics disabled: {disabled_seconds * 1e6:8.2f} us/call')
+    print(f'metrics enabled:  {enabled_seconds * 1e6:8.2f} us/call '
+          f'(+{(enabled_seconds - disabled_seconds) * 1e6:.2f} us)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Models and views of the decoded json: the time to wrap one websocket deal message, and the memory of
+a decoded page of 10k deals with all its models created, measured with tracemalloc.
+
+    python -m benchmarks.bench_model_views
+"""
+import gc
+import json
+import time
+import tracemalloc
+from src.three_commas import codec
+from src.three_commas.model import DealEntity
+
+
+DEALS = 10_000
+MESSAGES = 100_000
+
+
+def load_deal() -> dict:
+    with open('test/sample_data/deals/usdt/deal_show_usdt.json', 'r') as f:
+        return json.load(f)
+
+
+def measure_messages(wrap, message: dict) -> float:
+    start = time.perf_counter()
+    for _ in range(MESSAGES):
+        wrap(message).bought_volume
+    return time.perf_counter() - start
+
+
+def measure_page(raw_json: str, view: bool):
+    gc.collect()
+    tracemalloc.start()
+    deals = DealEntity.of_list(codec.loads(raw_json), lazy=False, view=view)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del deals
+    return retained, peak
+
+
+def main():
+    deal = load_deal()
+    for name, wrap in (('model', DealEntity), ('view', DealEntity.view)):
+        seconds = measure_messages(wrap, deal)
+        print(f'{name:5} message {seconds / MESSAGES * 1e6:5.2f} us')
+
+    raw_json = codec.dumps([{**deal, 'id': i} for i in range(DEALS)])
+    for name, view in (('model', False), ('view', True)):
+        retained, peak = measure_page(raw_json, view)
+        print(f'{name:5} page    retained {retained / 2 ** 20:6.1f} MiB, peak {peak / 2 ** 20:6.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
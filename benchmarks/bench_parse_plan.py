@@ -0,0 +1,59 @@
+"""
+All fields of 10k deals converted, with an attribute read per field and with the parse plan of DealEntity,
+as dicts and as rows.
+
+    python -m benchmarks.bench_parse_plan
+"""
+import json
+import time
+from src.three_commas.model import DealEntity
+
+
+DEALS = 10_000
+REPEAT = 5
+
+
+def create_deals() -> list:
+    with open('test/sample_data/deals/usdt/deal_show_usdt.json', 'r') as f:
+        deal = json.load(f)
+    return [{**deal, 'id': i} for i in range(DEALS)]
+
+
+NAMES = list(DealEntity.__annotations__)
+DATETIMES = {'created_at', 'updated_at', 'closed_at'}
+
+
+def per_attribute_dicts(deals: list):
+    return [{name: getattr(deal.parsed(True) if name in DATETIMES else deal, name) for name in NAMES}
+            for deal in deals]
+
+
+def per_attribute_rows(deals: list):
+    return [tuple(getattr(deal.parsed(True) if name in DATETIMES else deal, name) for name in NAMES)
+            for deal in deals]
+
+
+def measure(func, deals: list) -> float:
+    best = float('inf')
+    for _ in range(REPEAT):
+        models = DealEntity.of_list(deals, lazy=False)
+        start = time.perf_counter()
+        func(models)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    deals = create_deals()
+    scenarios = (
+        ('attributes, dicts', per_attribute_dicts),
+        ('parse_all', DealEntity.parse_all),
+        ('attributes, tuples', per_attribute_rows),
+        ('to_rows', DealEntity.to_rows),
+    )
+    for name, func in scenarios:
+        print(f'{name:18} {measure(func, deals) * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Repeated attribute reads on a list of 100k deals, like a P&L loop does.
+The declared fields are read through descriptors, the parsed values are cached after the first pass.
+
+    python -m benchmarks.bench_parsed_values
+"""
+import time
+from src.three_commas.model import DealEntity
+
+
+DEALS = 100_000
+PASSES = 5
+
+
+def create_deals() -> list:
+    return DealEntity.of_list([{
+        'id': i,
+        'pair': 'USDT_BTC',
+        'bought_volume': f'{100 + i % 50}.25',
+        'final_profit': f'{i % 7 - 3}.5',
+        'closed_at': '2022-01-09T17:32:13.632Z',
+    } for i in range(DEALS)])
+
+
+def read_fields(deals: list) -> float:
+    total = 0.0
+    for deal in deals:
+        total += deal.final_profit / deal.bought_volume
+    return total
+
+
+def read_plain_fields(deals: list):
+    for deal in deals:
+        deal.id
+        deal.pair
+
+
+def read_datetimes(deals: list):
+    for deal in deals:
+        deal.parsed(True).closed_at
+
+
+def measure(function, deals: list) -> list:
+    seconds = list()
+    for _ in range(PASSES):
+        start = time.perf_counter()
+        function(deals)
+        seconds.append(time.perf_counter() - start)
+    return seconds
+
+
+def main():
+    deals = create_deals()
+    for name, function in (('plain fields', read_plain_fields),
+                           ('float fields', read_fields),
+                           ('datetime field', read_datetimes)):
+        first, *repeated = measure(function, deals)
+        print(f'{name:15} first pass {first * 1e3:7.1f} ms, '
+              f'cached passes {min(repeated) * 1e3:7.1f} ms ({first / min(repeated):.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+Memory and build time of 100k deals as DealEntity, lazily and eagerly created, and as DealRecord, measured with tracemalloc.
+The decoded json of the page is released, only the models stay.
+
+    python -m benchmarks.bench_records
+"""
+import functools
+import gc
+import json
+import time
+import tracemalloc
+from src.three_commas import codec
+from src.three_commas.model import DealEntity, DealRecord
+
+
+DEALS = 100_000
+
+
+def create_json() -> str:
+    with open('test/sample_data/deals/usdt/deal_show_usdt.json', 'r') as f:
+        deal = json.load(f)
+    deal.pop('bot_events', None)
+    return codec.dumps([{**deal, 'id': deal['id'] + i, 'bought_volume': f'{10 + i % 997 / 7:.8f}'}
+                        for i in range(DEALS)])
+
+
+def measure(of_list, raw_json: str):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    deals = of_list(codec.loads(raw_json))
+    seconds = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del deals
+    return retained, peak, seconds
+
+
+def main():
+    raw_json = create_json()
+    # a lazy list creates the models when they are read, the eager one right away like the records
+    for name, of_list in (('DealEntity lazy', functools.partial(DealEntity.of_list, lazy=True)),
+                          ('DealEntity', functools.partial(DealEntity.of_list, lazy=False)),
+                          ('DealRecord', DealRecord.of_list)):
+        retained, peak, seconds = measure(of_list, raw_json)
+        print(f'{name:15} retained {retained / 2 ** 20:7.1f} MiB ({retained / DEALS:6.0f} B/deal), '
+              f'peak {peak / 2 ** 20:7.1f} MiB, built in {seconds:.2f} s (under tracemalloc)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""
+Throughput of the whole request pipeline, from the api function to the parsed entities,
+with the responses replayed from a cassette instead of the network.
+
+    python -m benchmarks.bench_replay
+"""
+import json
+import timeit
+from src.three_commas import api
+from src.three_commas.transport import Cassette, ReplayTransport, use_transport
+
+
+CALLS = 200
+DEALS_PER_PAGE = 100
+
+
+def create_cassette() -> Cassette:
+    with open('test/sample_data/deals/usdt/deal_show_usdt.json', 'r') as f:
+        deal = json.load(f)
+    page = [{**deal, 'id': deal['id'] + i} for i in range(DEALS_PER_PAGE)]
+    return Cassette(interactions=[{'entity': 'deals', 'action': '', 'payload': {'limit': DEALS_PER_PAGE},
+                                   'seconds': 0.0, 'error': {}, 'data': page}])
+
+
+def main():
+    # the replayed requests are not rate limited
+    with use_transport(ReplayTransport(create_cassette())):
+        timer = timeit.Timer(lambda: api.ver1.deals.get(limit=DEALS_PER_PAGE, api_key='bench_key', api_secret='bench_secret'))
+        seconds = min(timer.repeat(repeat=5, number=CALLS)) / CALLS
+
+    print(f'deals.get of {DEALS_PER_PAGE} deals: {seconds * 1e3:8.3f} ms/call, '
+          f'{DEALS_PER_PAGE / seconds:,.0f} deals/s')
+
+
+if __name__ == '__main__':
+    main()
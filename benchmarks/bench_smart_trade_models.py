@@ -0,0 +1,55 @@
+"""
+Reading the nested prices of 10k smart trades 10 times, e.g. in a stream handler that checks every update,
+with float() on the nested dicts and with the nested models that parse once. The first read of the models
+creates the submodels, the reads after it use the cached values.
+
+    python -m benchmarks.bench_smart_trade_models
+"""
+import copy
+import time
+from src.three_commas.model import SmartTradeV2Entity
+from test.test_smart_trade_models import SMART_TRADE
+
+
+SMART_TRADES = 10_000
+READS = 10
+
+
+def with_dicts(smart_trades: list, reads: int) -> float:
+    total = 0.0
+    for _ in range(reads):
+        for smart_trade in smart_trades:
+            total += float(smart_trade['position']['price']['value']) + float(smart_trade['profit']['usd'])
+            for step in smart_trade['take_profit']['steps']:
+                total += float(step['price']['value'])
+    return total
+
+
+def with_models(smart_trades: list, reads: int) -> float:
+    total = 0.0
+    for _ in range(reads):
+        for smart_trade in smart_trades:
+            total += smart_trade.position.price.value + smart_trade.profit.usd
+            for step in smart_trade.take_profit.steps:
+                total += step.price.value
+    return total
+
+
+def measure(func):
+    smart_trades = SmartTradeV2Entity.of_list([copy.deepcopy(SMART_TRADE) for _ in range(SMART_TRADES)], lazy=False)
+    start = time.perf_counter()
+    func(smart_trades, 1)
+    first = time.perf_counter() - start
+    start = time.perf_counter()
+    func(smart_trades, READS - 1)
+    return first, time.perf_counter() - start
+
+
+def main():
+    for name, func in (('dicts, float()', with_dicts), ('nested models', with_models)):
+        first, rest = measure(func)
+        print(f'{name:14} first read {first * 1000:6.1f} ms, {READS - 1} reads after it {rest * 1000:6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
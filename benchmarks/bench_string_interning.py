@@ -0,0 +1,72 @@
+"""
+Memory of a decoded history of 100k deals, with and without interning the low cardinality fields, measured with
+tracemalloc, and the time to decode and list them. The synthetic deals have 300 pairs, 200 bots and 5 accounts,
+like a large account.
+
+    python -m benchmarks.bench_string_interning
+"""
+import gc
+import json
+import random
+import time
+import tracemalloc
+from src.three_commas import codec
+from src.three_commas.model import DealEntity
+
+
+DEALS = 100_000
+PAIRS = 300
+BOTS = 200
+ACCOUNTS = 5
+
+
+def create_raw_json() -> str:
+    with open('test/sample_data/deals/usdt/deal_show_usdt.json', 'r') as f:
+        deal = json.load(f)
+    rng = random.Random(42)
+    currencies = [f'COIN{i}' for i in range(PAIRS)]
+    deals = list()
+    for i in range(DEALS):
+        to_currency = rng.choice(currencies)
+        bot_id = rng.randrange(BOTS)
+        deals.append({
+            **deal,
+            'id': i,
+            'bot_id': bot_id,
+            'bot_name': f'Bot {bot_id}',
+            'account_name': f'Account {bot_id % ACCOUNTS}',
+            'pair': f'USDT_{to_currency}',
+            'to_currency': to_currency,
+            'status': rng.choice(('completed', 'completed', 'completed', 'panic_sold', 'bought', 'failed')),
+            'type': rng.choice(('Deal', 'Deal::ShortDeal')),
+        })
+    return codec.dumps(deals)
+
+
+def measure_memory(raw_json: str, intern: bool) -> int:
+    gc.collect()
+    tracemalloc.start()
+    deals = DealEntity.of_list(codec.loads(raw_json), intern=intern)
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del deals
+    return retained
+
+
+def measure_time(raw_json: str, intern: bool) -> float:
+    start = time.perf_counter()
+    DealEntity.of_list(codec.loads(raw_json), intern=intern)
+    return time.perf_counter() - start
+
+
+def main():
+    raw_json = create_raw_json()
+    for name, intern in (('not interned', False), ('interned', True)):
+        retained = measure_memory(raw_json, intern)
+        seconds = measure_time(raw_json, intern)
+        print(f'{name:12} retained {retained / 2 ** 20:6.1f} MiB, decoded and listed in {seconds * 1000:6.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -9,6 +9,9 @@ setup(
               'three_commas.api',
               'three_commas.api.ver1',
               'three_commas.api.v2',
+              'three_commas.api.aio',
+              'three_commas.api.aio.ver1',
+              'three_commas.api.aio.v2',
               'three_commas.model',
               'three_commas.utils',
               'three_commas.streams',
@@ -36,5 +39,10 @@ setup(
         'py3cw',
         'cachetools',
         'aenum'
-    ]
+    ],
+    extras_require={
+        'aio': ['aiohttp'],
+        'fast-json': ['orjson'],
+        'frames': ['numpy'],
+    }
 )
@@ -1,7 +1,7 @@
-from . import api
-from . import site
-from . import cached_api
-from . import error
-from . import model
-from . import utils
-from . import streams
+from typing import TYPE_CHECKING
+from .lazy_imports import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import api, site, cached_api, error, model, utils, streams
+
+__getattr__, __dir__ = lazy_submodules(__name__, ['api', 'site', 'cached_api', 'error', 'model', 'utils', 'streams'])
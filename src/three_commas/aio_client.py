@@ -0,0 +1,217 @@
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Tuple, Union
+import aiohttp
+from py3cw.config import API_URL
+from . import configuration, codec
+from .model.generated_enums import Mode
+from .rate_limiting import rate_limiter
+from .coalescing import single_flight
+from .metrics import metrics, set_response_size
+from .client_pool import _PooledClient, pop_idle_clients
+from .transport import get_transport
+from .retry import RetryPolicy, aio_retry_request, set_retry_after
+from .rest import build_request, create_signature, to_response
+from .sys_utils import get_api_keys, create_py3cw_closure, bind_py3cw_closure, unbind_py3cw_closure, \
+    Py3cwClosure
+
+
+logger = logging.getLogger(__name__)
+
+
+class AioPy3cw:
+    """
+    Asyncio counterpart of Py3CW.request. The requests are signed in process and sent through one pooled
+    aiohttp session. At most concurrency_limit requests of this client are in flight at the same time.
+    The session is created lazily, so it belongs to the event loop that makes the first request.
+    """
+    def __init__(self,
+                 api_key: str,
+                 api_secret: str,
+                 request_options: dict = None,
+                 concurrency_limit: int = None):
+        request_options = request_options or dict()
+        self.key = api_key
+        self.secret = api_secret
+        self.request_timeout = request_options.get('request_timeout', 30)
+        self.concurrency_limit = concurrency_limit or configuration.THREE_COMMAS_AIO_CONCURRENCY_LIMIT
+        self.api_url = (configuration.THREE_COMMAS_API_URL or API_URL).rstrip('/')
+        self._session: aiohttp.ClientSession = None
+        self._semaphore: asyncio.Semaphore = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # one connection per request the semaphore lets through, so no request waits for a connection,
+            # which would count against the total timeout
+            connector = aiohttp.TCPConnector(limit=self.concurrency_limit)
+            timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+            self._semaphore = asyncio.Semaphore(self.concurrency_limit)
+        return self._session
+
+    async def request(self,
+                      entity: str,
+                      action: str = '',
+                      action_id: str = None,
+                      action_sub_id: str = None,
+                      payload: any = None,
+                      additional_headers: dict = None) -> Tuple[dict, Union[dict, list]]:
+        method, relative_url, body = build_request(entity=entity,
+                                                   action=action,
+                                                   action_id=action_id,
+                                                   action_sub_id=action_sub_id,
+                                                   payload=payload)
+        headers = {
+            'APIKEY': self.key,
+            'Signature': create_signature(relative_url + (body or ''), self.secret),
+            **(additional_headers or dict())
+        }
+        if body is not None:
+            headers['Content-Type'] = 'application/json'
+
+        session = self._get_session()
+        status_code = None
+        try:
+            async with self._semaphore:
+                async with session.request(method, f'{self.api_url}{relative_url}', data=body, headers=headers) as response:
+                    status_code = response.status
+                    set_retry_after(response.headers.get('Retry-After'))
+                    raw = await response.read()
+                    set_response_size(len(raw))
+            response_json = codec.loads(raw)
+        except Exception as e:
+            return {'error': True, 'msg': f'Other error occurred: {e!r}', 'status_code': status_code}, {}
+
+        return to_response(response_json, status_code)
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+class AioPy3cwClosure(Py3cwClosure):
+    async def request(self,
+                      entity: str,
+                      action: str = '',
+                      action_id: str = None,
+                      action_sub_id: str = None,
+                      payload: any = None) -> Tuple[dict, Union[dict, list]]:
+        async def send():
+            transport = get_transport()
+            if transport.sends_requests:
+                await rate_limiter.aio_acquire(api_key=self.py3cw.key, entity=entity, action=action)
+            set_response_size(None)
+            start = time.perf_counter()
+            response = await transport.aio_request(self.py3cw,
+                                                   entity=entity,
+                                                   action=action,
+                                                   action_id=action_id,
+                                                   action_sub_id=action_sub_id,
+                                                   payload=payload,
+                                                   additional_headers=self.additional_headers)
+            metrics.request_finished(entity, action, seconds=time.perf_counter() - start, error=response[0])
+            return response
+
+        def send_with_retries():
+            return aio_retry_request(send, entity=entity, action=action, retry=self.retry)
+
+        if not single_flight.is_coalesced(entity, action):
+            return await send_with_retries()
+        return await single_flight.aio_do(self.get_request_key(entity, action, action_id, action_sub_id, payload),
+                                          send_with_retries)
+
+
+class AioClientPool:
+    """
+    AioPy3cw clients keyed by (api_key, api_secret, request_options), separately for every event loop.
+    Like ClientPool, clients that were not used for idle_timeout seconds are evicted, at most max_clients are kept
+    per event loop and the sessions of the evicted clients are closed.
+    The clients of closed event loops, e.g. of a finished asyncio.run, are dropped by the next get
+    """
+    def __init__(self, max_clients: int = None, idle_timeout: float = None):
+        self.max_clients = max_clients or configuration.THREE_COMMAS_POOL_MAX_CLIENTS
+        self.idle_timeout = idle_timeout if idle_timeout is not None else configuration.THREE_COMMAS_POOL_IDLE_TIMEOUT
+        # the sessions refer to their event loop, so the loops are dropped explicitly once closed
+        self._clients_per_loop: Dict[asyncio.AbstractEventLoop, OrderedDict] = dict()
+        self._closing: set = set()
+        self._lock = threading.Lock()
+
+    def get(self, api_key: str, api_secret: str, request_options: dict = None) -> AioPy3cw:
+        loop = asyncio.get_running_loop()
+        key = api_key, api_secret, tuple(sorted((k, repr(v)) for k, v in (request_options or dict()).items()))
+        now = time.monotonic()
+        with self._lock:
+            self._drop_closed_loops()
+            clients = self._clients_per_loop.setdefault(loop, OrderedDict())
+            evicted = pop_idle_clients(clients, self.idle_timeout, now)
+            pooled_client = clients.get(key)
+            if pooled_client is None:
+                client = AioPy3cw(api_key=api_key, api_secret=api_secret, request_options=request_options)
+                pooled_client = _PooledClient(py3cw=client, last_used=now)
+                clients[key] = pooled_client
+                while len(clients) > self.max_clients:
+                    evicted.append(clients.popitem(last=False)[1])
+            else:
+                pooled_client.last_used = now
+                clients.move_to_end(key)
+        for evicted_client in evicted:
+            logger.debug('Closing the session of an evicted client')
+            task = loop.create_task(evicted_client.py3cw.close())
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+        return pooled_client.py3cw
+
+    def _drop_closed_loops(self):
+        for loop in [loop for loop in self._clients_per_loop if loop.is_closed()]:
+            # the sessions can not be closed without their loop, dropping them lets them close their connections
+            logger.debug('Dropping the clients of a closed event loop')
+            del self._clients_per_loop[loop]
+
+    async def close(self):
+        """
+        Closes the sessions of the clients of the running event loop
+        """
+        with self._lock:
+            clients = self._clients_per_loop.pop(asyncio.get_running_loop(), OrderedDict())
+        for pooled_client in clients.values():
+            await pooled_client.py3cw.close()
+
+    def __len__(self):
+        return sum(len(clients) for clients in self._clients_per_loop.values())
+
+
+aio_client_pool = AioClientPool()
+
+
+def get_aio_py3cw(req_api_key: str = None, req_api_secret: str = None, request_options: dict = None) -> AioPy3cw:
+    api_key, api_secret = get_api_keys(req_api_key=req_api_key, req_api_secret=req_api_secret)
+    return aio_client_pool.get(api_key=api_key, api_secret=api_secret, request_options=request_options)
+
+
+def with_aio_py3cw(func: Callable) -> Callable:
+    @functools.wraps(func)
+    async def wrapper(*args,
+                      forced_mode: Union[str, Mode] = None,
+                      additional_headers: dict = None,
+                      api_key: str = None,
+                      api_secret: str = None,
+                      request_options: dict = None,
+                      retry: Union[bool, RetryPolicy] = None,
+                      **kwargs):
+        py3cw = get_aio_py3cw(req_api_key=api_key, req_api_secret=api_secret, request_options=request_options)
+        py3cw_closure = create_py3cw_closure(py3cw=py3cw,
+                                             forced_mode=forced_mode,
+                                             additional_headers=additional_headers,
+                                             retry=retry,
+                                             closure_type=AioPy3cwClosure)
+        # the context of an asyncio task is kept across the awaits
+        token = bind_py3cw_closure(py3cw_closure)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            unbind_py3cw_closure(token)
+    return wrapper
@@ -1 +1,7 @@
-from . import ver1, v2
+from typing import TYPE_CHECKING
+from ..lazy_imports import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import ver1, v2, aio
+
+__getattr__, __dir__ = lazy_submodules(__name__, ['ver1', 'v2', 'aio'])
@@ -0,0 +1,7 @@
+from typing import TYPE_CHECKING
+from ....lazy_imports import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import smart_trades
+
+__getattr__, __dir__ = lazy_submodules(__name__, ['smart_trades'])
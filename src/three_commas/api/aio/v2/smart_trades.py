@@ -0,0 +1,403 @@
+from py3cw.request import Py3CW
+from ....model import *
+from ....error import ThreeCommasApiError
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
+import logging
+from ....sys_utils import logged, Py3cwClosureProxy, without_none_values
+from ....aio_client import with_aio_py3cw
+from ....bulk import aio_bulk_by_id, BulkResult
+from ....pagination import aio_iter_pages, offset_page_params, numbered_page_params
+
+
+logger = logging.getLogger(__name__)
+wrapper = Py3cwClosureProxy()
+
+
+@logged
+@with_aio_py3cw
+async def get(account_id: int = None,
+              pair: str = None,
+              type: str = None,
+              page: int = None,
+              per_page: int = None,
+              status: str = None,
+              order_by: str = None,
+              order_direction: str = None,
+              from_: str = None,
+              base: str = None,
+              quote: str = None) -> Tuple[ThreeCommasApiError, List[SmartTradeV2Entity]]:
+    """
+    GET /v2/smart_trades
+    Get smart trade history (Permission: SMART_TRADE_READ, Security: SIGNED)
+
+    :param account_id: integer
+    :param pair: string
+    :param type: string, values: ['simple_buy', 'simple_sell', 'smart_sell', 'smart_trade', 'smart_cover', 'smart_buy']
+    :param page: integer
+    :param per_page: integer
+    :param status: string, values: ['all', 'active', 'finished', 'successfully_finished', 'cancelled', 'failed']
+    :param order_by: string, values: ['created_at', 'updated_at', 'closed_at', 'status', 'profit', 'profit_percentage']
+    :param order_direction: string, values: ['asc', 'desc']
+    :param from_: string, Param for a filter by created date
+    :param base: string, Base currency
+    :param quote: string, Quote currency
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='',
+        payload=without_none_values({
+            'account_id': account_id,
+            'pair': pair,
+            'type': type,
+            'page': page,
+            'per_page': per_page,
+            'status': status,
+            'order_by': order_by,
+            'order_direction': order_direction,
+            'from': from_,
+            'base': base,
+            'quote': quote,
+        }),
+    )
+    return ThreeCommasApiError(error), SmartTradeV2Entity.of_list(data)
+
+
+@logged
+def iter_all(page_size: int = 100, prefetch: bool = True, **kwargs) -> AsyncIterator[SmartTradeV2Entity]:
+    """
+    GET /v2/smart_trades page by page. The next page is fetched while the current one is consumed
+    :param kwargs: the arguments of get
+    """
+    return aio_iter_pages(get, page_params=numbered_page_params, page_size=page_size, prefetch=prefetch, max_page_size=100, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def post(entity: dict,
+               account_id: int = None,
+               pair: str = None,
+               instant: bool = None,
+               skip_enter_step: bool = None,
+               note: str = None):
+    """
+    POST /v2/smart_trades
+    Create smart trade v2 (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_id: REQUIRED, integer, id from GET /ver1/accounts
+    :param pair: REQUIRED, string
+    :param leverage[enabled]: REQUIRED, boolean
+    :param position[type]: REQUIRED, string, values: ['buy', 'sell']
+    :param position[order_type]: REQUIRED, string, values: ['market', 'limit', 'conditional']
+    :param position[units][value]: REQUIRED, number, Amount of units to buy
+    :param position[price][value]: REQUIRED, number, Price for limit order
+    :param position[conditional][price][value]: REQUIRED, number, Conditional trigger price
+    :param position[conditional][order_type]: REQUIRED, string, values: ['market', 'limit']
+    :param position[conditional][trailing][enabled]: REQUIRED, boolean
+    :param position[conditional][trailing][percent]: REQUIRED, number, Should be 100% in the sum of all steps
+    :param take_profit[enabled]: REQUIRED, boolean
+    :param take_profit[steps][][order_type]: REQUIRED, array, market, limit
+    :param take_profit[steps][][volume]: REQUIRED, array
+    :param take_profit[steps][][price][type]: REQUIRED, array, bid, ask, last
+    :param take_profit[steps][][trailing][enabled]: REQUIRED, array
+    :param take_profit[steps][][trailing][percent]: REQUIRED, array
+    :param stop_loss[enabled]: REQUIRED, boolean
+    :param stop_loss[order_type]: REQUIRED, string, values: ['market', 'limit']
+    :param stop_loss[price][value]: REQUIRED, number, Price for limit order
+    :param stop_loss[conditional][price][type]: REQUIRED, string, values: ['bid', 'ask', 'last']
+    :param stop_loss[conditional][trailing][enabled]: REQUIRED, boolean
+    :param stop_loss[timeout][enabled]: REQUIRED, boolean
+    :param stop_loss[timeout][value]: REQUIRED, integer
+    :param instant: boolean, true for Simple Buy and Simple Sell
+    :param skip_enter_step: boolean, true only for Smart Sell
+    :param note: string
+    :param leverage[type]: string, values: ['custom', 'cross', 'isolated']
+    :param leverage[value]: integer, Cross leverage value
+    :param position[conditional][price][type]: string, values: ['bid', 'ask', 'last'], By default ask for long, bid for short
+    :param take_profit[steps][][price][value]: array, only if position has no trailing or position trailing is finished
+    :param take_profit[steps][][price][percent]: array, only if position has trailing and position trailing is not finished
+    :param stop_loss[breakeven]: boolean
+    :param stop_loss[conditional][price][value]: number, if position has no trailing or position trailing is finished
+    :param stop_loss[conditional][price][percent]: number, only if position has trailing and position trailing is not finished
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='new',
+        payload={**(entity or dict()), **without_none_values({
+            'account_id': account_id,
+            'pair': pair,
+            'instant': instant,
+            'skip_enter_step': skip_enter_step,
+            'note': note,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_by_id(id) -> Tuple[ThreeCommasApiError, SmartTradeV2Entity]:
+    """
+    GET /v2/smart_trades/{id}
+    Get smart trade v2 by id (Permission: SMART_TRADE_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='get_by_id',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), SmartTradeV2Entity(data)
+
+
+@logged
+async def bulk_get(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /v2/smart_trades/{id} for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def delete_by_id(id):
+    """
+    DELETE /v2/smart_trades/{id}
+    Cancel smart trade v2 (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='cancel',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def patch_by_id(id, entity: dict = None):
+    """
+    PATCH /v2/smart_trades/{id}
+    Update smart trade v2 (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param leverage[enabled]: REQUIRED, boolean
+    :param position[units][value]: REQUIRED, number, Amount of units to buy
+    :param position[price][value]: REQUIRED, number, Price for limit order
+    :param position[conditional][price][value]: REQUIRED, number, Conditional trigger price
+    :param position[conditional][order_type]: REQUIRED, string, values: ['market', 'limit']
+    :param position[conditional][trailing][enabled]: REQUIRED, boolean
+    :param position[conditional][trailing][percent]: REQUIRED, number
+    :param take_profit[enabled]: REQUIRED, boolean
+    :param take_profit[steps][][order_type]: REQUIRED, array
+    :param take_profit[steps][][volume]: REQUIRED, array
+    :param take_profit[steps][][price][type]: REQUIRED, array
+    :param take_profit[steps][][trailing][enabled]: REQUIRED, array
+    :param take_profit[steps][][trailing][percent]: REQUIRED, array
+    :param stop_loss[enabled]: REQUIRED, boolean
+    :param stop_loss[order_type]: REQUIRED, string, values: ['market', 'limit']
+    :param stop_loss[price][value]: REQUIRED, number, Price for limit order
+    :param stop_loss[conditional][price][type]: REQUIRED, string, values: ['bid', 'ask', 'last']
+    :param stop_loss[conditional][trailing][enabled]: REQUIRED, boolean
+    :param stop_loss[timeout][enabled]: REQUIRED, boolean
+    :param stop_loss[timeout][value]: REQUIRED, integer
+    :param leverage[type]: string, values: ['custom', 'cross', 'isolated']
+    :param leverage[value]: integer, Cross leverage value
+    :param position[conditional][price][type]: string, values: ['bid', 'ask', 'last'], By default ask for long, bid for short
+    :param take_profit[steps][][price][value]: array
+    :param take_profit[steps][][price][percent]: array
+    :param stop_loss[breakeven]: boolean
+    :param stop_loss[conditional][price][value]: number, Trigger price
+    :param stop_loss[conditional][price][percent]: number
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='update',
+        action_id=str(id),
+        payload=entity,
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_reduce_funds_by_id(id,
+                                  entity: dict = None,
+                                  order_type: str = None):
+    """
+    POST /v2/smart_trades/{id}/reduce_funds
+    Reduce funds for smart trade v2 (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param order_type: REQUIRED, string, values: ['market', 'limit']
+    :param units[value]: REQUIRED, number, Amount of units to buy
+    :param price[value]: REQUIRED, number, Price for limit order
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='reduce_funds',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'order_type': order_type,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_add_funds_by_id(id,
+                               entity: dict = None,
+                               order_type: str = None):
+    """
+    POST /v2/smart_trades/{id}/add_funds
+    Average for smart trade v2 (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param order_type: REQUIRED, string, values: ['market', 'limit']
+    :param units[value]: REQUIRED, number, Amount of units to buy
+    :param price[value]: REQUIRED, number, Price for limit order
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='add_funds',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'order_type': order_type,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_close_by_market_by_id(id):
+    """
+    POST /v2/smart_trades/{id}/close_by_market
+    Close by market smart trade v2 (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='close_by_market',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_force_start_by_id(id):
+    """
+    POST /v2/smart_trades/{id}/force_start
+    Force start smart trade v2 (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='force_start',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_force_process_by_id(id):
+    """
+    POST /v2/smart_trades/{id}/force_process
+    Process smart trade v2 (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='force_process',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_set_note_by_id(id,
+                              entity: dict = None,
+                              note: str = None):
+    """
+    POST /v2/smart_trades/{id}/set_note
+    Set note to smart trade v2 (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param note: REQUIRED, string
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='set_note',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'note': note,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_trades_by_id(id):
+    """
+    GET /v2/smart_trades/{smart_trade_id}/trades
+    Get smart trade v2 trades (Permission: SMART_TRADE_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='get_trades',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get_trades(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /v2/smart_trades/{smart_trade_id}/trades for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_trades_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def post_trades_close_by_market_by_id(id, sub_id):
+    """
+    POST /v2/smart_trades/{smart_trade_id}/trades/{id}/close_by_market
+    Panic close trade by market (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='panic_close_by_market',
+        action_id=str(id),
+        action_sub_id=str(sub_id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def delete_trades_by_id(id, sub_id):
+    """
+    DELETE /v2/smart_trades/{smart_trade_id}/trades/{id}
+    Cancel trade (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='smart_trades_v2',
+        action='cancel_trade',
+        action_id=str(id),
+        action_sub_id=str(sub_id),
+    )
+    return ThreeCommasApiError(error), data
+
+
@@ -0,0 +1,592 @@
+from py3cw.request import Py3CW
+from ....model import *
+from ....error import ThreeCommasApiError
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
+import logging
+from ....sys_utils import logged, Py3cwClosureProxy, without_none_values
+from ....aio_client import with_aio_py3cw
+from ....bulk import aio_bulk_by_id, BulkResult
+from ....pagination import aio_iter_pages, offset_page_params, numbered_page_params
+
+
+logger = logging.getLogger(__name__)
+wrapper = Py3cwClosureProxy()
+
+
+@logged
+@with_aio_py3cw
+async def post_transfer(entity: dict = None,
+                        currency: str = None,
+                        amount: float = None,
+                        to_account_id: int = None,
+                        from_account_id: int = None):
+    """
+    POST /ver1/accounts/transfer
+    Transfer coins between accounts (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param currency: REQUIRED, string, Currency code(example: USDT)
+    :param amount: REQUIRED, number
+    :param to_account_id: REQUIRED, integer, Recipient account ID (possible values in /transfer_data)
+    :param from_account_id: REQUIRED, integer, Sender account ID (possible values in /transfer_data)
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='transfer',
+        payload={**(entity or dict()), **without_none_values({
+            'currency': currency,
+            'amount': amount,
+            'to_account_id': to_account_id,
+            'from_account_id': from_account_id,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_transfer_history(account_id: int = None,
+                               currency: str = None,
+                               page: int = None,
+                               per_page: int = None):
+    """
+    GET /ver1/accounts/transfer_history
+    Transfers history (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    :param account_id: REQUIRED, integer, Sender or Recipient account ID (possible values in /transfer_data)
+    :param currency: REQUIRED, string, Currency code(example: USDT)
+    :param page: integer, Page number
+    :param per_page: integer, Elements per page
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='transfer_history',
+        payload=without_none_values({
+            'account_id': account_id,
+            'currency': currency,
+            'page': page,
+            'per_page': per_page,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_transfer_data():
+    """
+    GET /ver1/accounts/transfer_data
+    Data for transfer between accounts (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='transfer_data',
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_new(entity: dict = None,
+                   type: str = None,
+                   name: str = None,
+                   secret: str = None,
+                   address: str = None,
+                   customer_id: str = None,
+                   passphrase: str = None,
+                   how_connect: str = None,
+                   keystore: str = None,
+                   wallet_password: str = None,
+                   mnemonic_phrase: str = None):
+    """
+    POST /ver1/accounts/new
+    Add exchange account  (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param type: REQUIRED, string, check market_code in market_list method
+    :param name: REQUIRED, string, Account name (any string)
+    :param api_key: string, Requires unless type = binance_dex
+    :param secret: string, Requires unless type = binance_dex
+    :param address: string, Requires if type = ethereumwallet
+    :param customer_id: string, For Bitstamp
+    :param passphrase: string, For Coinbase Pro (GDAX)
+    :param how_connect: string, values: ['mnemonic_phrase', 'keystore']
+    :param keystore: json, keystore file content. Requires if type = binance_dex and how_connect = keystore
+    :param wallet_password: string, Requires if type = binance_dex and how_connect = keystore
+    :param mnemonic_phrase: string, Requires if type = binance_dex and how_connect = mnemonic_phrase
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='new',
+        payload={**(entity or dict()), **without_none_values({
+            'type': type,
+            'name': name,
+            'secret': secret,
+            'address': address,
+            'customer_id': customer_id,
+            'passphrase': passphrase,
+            'how_connect': how_connect,
+            'keystore': keystore,
+            'wallet_password': wallet_password,
+            'mnemonic_phrase': mnemonic_phrase,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_update(entity: dict = None,
+                      account_id: int = None,
+                      name: str = None,
+                      secret: str = None,
+                      customer_id: str = None,
+                      passphrase: str = None,
+                      address: str = None,
+                      how_connect: str = None,
+                      keystore: str = None,
+                      wallet_password: str = None,
+                      mnemonic_phrase: str = None):
+    """
+    POST /ver1/accounts/update
+    Edit exchange account
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_id: REQUIRED, integer
+    :param name: string, Account name (any string)
+    :param api_key: string
+    :param secret: string
+    :param customer_id: string, For Bitstamp
+    :param passphrase: string, For Coinbase Pro (GDAX)
+    :param address: string, For accounts with type = ethereumwallet
+    :param how_connect: string, values: ['mnemonic_phrase', 'keystore']
+    :param keystore: json
+    :param wallet_password: string
+    :param mnemonic_phrase: string
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='update',
+        payload={**(entity or dict()), **without_none_values({
+            'account_id': account_id,
+            'name': name,
+            'secret': secret,
+            'customer_id': customer_id,
+            'passphrase': passphrase,
+            'address': address,
+            'how_connect': how_connect,
+            'keystore': keystore,
+            'wallet_password': wallet_password,
+            'mnemonic_phrase': mnemonic_phrase,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get():
+    """
+    GET /ver1/accounts
+    User connected exchanges(and EthereumWallet) list (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='',
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_market_list():
+    """
+    GET /ver1/accounts/market_list
+    Supported markets list (Permission: NONE, Security: NONE)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='market_list',
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_market_pairs(pretty_display_type: str = None,
+                           market_code: str = None):
+    """
+    GET /ver1/accounts/market_pairs
+    All market pairs (Permission: NONE, Security: NONE)
+
+    :param pretty_display_type: string, deprecated. mandatory use market_code instead
+    :param market_code: string, market_code from account model
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='market_pairs',
+        payload=without_none_values({
+            'pretty_display_type': pretty_display_type,
+            'market_code': market_code,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def get_currency_rates_with_leverage_data(market_code: str = None,
+                                                pair: str = None):
+    """
+    GET /ver1/accounts/currency_rates_with_leverage_data
+    Currency rates and limits with leverage data (Permission: NONE, Security: NONE)
+
+    :param market_code: REQUIRED, string, market_code from account model
+    :param pair: REQUIRED, string, Pair
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='<py3cw_action>',
+        payload=without_none_values({
+            'market_code': market_code,
+            'pair': pair,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+@logged
+@with_aio_py3cw
+async def get_currency_rates(pretty_display_type: str = None,
+                             market_code: str = None,
+                             pair: str = None):
+    """
+    GET /ver1/accounts/currency_rates
+    Currency rates and limits (Permission: NONE, Security: NONE)
+
+    :param pair: REQUIRED, string, Pair
+    :param pretty_display_type: string, deprecated. use market_code instead
+    :param market_code: string, market_code from account model. If you are retrieving data for pairs, you must also include market_code
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='currency_rates',
+        payload=without_none_values({
+            'pretty_display_type': pretty_display_type,
+            'market_code': market_code,
+            'pair': pair,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def get_deposit_data_by_id(id,
+                                 currency: str = None,
+                                 network: str = None):
+    """
+    GET /ver1/accounts/{account_id}/deposit_data
+    User Deposit Data (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    :param currency: REQUIRED, string
+    :param network: REQUIRED, string
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='<py3cw_action>',
+        action_id=str(id),
+        payload=without_none_values({
+            'currency': currency,
+            'network': network,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+@logged
+@with_aio_py3cw
+async def get_networks_info_by_id(id,
+                                  purpose: str = None):
+    """
+    GET /ver1/accounts/{account_id}/networks_info
+    Deposit/withdraw networks info (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    :param purpose: string, values: ['deposit', 'withdraw'], Filter currencies with deposit/withdraw enabled
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='networks_info',
+        action_id=str(id),
+        payload=without_none_values({
+            'purpose': purpose,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get_networks_info(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/accounts/{account_id}/networks_info for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_networks_info_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def post_convert_dust_to_bnb_by_id(id,
+                                         entity: dict = None,
+                                         codes: list = None):
+    """
+    POST /ver1/accounts/{account_id}/convert_dust_to_bnb
+    Convert dust coins to BNB (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param codes: array, Array of currency codes
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='convert_dust_to_bnb',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'codes': codes,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_active_trading_entities_by_id(id):
+    """
+    GET /ver1/accounts/{account_id}/active_trading_entities
+    Active trade entities (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='active_trading_entities',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get_active_trading_entities(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/accounts/{account_id}/active_trading_entities for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_active_trading_entities_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def post_sell_all_to_usd_by_id(id):
+    """
+    POST /ver1/accounts/{account_id}/sell_all_to_usd
+    Sell all to USD  (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='sell_all_to_usd',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_sell_all_to_btc_by_id(id):
+    """
+    POST /ver1/accounts/{account_id}/sell_all_to_btc
+    Sell all to BTC  (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='sell_all_to_btc',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_balance_chart_data_by_id(id,
+                                       date_from: str = None,
+                                       date_to: str = None):
+    """
+    GET /ver1/accounts/{account_id}/balance_chart_data
+    balance history data (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    :param date_from: REQUIRED, string
+    :param date_to: string
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='balance_chart_data',
+        action_id=str(id),
+        payload=without_none_values({
+            'date_from': date_from,
+            'date_to': date_to,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get_balance_chart_data(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/accounts/{account_id}/balance_chart_data for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_balance_chart_data_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def post_load_balances_by_id(id):
+    """
+    POST /ver1/accounts/{account_id}/load_balances
+    Load balances for specified exchange  (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='load_balances',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_rename_by_id(id,
+                            entity: dict = None,
+                            name: str = None):
+    """
+    POST /ver1/accounts/{account_id}/rename
+    Rename exchange connection  (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param name: REQUIRED, string
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='rename',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_pie_chart_data_by_id(id):
+    """
+    POST /ver1/accounts/{account_id}/pie_chart_data
+    Information about all user balances on specified exchange in pretty for pie chart format (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='pie_chart_data',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_account_table_data_by_id(id):
+    """
+    POST /ver1/accounts/{account_id}/account_table_data
+    Information about all user balances on specified exchange  (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='account_table_data',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_remove_by_id(id):
+    """
+    POST /ver1/accounts/{account_id}/remove
+    Remove exchange connection  (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='remove',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def get_leverage_data_by_id(id,
+                                  pair: str = None):
+    """
+    GET /ver1/accounts/{account_id}/leverage_data
+    Information about account leverage (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    :param pair: REQUIRED, string
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='<py3cw_action>',
+        action_id=str(id),
+        payload=without_none_values({
+            'pair': pair,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+@logged
+@with_aio_py3cw
+async def get_by_id(id):
+    """
+    GET /ver1/accounts/{account_id}
+    Single Account Info (Permission: ACCOUNTS_READ, Security: SIGNED)
+You can send 'summary' instead of {account_id} to get summary account info
+
+    """
+    error, data = await wrapper.request(
+        entity='accounts',
+        action='account_info',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/accounts/{account_id} for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
@@ -0,0 +1,585 @@
+from py3cw.request import Py3CW
+from ....model import *
+from ....error import ThreeCommasApiError
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
+import logging
+from ....sys_utils import logged, Py3cwClosureProxy, without_none_values
+from ....aio_client import with_aio_py3cw
+from ....bulk import aio_bulk_by_id, BulkResult
+from ....pagination import aio_iter_pages, offset_page_params, numbered_page_params
+
+
+logger = logging.getLogger(__name__)
+wrapper = Py3cwClosureProxy()
+
+
+@logged
+@with_aio_py3cw
+async def get_strategy_list(account_id: int = None,
+                            type: str = None,
+                            strategy: str = None):
+    """
+    GET /ver1/bots/strategy_list
+    Available strategy list for bot (Permission: BOTS_READ, Security: SIGNED)
+
+    :param account_id: integer, id from GET /ver1/accounts
+    :param type: string, values: ['simple', 'composite']
+    :param strategy: string, values: ['long', 'short']
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='strategy_list',
+        payload=without_none_values({
+            'account_id': account_id,
+            'type': type,
+            'strategy': strategy,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_pairs_black_list():
+    """
+    GET /ver1/bots/pairs_black_list
+    Black List for bot pairs (Permission: BOTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='pairs_black_list',
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_update_pairs_black_list(entity: dict = None,
+                                       pairs: list = None):
+    """
+    POST /ver1/bots/update_pairs_black_list
+    Create or Update pairs BlackList for bots (Permission: BOTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param pairs: REQUIRED, array
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='update_pairs_black_list',
+        payload={**(entity or dict()), **without_none_values({
+            'pairs': pairs,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_create_bot(entity: dict = None,
+                          name: str = None,
+                          account_id: int = None,
+                          pairs: list = None,
+                          max_active_deals: int = None,
+                          base_order_volume: float = None,
+                          base_order_volume_type: str = None,
+                          take_profit: float = None,
+                          safety_order_volume: float = None,
+                          safety_order_volume_type: str = None,
+                          martingale_volume_coefficient: float = None,
+                          martingale_step_coefficient: float = None,
+                          max_safety_orders: int = None,
+                          active_safety_orders_count: int = None,
+                          stop_loss_percentage: float = None,
+                          cooldown: float = None,
+                          trailing_enabled: bool = None,
+                          trailing_deviation: float = None,
+                          btc_price_limit: float = None,
+                          strategy: str = None,
+                          safety_order_step_percentage: float = None,
+                          take_profit_type: str = None,
+                          strategy_list: list = None,
+                          leverage_type: str = None,
+                          leverage_custom_value: float = None,
+                          min_price: float = None,
+                          max_price: float = None,
+                          stop_loss_timeout_enabled: bool = None,
+                          stop_loss_timeout_in_seconds: int = None,
+                          min_volume_btc_24h: float = None,
+                          tsl_enabled: bool = None,
+                          deal_start_delay_seconds: int = None,
+                          profit_currency: str = None,
+                          start_order_type: str = None,
+                          stop_loss_type: str = None,
+                          disable_after_deals_count: int = None,
+                          allowed_deals_on_same_pair: int = None,
+                          close_deals_timeout: int = None):
+    """
+    POST /ver1/bots/create_bot
+    Create bot (Permission: BOTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param name: REQUIRED, string
+    :param account_id: REQUIRED, integer, id from GET /ver1/accounts
+    :param pairs: REQUIRED, array, Pass single pair to create SingleBot or any other number of pairs to create MultiBot
+    :param base_order_volume: REQUIRED, number, Base order size
+    :param take_profit: REQUIRED, number, Target profit(percentage)
+    :param safety_order_volume: REQUIRED, number, Safety trade size
+    :param martingale_volume_coefficient: REQUIRED, number
+    :param martingale_step_coefficient: REQUIRED, number
+    :param max_safety_orders: REQUIRED, integer, Max safety trades count
+    :param active_safety_orders_count: REQUIRED, integer, Max active safety trades count
+    :param safety_order_step_percentage: REQUIRED, number, Price deviation to open safety trades(percentage)
+    :param take_profit_type: REQUIRED, string, values: ['base', 'total'], Percentage: base – from base order, total – from total volume
+    :param strategy_list: REQUIRED, array, For manual signals: [{"strategy":"manual"}] or []<br> For non-stop(1 pair only): [{"strategy":"nonstop"}]<br> QFL: {"options": {"type": "original"}, {"percent": 3}, "strategy": "qfl"}] <br> TradingView: [{"options": {"time": "5m", "type": "buy_or_strong_buy"}, "strategy": "trading_view"}
+    :param max_active_deals: integer
+    :param base_order_volume_type: string, values: ['quote_currency', 'base_currency', 'percent', 'xbt'], base order volume currency
+    :param safety_order_volume_type: string, values: ['quote_currency', 'base_currency', 'percent', 'xbt'], safety order volume currency
+    :param stop_loss_percentage: number
+    :param cooldown: number
+    :param trailing_enabled: boolean, Enable trailing take profit. Binance only.
+    :param trailing_deviation: number, required if trailing_enabled
+    :param btc_price_limit: number
+    :param strategy: string, values: ['short', 'long']
+    :param leverage_type: string, values: ['custom', 'cross', 'not_specified', 'isolated'], Used for Bitmex bots only
+    :param leverage_custom_value: number, required if leverage_type is isolated
+    :param min_price: number, minimum price to open deal
+    :param max_price: number, maximum price to open deal
+    :param stop_loss_timeout_enabled: boolean
+    :param stop_loss_timeout_in_seconds: integer, StopLoss timeout in seconds if StopLoss timeout enabled
+    :param min_volume_btc_24h: number
+    :param tsl_enabled: boolean, Enable trailing stop loss. Bitmex only.
+    :param deal_start_delay_seconds: integer, Deal start delay in seconds
+    :param profit_currency: string, values: ['quote_currency', 'base_currency'], Take profit currency
+    :param start_order_type: string, values: ['limit', 'market']
+    :param stop_loss_type: string, values: ['stop_loss', 'stop_loss_and_disable_bot']
+    :param disable_after_deals_count: integer, Bot will be disabled after opening this number of deals
+    :param allowed_deals_on_same_pair: integer, Allow specific number of deals on the same pair. Multibot only.
+    :param close_deals_timeout: integer, Close bot deals after given number of seconds. Must be greater than 60.
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='create_bot',
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+            'account_id': account_id,
+            'pairs': pairs,
+            'max_active_deals': max_active_deals,
+            'base_order_volume': base_order_volume,
+            'base_order_volume_type': base_order_volume_type,
+            'take_profit': take_profit,
+            'safety_order_volume': safety_order_volume,
+            'safety_order_volume_type': safety_order_volume_type,
+            'martingale_volume_coefficient': martingale_volume_coefficient,
+            'martingale_step_coefficient': martingale_step_coefficient,
+            'max_safety_orders': max_safety_orders,
+            'active_safety_orders_count': active_safety_orders_count,
+            'stop_loss_percentage': stop_loss_percentage,
+            'cooldown': cooldown,
+            'trailing_enabled': trailing_enabled,
+            'trailing_deviation': trailing_deviation,
+            'btc_price_limit': btc_price_limit,
+            'strategy': strategy,
+            'safety_order_step_percentage': safety_order_step_percentage,
+            'take_profit_type': take_profit_type,
+            'strategy_list': strategy_list,
+            'leverage_type': leverage_type,
+            'leverage_custom_value': leverage_custom_value,
+            'min_price': min_price,
+            'max_price': max_price,
+            'stop_loss_timeout_enabled': stop_loss_timeout_enabled,
+            'stop_loss_timeout_in_seconds': stop_loss_timeout_in_seconds,
+            'min_volume_btc_24h': min_volume_btc_24h,
+            'tsl_enabled': tsl_enabled,
+            'deal_start_delay_seconds': deal_start_delay_seconds,
+            'profit_currency': profit_currency,
+            'start_order_type': start_order_type,
+            'stop_loss_type': stop_loss_type,
+            'disable_after_deals_count': disable_after_deals_count,
+            'allowed_deals_on_same_pair': allowed_deals_on_same_pair,
+            'close_deals_timeout': close_deals_timeout,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get(limit: int = None,
+              offset: int = None,
+              from_: str = None,
+              account_id: int = None,
+              scope: str = None,
+              strategy: str = None,
+              sort_by: str = None,
+              sort_direction: str = None,
+              quote: str = None) -> Tuple[ThreeCommasApiError, List[BotEntity]]:
+    """
+    GET /ver1/bots
+    User bots (Permission: BOTS_READ, Security: SIGNED)
+
+    :param limit: integer, Limit records. Max: 100
+    :param offset: integer, Offset records
+    :param from_: string, Param for a filter by created date
+    :param account_id: integer, Account to show bots on. Return all if not specified. Gather this from GET /ver1/accounts
+    :param scope: string, values: ['enabled', 'disabled']
+    :param strategy: string, values: ['long', 'short']
+    :param sort_by: string, values: ['profit', 'created_at', 'updated_at']
+    :param sort_direction: string, values: ['asc', 'desc']
+    :param quote: string, Quote currency
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='',
+        payload=without_none_values({
+            'limit': limit,
+            'offset': offset,
+            'from': from_,
+            'account_id': account_id,
+            'scope': scope,
+            'strategy': strategy,
+            'sort_by': sort_by,
+            'sort_direction': sort_direction,
+            'quote': quote,
+        }),
+    )
+    return ThreeCommasApiError(error), BotEntity.of_list(data)
+
+
+@logged
+@with_aio_py3cw
+async def get_stats(account_id: int = None,
+                    bot_id: int = None):
+    """
+    GET /ver1/bots/stats
+    Get bot stats (Permission: BOTS_READ, Security: SIGNED)
+
+    :param account_id: integer, Account to show on. Null - show for all. Gather this from GET /ver1/accounts
+    :param bot_id: integer, Bots to show on. Null - show for all
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='stats',
+        payload=without_none_values({
+            'account_id': account_id,
+            'bot_id': bot_id,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_copy_and_create_by_id(id,
+                                     entity: dict = None,
+                                     name: str = None,
+                                     secret: str = None,
+                                     amount: float = None):
+    """
+    POST /ver1/bots/{bot_id}/copy_and_create
+    POST /bots/:id/copy_and_create. Permission: BOTS_WRITE, Security: SIGNED
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param name: REQUIRED, string
+    :param secret: REQUIRED, string
+    :param amount: number, Max amount for bot usage (Based on current rate)
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='copy_and_create',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+            'secret': secret,
+            'amount': amount,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def patch_update_by_id(id,
+                             entity: dict = None,
+                             name: str = None,
+                             pairs: list = None,
+                             max_active_deals: int = None,
+                             base_order_volume: float = None,
+                             base_order_volume_type: str = None,
+                             take_profit: float = None,
+                             safety_order_volume: float = None,
+                             safety_order_volume_type: str = None,
+                             martingale_volume_coefficient: float = None,
+                             martingale_step_coefficient: float = None,
+                             max_safety_orders: int = None,
+                             active_safety_orders_count: int = None,
+                             stop_loss_percentage: float = None,
+                             cooldown: float = None,
+                             trailing_enabled: bool = None,
+                             trailing_deviation: float = None,
+                             btc_price_limit: float = None,
+                             safety_order_step_percentage: float = None,
+                             take_profit_type: str = None,
+                             strategy_list: list = None,
+                             leverage_type: str = None,
+                             leverage_custom_value: float = None,
+                             min_price: float = None,
+                             max_price: float = None,
+                             stop_loss_timeout_enabled: bool = None,
+                             stop_loss_timeout_in_seconds: int = None,
+                             min_volume_btc_24h: float = None,
+                             tsl_enabled: bool = None,
+                             deal_start_delay_seconds: int = None,
+                             profit_currency: str = None,
+                             start_order_type: str = None,
+                             stop_loss_type: str = None,
+                             disable_after_deals_count: int = None,
+                             allowed_deals_on_same_pair: int = None):
+    """
+    PATCH /ver1/bots/{bot_id}/update
+    Edit bot (Permission: BOTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param name: REQUIRED, string
+    :param pairs: REQUIRED, array
+    :param base_order_volume: REQUIRED, number, Base order size
+    :param take_profit: REQUIRED, number, Target profit(percentage)
+    :param safety_order_volume: REQUIRED, number, Safety trade size
+    :param martingale_volume_coefficient: REQUIRED, number
+    :param martingale_step_coefficient: REQUIRED, number
+    :param max_safety_orders: REQUIRED, integer, Max safety trades count
+    :param active_safety_orders_count: REQUIRED, integer, Max active safety trades count
+    :param safety_order_step_percentage: REQUIRED, number, Price deviation to open safety trades(percentage)
+    :param take_profit_type: REQUIRED, string, values: ['total', 'base'], Percentage: base – from base order, total – from total volume
+    :param strategy_list: REQUIRED, array, For manual signals: [{"strategy":"manual"}] or []<br> For non-stop(1 pair only): [{"strategy":"nonstop"}]<br> QFL: {"options": {"type": "original"}, {"percent": 3}, "strategy": "qfl"}] <br> TradingView: [{"options": {"time": "5m", "type": "buy_or_strong_buy", "strategy": "trading_view"}
+    :param max_active_deals: integer
+    :param base_order_volume_type: string, values: ['quote_currency', 'base_currency', 'percent', 'xbt'], base order volume currency
+    :param safety_order_volume_type: string, values: ['quote_currency', 'base_currency', 'percent', 'xbt'], safety order volume currency
+    :param stop_loss_percentage: number
+    :param cooldown: number
+    :param trailing_enabled: boolean, Enable trailing take profit. Binance only.
+    :param trailing_deviation: number, required if trailing_enabled
+    :param btc_price_limit: number
+    :param leverage_type: string, values: ['custom', 'cross', 'not_specified', 'isolated'], Used for Bitmex bots only
+    :param leverage_custom_value: number, required if leverage_type is isolated
+    :param min_price: number, minimum price to open deal
+    :param max_price: number, maximum price to open deal
+    :param stop_loss_timeout_enabled: boolean
+    :param stop_loss_timeout_in_seconds: integer, StopLoss timeout in seconds if StopLoss timeout enabled
+    :param min_volume_btc_24h: number
+    :param tsl_enabled: boolean, Enable trailing stop loss. Bitmex only.
+    :param deal_start_delay_seconds: integer, Deal start delay in seconds
+    :param profit_currency: string, values: ['quote_currency', 'base_currency'], Take profit currency
+    :param start_order_type: string, values: ['limit', 'market']
+    :param stop_loss_type: string, values: ['stop_loss', 'stop_loss_and_disable_bot']
+    :param disable_after_deals_count: integer, Bot will be disabled after opening this number of deals
+    :param allowed_deals_on_same_pair: integer, Allow specific number of deals on the same pair. Multibot only.
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='update',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+            'pairs': pairs,
+            'max_active_deals': max_active_deals,
+            'base_order_volume': base_order_volume,
+            'base_order_volume_type': base_order_volume_type,
+            'take_profit': take_profit,
+            'safety_order_volume': safety_order_volume,
+            'safety_order_volume_type': safety_order_volume_type,
+            'martingale_volume_coefficient': martingale_volume_coefficient,
+            'martingale_step_coefficient': martingale_step_coefficient,
+            'max_safety_orders': max_safety_orders,
+            'active_safety_orders_count': active_safety_orders_count,
+            'stop_loss_percentage': stop_loss_percentage,
+            'cooldown': cooldown,
+            'trailing_enabled': trailing_enabled,
+            'trailing_deviation': trailing_deviation,
+            'btc_price_limit': btc_price_limit,
+            'safety_order_step_percentage': safety_order_step_percentage,
+            'take_profit_type': take_profit_type,
+            'strategy_list': strategy_list,
+            'leverage_type': leverage_type,
+            'leverage_custom_value': leverage_custom_value,
+            'min_price': min_price,
+            'max_price': max_price,
+            'stop_loss_timeout_enabled': stop_loss_timeout_enabled,
+            'stop_loss_timeout_in_seconds': stop_loss_timeout_in_seconds,
+            'min_volume_btc_24h': min_volume_btc_24h,
+            'tsl_enabled': tsl_enabled,
+            'deal_start_delay_seconds': deal_start_delay_seconds,
+            'profit_currency': profit_currency,
+            'start_order_type': start_order_type,
+            'stop_loss_type': stop_loss_type,
+            'disable_after_deals_count': disable_after_deals_count,
+            'allowed_deals_on_same_pair': allowed_deals_on_same_pair,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_disable_by_id(id):
+    """
+    POST /ver1/bots/{bot_id}/disable
+    Disable bot (Permission: BOTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='disable',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_enable_by_id(id):
+    """
+    POST /ver1/bots/{bot_id}/enable
+    Enable bot (Permission: BOTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='enable',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_start_new_deal_by_id(id,
+                                    entity: dict = None,
+                                    pair: str = None,
+                                    skip_signal_checks: bool = None,
+                                    skip_open_deals_checks: bool = None):
+    """
+    POST /ver1/bots/{bot_id}/start_new_deal
+    Start new deal asap (Permission: BOTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param pair: string, Can be omited for simple bot
+    :param skip_signal_checks: boolean, If false or not specified then all paramaters like signals or volume filters will be checked. If true - those checks will be skipped
+    :param skip_open_deals_checks: boolean, If true then you will be allowed to open more then one deal per pair in composite bot
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='start_new_deal',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'pair': pair,
+            'skip_signal_checks': skip_signal_checks,
+            'skip_open_deals_checks': skip_open_deals_checks,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_delete_by_id(id):
+    """
+    POST /ver1/bots/{bot_id}/delete
+    Delete bot (Permission: BOTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='delete',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_panic_sell_all_deals_by_id(id):
+    """
+    POST /ver1/bots/{bot_id}/panic_sell_all_deals
+    Panic sell all bot deals (Permission: BOTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='panic_sell_all_deals',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_cancel_all_deals_by_id(id):
+    """
+    POST /ver1/bots/{bot_id}/cancel_all_deals
+    Cancel all bot deals (Permission: BOTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='cancel_all_deals',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_deals_stats_by_id(id):
+    """
+    GET /ver1/bots/{bot_id}/deals_stats
+    Bot deals stats (Permission: BOTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='deals_stats',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get_deals_stats(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/bots/{bot_id}/deals_stats for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_deals_stats_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def get_show_by_id(id,
+                         include_events: bool = None) -> Tuple[ThreeCommasApiError, BotEntity]:
+    """
+    GET /ver1/bots/{bot_id}/show
+    Bot info (Permission: BOTS_READ, Security: SIGNED)
+
+    :param include_events: boolean
+    """
+    error, data = await wrapper.request(
+        entity='bots',
+        action='show',
+        action_id=str(id),
+        payload=without_none_values({
+            'include_events': include_events,
+        }),
+    )
+    return ThreeCommasApiError(error), BotEntity(data)
+
+
+@logged
+async def bulk_get_show(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/bots/{bot_id}/show for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_show_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
@@ -0,0 +1,360 @@
+from py3cw.request import Py3CW
+from ....model import *
+from ....error import ThreeCommasApiError
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
+import logging
+from ....sys_utils import logged, Py3cwClosureProxy, without_none_values
+from ....aio_client import with_aio_py3cw
+from ....bulk import aio_bulk_by_id, BulkResult
+from ....pagination import aio_iter_pages, offset_page_params, numbered_page_params
+
+
+logger = logging.getLogger(__name__)
+wrapper = Py3cwClosureProxy()
+
+
+@logged
+@with_aio_py3cw
+async def get(limit: int = None,
+              offset: int = None,
+              from_: str = None,
+              account_id: int = None,
+              bot_id: int = None,
+              scope: str = None,
+              order: str = None,
+              order_direction: str = None,
+              base: str = None,
+              quote: str = None) -> Tuple[ThreeCommasApiError, List[DealEntity]]:
+    """
+    GET /ver1/deals
+    User deals (Permission: BOTS_READ, Security: SIGNED)
+
+    :param limit: integer, Limit records. Max: 1_000
+    :param offset: integer, Offset records
+    :param from_: string, Param for a filter by created date
+    :param account_id: integer, Account to show bots on. Return all if not specified. Gather this from GET /ver1/accounts
+    :param bot_id: integer, Bot show deals on. Return all if not specified
+    :param scope: string, active - active deals, finished - finished deals, completed - successfully completed, cancelled - cancelled deals, failed - failed deals, any other value or null (default) - all deals
+    :param order: string, values: ['created_at', 'updated_at', 'closed_at', 'profit', 'profit_percentage']
+    :param order_direction: string, values: ['asc', 'desc']
+    :param base: string, Base currency
+    :param quote: string, Quote currency
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='',
+        payload=without_none_values({
+            'limit': limit,
+            'offset': offset,
+            'from': from_,
+            'account_id': account_id,
+            'bot_id': bot_id,
+            'scope': scope,
+            'order': order,
+            'order_direction': order_direction,
+            'base': base,
+            'quote': quote,
+        }),
+    )
+    return ThreeCommasApiError(error), DealEntity.of_list(data)
+
+
+@logged
+def iter_all(page_size: int = 1000, prefetch: bool = True, **kwargs) -> AsyncIterator[DealEntity]:
+    """
+    GET /ver1/deals page by page. The next page is fetched while the current one is consumed
+    :param kwargs: the arguments of get
+    """
+    return aio_iter_pages(get, page_params=offset_page_params, page_size=page_size, prefetch=prefetch, max_page_size=1000, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def post_convert_to_smart_trade_by_id(id,
+                                            entity: dict = None,
+                                            stop_bot: bool = None):
+    """
+    POST /ver1/deals/{deal_id}/convert_to_smart_trade
+    Convert to smart trade (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param stop_bot: boolean
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='convert_to_smart_trade',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'stop_bot': stop_bot,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_update_max_safety_orders_by_id(id,
+                                              entity: dict = None,
+                                              max_safety_orders: int = None):
+    """
+    POST /ver1/deals/{deal_id}/update_max_safety_orders
+    Update max safety orders (Permission: BOTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param max_safety_orders: REQUIRED, integer, New maximum safety orders value
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='update_max_safety_orders',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'max_safety_orders': max_safety_orders,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_panic_sell_by_id(id):
+    """
+    POST /ver1/deals/{deal_id}/panic_sell
+    Panic sell deal (Permission: BOTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='panic_sell',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_cancel_by_id(id):
+    """
+    POST /ver1/deals/{deal_id}/cancel
+    Cancel deal (Permission: BOTS_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='cancel',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def patch_update_deal_by_id(id,
+                                  entity: dict = None,
+                                  take_profit: float = None,
+                                  profit_currency: str = None,
+                                  take_profit_type: str = None,
+                                  trailing_enabled: bool = None,
+                                  trailing_deviation: float = None,
+                                  stop_loss_percentage: float = None,
+                                  max_safety_orders: int = None,
+                                  active_safety_orders_count: int = None,
+                                  stop_loss_timeout_enabled: bool = None,
+                                  stop_loss_timeout_in_seconds: int = None,
+                                  tsl_enabled: bool = None,
+                                  stop_loss_type: str = None,
+                                  close_timeout: int = None):
+    """
+    PATCH /ver1/deals/{deal_id}/update_deal
+    Update deal (Permission: BOTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param take_profit: number, New take profit value
+    :param profit_currency: string, values: ['quote_currency', 'base_currency']
+    :param take_profit_type: string, base – from base order, total – from total volume
+    :param trailing_enabled: boolean
+    :param trailing_deviation: number, New trailing deviation value
+    :param stop_loss_percentage: number, New stop loss percentage value
+    :param max_safety_orders: integer, New max safety orders value
+    :param active_safety_orders_count: integer, New active safety orders count value
+    :param stop_loss_timeout_enabled: boolean
+    :param stop_loss_timeout_in_seconds: integer, StopLoss timeout in seconds if StopLoss timeout enabled
+    :param tsl_enabled: boolean, Trailing stop loss enabled
+    :param stop_loss_type: string, values: ['stop_loss', 'stop_loss_and_disable_bot']
+    :param close_timeout: integer, Close deal after given number of seconds. Must be greater than 60.
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='update_deal',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'take_profit': take_profit,
+            'profit_currency': profit_currency,
+            'take_profit_type': take_profit_type,
+            'trailing_enabled': trailing_enabled,
+            'trailing_deviation': trailing_deviation,
+            'stop_loss_percentage': stop_loss_percentage,
+            'max_safety_orders': max_safety_orders,
+            'active_safety_orders_count': active_safety_orders_count,
+            'stop_loss_timeout_enabled': stop_loss_timeout_enabled,
+            'stop_loss_timeout_in_seconds': stop_loss_timeout_in_seconds,
+            'tsl_enabled': tsl_enabled,
+            'stop_loss_type': stop_loss_type,
+            'close_timeout': close_timeout,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_update_tp_by_id(id,
+                               entity: dict = None,
+                               new_take_profit_percentage: float = None):
+    """
+    POST /ver1/deals/{deal_id}/update_tp
+    DEPRECATED, Update take profit condition. Deal status should be bought (Permission: BOTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param new_take_profit_percentage: REQUIRED, number, New take profit value
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='update_tp',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'new_take_profit_percentage': new_take_profit_percentage,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_show_by_id(id):
+    """
+    GET /ver1/deals/{deal_id}/show
+    Info about specific deal (Permission: BOTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='show',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get_show(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/deals/{deal_id}/show for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_show_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def post_cancel_order_by_id(id,
+                                  entity: dict = None,
+                                  order_id: str = None):
+    """
+    POST /ver1/deals/{deal_id}/cancel_order
+    Cancel manual safety orders (Permission: BOTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param order_id: REQUIRED, string, manual safety order id
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='cancel_order',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'order_id': order_id,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_market_orders_by_id(id):
+    """
+    GET /ver1/deals/{deal_id}/market_orders
+    Deal safety orders (Permission: BOTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='market_orders',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get_market_orders(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/deals/{deal_id}/market_orders for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_market_orders_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
+@logged
+@with_aio_py3cw
+async def post_add_funds_by_id(id,
+                               entity: dict = None,
+                               quantity: float = None,
+                               is_market: bool = None,
+                               response_type: str = None,
+                               rate: float = None):
+    """
+    POST /ver1/deals/{deal_id}/add_funds
+    Adding manual safety order (Permission: BOTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param quantity: REQUIRED, number, safety order quantity
+    :param is_market: REQUIRED, boolean, true - use MARKET order, false - use LIMIT order
+    :param rate: REQUIRED, number, safety order rate. Required if LIMIT order used
+    :param response_type: string, values: ['empty', 'deal', 'market_order']
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='add_funds',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'quantity': quantity,
+            'is_market': is_market,
+            'response_type': response_type,
+            'rate': rate,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_data_for_adding_funds_by_id(id):
+    """
+    GET /ver1/deals/{deal_id}/data_for_adding_funds
+    Info required to add funds correctly: available amounts, exchange limitations etc  (Permission: BOTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='deals',
+        action='data_for_adding_funds',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get_data_for_adding_funds(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/deals/{deal_id}/data_for_adding_funds for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_data_for_adding_funds_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
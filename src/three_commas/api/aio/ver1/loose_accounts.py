@@ -0,0 +1,94 @@
+from py3cw.request import Py3CW
+from ....model import *
+from ....error import ThreeCommasApiError
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
+import logging
+from ....sys_utils import logged, Py3cwClosureProxy, without_none_values
+from ....aio_client import with_aio_py3cw
+from ....bulk import aio_bulk_by_id, BulkResult
+from ....pagination import aio_iter_pages, offset_page_params, numbered_page_params
+
+
+logger = logging.getLogger(__name__)
+wrapper = Py3cwClosureProxy()
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post(entity: dict = None,
+               name: str = None):
+    """
+    POST /ver1/loose_accounts
+    Create Loose Account (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param name: REQUIRED, string
+    :param tokens[code]: REQUIRED, array
+    :param tokens[amount]: REQUIRED, array
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def get_available_currencies(contains: str = None,
+                                   limit: int = None,
+                                   offset: int = None):
+    """
+    GET /ver1/loose_accounts/available_currencies
+    Available currencies (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    :param contains: string
+    :param limit: integer
+    :param offset: integer
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        payload=without_none_values({
+            'contains': contains,
+            'limit': limit,
+            'offset': offset,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def put_by_id(id,
+                    entity: dict = None,
+                    name: str = None):
+    """
+    PUT /ver1/loose_accounts/{account_id}
+    Update Loose Account (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param tokens[code]: REQUIRED, array
+    :param tokens[amount]: REQUIRED, array
+    :param name: string
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
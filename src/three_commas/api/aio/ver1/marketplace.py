@@ -0,0 +1,160 @@
+from py3cw.request import Py3CW
+from ....model import *
+from ....error import ThreeCommasApiError
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
+import logging
+from ....sys_utils import logged, Py3cwClosureProxy, without_none_values
+from ....aio_client import with_aio_py3cw
+from ....bulk import aio_bulk_by_id, BulkResult
+from ....pagination import aio_iter_pages, offset_page_params, numbered_page_params
+
+
+logger = logging.getLogger(__name__)
+wrapper = Py3cwClosureProxy()
+
+
+@logged
+@with_aio_py3cw
+async def get_presets(entity: dict = None,
+                      profit_per_day_from: float = None,
+                      profit_per_day_to: float = None,
+                      profit_per_month_from: float = None,
+                      profit_per_month_to: float = None,
+                      account_types: list = None,
+                      markets: list = None,
+                      with_all_market_pairs: bool = None,
+                      pairs: list = None,
+                      days_running_from: int = None,
+                      days_running_to: int = None,
+                      deal_start_conditions: list = None,
+                      bot_type: str = None,
+                      bot_strategy: str = None,
+                      cmc: str = None,
+                      sort_by: str = None,
+                      sort_direction: str = None,
+                      page: int = None,
+                      per_page: int = None):
+    """
+    GET /ver1/marketplace/presets
+    Marketplace presets (Permission: NONE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param profit_per_day_from: number
+    :param profit_per_day_to: number
+    :param profit_per_month_from: number
+    :param profit_per_month_to: number
+    :param account_types: array
+    :param markets: array
+    :param with_all_market_pairs: boolean
+    :param pairs: array
+    :param days_running_from: integer
+    :param days_running_to: integer
+    :param deal_start_conditions: array
+    :param bot_type: string
+    :param bot_strategy: string
+    :param cmc: string
+    :param sort_by: string
+    :param sort_direction: string, values: ['asc', 'desc']
+    :param page: integer
+    :param per_page: integer
+    """
+    error, data = await wrapper.request(
+        entity='marketplace',
+        action='presets',
+        payload={**(entity or dict()), **without_none_values({
+            'profit_per_day_from': profit_per_day_from,
+            'profit_per_day_to': profit_per_day_to,
+            'profit_per_month_from': profit_per_month_from,
+            'profit_per_month_to': profit_per_month_to,
+            'account_types': account_types,
+            'markets': markets,
+            'with_all_market_pairs': with_all_market_pairs,
+            'pairs': pairs,
+            'days_running_from': days_running_from,
+            'days_running_to': days_running_to,
+            'deal_start_conditions': deal_start_conditions,
+            'bot_type': bot_type,
+            'bot_strategy': bot_strategy,
+            'cmc': cmc,
+            'sort_by': sort_by,
+            'sort_direction': sort_direction,
+            'page': page,
+            'per_page': per_page,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_items(limit: int = None,
+                    offset: int = None,
+                    scope: str = None,
+                    order: str = None,
+                    locale: str = None):
+    """
+    GET /ver1/marketplace/items
+    All marketplace items (Permission: NONE, Security: NONE)
+
+    :param limit: integer, Limit records. Max: 1_000
+    :param offset: integer, Offset records
+    :param scope: string, values: ['all', 'paid', 'free'], paid - show only paid signal providers. free - show only free signal providers
+    :param order: string, values: ['subscribers', 'name', 'newest']
+    :param locale: string, values: ['en', 'ru', 'zh', 'zh-CN', 'es', 'pt', 'ko', 'fr', 'cs']
+    """
+    error, data = await wrapper.request(
+        entity='marketplace',
+        action='items',
+        payload=without_none_values({
+            'limit': limit,
+            'offset': offset,
+            'scope': scope,
+            'order': order,
+            'locale': locale,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def get_signals_by_id(id,
+                            limit: int = None,
+                            offset: int = None,
+                            order: str = None,
+                            order_direction: str = None,
+                            locale: str = None):
+    """
+    GET /ver1/marketplace/{item_id}/signals
+    Marketplace Item Signals (Permission: NONE, Security: NONE)
+
+    :param limit: integer, Limit records. Max: 1_000
+    :param offset: integer, Offset records
+    :param order: string, values: ['pair', 'exchange', 'signal_type', 'date']
+    :param order_direction: string, values: ['asc', 'desc']
+    :param locale: string, values: ['en', 'ru', 'zh', 'zh-CN', 'es', 'pt', 'ko', 'fr', 'cs']
+    """
+    error, data = await wrapper.request(
+        entity='marketplace',
+        action='signals',
+        action_id=str(id),
+        payload=without_none_values({
+            'limit': limit,
+            'offset': offset,
+            'order': order,
+            'order_direction': order_direction,
+            'locale': locale,
+        }),
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+async def bulk_get_signals(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/marketplace/{item_id}/signals for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return await aio_bulk_by_id(get_signals_by_id, ids, max_concurrency=max_concurrency, **kwargs)
+
+
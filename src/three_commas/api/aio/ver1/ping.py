@@ -0,0 +1,32 @@
+from py3cw.request import Py3CW
+from ....model import *
+from ....error import ThreeCommasApiError
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
+import logging
+from ....sys_utils import logged, Py3cwClosureProxy, without_none_values
+from ....aio_client import with_aio_py3cw
+from ....bulk import aio_bulk_by_id, BulkResult
+from ....pagination import aio_iter_pages, offset_page_params, numbered_page_params
+
+
+logger = logging.getLogger(__name__)
+wrapper = Py3cwClosureProxy()
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def get():
+    """
+    GET /ver1/ping
+    Test connectivity to the Rest API (Permission: NONE, Security: NONE)
+
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
@@ -0,0 +1,703 @@
+from py3cw.request import Py3CW
+from ....model import *
+from ....error import ThreeCommasApiError
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
+import logging
+from ....sys_utils import logged, Py3cwClosureProxy, without_none_values
+from ....aio_client import with_aio_py3cw
+from ....bulk import aio_bulk_by_id, BulkResult
+from ....pagination import aio_iter_pages, offset_page_params, numbered_page_params
+
+
+logger = logging.getLogger(__name__)
+wrapper = Py3cwClosureProxy()
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_create_simple_sell(entity: dict = None,
+                                  account_id: int = None,
+                                  pair: str = None,
+                                  units_to_buy: float = None,
+                                  buy_price: float = None,
+                                  conditional_limit_price: float = None,
+                                  buy_method: str = None):
+    """
+    POST /ver1/smart_trades/create_simple_sell
+    Create SimpleSell (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_id: REQUIRED, integer, id from GET /ver1/accounts
+    :param pair: REQUIRED, string
+    :param units_to_buy: REQUIRED, number, Amount of units to buy
+    :param buy_price: REQUIRED, number
+    :param buy_method: REQUIRED, string, values: ['limit', 'market', 'conditional']
+    :param conditional_limit_price: number, Order price for conditional SimpleSell with limit order
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        payload={**(entity or dict()), **without_none_values({
+            'account_id': account_id,
+            'pair': pair,
+            'units_to_buy': units_to_buy,
+            'buy_price': buy_price,
+            'conditional_limit_price': conditional_limit_price,
+            'buy_method': buy_method,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_create_simple_buy(entity: dict = None,
+                                 account_id: int = None,
+                                 pair: str = None,
+                                 units_to_buy: float = None,
+                                 buy_price: float = None,
+                                 conditional_limit_price: float = None,
+                                 buy_method: str = None):
+    """
+    POST /ver1/smart_trades/create_simple_buy
+    Create SimpleBuy (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_id: REQUIRED, integer, id from GET /ver1/accounts
+    :param pair: REQUIRED, string
+    :param units_to_buy: REQUIRED, number, Amount of units to buy
+    :param buy_price: REQUIRED, number
+    :param buy_method: REQUIRED, string, values: ['limit', 'market', 'conditional']
+    :param conditional_limit_price: number, Order price for conditional SimpleBuy with limit order
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        payload={**(entity or dict()), **without_none_values({
+            'account_id': account_id,
+            'pair': pair,
+            'units_to_buy': units_to_buy,
+            'buy_price': buy_price,
+            'conditional_limit_price': conditional_limit_price,
+            'buy_method': buy_method,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_create_smart_sell(entity: dict = None,
+                                 account_id: int = None,
+                                 pair: str = None,
+                                 units_to_buy: float = None,
+                                 average_buy_price: float = None,
+                                 take_profit_enabled: bool = None,
+                                 take_profit_type: str = None,
+                                 take_profit_price_condition: float = None,
+                                 take_profit_percentage_condition: float = None,
+                                 take_profit_price_method: str = None,
+                                 take_profit_sell_method: str = None,
+                                 take_profit_sell_order_price: float = None,
+                                 trailing_take_profit: bool = None,
+                                 trailing_take_profit_step: float = None,
+                                 stop_loss_enabled: bool = None,
+                                 stop_loss_price_condition: float = None,
+                                 stop_loss_percentage_condition: float = None,
+                                 stop_loss_price_method: str = None,
+                                 stop_loss_sell_method: str = None,
+                                 stop_loss_sell_order_price: float = None,
+                                 trailing_stop_loss: bool = None,
+                                 stop_loss_timeout_enabled: bool = None,
+                                 stop_loss_timeout_seconds: int = None,
+                                 note: str = None):
+    """
+    POST /ver1/smart_trades/create_smart_sell
+    Create SmartSale (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_id: REQUIRED, integer, id from GET /ver1/accounts
+    :param pair: REQUIRED, string
+    :param units_to_buy: REQUIRED, number, Bought amount
+    :param average_buy_price: REQUIRED, number, Bought price
+    :param take_profit_enabled: REQUIRED, boolean
+    :param take_profit_step_orders[percent]: REQUIRED, array, Required if take_profit_step_orders
+    :param take_profit_step_orders[price_method]: REQUIRED, array, Required if take_profit_step_orders
+    :param stop_loss_enabled: REQUIRED, boolean
+    :param take_profit_type: string, values: ['classic', 'step_sell'], Required if take_profit_enabled. classic - common take profit, step_sell - step sell take profit
+    :param take_profit_price_condition: number, Required if take_profit_type = classic
+    :param take_profit_percentage_condition: number, Required if take_profit_type = classic AND trailing_buy_enabled. Must be positive
+    :param take_profit_step_orders[price]: array, Required if take_profit_step_orders
+    :param take_profit_step_orders[price_percentage]: array, Required if take_profit_step_orders AND trailing_buy_enabled. Must be positive
+    :param take_profit_price_method: string, values: ['bid', 'ask', 'last'], Price type for take profit(bid,asl,last)
+    :param take_profit_sell_method: string, values: ['market', 'limit']
+    :param take_profit_sell_order_price: number, Required if limit
+    :param trailing_take_profit: boolean
+    :param trailing_take_profit_step: number, Required if trailing_take_profit
+    :param stop_loss_price_condition: number, Required if stop_loss_enabled
+    :param stop_loss_percentage_condition: number, Required if stop_loss_enabled AND trailing_buy_enabled. Must be negative
+    :param stop_loss_price_method: string, values: ['bid', 'ask', 'last'], Price type for stop loss
+    :param stop_loss_sell_method: string, values: ['market', 'limit']
+    :param stop_loss_sell_order_price: number, Required if limit
+    :param trailing_stop_loss: boolean
+    :param stop_loss_timeout_enabled: boolean
+    :param stop_loss_timeout_seconds: integer, Timeout in seconds
+    :param note: string
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        payload={**(entity or dict()), **without_none_values({
+            'account_id': account_id,
+            'pair': pair,
+            'units_to_buy': units_to_buy,
+            'average_buy_price': average_buy_price,
+            'take_profit_enabled': take_profit_enabled,
+            'take_profit_type': take_profit_type,
+            'take_profit_price_condition': take_profit_price_condition,
+            'take_profit_percentage_condition': take_profit_percentage_condition,
+            'take_profit_price_method': take_profit_price_method,
+            'take_profit_sell_method': take_profit_sell_method,
+            'take_profit_sell_order_price': take_profit_sell_order_price,
+            'trailing_take_profit': trailing_take_profit,
+            'trailing_take_profit_step': trailing_take_profit_step,
+            'stop_loss_enabled': stop_loss_enabled,
+            'stop_loss_price_condition': stop_loss_price_condition,
+            'stop_loss_percentage_condition': stop_loss_percentage_condition,
+            'stop_loss_price_method': stop_loss_price_method,
+            'stop_loss_sell_method': stop_loss_sell_method,
+            'stop_loss_sell_order_price': stop_loss_sell_order_price,
+            'trailing_stop_loss': trailing_stop_loss,
+            'stop_loss_timeout_enabled': stop_loss_timeout_enabled,
+            'stop_loss_timeout_seconds': stop_loss_timeout_seconds,
+            'note': note,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_create_smart_cover(entity: dict = None,
+                                  account_id: int = None,
+                                  pair: str = None,
+                                  units_to_buy: float = None,
+                                  buy_price: float = None,
+                                  conditional_limit_price: float = None,
+                                  buy_method: str = None,
+                                  trailing_buy_enabled: bool = None,
+                                  trailing_buy_step: float = None,
+                                  take_profit_enabled: bool = None,
+                                  take_profit_type: str = None,
+                                  take_profit_price_condition: float = None,
+                                  take_profit_percentage_condition: float = None,
+                                  take_profit_price_method: str = None,
+                                  take_profit_sell_method: str = None,
+                                  take_profit_sell_order_price: float = None,
+                                  trailing_take_profit: bool = None,
+                                  trailing_take_profit_step: float = None,
+                                  stop_loss_enabled: bool = None,
+                                  stop_loss_price_condition: float = None,
+                                  stop_loss_percentage_condition: float = None,
+                                  stop_loss_price_method: str = None,
+                                  stop_loss_sell_method: str = None,
+                                  stop_loss_sell_order_price: float = None,
+                                  trailing_stop_loss: bool = None,
+                                  stop_loss_timeout_enabled: bool = None,
+                                  stop_loss_timeout_seconds: int = None,
+                                  note: str = None):
+    """
+    POST /ver1/smart_trades/create_smart_cover
+    Create SmartCover (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_id: REQUIRED, integer, id from GET /ver1/accounts
+    :param pair: REQUIRED, string
+    :param units_to_buy: REQUIRED, number, Amount of units to buy
+    :param buy_price: REQUIRED, number
+    :param take_profit_enabled: REQUIRED, boolean
+    :param take_profit_step_orders[percent]: REQUIRED, array, Required if take_profit_step_orders
+    :param take_profit_step_orders[price_method]: REQUIRED, array, Required if take_profit_step_orders
+    :param stop_loss_enabled: REQUIRED, boolean
+    :param conditional_limit_price: number, Order price for conditional SmartCover with limit order
+    :param buy_method: string, values: ['limit', 'market', 'conditional']
+    :param trailing_buy_enabled: boolean
+    :param trailing_buy_step: number, Required if trailing_buy_enabled
+    :param take_profit_type: string, values: ['classic', 'step_sell'], Required if take_profit_enabled. classic - common take profit, step_sell - step sell take profit
+    :param take_profit_price_condition: number, Required if take_profit_type = classic
+    :param take_profit_percentage_condition: number, Required if take_profit_type = classic AND trailing_buy_enabled. Must be negative
+    :param take_profit_step_orders[price]: array, Required if take_profit_step_orders
+    :param take_profit_step_orders[price_percentage]: array, Required if take_profit_step_orders AND trailing_buy_enabled. Must be negative
+    :param take_profit_price_method: string, values: ['bid', 'ask', 'last'], Price type for take profit
+    :param take_profit_sell_method: string, values: ['market', 'limit']
+    :param take_profit_sell_order_price: number, Required if limit
+    :param trailing_take_profit: boolean
+    :param trailing_take_profit_step: number, Required if trailing_take_profit
+    :param stop_loss_price_condition: number, Required if stop_loss_enabled
+    :param stop_loss_percentage_condition: number, Required if stop_loss_enabled AND trailing_buy_enabled. Must Be positive
+    :param stop_loss_price_method: string, values: ['bid', 'ask', 'last'], Price type for stop loss
+    :param stop_loss_sell_method: string, values: ['market', 'limit']
+    :param stop_loss_sell_order_price: number, Required if limit
+    :param trailing_stop_loss: boolean
+    :param stop_loss_timeout_enabled: boolean
+    :param stop_loss_timeout_seconds: integer, timeout in seconds
+    :param note: string
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        payload={**(entity or dict()), **without_none_values({
+            'account_id': account_id,
+            'pair': pair,
+            'units_to_buy': units_to_buy,
+            'buy_price': buy_price,
+            'conditional_limit_price': conditional_limit_price,
+            'buy_method': buy_method,
+            'trailing_buy_enabled': trailing_buy_enabled,
+            'trailing_buy_step': trailing_buy_step,
+            'take_profit_enabled': take_profit_enabled,
+            'take_profit_type': take_profit_type,
+            'take_profit_price_condition': take_profit_price_condition,
+            'take_profit_percentage_condition': take_profit_percentage_condition,
+            'take_profit_price_method': take_profit_price_method,
+            'take_profit_sell_method': take_profit_sell_method,
+            'take_profit_sell_order_price': take_profit_sell_order_price,
+            'trailing_take_profit': trailing_take_profit,
+            'trailing_take_profit_step': trailing_take_profit_step,
+            'stop_loss_enabled': stop_loss_enabled,
+            'stop_loss_price_condition': stop_loss_price_condition,
+            'stop_loss_percentage_condition': stop_loss_percentage_condition,
+            'stop_loss_price_method': stop_loss_price_method,
+            'stop_loss_sell_method': stop_loss_sell_method,
+            'stop_loss_sell_order_price': stop_loss_sell_order_price,
+            'trailing_stop_loss': trailing_stop_loss,
+            'stop_loss_timeout_enabled': stop_loss_timeout_enabled,
+            'stop_loss_timeout_seconds': stop_loss_timeout_seconds,
+            'note': note,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_create_smart_trade(entity: dict = None,
+                                  account_id: int = None,
+                                  pair: str = None,
+                                  units_to_buy: float = None,
+                                  buy_price: float = None,
+                                  conditional_limit_price: float = None,
+                                  buy_method: str = None,
+                                  trailing_buy_enabled: bool = None,
+                                  trailing_buy_step: float = None,
+                                  take_profit_enabled: bool = None,
+                                  take_profit_type: str = None,
+                                  take_profit_price_condition: float = None,
+                                  take_profit_percentage_condition: float = None,
+                                  take_profit_price_method: str = None,
+                                  take_profit_sell_method: str = None,
+                                  take_profit_sell_order_price: float = None,
+                                  trailing_take_profit: bool = None,
+                                  trailing_take_profit_step: float = None,
+                                  stop_loss_enabled: bool = None,
+                                  stop_loss_price_condition: float = None,
+                                  stop_loss_percentage_condition: float = None,
+                                  stop_loss_price_method: str = None,
+                                  stop_loss_sell_method: str = None,
+                                  stop_loss_sell_order_price: float = None,
+                                  trailing_stop_loss: bool = None,
+                                  stop_loss_timeout_enabled: bool = None,
+                                  stop_loss_timeout_seconds: int = None,
+                                  note: str = None):
+    """
+    POST /ver1/smart_trades/create_smart_trade
+    Create SmartTrade (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_id: REQUIRED, integer, id from GET /ver1/accounts
+    :param pair: REQUIRED, string
+    :param units_to_buy: REQUIRED, number, Amount of units to buy
+    :param buy_price: REQUIRED, number
+    :param take_profit_enabled: REQUIRED, boolean
+    :param take_profit_step_orders[percent]: REQUIRED, array, Required if take_profit_step_orders
+    :param take_profit_step_orders[price_method]: REQUIRED, array, Required if take_profit_step_orders
+    :param stop_loss_enabled: REQUIRED, boolean
+    :param conditional_limit_price: number, Order price for conditional SmartTrade with limit order
+    :param buy_method: string, values: ['limit', 'market', 'conditional']
+    :param trailing_buy_enabled: boolean
+    :param trailing_buy_step: number, Required if trailing_buy_enabled
+    :param take_profit_type: string, values: ['classic', 'step_sell'], Required if take_profit_enabled. classic - common take profit, step_sell - step sell take profit
+    :param take_profit_price_condition: number, Required if take_profit_type = classic
+    :param take_profit_percentage_condition: number, Required if take_profit_type = classic AND trailing_buy_enabled. Must be positive
+    :param take_profit_step_orders[price]: array, Required if take_profit_step_orders
+    :param take_profit_step_orders[price_percentage]: array, Required if take_profit_step_orders AND trailing_buy_enabled. Must be positive
+    :param take_profit_price_method: string, values: ['bid', 'ask', 'last'], Price type for take profit
+    :param take_profit_sell_method: string, values: ['market', 'limit']
+    :param take_profit_sell_order_price: number, Required if limit
+    :param trailing_take_profit: boolean
+    :param trailing_take_profit_step: number, Required if trailing_take_profit
+    :param stop_loss_price_condition: number, Required if stop_loss_enabled
+    :param stop_loss_percentage_condition: number, Required if stop_loss_enabled AND trailing_buy_enabled. Must be negative
+    :param stop_loss_price_method: string, values: ['bid', 'ask', 'last'], Price type for stop loss
+    :param stop_loss_sell_method: string, values: ['market', 'limit']
+    :param stop_loss_sell_order_price: number, Required if limit
+    :param trailing_stop_loss: boolean
+    :param stop_loss_timeout_enabled: boolean
+    :param stop_loss_timeout_seconds: integer, timeout in seconds
+    :param note: string
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        payload={**(entity or dict()), **without_none_values({
+            'account_id': account_id,
+            'pair': pair,
+            'units_to_buy': units_to_buy,
+            'buy_price': buy_price,
+            'conditional_limit_price': conditional_limit_price,
+            'buy_method': buy_method,
+            'trailing_buy_enabled': trailing_buy_enabled,
+            'trailing_buy_step': trailing_buy_step,
+            'take_profit_enabled': take_profit_enabled,
+            'take_profit_type': take_profit_type,
+            'take_profit_price_condition': take_profit_price_condition,
+            'take_profit_percentage_condition': take_profit_percentage_condition,
+            'take_profit_price_method': take_profit_price_method,
+            'take_profit_sell_method': take_profit_sell_method,
+            'take_profit_sell_order_price': take_profit_sell_order_price,
+            'trailing_take_profit': trailing_take_profit,
+            'trailing_take_profit_step': trailing_take_profit_step,
+            'stop_loss_enabled': stop_loss_enabled,
+            'stop_loss_price_condition': stop_loss_price_condition,
+            'stop_loss_percentage_condition': stop_loss_percentage_condition,
+            'stop_loss_price_method': stop_loss_price_method,
+            'stop_loss_sell_method': stop_loss_sell_method,
+            'stop_loss_sell_order_price': stop_loss_sell_order_price,
+            'trailing_stop_loss': trailing_stop_loss,
+            'stop_loss_timeout_enabled': stop_loss_timeout_enabled,
+            'stop_loss_timeout_seconds': stop_loss_timeout_seconds,
+            'note': note,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def get(entity: dict = None,
+              limit: int = None,
+              offset: int = None,
+              account_id: int = None,
+              scope: str = None,
+              type: str = None,
+              order: str = None,
+              pairs: list = None):
+    """
+    GET /ver1/smart_trades
+    Get SmartTrade history (Permission: SMART_TRADE_READ, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param limit: integer, Limit records
+    :param offset: integer, Offset records
+    :param account_id: integer, Account to show smart_trades on. Pass null (default) - show all
+    :param scope: string, active - show only active trades, finished - history of closed trades, cancelled - cancelled trades, failed - failed trades, any other value or null (default) - all trades
+    :param type: string, SmartTrade::SmartSale , SmartTrade::Classic , SmartTrade::ConditionalBuy
+    :param order: string, values: ['created_at', 'closed_at', 'updated_at']
+    :param pairs: array, Array of pairs
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        payload={**(entity or dict()), **without_none_values({
+            'limit': limit,
+            'offset': offset,
+            'account_id': account_id,
+            'scope': scope,
+            'type': type,
+            'order': order,
+            'pairs': pairs,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_cancel_order_by_id(id,
+                                  entity: dict = None,
+                                  step_id: str = None):
+    """
+    POST /ver1/smart_trades/{smart_trade_id}/cancel_order
+    Manual cancel order (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param step_id: REQUIRED, string, SmartTrade step id to cancel
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'step_id': step_id,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_add_funds_by_id(id,
+                               entity: dict = None,
+                               quantity: float = None,
+                               is_market: bool = None,
+                               response_type: str = None,
+                               rate: float = None):
+    """
+    POST /ver1/smart_trades/{smart_trade_id}/add_funds
+    Smart Trade add funds (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param quantity: REQUIRED, number, buy order quantity
+    :param is_market: REQUIRED, boolean, true - use MARKET order, false - use LIMIT order
+    :param rate: REQUIRED, number, buy order rate. Required if LIMIT order used
+    :param response_type: string, values: ['smart_trade', 'empty', 'order', 'step']
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'quantity': quantity,
+            'is_market': is_market,
+            'response_type': response_type,
+            'rate': rate,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_step_panic_sell_by_id(id,
+                                     entity: dict = None,
+                                     step_id: int = None):
+    """
+    POST /ver1/smart_trades/{smart_trade_id}/step_panic_sell
+    Step panic sell (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param step_id: REQUIRED, integer
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'step_id': step_id,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def patch_update_by_id(id,
+                             entity: dict = None,
+                             buy_price: float = None,
+                             conditional_limit_price: float = None,
+                             average_buy_price: float = None,
+                             trailing_buy_enabled: bool = None,
+                             trailing_buy_step: float = None,
+                             take_profit_enabled: bool = None,
+                             take_profit_type: str = None,
+                             take_profit_price_condition: float = None,
+                             take_profit_percentage_condition: float = None,
+                             take_profit_price_method: str = None,
+                             take_profit_sell_method: str = None,
+                             take_profit_sell_order_price: float = None,
+                             trailing_take_profit: bool = None,
+                             trailing_take_profit_step: float = None,
+                             stop_loss_enabled: bool = None,
+                             stop_loss_price_condition: float = None,
+                             stop_loss_percentage_condition: float = None,
+                             stop_loss_price_method: str = None,
+                             stop_loss_sell_method: str = None,
+                             stop_loss_sell_order_price: float = None,
+                             trailing_stop_loss: bool = None,
+                             stop_loss_timeout_enabled: bool = None,
+                             stop_loss_timeout_seconds: int = None,
+                             note: str = None):
+    """
+    PATCH /ver1/smart_trades/{smart_trade_id}/update
+    Edit SmartTrade/SmartSale/SmartCover (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param take_profit_enabled: REQUIRED, boolean
+    :param take_profit_step_orders[percent]: REQUIRED, array, Required if take_profit_step_orders
+    :param take_profit_step_orders[position]: REQUIRED, array, Required if take_profit_step_orders
+    :param take_profit_step_orders[price_method]: REQUIRED, array, Required if take_profit_step_orders
+    :param stop_loss_enabled: REQUIRED, boolean
+    :param buy_price: number, Available if Conditional SmartTrade
+    :param conditional_limit_price: number
+    :param average_buy_price: number, Available if SmartSale
+    :param trailing_buy_enabled: boolean, Available if Conditional SmartTrade
+    :param trailing_buy_step: number, Available if trailing_buy_enabled
+    :param take_profit_type: string, values: ['classic', 'step_sell'], Required if take_profit_enabled. classic - common take profit, step_sell - step sell take profit
+    :param take_profit_price_condition: number, Required if take_profit_type = classic
+    :param take_profit_percentage_condition: number, Required if take_profit_type = classic AND trailing_buy_enabled
+    :param take_profit_step_orders[price]: array, Required if take_profit_step_orders
+    :param take_profit_step_orders[price_percentage]: array, Required if take_profit_step_orders AND trailing_buy_enabled
+    :param take_profit_price_method: string, values: ['bid', 'ask', 'last'], Price type for take profit(bid,asl,last)
+    :param take_profit_sell_method: string, values: ['market', 'limit']
+    :param take_profit_sell_order_price: number, Required if limit
+    :param trailing_take_profit: boolean
+    :param trailing_take_profit_step: number, Required if trailing_take_profit
+    :param stop_loss_price_condition: number, Required if stop_loss_enabled
+    :param stop_loss_percentage_condition: number, Required if stop_loss_enabled AND trailing_buy_enabled
+    :param stop_loss_price_method: string, values: ['bid', 'ask', 'last'], Price type for stop loss
+    :param stop_loss_sell_method: string, values: ['market', 'limit']
+    :param stop_loss_sell_order_price: number, Required if limit
+    :param trailing_stop_loss: boolean
+    :param stop_loss_timeout_enabled: boolean
+    :param stop_loss_timeout_seconds: integer, Timeout in seconds
+    :param note: string
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'buy_price': buy_price,
+            'conditional_limit_price': conditional_limit_price,
+            'average_buy_price': average_buy_price,
+            'trailing_buy_enabled': trailing_buy_enabled,
+            'trailing_buy_step': trailing_buy_step,
+            'take_profit_enabled': take_profit_enabled,
+            'take_profit_type': take_profit_type,
+            'take_profit_price_condition': take_profit_price_condition,
+            'take_profit_percentage_condition': take_profit_percentage_condition,
+            'take_profit_price_method': take_profit_price_method,
+            'take_profit_sell_method': take_profit_sell_method,
+            'take_profit_sell_order_price': take_profit_sell_order_price,
+            'trailing_take_profit': trailing_take_profit,
+            'trailing_take_profit_step': trailing_take_profit_step,
+            'stop_loss_enabled': stop_loss_enabled,
+            'stop_loss_price_condition': stop_loss_price_condition,
+            'stop_loss_percentage_condition': stop_loss_percentage_condition,
+            'stop_loss_price_method': stop_loss_price_method,
+            'stop_loss_sell_method': stop_loss_sell_method,
+            'stop_loss_sell_order_price': stop_loss_sell_order_price,
+            'trailing_stop_loss': trailing_stop_loss,
+            'stop_loss_timeout_enabled': stop_loss_timeout_enabled,
+            'stop_loss_timeout_seconds': stop_loss_timeout_seconds,
+            'note': note,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_cancel_by_id(id):
+    """
+    POST /ver1/smart_trades/{smart_trade_id}/cancel
+    Cancel SmartTrade (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_panic_sell_by_id(id):
+    """
+    POST /ver1/smart_trades/{smart_trade_id}/panic_sell
+    Sell currency immediately (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_force_start_by_id(id):
+    """
+    POST /ver1/smart_trades/{smart_trade_id}/force_start
+    Process BuyStep immediately  (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def post_force_process_by_id(id):
+    """
+    POST /ver1/smart_trades/{smart_trade_id}/force_process
+    Refresh SmartTrade state (Permission: SMART_TRADE_WRITE, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
+''' This endpoint was not present in the py3cw module
+@logged
+@with_aio_py3cw
+async def get_show_by_id(id):
+    error, data = await wrapper.request(
+        entity='<py3cw_entity>',
+        action='<py3cw_action>',
+        action_id=str(id),
+    )
+    return ThreeCommasApiError(error), data
+'''
+
+
@@ -0,0 +1,51 @@
+from py3cw.request import Py3CW
+from ....model import *
+from ....error import ThreeCommasApiError
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
+import logging
+from ....sys_utils import logged, Py3cwClosureProxy, without_none_values
+from ....aio_client import with_aio_py3cw
+from ....bulk import aio_bulk_by_id, BulkResult
+from ....pagination import aio_iter_pages, offset_page_params, numbered_page_params
+
+
+logger = logging.getLogger(__name__)
+wrapper = Py3cwClosureProxy()
+
+
+@logged
+@with_aio_py3cw
+async def get_current_mode():
+    """
+    GET /ver1/users/current_mode
+    Current User Mode (Paper or Real) (Permission: ACCOUNTS_READ, Security: SIGNED)
+
+    """
+    error, data = await wrapper.request(
+        entity='users',
+        action='current_mode',
+    )
+    return ThreeCommasApiError(error), data
+
+
+@logged
+@with_aio_py3cw
+async def post_change_mode(entity: dict = None,
+                           mode: str = None):
+    """
+    POST /ver1/users/change_mode
+    Change User Mode (Paper or Real) (Permission: ACCOUNTS_WRITE, Security: SIGNED)
+
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param mode: REQUIRED, string, values: ['paper', 'real']
+    """
+    error, data = await wrapper.request(
+        entity='users',
+        action='change_mode',
+        payload={**(entity or dict()), **without_none_values({
+            'mode': mode,
+        })},
+    )
+    return ThreeCommasApiError(error), data
+
+
@@ -1 +1,7 @@
-from . import accounts, bots, deals, grid_bots, marketplace, users
+from typing import TYPE_CHECKING
+from ...lazy_imports import lazy_submodules
+
+if TYPE_CHECKING:
+    from . import accounts, bots, deals, grid_bots, marketplace, users
+
+__getattr__, __dir__ = lazy_submodules(__name__, ['accounts', 'bots', 'deals', 'grid_bots', 'marketplace', 'users'])
@@ -1,71 +1,167 @@
 from py3cw.request import Py3CW
 from ...model import *
 from ...error import ThreeCommasApiError
-from typing import Tuple, List
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
 import logging
-from ...sys_utils import logged, with_py3cw, Py3cwClosure
+from ...sys_utils import logged, with_py3cw, Py3cwClosureProxy, without_none_values
+from ...bulk import bulk_by_id, BulkResult
+from ...pagination import iter_pages, offset_page_params, numbered_page_params
 
 
 logger = logging.getLogger(__name__)
-wrapper: Py3cwClosure = None
+wrapper = Py3cwClosureProxy()
 
 
 @logged
 @with_py3cw
-def post_ai():
+def post_ai(entity: dict = None,
+            name: str = None,
+            account_id: int = None,
+            pair: str = None,
+            total_quantity: float = None,
+            leverage_type: str = None,
+            leverage_custom_value: float = None):
     """
     POST /ver1/grid_bots/ai
     Create AI Grid Bot (Permission: BOTS_WRITE, Security: SIGNED)
 
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_id: REQUIRED, integer, id from GET /ver1/accounts
+    :param pair: REQUIRED, string
+    :param total_quantity: REQUIRED, number
+    :param name: string, Grid Bot's name
+    :param leverage_type: string, values: ['custom', 'cross', 'not_specified', 'isolated'], Leverage type for futures accounts
+    :param leverage_custom_value: number, Required if leverage_type = 'isolated'
     """
     error, data = wrapper.request(
         entity='grid_bots',
         action='ai',
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+            'account_id': account_id,
+            'pair': pair,
+            'total_quantity': total_quantity,
+            'leverage_type': leverage_type,
+            'leverage_custom_value': leverage_custom_value,
+        })},
     )
     return ThreeCommasApiError(error), data
 
 
 @logged
 @with_py3cw
-def post_manual():
+def post_manual(entity: dict = None,
+                name: str = None,
+                account_id: int = None,
+                pair: str = None,
+                upper_price: float = None,
+                lower_price: float = None,
+                quantity_per_grid: float = None,
+                grids_quantity: float = None,
+                leverage_type: str = None,
+                leverage_custom_value: float = None,
+                is_enabled: bool = None):
     """
     POST /ver1/grid_bots/manual
     Create Grid Bot (Permission: BOTS_WRITE, Security: SIGNED)
 
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_id: REQUIRED, integer, id from GET /ver1/accounts
+    :param pair: REQUIRED, string
+    :param upper_price: REQUIRED, number
+    :param lower_price: REQUIRED, number
+    :param quantity_per_grid: REQUIRED, number
+    :param grids_quantity: REQUIRED, number
+    :param name: string, Grid Bot's name
+    :param leverage_type: string, values: ['custom', 'cross', 'not_specified', 'isolated'], Leverage type for futures accounts
+    :param leverage_custom_value: number, Required if leverage_type = 'isolated'
+    :param is_enabled: boolean, Turn on or off grid_bot after creation
     """
     error, data = wrapper.request(
         entity='grid_bots',
         action='manual',
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+            'account_id': account_id,
+            'pair': pair,
+            'upper_price': upper_price,
+            'lower_price': lower_price,
+            'quantity_per_grid': quantity_per_grid,
+            'grids_quantity': grids_quantity,
+            'leverage_type': leverage_type,
+            'leverage_custom_value': leverage_custom_value,
+            'is_enabled': is_enabled,
+        })},
     )
     return ThreeCommasApiError(error), data
 
 
 @logged
 @with_py3cw
-def get_ai_settings():
+def get_ai_settings(pair: str = None,
+                    market_code: str = None):
     """
     GET /ver1/grid_bots/ai_settings
     Get AI settings (Permission: BOTS_READ, Security: SIGNED)
 
+    :param pair: REQUIRED, string
+    :param market_code: REQUIRED, string, Market code from /accounts/market_list
     """
     error, data = wrapper.request(
         entity='grid_bots',
         action='ai_settings',
+        payload=without_none_values({
+            'pair': pair,
+            'market_code': market_code,
+        }),
     )
     return ThreeCommasApiError(error), data
 
 
 @logged
 @with_py3cw
-def get():
+def get(entity: dict = None,
+        account_ids: list = None,
+        account_types: list = None,
+        state: str = None,
+        sort_by: str = None,
+        sort_direction: str = None,
+        limit: int = None,
+        offset: int = None,
+        from_: str = None,
+        base: str = None,
+        quote: str = None):
     """
     GET /ver1/grid_bots
     Grid bots list (Permission: BOTS_READ, Security: SIGNED)
 
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param account_ids: array, Filter by account id
+    :param account_types: array, Filter by account type
+    :param state: string, values: ['enabled', 'disabled'], Filter by bot state
+    :param sort_by: string, values: ['current_profit', 'profit', 'bot_id', 'pair', 'created_at', 'updated_at'], Sort column
+    :param sort_direction: string, values: ['desc', 'asc'], Sort direction
+    :param limit: integer
+    :param offset: integer
+    :param from_: string, Param for a filter by created date
+    :param base: string, Base currency
+    :param quote: string, Quote currency
     """
     error, data = wrapper.request(
         entity='grid_bots',
         action='',
+        payload={**(entity or dict()), **without_none_values({
+            'account_ids': account_ids,
+            'account_types': account_types,
+            'state': state,
+            'sort_by': sort_by,
+            'sort_direction': sort_direction,
+            'limit': limit,
+            'offset': offset,
+            'from': from_,
+            'base': base,
+            'quote': quote,
+        })},
     )
     return ThreeCommasApiError(error), data
 
@@ -86,6 +182,15 @@ def get_market_orders_by_id(id):
     return ThreeCommasApiError(error), data
 
 
+@logged
+def bulk_get_market_orders(ids: Iterable, max_workers: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/grid_bots/{id}/market_orders for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return bulk_by_id(get_market_orders_by_id, ids, max_workers=max_workers, **kwargs)
+
+
 @logged
 @with_py3cw
 def get_profits_by_id(id):
@@ -102,34 +207,90 @@ def get_profits_by_id(id):
     return ThreeCommasApiError(error), data
 
 
+@logged
+def bulk_get_profits(ids: Iterable, max_workers: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/grid_bots/{id}/profits for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return bulk_by_id(get_profits_by_id, ids, max_workers=max_workers, **kwargs)
+
+
 @logged
 @with_py3cw
-def patch_ai_by_id(id):
+def patch_ai_by_id(id,
+                   entity: dict = None,
+                   name: str = None,
+                   pair: str = None,
+                   total_quantity: float = None,
+                   leverage_type: str = None,
+                   leverage_custom_value: float = None):
     """
     PATCH /ver1/grid_bots/{id}/ai
     Edit Grid Bot (AI) (Permission: BOTS_WRITE, Security: SIGNED)
 
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param pair: REQUIRED, string
+    :param total_quantity: REQUIRED, number
+    :param name: string, Grid Bot's name
+    :param leverage_type: string, values: ['custom', 'cross', 'not_specified', 'isolated'], Leverage type for futures accounts
+    :param leverage_custom_value: number, Required if leverage_type = 'isolated'
     """
     error, data = wrapper.request(
         entity='grid_bots',
         action='ai_update',
         action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+            'pair': pair,
+            'total_quantity': total_quantity,
+            'leverage_type': leverage_type,
+            'leverage_custom_value': leverage_custom_value,
+        })},
     )
     return ThreeCommasApiError(error), data
 
 
 @logged
 @with_py3cw
-def patch_manual_by_id(id):
+def patch_manual_by_id(id,
+                       entity: dict = None,
+                       name: str = None,
+                       pair: str = None,
+                       upper_price: float = None,
+                       lower_price: float = None,
+                       quantity_per_grid: float = None,
+                       grids_quantity: float = None,
+                       leverage_type: str = None,
+                       leverage_custom_value: float = None):
     """
     PATCH /ver1/grid_bots/{id}/manual
     Edit Grid Bot (Manual) (Permission: BOTS_WRITE, Security: SIGNED)
 
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param pair: REQUIRED, string
+    :param upper_price: REQUIRED, number
+    :param lower_price: REQUIRED, number
+    :param quantity_per_grid: REQUIRED, number
+    :param grids_quantity: REQUIRED, number
+    :param name: string, Grid Bot's name
+    :param leverage_type: string, values: ['custom', 'cross', 'not_specified', 'isolated'], Leverage type for futures accounts
+    :param leverage_custom_value: number, Required if leverage_type = 'isolated'
     """
     error, data = wrapper.request(
         entity='grid_bots',
         action='manual_update',
         action_id=str(id),
+        payload={**(entity or dict()), **without_none_values({
+            'name': name,
+            'pair': pair,
+            'upper_price': upper_price,
+            'lower_price': lower_price,
+            'quantity_per_grid': quantity_per_grid,
+            'grids_quantity': grids_quantity,
+            'leverage_type': leverage_type,
+            'leverage_custom_value': leverage_custom_value,
+        })},
     )
     return ThreeCommasApiError(error), data
 
@@ -150,6 +311,15 @@ def get_by_id(id):
     return ThreeCommasApiError(error), data
 
 
+@logged
+def bulk_get(ids: Iterable, max_workers: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/grid_bots/{id} for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return bulk_by_id(get_by_id, ids, max_workers=max_workers, **kwargs)
+
+
 @logged
 @with_py3cw
 def delete_by_id(id):
@@ -214,3 +384,12 @@ def get_required_balances_by_id(id):
     return ThreeCommasApiError(error), data
 
 
+@logged
+def bulk_get_required_balances(ids: Iterable, max_workers: int = None, **kwargs) -> BulkResult:
+    """
+    GET /ver1/grid_bots/{id}/required_balances for every id in parallel
+    :return: the result or the ThreeCommasApiError for every id, in the order of the ids
+    """
+    return bulk_by_id(get_required_balances_by_id, ids, max_workers=max_workers, **kwargs)
+
+
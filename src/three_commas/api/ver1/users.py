@@ -1,13 +1,15 @@
 from py3cw.request import Py3CW
 from ...model import *
 from ...error import ThreeCommasApiError
-from typing import Tuple, List
+from typing import Tuple, List, Iterable, Iterator, AsyncIterator
 import logging
-from ...sys_utils import logged, with_py3cw, Py3cwClosure
+from ...sys_utils import logged, with_py3cw, Py3cwClosureProxy, without_none_values
+from ...bulk import bulk_by_id, BulkResult
+from ...pagination import iter_pages, offset_page_params, numbered_page_params
 
 
 logger = logging.getLogger(__name__)
-wrapper: Py3cwClosure = None
+wrapper = Py3cwClosureProxy()
 
 
 @logged
@@ -27,15 +29,21 @@ def get_current_mode():
 
 @logged
 @with_py3cw
-def post_change_mode():
+def post_change_mode(entity: dict = None,
+                     mode: str = None):
     """
     POST /ver1/users/change_mode
     Change User Mode (Paper or Real) (Permission: ACCOUNTS_WRITE, Security: SIGNED)
 
+    :param entity: the body. Pass the parameters below without a keyword argument in it
+    :param mode: REQUIRED, string, values: ['paper', 'real']
     """
     error, data = wrapper.request(
         entity='users',
         action='change_mode',
+        payload={**(entity or dict()), **without_none_values({
+            'mode': mode,
+        })},
     )
     return ThreeCommasApiError(error), data
 
@@ -0,0 +1,110 @@
+import asyncio
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, List
+from . import configuration
+from .error import ThreeCommasApiError
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkStats:
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    min_call_seconds: float = 0.0
+    max_call_seconds: float = 0.0
+    mean_call_seconds: float = 0.0
+
+    @staticmethod
+    def of(call_durations: List[float], errors: int, total_seconds: float) -> 'BulkStats':
+        if not call_durations:
+            return BulkStats(total_seconds=total_seconds)
+        return BulkStats(calls=len(call_durations),
+                         errors=errors,
+                         total_seconds=total_seconds,
+                         min_call_seconds=min(call_durations),
+                         max_call_seconds=max(call_durations),
+                         mean_call_seconds=sum(call_durations) / len(call_durations))
+
+
+class BulkResult(dict):
+    """
+    The result or the ThreeCommasApiError for every id, in the order of the requested ids
+    """
+    def __init__(self, *args, stats: BulkStats = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = stats or BulkStats()
+
+    def errors(self) -> dict:
+        return {k: v for k, v in self.items() if isinstance(v, ThreeCommasApiError)}
+
+    def successes(self) -> dict:
+        return {k: v for k, v in self.items() if not isinstance(v, ThreeCommasApiError)}
+
+
+def _to_result(error, data):
+    return error if error else data
+
+
+def _exception_to_error(e: Exception) -> ThreeCommasApiError:
+    logger.debug(f'Call of a bulk request raised {e!r}')
+    return ThreeCommasApiError({'error': True, 'msg': f'Other error occurred: {e!r}', 'status_code': None})
+
+
+def _create_bulk_result(ids: list, results: list, durations: List[float], total_seconds: float) -> BulkResult:
+    errors = sum(1 for r in results if isinstance(r, ThreeCommasApiError))
+    return BulkResult(zip(ids, results), stats=BulkStats.of(durations, errors=errors, total_seconds=total_seconds))
+
+
+def bulk_by_id(function: Callable, ids: Iterable, max_workers: int = None, **kwargs) -> BulkResult:
+    """
+    Calls function(id, **kwargs) for every id in parallel threads.
+    A failing call does not abort the others, its ThreeCommasApiError is returned for its id instead.
+    :param function: an api function taking the id as first argument
+    :param max_workers: maximum calls in flight at the same time
+    """
+    ids = list(dict.fromkeys(ids))
+    max_workers = max_workers or configuration.THREE_COMMAS_BULK_MAX_WORKERS
+    durations = [0.0] * len(ids)
+
+    def call(index: int):
+        start = time.perf_counter()
+        try:
+            return _to_result(*function(ids[index], **kwargs))
+        except Exception as e:
+            return _exception_to_error(e)
+        finally:
+            durations[index] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ids)))) as executor:
+        results = list(executor.map(call, range(len(ids))))
+    return _create_bulk_result(ids, results, durations, time.perf_counter() - start)
+
+
+async def aio_bulk_by_id(function: Callable, ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:
+    """
+    Asyncio counterpart of bulk_by_id for the coroutines of api.aio
+    """
+    ids = list(dict.fromkeys(ids))
+    semaphore = asyncio.Semaphore(max_concurrency or configuration.THREE_COMMAS_BULK_MAX_WORKERS)
+    durations = [0.0] * len(ids)
+
+    async def call(index: int):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                return _to_result(*await function(ids[index], **kwargs))
+            except Exception as e:
+                return _exception_to_error(e)
+            finally:
+                durations[index] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*[call(i) for i in range(len(ids))])
+    return _create_bulk_result(ids, results, durations, time.perf_counter() - start)
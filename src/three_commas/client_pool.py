@@ -0,0 +1,237 @@
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import Tuple
+import json
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import HTTPError
+from urllib3.util.retry import Retry
+from py3cw.request import Py3CW
+from py3cw.config import API_URL, API_VERSION_V1, API_VERSION_V2, API_VERSION_V2_ENTITIES
+from . import configuration, codec
+from .rest import to_response
+from .retry import remember_retry_after
+from .metrics import remember_response_size
+
+
+logger = logging.getLogger(__name__)
+PY3CW_RETRY_OPTIONS = {'nr_of_retries', 'retry_status_codes', 'retry_backoff_factor'}
+
+
+class ApiUrlSession(requests.Session):
+    """
+    Session that sends the requests py3cw builds for the 3commas api url to another base url.
+    Used to point the client to a local server.
+    """
+    def __init__(self, api_url: str):
+        super().__init__()
+        self.api_url = api_url.rstrip('/')
+
+    def request(self, method, url, *args, **kwargs):
+        if url.startswith(API_URL):
+            url = self.api_url + url[len(API_URL):]
+        return super().request(method, url, *args, **kwargs)
+
+
+class PooledPy3cw(Py3CW):
+    """
+    Py3CW that decodes the responses with the configured json codec instead of the stdlib json.
+    The requests are still verified, signed and sent by py3cw, only its private __make_request is replaced
+    by the same code with another decoding
+    """
+    def _Py3CW__make_request(self, http_method: str, path: str, params: any, payload: any, additional_headers: dict,
+                             retry_count=0):
+        entity = path.split('/')[0]
+        if entity in API_VERSION_V2_ENTITIES:
+            path = path.replace('_v2', '')
+            relative_url = f'{API_VERSION_V2}{path}'
+        else:
+            relative_url = f'{API_VERSION_V1}{path}'
+        if params is not None and len(params) > 0:
+            relative_url = relative_url + f'?{params}'
+        if http_method == 'GET' or (payload is not None and len(payload) == 0):
+            payload = None
+
+        signature = self._Py3CW__generate_signature(relative_url, (json.dumps(payload) if payload is not None else ''))
+
+        response = None
+        response_json = None
+        try:
+            response = self.session.request(method=http_method,
+                                            url=f'{API_URL}{relative_url}',
+                                            headers={'APIKEY': self.key, 'Signature': signature, **additional_headers},
+                                            json=payload,
+                                            timeout=(self.request_timeout, self.request_timeout))
+            response_json = codec.loads(response.content)
+
+            if type(response_json) is dict and 'error' in response_json:
+                error_status_code = response_json.get('error').get('status_code')
+                if error_status_code and error_status_code in self.request_retry_status_codes \
+                        and retry_count < self.request_retries_count:
+                    return self._Py3CW__make_request(http_method=http_method,
+                                                     path=path,
+                                                     params=params,
+                                                     payload=payload,
+                                                     additional_headers=additional_headers,
+                                                     retry_count=retry_count + 1)
+                response_json['status_code'] = error_status_code
+                return response_json, {}
+            return {}, response_json
+
+        except HTTPError as http_err:
+            return {'error': True,
+                    'msg': 'HTTP error occurred: {0}'.format(http_err),
+                    'status_code': http_err.response.status_code if http_err.response else None}, {}
+
+        except Exception as generic_exc:
+            status_code = response.status_code if response is not None else None
+            if response_json is None:
+                return {'error': True,
+                        'msg': 'Other error occurred: {}'.format(generic_exc.args[0] if generic_exc.args else generic_exc),
+                        'status_code': status_code}, {}
+            # the error of 3commas is a str, so response_json.get('error').get fails and ends here, like in py3cw
+            return to_response(response_json, status_code)
+
+
+def create_py3cw(api_key: str, api_secret: str, request_options: dict = None, pool_size: int = None) -> Py3CW:
+    """
+    Creates a PooledPy3cw client whose session keeps up to pool_size connections alive
+    """
+    request_options = request_options or dict()
+    pool_size = pool_size or configuration.THREE_COMMAS_POOL_SIZE
+    py3cw = PooledPy3cw(key=api_key, secret=api_secret, request_options=request_options)
+
+    if configuration.THREE_COMMAS_API_URL:
+        py3cw.session.close()
+        py3cw.session = ApiUrlSession(api_url=configuration.THREE_COMMAS_API_URL)
+
+    # same retries py3cw mounts, but with a sized connection pool.
+    # The retry policy retries the error statuses, unless the py3cw retries were configured explicitly
+    status_forcelist = py3cw.request_retry_status_codes
+    respect_retry_after_header = True
+    if configuration.THREE_COMMAS_RETRY and not PY3CW_RETRY_OPTIONS.intersection(request_options):
+        # urllib3 would still retry the 413, 429 and 503 responses that have a Retry-After header
+        status_forcelist = []
+        respect_retry_after_header = False
+    retries = Retry(
+        total=py3cw.request_retries_count,
+        backoff_factor=py3cw.request_retry_backoff_factor,
+        status_forcelist=status_forcelist,
+        respect_retry_after_header=respect_retry_after_header
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+    py3cw.session.mount('https://', adapter)
+    py3cw.session.mount('http://', adapter)
+    py3cw.session.hooks['response'].extend([remember_retry_after, remember_response_size])
+    return py3cw
+
+
+class _PooledClient:
+    def __init__(self, py3cw, last_used: float):
+        self.py3cw = py3cw
+        self.last_used = last_used
+
+
+def pop_idle_clients(clients: OrderedDict, idle_timeout: float, now: float) -> list:
+    """
+    Removes the _PooledClients not used for idle_timeout seconds from clients, ordered by last usage
+    :return: the removed clients
+    """
+    # the clients are ordered by last usage, so the idle ones are at the beginning
+    evicted = list()
+    while clients:
+        key, pooled_client = next(iter(clients.items()))
+        if now - pooled_client.last_used < idle_timeout:
+            break
+        evicted.append(clients.pop(key))
+    return evicted
+
+
+class ClientPool:
+    """
+    Registry of Py3CW clients keyed by (api_key, api_secret, request_options).
+    Reusing the client reuses its http session, so the keep-alive connections are not
+    established again for every request.
+    Clients that were not used for idle_timeout seconds are evicted, and at most max_clients are kept.
+    """
+    def __init__(self,
+                 pool_size: int = None,
+                 max_clients: int = None,
+                 idle_timeout: float = None):
+        self.pool_size = pool_size or configuration.THREE_COMMAS_POOL_SIZE
+        self.max_clients = max_clients or configuration.THREE_COMMAS_POOL_MAX_CLIENTS
+        self.idle_timeout = idle_timeout if idle_timeout is not None else configuration.THREE_COMMAS_POOL_IDLE_TIMEOUT
+        self._clients: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, pool_size: int = None, max_clients: int = None, idle_timeout: float = None):
+        """
+        Changes the pool settings. A new pool_size only applies to clients created afterwards
+        """
+        with self._lock:
+            if pool_size is not None:
+                self.pool_size = pool_size
+            if max_clients is not None:
+                self.max_clients = max_clients
+            if idle_timeout is not None:
+                self.idle_timeout = idle_timeout
+
+    @staticmethod
+    def _get_key(api_key: str, api_secret: str, request_options: dict = None) -> Tuple:
+        options = tuple(sorted((k, repr(v)) for k, v in (request_options or dict()).items()))
+        return api_key, api_secret, options
+
+    def get(self, api_key: str, api_secret: str, request_options: dict = None) -> Py3CW:
+        key = self._get_key(api_key, api_secret, request_options)
+        now = time.monotonic()
+        evicted = list()
+        with self._lock:
+            evicted.extend(self._pop_idle(now))
+            pooled_client = self._clients.get(key)
+            if pooled_client is None:
+                py3cw = create_py3cw(api_key=api_key,
+                                     api_secret=api_secret,
+                                     request_options=request_options,
+                                     pool_size=self.pool_size)
+                pooled_client = _PooledClient(py3cw=py3cw, last_used=now)
+                self._clients[key] = pooled_client
+                while len(self._clients) > self.max_clients:
+                    evicted.append(self._clients.popitem(last=False)[1])
+            else:
+                pooled_client.last_used = now
+                self._clients.move_to_end(key)
+        self._close(evicted)
+        return pooled_client.py3cw
+
+    def evict_idle(self, now: float = None) -> int:
+        """
+        :return: the number of evicted clients
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            evicted = self._pop_idle(now)
+        self._close(evicted)
+        return len(evicted)
+
+    def clear(self):
+        with self._lock:
+            evicted = list(self._clients.values())
+            self._clients.clear()
+        self._close(evicted)
+
+    def _pop_idle(self, now: float) -> list:
+        return pop_idle_clients(self._clients, self.idle_timeout, now)
+
+    @staticmethod
+    def _close(evicted: list):
+        for pooled_client in evicted:
+            logger.debug('Closing the session of an evicted client')
+            pooled_client.py3cw.session.close()
+
+    def __len__(self):
+        return len(self._clients)
+
+
+client_pool = ClientPool()
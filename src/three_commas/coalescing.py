@@ -0,0 +1,132 @@
+import asyncio
+import copy
+import json
+import logging
+import threading
+from dataclasses import dataclass, replace
+from typing import Awaitable, Callable, Dict, Hashable, Tuple
+from . import configuration
+from .rate_limiting import EndpointClass, get_endpoint_class
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CoalescingStats:
+    calls: int = 0
+    coalesced: int = 0
+
+
+def get_request_key(api_key: str,
+                    api_secret: str,
+                    additional_headers: dict,
+                    entity: str,
+                    action: str = '',
+                    action_id: str = None,
+                    action_sub_id: str = None,
+                    payload: any = None) -> Hashable:
+    return (api_key,
+            api_secret,
+            tuple(sorted((additional_headers or dict()).items())),
+            entity,
+            action,
+            action_id,
+            action_sub_id,
+            json.dumps(payload, sort_keys=True, default=str))
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.exception: BaseException = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent GET requests. While a request is in flight, the same request
+    of other threads or asyncio tasks waits for its response instead of being sent again.
+    The waiting callers get a copy of the response.
+    """
+    def __init__(self, enabled: bool = None):
+        self.enabled = configuration.THREE_COMMAS_COALESCE if enabled is None else enabled
+        self._flights: Dict[Hashable, _Flight] = dict()
+        self._aio_flights: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = dict()
+        self._stats = CoalescingStats()
+        self._lock = threading.Lock()
+
+    def is_coalesced(self, entity: str, action: str) -> bool:
+        return self.enabled and get_endpoint_class(entity, action) != EndpointClass.WRITE
+
+    def do(self, key: Hashable, send: Callable):
+        with self._lock:
+            self._stats.calls += 1
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight()
+                self._flights[key] = flight
+            else:
+                self._stats.coalesced += 1
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.exception is not None:
+                raise flight.exception
+            return copy.deepcopy(flight.result)
+
+        try:
+            flight.result = send()
+            return flight.result
+        except BaseException as e:
+            flight.exception = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def aio_do(self, key: Hashable, send: Callable[[], Awaitable]):
+        # futures belong to their event loop, the flights of different loops are kept apart
+        key = asyncio.get_running_loop(), key
+        with self._lock:
+            self._stats.calls += 1
+            future = self._aio_flights.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = asyncio.get_running_loop().create_future()
+                self._aio_flights[key] = future
+            else:
+                self._stats.coalesced += 1
+
+        if not is_leader:
+            # shielded, a cancelled follower must not cancel the request of the others
+            return copy.deepcopy(await asyncio.shield(future))
+
+        try:
+            result = await send()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # retrieved, so an exception nobody waited for is not logged
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                del self._aio_flights[key]
+
+    def stats(self) -> CoalescingStats:
+        with self._lock:
+            return replace(self._stats)
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = CoalescingStats()
+
+
+single_flight = SingleFlight()
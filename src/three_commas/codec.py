@@ -0,0 +1,71 @@
+import json
+import logging
+from typing import Callable, Union
+from . import configuration
+
+
+logger = logging.getLogger(__name__)
+
+
+class JsonCodec:
+    def __init__(self, name: str, loads: Callable[[Union[str, bytes]], any], dumps: Callable[[any], str]):
+        self.name = name
+        self.loads = loads
+        self.dumps = dumps
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.name})'
+
+
+def _create_orjson_codec() -> JsonCodec:
+    import orjson
+    return JsonCodec(name='orjson', loads=orjson.loads, dumps=lambda obj: orjson.dumps(obj).decode())
+
+
+def _create_ujson_codec() -> JsonCodec:
+    import ujson
+    return JsonCodec(name='ujson', loads=ujson.loads, dumps=ujson.dumps)
+
+
+def _create_json_codec() -> JsonCodec:
+    return JsonCodec(name='json', loads=json.loads, dumps=json.dumps)
+
+
+CODEC_FACTORIES = {
+    'orjson': _create_orjson_codec,
+    'ujson': _create_ujson_codec,
+    'json': _create_json_codec,
+}
+
+
+def get_codec(name: str = None) -> JsonCodec:
+    """
+    :param name: one of orjson, ujson or json. By default the fastest installed one
+    """
+    if name:
+        return CODEC_FACTORIES[name]()
+    for factory in CODEC_FACTORIES.values():
+        try:
+            return factory()
+        except ImportError:
+            continue
+
+
+def set_codec(name: str = None):
+    """
+    Changes the codec used for the responses and the websocket frames
+    """
+    global codec
+    codec = get_codec(name)
+    logger.debug(f'Using the {codec.name} json codec')
+
+
+def loads(data: Union[str, bytes]):
+    return codec.loads(data)
+
+
+def dumps(obj) -> str:
+    return codec.dumps(obj)
+
+
+codec: JsonCodec = get_codec(configuration.THREE_COMMAS_JSON_CODEC)
@@ -1,5 +1,6 @@
 import os
 import logging
+from typing import Union
 
 
 logger = logging.getLogger(__name__)
@@ -16,7 +17,59 @@ def check_bool_env(env_var_name: str, default_value: bool) -> bool:
         return default_value_str.upper() == 'TRUE'
 
 
+def check_number_env(env_var_name: str, default_value: Union[int, float]) -> Union[int, float]:
+    number_type = type(default_value)
+    var = os.getenv(env_var_name)
+    if var is None:
+        return default_value
+    try:
+        return number_type(var)
+    except ValueError:
+        logger.warning(f"numeric variable {env_var_name} value is not a valid {number_type.__name__}: '{var}'. "
+                       f"Will default to {default_value}")
+        return default_value
+
+
 THREE_COMMAS_AUTO_PARSE_DEFAULT = check_bool_env('THREE_COMMAS_AUTO_PARSE_DEFAULT', True)
 THREE_COMMAS_AUTO_PARSE_DATETIME_DEFAULT = check_bool_env('THREE_COMMAS_AUTO_PARSE_DATETIME_DEFAULT', False)
+THREE_COMMAS_AUTO_PARSE_DATETIME_UTC = check_bool_env('THREE_COMMAS_AUTO_PARSE_DATETIME_UTC', False)  # tz aware
+THREE_COMMAS_LAZY_MODEL_LISTS = check_bool_env('THREE_COMMAS_LAZY_MODEL_LISTS', True)  # models built on access
+THREE_COMMAS_MODEL_VIEWS = check_bool_env('THREE_COMMAS_MODEL_VIEWS', False)  # views instead of model copies
+THREE_COMMAS_INTERN_STRINGS = check_bool_env('THREE_COMMAS_INTERN_STRINGS', False)  # shared pair, status, ... strings
 THREE_COMMAS_LOG_API = check_bool_env('THREE_COMMAS_LOG_API_DEFAULT', True)  # will log only on debug level
 REDUCED_LOGGING_LIMIT = 130
+
+# client pooling. One Py3CW client (and its keep-alive http connection pool) is kept per credentials
+THREE_COMMAS_POOL_CLIENTS = check_bool_env('THREE_COMMAS_POOL_CLIENTS', True)
+THREE_COMMAS_POOL_SIZE = check_number_env('THREE_COMMAS_POOL_SIZE', 10)  # connections kept alive per client
+THREE_COMMAS_POOL_MAX_CLIENTS = check_number_env('THREE_COMMAS_POOL_MAX_CLIENTS', 64)
+THREE_COMMAS_POOL_IDLE_TIMEOUT = check_number_env('THREE_COMMAS_POOL_IDLE_TIMEOUT', 300.0)  # seconds
+THREE_COMMAS_API_URL = os.getenv('THREE_COMMAS_API_URL')  # overrides the py3cw api url, e.g. for a local server
+
+# asyncio api. Maximum requests of one client in flight at the same time
+THREE_COMMAS_AIO_CONCURRENCY_LIMIT = check_number_env('THREE_COMMAS_AIO_CONCURRENCY_LIMIT', 100)
+
+# bulk requests. Maximum calls of a bulk_* function in flight at the same time
+THREE_COMMAS_BULK_MAX_WORKERS = check_number_env('THREE_COMMAS_BULK_MAX_WORKERS', 8)
+
+# client side rate limiting. Requests per second per api key, for every endpoint class
+THREE_COMMAS_RATE_LIMIT = check_bool_env('THREE_COMMAS_RATE_LIMIT', True)
+THREE_COMMAS_RATE_LIMIT_PUBLIC = check_number_env('THREE_COMMAS_RATE_LIMIT_PUBLIC', 20.0)
+THREE_COMMAS_RATE_LIMIT_READ = check_number_env('THREE_COMMAS_RATE_LIMIT_READ', 10.0)
+THREE_COMMAS_RATE_LIMIT_WRITE = check_number_env('THREE_COMMAS_RATE_LIMIT_WRITE', 5.0)
+
+# retries of failed requests. Read endpoints are retried by default, write endpoints only with retry=True
+THREE_COMMAS_RETRY = check_bool_env('THREE_COMMAS_RETRY', True)
+THREE_COMMAS_RETRY_MAX_ATTEMPTS = check_number_env('THREE_COMMAS_RETRY_MAX_ATTEMPTS', 5)  # including the first
+THREE_COMMAS_RETRY_BASE_DELAY = check_number_env('THREE_COMMAS_RETRY_BASE_DELAY', 0.5)  # seconds
+THREE_COMMAS_RETRY_MAX_DELAY = check_number_env('THREE_COMMAS_RETRY_MAX_DELAY', 30.0)  # seconds
+THREE_COMMAS_RETRY_BUDGET = check_number_env('THREE_COMMAS_RETRY_BUDGET', 60.0)  # seconds per call, all attempts
+
+# coalescing of identical GET requests in flight at the same time
+THREE_COMMAS_COALESCE = check_bool_env('THREE_COMMAS_COALESCE', False)
+
+# per endpoint latency, error, size, retry and rate limit metrics, see metrics.render_prometheus
+THREE_COMMAS_METRICS = check_bool_env('THREE_COMMAS_METRICS', False)
+
+# json codec of the responses and the websocket frames: orjson, ujson or json. By default the fastest installed one
+THREE_COMMAS_JSON_CODEC = os.getenv('THREE_COMMAS_JSON_CODEC')
@@ -74,3 +74,13 @@ class ThreeCommasApiError(ThreeCommasDict):
 
 class ThreeCommasException(RuntimeError):
     pass
+
+
+class ThreeCommasPaginationException(ThreeCommasException):
+    """
+    Raised by the iter_all functions when a page could not be fetched
+    """
+    def __init__(self, error: ThreeCommasApiError, page_params: dict = None):
+        super().__init__(f'Fetching the page {page_params} failed: {error.get_msg()}')
+        self.error = error
+        self.page_params = page_params
@@ -0,0 +1,408 @@
+"""
+Columnar containers for aggregating large deal histories. The columns are numpy arrays if numpy is installed
+(pip install three-commas[frames]), array.array otherwise.
+
+    frame = DealFrame.of_deals(api.ver1.deals.iter_all(scope='finished'))
+    completed = frame.filter(frame.where(status='completed'))
+    profit_per_bot = completed.group_by('bot_id', 'usd_final_profit')
+    profit_per_day = completed.group_by_time('usd_final_profit', period=datetime.timedelta(days=1))
+"""
+import math
+import itertools
+import logging
+import datetime
+from array import array
+from typing import Dict, Iterable, List, Mapping, Sequence, Union
+from .model.models import parse_datetime
+
+
+logger = logging.getLogger(__name__)
+
+FLOAT_COLUMNS = (
+    'final_profit', 'usd_final_profit', 'actual_profit', 'actual_usd_profit',
+    'final_profit_percentage', 'actual_profit_percentage',
+    'bought_volume', 'bought_amount', 'bought_average_price', 'sold_volume', 'sold_amount', 'sold_average_price',
+    'base_order_volume', 'safety_order_volume', 'take_profit', 'current_price',
+)
+# stored as codes into a list of the distinct values
+CATEGORY_COLUMNS = ('bot_id', 'account_id', 'pair', 'status', 'from_currency', 'to_currency', 'strategy')
+# stored as utc epoch seconds, NaN if missing
+TIME_COLUMNS = ('created_at', 'updated_at', 'closed_at')
+AGGREGATIONS = ('sum', 'mean', 'count', 'min', 'max')
+NAN = float('nan')
+
+
+def _to_float(value) -> float:
+    if value is None:
+        return NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+
+def _floats(values: list) -> list:
+    try:
+        return list(map(float, values))
+    except (TypeError, ValueError):
+        return [_to_float(value) for value in values]
+
+
+def _to_timestamp(value) -> float:
+    if value is None:
+        return NAN
+    if isinstance(value, datetime.datetime):
+        return (value if value.tzinfo else value.replace(tzinfo=datetime.timezone.utc)).timestamp()
+    try:
+        return parse_datetime(value, utc=True).timestamp()
+    except (TypeError, ValueError):
+        return NAN
+
+
+class _ArrayBackend:
+    """
+    Columns as array.array, the operations are loops in python
+    """
+    name = 'array'
+
+    @staticmethod
+    def floats(values: Sequence[float]):
+        return array('d', values)
+
+    @staticmethod
+    def ints(values: Sequence[int]):
+        return array('q', values)
+
+    @staticmethod
+    def compress(column, mask):
+        return array(column.typecode, itertools.compress(column, mask))
+
+    @staticmethod
+    def isin(codes, wanted: set):
+        return [code in wanted for code in codes]
+
+    @staticmethod
+    def between(values, low: float, high: float):
+        return [low <= value < high for value in values]
+
+    @staticmethod
+    def all_of(masks: list):
+        return [all(flags) for flags in zip(*masks)]
+
+    @staticmethod
+    def everything(length: int):
+        return [True] * length
+
+    @staticmethod
+    def total(values, aggregation: str) -> float:
+        valid = [value for value in values if value == value]
+        if aggregation == 'count':
+            return float(len(valid))
+        if not valid:
+            return 0.0 if aggregation == 'sum' else NAN
+        if aggregation == 'sum':
+            return math.fsum(valid)
+        if aggregation == 'mean':
+            return math.fsum(valid) / len(valid)
+        return min(valid) if aggregation == 'min' else max(valid)
+
+    @staticmethod
+    def aggregate(codes, group_count: int, values, aggregation: str):
+        """
+        :return: the aggregated values and the count of the values of every group
+        """
+        groups = [list() for _ in range(group_count)]
+        for code, value in zip(codes, values):
+            if value == value and code >= 0:
+                groups[code].append(value)
+        results = [_ArrayBackend.total(group, aggregation) for group in groups]
+        counts = [len(group) for group in groups]
+        return results, counts
+
+    @staticmethod
+    def bucket_codes(times, period_seconds: float):
+        """
+        :return: a code per row, -1 for missing times, and the bucket start of every code
+        """
+        codes = array('q')
+        starts = list()
+        code_of_bucket = dict()
+        for t in times:
+            if t != t:
+                codes.append(-1)
+                continue
+            bucket = math.floor(t / period_seconds)
+            code = code_of_bucket.get(bucket)
+            if code is None:
+                code = code_of_bucket[bucket] = len(starts)
+                starts.append(bucket * period_seconds)
+            codes.append(code)
+        return codes, starts
+
+
+class _NumpyBackend:
+    """
+    Columns as numpy arrays, the operations are vectorized
+    """
+    name = 'numpy'
+
+    def __init__(self, np):
+        self.np = np
+
+    def floats(self, values: Sequence[float]):
+        return self.np.asarray(values, dtype=self.np.float64)
+
+    def ints(self, values: Sequence[int]):
+        return self.np.asarray(values, dtype=self.np.int64)
+
+    @staticmethod
+    def compress(column, mask):
+        return column[mask]
+
+    def isin(self, codes, wanted: set):
+        return self.np.isin(codes, list(wanted))
+
+    @staticmethod
+    def between(values, low: float, high: float):
+        return (values >= low) & (values < high)
+
+    def all_of(self, masks: list):
+        return self.np.logical_and.reduce([self.np.asarray(mask, dtype=bool) for mask in masks])
+
+    def everything(self, length: int):
+        return self.np.ones(length, dtype=bool)
+
+    def total(self, values, aggregation: str) -> float:
+        np = self.np
+        valid = values[~np.isnan(values)]
+        if aggregation == 'count':
+            return float(valid.size)
+        if not valid.size:
+            return 0.0 if aggregation == 'sum' else NAN
+        return float({'sum': np.sum, 'mean': np.mean, 'min': np.min, 'max': np.max}[aggregation](valid))
+
+    def aggregate(self, codes, group_count: int, values, aggregation: str):
+        np = self.np
+        valid = ~np.isnan(values) & (codes >= 0)
+        codes = codes[valid]
+        values = values[valid]
+        counts = np.bincount(codes, minlength=group_count)
+        if aggregation == 'count':
+            results = counts.astype(np.float64)
+        elif aggregation in {'sum', 'mean'}:
+            results = np.bincount(codes, weights=values, minlength=group_count)
+            if aggregation == 'mean':
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    results = np.where(counts > 0, results / np.maximum(counts, 1), NAN)
+        else:
+            results = np.full(group_count, np.inf if aggregation == 'min' else -np.inf)
+            (np.minimum if aggregation == 'min' else np.maximum).at(results, codes, values)
+            results[counts == 0] = NAN
+        return results.tolist(), counts.tolist()
+
+    def bucket_codes(self, times, period_seconds: float):
+        np = self.np
+        valid = ~np.isnan(times)
+        buckets = np.floor(times[valid] / period_seconds).astype(np.int64)
+        unique_buckets, inverse = np.unique(buckets, return_inverse=True)
+        codes = np.full(times.shape[0], -1, dtype=np.int64)
+        codes[valid] = inverse
+        return codes, (unique_buckets * period_seconds).tolist()
+
+
+class _FilteredColumns(Mapping):
+    """
+    The columns of a filtered frame, a column is filtered when it is first read
+    """
+    def __init__(self, backend, columns: Mapping, mask):
+        self._backend = backend
+        self._columns = columns
+        self._mask = mask
+        self._filtered = dict()
+
+    def __getitem__(self, column: str):
+        values = self._filtered.get(column)
+        if values is None:
+            values = self._filtered[column] = self._backend.compress(self._columns[column], self._mask)
+        return values
+
+    def __iter__(self):
+        return iter(self._columns)
+
+    def __len__(self):
+        return len(self._columns)
+
+
+def get_backend(use_numpy: bool = None):
+    """
+    :param use_numpy: None uses numpy if it is installed
+    """
+    if use_numpy is False:
+        return _ArrayBackend()
+    try:
+        import numpy
+    except ImportError:
+        if use_numpy:
+            raise
+        return _ArrayBackend()
+    return _NumpyBackend(numpy)
+
+
+class DealFrame:
+    """
+    Typed columns of a list of deals. Float and time columns hold NaN for missing values,
+    the category columns hold codes into the list of their distinct values.
+    """
+    def __init__(self, backend, ids, floats: Mapping[str, any], times: Mapping[str, any], codes: Mapping[str, any],
+                 categories: Dict[str, list]):
+        self.backend = backend
+        self.ids = ids
+        self.floats = floats
+        self.times = times
+        self.codes = codes
+        self.categories = categories
+
+    @classmethod
+    def of_deals(cls,
+                 deals: Iterable[dict],
+                 float_columns: Sequence[str] = FLOAT_COLUMNS,
+                 category_columns: Sequence[str] = CATEGORY_COLUMNS,
+                 time_columns: Sequence[str] = TIME_COLUMNS,
+                 use_numpy: bool = None) -> 'DealFrame':
+        """
+        :param deals: the deal dicts or models, e.g. a list of DealEntity or api.ver1.deals.iter_all
+        """
+        backend = get_backend(use_numpy)
+        deals = deals if isinstance(deals, list) else list(deals)
+        categories = dict()
+        codes = dict()
+        for column in category_columns:
+            code_of_value = dict()
+            codes[column] = backend.ints([code_of_value.setdefault(deal.get(column), len(code_of_value))
+                                          for deal in deals])
+            categories[column] = list(code_of_value)
+        return cls(backend=backend,
+                   ids=backend.ints([deal.get('id') or 0 for deal in deals]),
+                   floats={column: backend.floats(_floats([deal.get(column) for deal in deals]))
+                           for column in float_columns},
+                   times={column: backend.floats([_to_timestamp(deal.get(column)) for deal in deals])
+                          for column in time_columns},
+                   codes=codes,
+                   categories=categories)
+
+    def __len__(self):
+        return len(self.ids)
+
+    @property
+    def columns(self) -> List[str]:
+        return ['id', *self.floats, *self.times, *self.codes]
+
+    def __getitem__(self, column: str):
+        """
+        :return: the array of a float or time column, the values of a category column
+        """
+        if column == 'id':
+            return self.ids
+        if column in self.floats:
+            return self.floats[column]
+        if column in self.times:
+            return self.times[column]
+        if column in self.codes:
+            categories = self.categories[column]
+            return [categories[code] for code in self.codes[column]]
+        raise KeyError(column)
+
+    def _numeric(self, column: str):
+        if column in self.floats:
+            return self.floats[column]
+        if column in self.times:
+            return self.times[column]
+        raise KeyError(f'{column} is not a float or time column')
+
+    def where(self, **equals) -> any:
+        """
+        Mask of the rows whose category columns have the value, or one of the values of a list:
+
+            frame.where(status='completed', pair=['USDT_BTC', 'USDT_ETH'])
+
+        Without any column all rows match
+        """
+        if not equals:
+            return self.backend.everything(len(self))
+        masks = list()
+        for column, wanted in equals.items():
+            if column not in self.codes:
+                raise KeyError(f'{column} is not a category column')
+            wanted = wanted if isinstance(wanted, (list, tuple, set, frozenset)) else [wanted]
+            categories = self.categories[column]
+            wanted_codes = {code for code, value in enumerate(categories) if value in wanted}
+            masks.append(self.backend.isin(self.codes[column], wanted_codes))
+        return self.backend.all_of(masks) if len(masks) > 1 else masks[0]
+
+    def between(self, column: str, low: Union[float, datetime.datetime] = None,
+                high: Union[float, datetime.datetime] = None) -> any:
+        """
+        Mask of the rows with low <= value < high. Time columns take datetimes, naive ones are taken as utc
+        """
+        low = -math.inf if low is None else _to_timestamp(low) if isinstance(low, datetime.datetime) else low
+        high = math.inf if high is None else _to_timestamp(high) if isinstance(high, datetime.datetime) else high
+        return self.backend.between(self._numeric(column), low, high)
+
+    def filter(self, *masks) -> 'DealFrame':
+        """
+        The rows where all masks are true. The masks come from where, between or a comparison of numpy columns.
+        Without any mask all rows are kept
+        """
+        if not masks:
+            return self
+        backend = self.backend
+        mask = backend.all_of(list(masks)) if len(masks) > 1 else masks[0]
+        return DealFrame(backend=backend,
+                         ids=backend.compress(self.ids, mask),
+                         floats=_FilteredColumns(backend, self.floats, mask),
+                         times=_FilteredColumns(backend, self.times, mask),
+                         codes=_FilteredColumns(backend, self.codes, mask),
+                         categories=self.categories)
+
+    def aggregate(self, column: str, aggregation: str = 'sum') -> float:
+        """
+        :param aggregation: sum, mean, count, min or max. Missing values are skipped
+        """
+        return self.backend.total(self._numeric(column), aggregation)
+
+    def sum(self, column: str) -> float:
+        return self.aggregate(column, 'sum')
+
+    def mean(self, column: str) -> float:
+        return self.aggregate(column, 'mean')
+
+    def group_by(self, key: str, column: str, aggregation: str = 'sum') -> Dict[any, float]:
+        """
+        :param key: a category column, e.g. bot_id, pair, account_id or status
+        :return: the aggregated column per value of key. Groups without any value of column are left out
+        """
+        if key not in self.codes:
+            raise KeyError(f'{key} is not a category column')
+        categories = self.categories[key]
+        results, counts = self._aggregate(self.codes[key], len(categories), column, aggregation)
+        return {categories[code]: result for code, (result, count) in enumerate(zip(results, counts)) if count}
+
+    def group_by_time(self, column: str, period: datetime.timedelta = datetime.timedelta(days=1),
+                      time_column: str = 'closed_at', aggregation: str = 'sum') -> Dict[datetime.datetime, float]:
+        """
+        :return: the aggregated column per period of time_column, by utc start of the period in time order.
+        Rows without time are skipped
+        """
+        codes, starts = self.backend.bucket_codes(self.times[time_column], period.total_seconds())
+        results, counts = self._aggregate(codes, len(starts), column, aggregation)
+        buckets = {datetime.datetime.fromtimestamp(start, tz=datetime.timezone.utc): result
+                   for start, result, count in zip(starts, results, counts) if count}
+        return dict(sorted(buckets.items()))
+
+    def _aggregate(self, codes, group_count: int, column: str, aggregation: str):
+        if aggregation not in AGGREGATIONS:
+            raise ValueError(f'aggregation must be one of {AGGREGATIONS}')
+        return self.backend.aggregate(codes, group_count, self._numeric(column), aggregation)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({len(self)} deals, {self.backend.name})'
@@ -0,0 +1,10 @@
+# generated from the swagger doc by type_generators/auto_api_from_swaggerdoc.py
+
+# (py3cw entity, py3cw action) of the endpoints with Security: NONE
+PUBLIC_ENDPOINTS = {
+    ('accounts', 'currency_rates'),
+    ('accounts', 'market_list'),
+    ('accounts', 'market_pairs'),
+    ('marketplace', 'items'),
+    ('marketplace', 'signals'),
+}
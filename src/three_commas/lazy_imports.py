@@ -0,0 +1,26 @@
+import sys
+import importlib
+from typing import Callable, Iterable, List, Tuple
+
+
+def lazy_submodules(package_name: str, submodules: Iterable[str]) -> Tuple[Callable, Callable]:
+    """
+    Module level __getattr__ and __dir__ of a package that imports its submodules on first access:
+
+        __getattr__, __dir__ = lazy_submodules(__name__, ['bots', 'deals'])
+    """
+    submodules = tuple(submodules)
+    package = importlib.import_module(package_name)
+
+    def __getattr__(name: str):
+        if name in submodules:
+            # the import sets the submodule as attribute of the package, __getattr__ is not called again.
+            # __import__ instead of importlib.import_module, so the import shows up in python -X importtime
+            __import__(f'{package_name}.{name}')
+            return sys.modules[f'{package_name}.{name}']
+        raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(package)) | set(submodules))
+
+    return __getattr__, __dir__
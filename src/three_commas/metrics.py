@@ -0,0 +1,252 @@
+import bisect
+import logging
+import threading
+import contextvars
+from typing import Dict, List, Optional, Tuple
+from . import configuration
+from .error import ThreeCommasApiError
+
+
+logger = logging.getLogger(__name__)
+_response_size: contextvars.ContextVar = contextvars.ContextVar('response_size', default=None)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def set_response_size(size: Optional[int]):
+    _response_size.set(size)
+
+
+def get_response_size() -> Optional[int]:
+    return _response_size.get()
+
+
+def remember_response_size(response, *args, **kwargs):
+    """
+    Response hook of the requests session, keeps the body size of the last response of this context.
+    The size is taken from the Content-Length header, the size on the wire of a compressed body, and the body is
+    read only without the header. Nothing is done while the metrics are disabled
+    """
+    if not metrics.enabled:
+        return
+    content_length = response.headers.get('Content-Length')
+    if content_length is not None and content_length.isdigit():
+        set_response_size(int(content_length))
+    else:
+        set_response_size(len(response.content))
+
+
+def get_error_category(error: dict) -> Optional[str]:
+    """
+    :return: None if there is no error, the category of the ThreeCommasApiError otherwise
+    """
+    if not error:
+        return None
+    error = error if isinstance(error, ThreeCommasApiError) else ThreeCommasApiError(error)
+    status_code = error.get('status_code')
+    if status_code == 429:
+        return 'rate_limited'
+    if isinstance(status_code, int) and status_code >= 500:
+        return 'server_error'
+    if error.is_api_key_invalid_or_expired():
+        return 'api_key_invalid_or_expired'
+    if error.is_api_key_has_no_permission_error():
+        return 'no_permission'
+    if error.is_base_order_to_small_error():
+        return 'base_order_to_small'
+    if error.is_no_market_pair_error():
+        return 'no_market_pair'
+    if error.is_not_found_error():
+        return 'not_found'
+    return 'other'
+
+
+class MetricsSink:
+    """
+    Receives the measurements of the request path. Subclass it and pass it to metrics.add_sink
+    to forward the measurements to another system
+    """
+    def request_finished(self, entity: str, action: str, seconds: float, error_category: Optional[str],
+                         response_bytes: Optional[int]):
+        pass
+
+    def retry_waited(self, entity: str, action: str, seconds: float):
+        pass
+
+    def rate_limit_waited(self, entity: str, action: str, seconds: float):
+        pass
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[Tuple[str, int]]:
+        ret = list()
+        total = 0
+        for upper_bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            ret.append(('+Inf' if upper_bound == float('inf') else repr(upper_bound), total))
+        return ret
+
+
+class _EndpointMetrics:
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.latency = Histogram(buckets)
+        self.errors: Dict[str, int] = dict()
+        self.response_bytes = 0
+        self.retries = 0
+        self.retry_wait_seconds = 0.0
+        self.rate_limit_waits = 0
+        self.rate_limit_wait_seconds = 0.0
+
+
+def _escape(label_value: str) -> str:
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class MetricsRegistry(MetricsSink):
+    """
+    Keeps the measurements in memory, per entity and action, and renders them in the prometheus text format
+    """
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._endpoints: Dict[Tuple[str, str], _EndpointMetrics] = dict()
+        self._lock = threading.Lock()
+
+    def _get(self, entity: str, action: str) -> _EndpointMetrics:
+        endpoint_metrics = self._endpoints.get((entity, action))
+        if endpoint_metrics is None:
+            endpoint_metrics = self._endpoints.setdefault((entity, action), _EndpointMetrics(self.buckets))
+        return endpoint_metrics
+
+    def request_finished(self, entity: str, action: str, seconds: float, error_category: Optional[str],
+                         response_bytes: Optional[int]):
+        with self._lock:
+            endpoint_metrics = self._get(entity, action)
+            endpoint_metrics.latency.observe(seconds)
+            if error_category is not None:
+                endpoint_metrics.errors[error_category] = endpoint_metrics.errors.get(error_category, 0) + 1
+            if response_bytes:
+                endpoint_metrics.response_bytes += response_bytes
+
+    def retry_waited(self, entity: str, action: str, seconds: float):
+        with self._lock:
+            endpoint_metrics = self._get(entity, action)
+            endpoint_metrics.retries += 1
+            endpoint_metrics.retry_wait_seconds += seconds
+
+    def rate_limit_waited(self, entity: str, action: str, seconds: float):
+        with self._lock:
+            endpoint_metrics = self._get(entity, action)
+            endpoint_metrics.rate_limit_waits += 1
+            endpoint_metrics.rate_limit_wait_seconds += seconds
+
+    def get_request_count(self, entity: str, action: str = '') -> int:
+        with self._lock:
+            endpoint_metrics = self._endpoints.get((entity, action))
+            return endpoint_metrics.latency.count if endpoint_metrics else 0
+
+    def get_error_counts(self, entity: str, action: str = '') -> Dict[str, int]:
+        with self._lock:
+            endpoint_metrics = self._endpoints.get((entity, action))
+            return dict(endpoint_metrics.errors) if endpoint_metrics else dict()
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+
+    def render_prometheus(self) -> str:
+        lines = list()
+
+        def add_metric(name: str, metric_type: str, help_text: str, samples: list):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {metric_type}')
+            for sample_name, labels, value in samples:
+                label_str = ','.join(f'{k}="{_escape(str(v))}"' for k, v in labels.items())
+                lines.append(f'{sample_name}{{{label_str}}} {value}')
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            latency_samples = list()
+            for (entity, action), m in endpoints:
+                labels = {'entity': entity, 'action': action}
+                for le, count in m.latency.cumulative_counts():
+                    latency_samples.append(('three_commas_request_duration_seconds_bucket', {**labels, 'le': le}, count))
+                latency_samples.append(('three_commas_request_duration_seconds_sum', labels, m.latency.sum))
+                latency_samples.append(('three_commas_request_duration_seconds_count', labels, m.latency.count))
+            add_metric('three_commas_request_duration_seconds', 'histogram',
+                       'Duration of the http requests to the 3commas api', latency_samples)
+            add_metric('three_commas_requests_total', 'counter', 'Http requests to the 3commas api',
+                       [('three_commas_requests_total', {'entity': e, 'action': a}, m.latency.count)
+                        for (e, a), m in endpoints])
+            add_metric('three_commas_request_errors_total', 'counter', 'Failed requests by ThreeCommasApiError category',
+                       [('three_commas_request_errors_total', {'entity': e, 'action': a, 'category': c}, n)
+                        for (e, a), m in endpoints for c, n in sorted(m.errors.items())])
+            add_metric('three_commas_response_bytes_total', 'counter', 'Bytes of the received response bodies',
+                       [('three_commas_response_bytes_total', {'entity': e, 'action': a}, m.response_bytes)
+                        for (e, a), m in endpoints])
+            add_metric('three_commas_retries_total', 'counter', 'Retried requests',
+                       [('three_commas_retries_total', {'entity': e, 'action': a}, m.retries)
+                        for (e, a), m in endpoints])
+            add_metric('three_commas_retry_wait_seconds_total', 'counter', 'Time waited before retries',
+                       [('three_commas_retry_wait_seconds_total', {'entity': e, 'action': a}, m.retry_wait_seconds)
+                        for (e, a), m in endpoints])
+            add_metric('three_commas_rate_limit_waits_total', 'counter', 'Requests delayed by the client side rate limit',
+                       [('three_commas_rate_limit_waits_total', {'entity': e, 'action': a}, m.rate_limit_waits)
+                        for (e, a), m in endpoints])
+            add_metric('three_commas_rate_limit_wait_seconds_total', 'counter', 'Time waited for the client side rate limit',
+                       [('three_commas_rate_limit_wait_seconds_total', {'entity': e, 'action': a}, m.rate_limit_wait_seconds)
+                        for (e, a), m in endpoints])
+        return '\n'.join(lines) + '\n'
+
+
+class Metrics:
+    """
+    Forwards the measurements of the request path to the sinks, if enabled
+    """
+    def __init__(self, sinks: List[MetricsSink] = None, enabled: bool = None):
+        self.enabled = configuration.THREE_COMMAS_METRICS if enabled is None else enabled
+        self.sinks: List[MetricsSink] = list(sinks or list())
+
+    def add_sink(self, sink: MetricsSink):
+        self.sinks = self.sinks + [sink]
+
+    def remove_sink(self, sink: MetricsSink):
+        self.sinks = [s for s in self.sinks if s is not sink]
+
+    def request_finished(self, entity: str, action: str, seconds: float, error: dict):
+        if not self.enabled:
+            return
+        error_category = get_error_category(error)
+        response_bytes = get_response_size()
+        for sink in self.sinks:
+            sink.request_finished(entity, action, seconds, error_category, response_bytes)
+
+    def retry_waited(self, entity: str, action: str, seconds: float):
+        if not self.enabled:
+            return
+        for sink in self.sinks:
+            sink.retry_waited(entity, action, seconds)
+
+    def rate_limit_waited(self, entity: str, action: str, seconds: float):
+        if not self.enabled:
+            return
+        for sink in self.sinks:
+            sink.rate_limit_waited(entity, action, seconds)
+
+
+registry = MetricsRegistry()
+metrics = Metrics(sinks=[registry])
+
+
+def render_prometheus() -> str:
+    return registry.render_prometheus()
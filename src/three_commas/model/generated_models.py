@@ -1,7 +1,8 @@
 from __future__ import annotations
-from .models import ThreeCommasModel, FloatParser, IntParser, DatetimeParser, ParsedProxy
+from .models import ThreeCommasModel, ThreeCommasRecord, FloatParser, IntParser, DatetimeParser, ModelParser, \
+    ModelListParser, ParsedProxy
 import datetime
-from typing import Union
+from typing import List, Optional, Union
 
 
 class IndexEntity(ThreeCommasModel):
@@ -146,6 +147,18 @@ class BotEntity(ThreeCommasModel):
     _name_proxy = {
         'deletable': 'deletable?',
     }
+    _interned_fields = (
+        'type',
+        'strategy',
+        'profit_currency',
+        'account_name',
+        'take_profit_type',
+        'stop_loss_type',
+        'leverage_type',
+        'base_order_volume_type',
+        'safety_order_volume_type',
+        'start_order_type',
+    )
 
 
 class AccountEntity(ThreeCommasModel):
@@ -351,7 +364,7 @@ class DealEntity(ThreeCommasModel):
     trailing_max_price: Union[str, float]
     tsl_max_price: str
     strategy: str
-    reserved_quote_funds: Union[float, float]
+    reserved_quote_funds: float
     reserved_base_funds: float
 
     _parse_map = {
@@ -386,31 +399,176 @@ class DealEntity(ThreeCommasModel):
         'trailing_deviation': FloatParser,
         'trailing_max_price': FloatParser,
         'reserved_quote_funds': FloatParser,
+        'reserved_base_funds': FloatParser,
     }
     _name_proxy = {
         'finished': 'finished?',
         'cancellable': 'cancellable?',
         'panic_sellable': 'panic_sellable?',
     }
+    _interned_fields = (
+        'type',
+        'pair',
+        'status',
+        'localized_status',
+        'profit_currency',
+        'from_currency',
+        'to_currency',
+        'account_name',
+        'bot_name',
+        'strategy',
+        'take_profit_type',
+        'stop_loss_type',
+        'leverage_type',
+        'base_order_volume_type',
+        'safety_order_volume_type',
+    )
 
 
-class SmartTradeV2Entity(ThreeCommasModel):
+class SmartTradeV2Account(ThreeCommasModel):
     id: int
-    version: int
-    account: dict
-    pair: str
-    instant: bool
-    status: dict
-    leverage: dict
-    position: dict
-    take_profit: dict
-    stop_loss: dict
-    note: str
-    skip_enter_step: bool
-    data: dict
-    profit: dict
-    margin: dict
-    is_position_not_filled: bool
+    type: str
+    name: str
+    market: str
+    link: str
+
+    _parse_map = {
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2Status(ThreeCommasModel):
+    type: str
+    title: str
+
+    _parse_map = {
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2Leverage(ThreeCommasModel):
+    enabled: bool
+    type: str
+    value: int
+
+    _parse_map = {
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2PositionUnits(ThreeCommasModel):
+    value: Union[str, float]
+    editable: bool
+
+    _parse_map = {
+        'value': FloatParser,
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2PositionPrice(ThreeCommasModel):
+    value: float
+    value_without_commission: float
+    editable: bool
+
+    _parse_map = {
+        'value': FloatParser,
+        'value_without_commission': FloatParser,
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2PositionTotal(ThreeCommasModel):
+    value: float
+
+    _parse_map = {
+        'value': FloatParser,
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2PositionStatus(ThreeCommasModel):
+    type: str
+    title: str
+
+    _parse_map = {
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2Position(ThreeCommasModel):
+    type: str
+    editable: bool
+    units: Union[dict, SmartTradeV2PositionUnits]
+    price: Union[dict, SmartTradeV2PositionPrice]
+    total: Union[dict, SmartTradeV2PositionTotal]
+    order_type: str
+    status: Union[dict, SmartTradeV2PositionStatus]
+
+    _parse_map = {
+        'units': ModelParser.of(SmartTradeV2PositionUnits),
+        'price': ModelParser.of(SmartTradeV2PositionPrice),
+        'total': ModelParser.of(SmartTradeV2PositionTotal),
+        'status': ModelParser.of(SmartTradeV2PositionStatus),
+    }
+    _name_proxy = {
+    }
+
+
+class TakeProfitStepUnits(ThreeCommasModel):
+    value: Union[str, float]
+
+    _parse_map = {
+        'value': FloatParser,
+    }
+    _name_proxy = {
+    }
+
+
+class TakeProfitStepPrice(ThreeCommasModel):
+    type: str
+    value: float
+    percent: float
+
+    _parse_map = {
+        'value': FloatParser,
+        'percent': FloatParser,
+    }
+    _name_proxy = {
+    }
+
+
+class TakeProfitStepTrailing(ThreeCommasModel):
+    enabled: bool
+    percent: float
+
+    _parse_map = {
+        'percent': FloatParser,
+    }
+    _name_proxy = {
+    }
+
+
+class TakeProfitStepStatus(ThreeCommasModel):
+    type: str
+    title: str
+
+    _parse_map = {
+    }
+    _name_proxy = {
+    }
+
+
+class TakeProfitStepData(ThreeCommasModel):
+    cancelable: bool
+    panic_sell_available: bool
 
     _parse_map = {
     }
@@ -421,25 +579,163 @@ class SmartTradeV2Entity(ThreeCommasModel):
 class TakeProfitStep(ThreeCommasModel):
     id: int
     version: int
-    account: dict
+    position: int
+    order_type: str
+    editable: bool
+    units: Union[dict, TakeProfitStepUnits]
+    price: Union[dict, TakeProfitStepPrice]
+    volume: Union[str, float]
+    total: Union[str, float]
+    trailing: Union[dict, TakeProfitStepTrailing]
+    status: Union[dict, TakeProfitStepStatus]
+    data: Union[dict, TakeProfitStepData]
+
+    _parse_map = {
+        'units': ModelParser.of(TakeProfitStepUnits),
+        'price': ModelParser.of(TakeProfitStepPrice),
+        'volume': FloatParser,
+        'total': FloatParser,
+        'trailing': ModelParser.of(TakeProfitStepTrailing),
+        'status': ModelParser.of(TakeProfitStepStatus),
+        'data': ModelParser.of(TakeProfitStepData),
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2TakeProfit(ThreeCommasModel):
+    enabled: bool
+    steps: Union[list, List[TakeProfitStep]]
+
+    _parse_map = {
+        'steps': ModelListParser.of(TakeProfitStep),
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2StopLoss(ThreeCommasModel):
+    enabled: bool
+
+    _parse_map = {
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2DataCurrentPrice(ThreeCommasModel):
+    quote_volume: Union[str, float]
+    last: Union[str, float]
+
+    _parse_map = {
+        'quote_volume': FloatParser,
+        'last': FloatParser,
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2Data(ThreeCommasModel):
+    editable: bool
+    current_price: Union[dict, SmartTradeV2DataCurrentPrice]
+    target_price_type: str
+    base_order_finished: bool
+    missing_funds_to_close: float
+    liquidation_price: float
+    average_enter_price: float
+    average_close_price: float
+    average_enter_price_without_commission: float
+    average_close_price_without_commission: float
+    panic_sell_available: bool
+    add_funds_available: bool
+    force_start_available: bool
+    force_process_available: bool
+    cancel_available: bool
+    finished: bool
+    base_position_step_finished: bool
+    created_at: Union[str, datetime.datetime]
+    updated_at: Union[str, datetime.datetime]
+    closed_at: Union[str, datetime.datetime]
+    type: str
+
+    _parse_map = {
+        'current_price': ModelParser.of(SmartTradeV2DataCurrentPrice),
+        'missing_funds_to_close': FloatParser,
+        'liquidation_price': FloatParser,
+        'average_enter_price': FloatParser,
+        'average_close_price': FloatParser,
+        'average_enter_price_without_commission': FloatParser,
+        'average_close_price_without_commission': FloatParser,
+        'created_at': DatetimeParser,
+        'updated_at': DatetimeParser,
+        'closed_at': DatetimeParser,
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2Profit(ThreeCommasModel):
+    volume: float
+    usd: float
+    percent: float
+    roe: float
+
+    _parse_map = {
+        'volume': FloatParser,
+        'usd': FloatParser,
+        'percent': FloatParser,
+        'roe': FloatParser,
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2Margin(ThreeCommasModel):
+    amount: float
+    total: float
+
+    _parse_map = {
+        'amount': FloatParser,
+        'total': FloatParser,
+    }
+    _name_proxy = {
+    }
+
+
+class SmartTradeV2Entity(ThreeCommasModel):
+    id: int
+    version: int
+    account: Union[dict, SmartTradeV2Account]
     pair: str
     instant: bool
-    status: dict
-    leverage: dict
-    position: dict
-    take_profit: dict
-    stop_loss: dict
+    status: Union[dict, SmartTradeV2Status]
+    leverage: Union[dict, SmartTradeV2Leverage]
+    position: Union[dict, SmartTradeV2Position]
+    take_profit: Union[dict, SmartTradeV2TakeProfit]
+    stop_loss: Union[dict, SmartTradeV2StopLoss]
     note: str
     skip_enter_step: bool
-    data: dict
-    profit: dict
-    margin: dict
+    data: Union[dict, SmartTradeV2Data]
+    profit: Union[dict, SmartTradeV2Profit]
+    margin: Union[dict, SmartTradeV2Margin]
     is_position_not_filled: bool
 
     _parse_map = {
+        'account': ModelParser.of(SmartTradeV2Account),
+        'status': ModelParser.of(SmartTradeV2Status),
+        'leverage': ModelParser.of(SmartTradeV2Leverage),
+        'position': ModelParser.of(SmartTradeV2Position),
+        'take_profit': ModelParser.of(SmartTradeV2TakeProfit),
+        'stop_loss': ModelParser.of(SmartTradeV2StopLoss),
+        'data': ModelParser.of(SmartTradeV2Data),
+        'profit': ModelParser.of(SmartTradeV2Profit),
+        'margin': ModelParser.of(SmartTradeV2Margin),
     }
     _name_proxy = {
     }
+    _interned_fields = (
+        'pair',
+    )
 
 
 class BotDealsStatsEntity(ThreeCommasModel):
@@ -474,3 +770,263 @@ class LooseAccountEntity(ThreeCommasModel):
     _name_proxy = {
     }
 
+
+class DealRecord(ThreeCommasRecord):
+    _entity_type = DealEntity
+    __slots__ = (
+        'id',
+        'type',
+        'bot_id',
+        'max_safety_orders',
+        'deal_has_error',
+        'from_currency_id',
+        'to_currency_id',
+        'account_id',
+        'active_safety_orders_count',
+        'created_at',
+        'updated_at',
+        'closed_at',
+        'finished',
+        'current_active_safety_orders_count',
+        'current_active_safety_orders',
+        'completed_safety_orders_count',
+        'completed_manual_safety_orders_count',
+        'cancellable',
+        'panic_sellable',
+        'trailing_enabled',
+        'tsl_enabled',
+        'stop_loss_timeout_enabled',
+        'stop_loss_timeout_in_seconds',
+        'active_manual_safety_orders',
+        'pair',
+        'status',
+        'localized_status',
+        'take_profit',
+        'base_order_volume',
+        'safety_order_volume',
+        'safety_order_step_percentage',
+        'leverage_type',
+        'leverage_custom_value',
+        'bought_amount',
+        'bought_volume',
+        'bought_average_price',
+        'base_order_average_price',
+        'sold_amount',
+        'sold_volume',
+        'sold_average_price',
+        'take_profit_type',
+        'final_profit',
+        'martingale_coefficient',
+        'martingale_volume_coefficient',
+        'martingale_step_coefficient',
+        'stop_loss_percentage',
+        'error_message',
+        'profit_currency',
+        'stop_loss_type',
+        'safety_order_volume_type',
+        'base_order_volume_type',
+        'from_currency',
+        'to_currency',
+        'current_price',
+        'take_profit_price',
+        'stop_loss_price',
+        'final_profit_percentage',
+        'actual_profit_percentage',
+        'bot_name',
+        'account_name',
+        'usd_final_profit',
+        'actual_profit',
+        'actual_usd_profit',
+        'failed_message',
+        'reserved_base_coin',
+        'reserved_second_coin',
+        'trailing_deviation',
+        'trailing_max_price',
+        'tsl_max_price',
+        'strategy',
+        'reserved_quote_funds',
+        'reserved_base_funds',
+    )
+
+    id: Optional[int]
+    type: Optional[str]
+    bot_id: Optional[int]
+    max_safety_orders: Optional[int]
+    deal_has_error: Optional[bool]
+    from_currency_id: Optional[int]
+    to_currency_id: Optional[int]
+    account_id: Optional[int]
+    active_safety_orders_count: Optional[int]
+    created_at: Optional[datetime.datetime]
+    updated_at: Optional[datetime.datetime]
+    closed_at: Optional[datetime.datetime]
+    finished: Optional[bool]
+    current_active_safety_orders_count: Optional[int]
+    current_active_safety_orders: Optional[int]
+    completed_safety_orders_count: Optional[int]
+    completed_manual_safety_orders_count: Optional[int]
+    cancellable: Optional[bool]
+    panic_sellable: Optional[bool]
+    trailing_enabled: Optional[bool]
+    tsl_enabled: Optional[bool]
+    stop_loss_timeout_enabled: Optional[bool]
+    stop_loss_timeout_in_seconds: Optional[int]
+    active_manual_safety_orders: Optional[int]
+    pair: Optional[str]
+    status: Optional[str]
+    localized_status: Optional[str]
+    take_profit: Optional[float]
+    base_order_volume: Optional[float]
+    safety_order_volume: Optional[float]
+    safety_order_step_percentage: Optional[float]
+    leverage_type: Optional[str]
+    leverage_custom_value: Optional[str]
+    bought_amount: Optional[float]
+    bought_volume: Optional[float]
+    bought_average_price: Optional[float]
+    base_order_average_price: Optional[float]
+    sold_amount: Optional[float]
+    sold_volume: Optional[float]
+    sold_average_price: Optional[float]
+    take_profit_type: Optional[str]
+    final_profit: Optional[float]
+    martingale_coefficient: Optional[float]
+    martingale_volume_coefficient: Optional[float]
+    martingale_step_coefficient: Optional[float]
+    stop_loss_percentage: Optional[float]
+    error_message: Optional[str]
+    profit_currency: Optional[str]
+    stop_loss_type: Optional[str]
+    safety_order_volume_type: Optional[str]
+    base_order_volume_type: Optional[str]
+    from_currency: Optional[str]
+    to_currency: Optional[str]
+    current_price: Optional[float]
+    take_profit_price: Optional[float]
+    stop_loss_price: Optional[str]
+    final_profit_percentage: Optional[float]
+    actual_profit_percentage: Optional[float]
+    bot_name: Optional[str]
+    account_name: Optional[str]
+    usd_final_profit: Optional[float]
+    actual_profit: Optional[float]
+    actual_usd_profit: Optional[float]
+    failed_message: Optional[str]
+    reserved_base_coin: Optional[float]
+    reserved_second_coin: Optional[float]
+    trailing_deviation: Optional[float]
+    trailing_max_price: Optional[float]
+    tsl_max_price: Optional[str]
+    strategy: Optional[str]
+    reserved_quote_funds: Optional[float]
+    reserved_base_funds: Optional[float]
+
+
+class BotRecord(ThreeCommasRecord):
+    _entity_type = BotEntity
+    __slots__ = (
+        'id',
+        'account_id',
+        'is_enabled',
+        'max_safety_orders',
+        'active_safety_orders_count',
+        'pairs',
+        'strategy_list',
+        'max_active_deals',
+        'active_deals_count',
+        'deletable',
+        'created_at',
+        'updated_at',
+        'trailing_enabled',
+        'tsl_enabled',
+        'deal_start_delay_seconds',
+        'stop_loss_timeout_enabled',
+        'stop_loss_timeout_in_seconds',
+        'disable_after_deals_count',
+        'deals_counter',
+        'allowed_deals_on_same_pair',
+        'easy_form_supported',
+        'close_deals_timeout',
+        'url_secret',
+        'name',
+        'take_profit',
+        'base_order_volume',
+        'safety_order_volume',
+        'safety_order_step_percentage',
+        'take_profit_type',
+        'type',
+        'martingale_volume_coefficient',
+        'martingale_step_coefficient',
+        'stop_loss_percentage',
+        'cooldown',
+        'btc_price_limit',
+        'strategy',
+        'min_volume_btc_24h',
+        'profit_currency',
+        'min_price',
+        'max_price',
+        'stop_loss_type',
+        'safety_order_volume_type',
+        'base_order_volume_type',
+        'account_name',
+        'trailing_deviation',
+        'finished_deals_profit_usd',
+        'finished_deals_count',
+        'leverage_type',
+        'leverage_custom_value',
+        'start_order_type',
+        'active_deals_usd_profit',
+    )
+
+    id: Optional[int]
+    account_id: Optional[int]
+    is_enabled: Optional[bool]
+    max_safety_orders: Optional[int]
+    active_safety_orders_count: Optional[int]
+    pairs: Optional[str]
+    strategy_list: Optional[str]
+    max_active_deals: Optional[int]
+    active_deals_count: Optional[int]
+    deletable: Optional[bool]
+    created_at: Optional[datetime.datetime]
+    updated_at: Optional[datetime.datetime]
+    trailing_enabled: Optional[bool]
+    tsl_enabled: Optional[bool]
+    deal_start_delay_seconds: Optional[int]
+    stop_loss_timeout_enabled: Optional[bool]
+    stop_loss_timeout_in_seconds: Optional[int]
+    disable_after_deals_count: Optional[int]
+    deals_counter: Optional[int]
+    allowed_deals_on_same_pair: Optional[int]
+    easy_form_supported: Optional[bool]
+    close_deals_timeout: Optional[int]
+    url_secret: Optional[str]
+    name: Optional[str]
+    take_profit: Optional[float]
+    base_order_volume: Optional[float]
+    safety_order_volume: Optional[float]
+    safety_order_step_percentage: Optional[float]
+    take_profit_type: Optional[str]
+    type: Optional[str]
+    martingale_volume_coefficient: Optional[float]
+    martingale_step_coefficient: Optional[float]
+    stop_loss_percentage: Optional[float]
+    cooldown: Optional[str]
+    btc_price_limit: Optional[float]
+    strategy: Optional[str]
+    min_volume_btc_24h: Optional[float]
+    profit_currency: Optional[str]
+    min_price: Optional[str]
+    max_price: Optional[str]
+    stop_loss_type: Optional[str]
+    safety_order_volume_type: Optional[str]
+    base_order_volume_type: Optional[str]
+    account_name: Optional[str]
+    trailing_deviation: Optional[float]
+    finished_deals_profit_usd: Optional[float]
+    finished_deals_count: Optional[int]
+    leverage_type: Optional[str]
+    leverage_custom_value: Optional[str]
+    start_order_type: Optional[str]
+    active_deals_usd_profit: Optional[float]
+
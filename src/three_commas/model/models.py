@@ -1,14 +1,98 @@
 from __future__ import annotations
-from typing import List, Union, Callable, TypeVar, Any, Generic, Optional
+from typing import List, Union, Callable, TypeVar, Any, Generic, Optional, Type
+from collections.abc import Mapping, MutableMapping
+import re
 import datetime
+import decimal
 import functools
+import collections
 import logging
+import sys
 from .. import configuration
 
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
+TR = TypeVar('TR', bound='ThreeCommasRecord')
+
+ISO_DATETIME_PATTERN = re.compile(r'(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6})\d*)?)?'
+                                  r'(Z|[+-]\d{2}:?\d{2})?$')
+DATETIME_CACHE_SIZE = 4096
+
+
+def _from_isoformat(value: str) -> datetime.datetime:
+    try:
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        pass
+    # before python 3.11 fromisoformat accepts neither the Z suffix nor fractions other than 3 or 6 digits
+    match = ISO_DATETIME_PATTERN.match(value)
+    if match is None:
+        raise ValueError(f'Invalid isoformat datetime: {value!r}')
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tzinfo = None
+    if offset == 'Z':
+        tzinfo = datetime.timezone.utc
+    elif offset:
+        offset = offset.replace(':', '')
+        minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+        tzinfo = datetime.timezone(datetime.timedelta(minutes=-minutes if offset[0] == '-' else minutes))
+    return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute), int(second or 0),
+                             int((fraction or '0').ljust(6, '0')), tzinfo=tzinfo)
+
+
+@functools.lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _parse_utc_datetime(value: str) -> datetime.datetime:
+    parsed = _from_isoformat(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed.astimezone(datetime.timezone.utc)
+
+
+@functools.lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _parse_naive_datetime(value: str) -> datetime.datetime:
+    if value.endswith('Z'):
+        # the usual 3commas timestamp, without the suffix it parses naive on every python version
+        try:
+            return datetime.datetime.fromisoformat(value[:-1])
+        except ValueError:
+            pass
+    parsed = _from_isoformat(value)
+    if parsed.tzinfo is None:
+        return parsed
+    return parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def parse_datetime(value: str, utc: bool = None) -> datetime.datetime:
+    """
+    Parses the iso 8601 timestamps of 3commas, e.g. 2022-01-09T17:32:13.632Z, with or without fractional seconds.
+    The repeated values are answered from a cache.
+    :param utc: True returns a timezone aware utc datetime, False a naive one in utc.
+    None uses THREE_COMMAS_AUTO_PARSE_DATETIME_UTC
+    """
+    if utc is None:
+        utc = configuration.THREE_COMMAS_AUTO_PARSE_DATETIME_UTC
+    return _parse_utc_datetime(value) if utc else _parse_naive_datetime(value)
+
+
+def parse_many(values: List[Optional[str]], utc: bool = None) -> List[Optional[datetime.datetime]]:
+    """
+    parse_datetime of every value, None values stay None
+    """
+    if utc is None:
+        utc = configuration.THREE_COMMAS_AUTO_PARSE_DATETIME_UTC
+    parse = _parse_utc_datetime if utc else _parse_naive_datetime
+    return [None if value is None else parse(value) for value in values]
+
+
+def format_datetime(value: datetime.datetime) -> str:
+    """
+    Formats the datetime like the 3commas timestamps, e.g. 2022-01-09T17:32:13.632Z. Naive datetimes are taken as utc
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc)
+    return f'{value:%Y-%m-%dT%H:%M:%S}.{value.microsecond // 1000:03d}Z'
 
 
 class ThreeCommasParser:
@@ -23,7 +107,7 @@ class ThreeCommasParser:
                 return None
             if parsed is None:
                 parsed = configuration.THREE_COMMAS_AUTO_PARSE_DATETIME_DEFAULT
-            return datetime.datetime.strptime(timestamp, ThreeCommasParser.DATETIME_PATTERN) if parsed else timestamp
+            return parse_datetime(timestamp) if parsed else timestamp
         return wrapper
 
     @staticmethod
@@ -131,17 +215,228 @@ class ThreeCommasDict(dict):
         super().__init__(*args, **kwargs)
 
     @classmethod
-    def of_list(cls, list_of_d: List[dict]) -> List[cls]:
-        if list_of_d is None:
-            return list()
-        return [cls(d) for d in list_of_d]
+    def of_list(cls, list_of_d: List[dict], lazy: bool = None) -> List[cls]:
+        """
+        :param lazy: None follows THREE_COMMAS_LAZY_MODEL_LISTS. A lazy list creates the model of an element
+        when the element is first read, an eager one creates all models at once
+        """
+        return _of_list(cls, list_of_d, lazy)
 
     def __repr__(self):
         return f'{self.__class__.__name__}({super().__repr__()})'
 
 
+def _of_list(model_type: type, list_of_d: List[dict], lazy: bool = None, intern: bool = False) -> list:
+    if intern and list_of_d:
+        _intern_fields(model_type._interned_fields, list_of_d)
+    if lazy is None:
+        lazy = configuration.THREE_COMMAS_LAZY_MODEL_LISTS
+    if lazy:
+        return LazyModelList(model_type, list_of_d or ())
+    if list_of_d is None:
+        return list()
+    return [model_type(d) for d in list_of_d]
+
+
+def _intern_fields(fields: tuple, list_of_d: List[dict]):
+    """
+    Replaces the str values of the fields in the dicts, in place, by the equal interned strings.
+    The dicts then share one string per distinct value instead of holding a copy each
+    """
+    if not fields:
+        return
+    for d in list_of_d:
+        for key in fields:
+            value = d.get(key)
+            if type(value) is str:
+                d[key] = sys.intern(value)
+
+
+def _to_unparsed(value):
+    """
+    The value as decoded from the json, with the submodels of ModelParser fields back as dicts and lists
+    """
+    if isinstance(value, (ThreeCommasModel, ThreeCommasView)):
+        return {key: _to_unparsed(item) for key, item in value.items()}
+    if isinstance(value, LazyModelList):
+        return [_to_unparsed(item) for item in list.__iter__(value)]
+    return value
+
+
+class LazyModelList(list):
+    """
+    List of models that holds the decoded dicts and replaces an element by its model when the element is
+    first read, through indexing, iteration or pop. The list operations that only compare the elements
+    (==, in, index, count, remove) and json encoding work on the dicts without creating the models.
+    Slices and concatenations are lazy lists too.
+    """
+    __slots__ = ('_model_type',)
+
+    def __init__(self, model_type: type, list_of_d=()):
+        super().__init__(list_of_d)
+        self._model_type = model_type
+
+    def _get_model(self, index: int):
+        item = list.__getitem__(self, index)
+        if type(item) is not self._model_type:
+            item = self._model_type(item)
+            list.__setitem__(self, index, item)
+        return item
+
+    def _get_items(self) -> list:
+        return list.__getitem__(self, slice(None))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyModelList(self._model_type, list.__getitem__(self, index))
+        return self._get_model(index)
+
+    def __iter__(self):
+        if set(map(type, list.__iter__(self))) <= {self._model_type}:
+            # all models are built, the iterator of list is faster
+            return list.__iter__(self)
+        return self._iter_building()
+
+    def _iter_building(self):
+        model_type = self._model_type
+        set_item = list.__setitem__
+        for index, item in enumerate(list.__iter__(self)):
+            if type(item) is not model_type:
+                item = model_type(item)
+                set_item(self, index, item)
+            yield item
+
+    def __reversed__(self):
+        for index in range(len(self) - 1, -1, -1):
+            yield self._get_model(index)
+
+    def pop(self, index: int = -1):
+        item = self._get_model(index)
+        list.pop(self, index)
+        return item
+
+    def sort(self, *, key=None, reverse: bool = False):
+        items = list(self)
+        items.sort(key=key, reverse=reverse)
+        list.__setitem__(self, slice(None), items)
+
+    def copy(self) -> LazyModelList:
+        return LazyModelList(self._model_type, self._get_items())
+
+    def __add__(self, other) -> LazyModelList:
+        return LazyModelList(self._model_type, self._get_items() + list.__getitem__(other, slice(None)))
+
+    def __radd__(self, other) -> LazyModelList:
+        return LazyModelList(self._model_type, list.__getitem__(other, slice(None)) + self._get_items())
+
+    def __mul__(self, n: int) -> LazyModelList:
+        return LazyModelList(self._model_type, self._get_items() * n)
+
+    __rmul__ = __mul__
+
+    def __reduce__(self):
+        return LazyModelList, (self._model_type, self._get_items())
+
+    def __repr__(self):
+        return repr(list(self))
+
+
+class Field:
+    """
+    Descriptor of a declared field without parser, reads the dict item
+    """
+    __slots__ = ('name', 'key')
+
+    def __init__(self, name: str, key: str):
+        self.name = name
+        self.key = key
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        return instance.get(self.key)
+
+
+class ParsedField(Field):
+    """
+    Descriptor of a declared field with parser, reads the dict item and parses it with the default parsing.
+    The parsed value is kept in the instance __dict__ under the field name, so the next reads find it there
+    without calling the descriptor.
+    """
+    __slots__ = ('parser',)
+
+    def __init__(self, name: str, key: str, parser: Parser):
+        super().__init__(name, key)
+        self.parser = parser
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.get(self.key)
+        if value is None:
+            return None
+
+        try:
+            parsed_value = self.parser.parse(value=value)
+        except Exception:
+            parsed_value = value
+        if self.parser.replaces_value:
+            instance._replace_value(self.key, parsed_value)
+        if instance._owned:
+            instance.__dict__[self.name] = parsed_value
+        return parsed_value
+
+
+def _get_field_names(cls) -> set:
+    names = set(getattr(cls, '_parse_map', dict())).union(getattr(cls, '_name_proxy', dict()))
+    for klass in cls.__mro__:
+        names.update(klass.__dict__.get('__annotations__', dict()))
+    return names
+
+
+def _create_fields(cls):
+    parse_map = getattr(cls, '_parse_map', dict())
+    name_proxy = getattr(cls, '_name_proxy', dict())
+    # {dict key: names of the ParsedFields of the key}, their cached values are dropped when the item is set
+    parsed_field_names = dict()
+    for name in _get_field_names(cls):
+        # methods and class attributes keep precedence over the fields, as with __getattr__
+        if not isinstance(getattr(cls, name, None), (Field, type(None))):
+            continue
+        key = name_proxy.get(name, name)
+        parser = parse_map.get(key)
+        setattr(cls, name, Field(name, key) if parser is None else ParsedField(name, key, parser))
+        if parser is not None:
+            parsed_field_names[key] = (*parsed_field_names.get(key, ()), name)
+    cls._parsed_field_names = parsed_field_names
+
+
 class ThreeCommasModel(ThreeCommasDict):
+    """
+    The declared fields of the subclasses are read through a Field or ParsedField descriptor built when the class
+    is created. Other names fall back to __getattr__, as do the ParsedProxy reads with an explicit parsed.
+
+    The parsed values are cached per instance: the declared fields in the instance __dict__ by field name,
+    the other reads in _parsed_values, by name for the default parsing and by (name, parsed) for an explicit one.
+    The instance __dict__ holds nothing else. Setting a value through the attribute or the dict drops its
+    cached values.
+
+    _interned_fields are the low cardinality str fields, e.g. pair or status, interned by intern_fields.
+    """
+    PARSED_VALUES_KEY = '_parsed_values'
+    _parsed_field_names = dict()
+    _interned_fields = ()
+    # the model copies its dict, so the parsed values can always be cached
+    _owned = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _create_fields(cls)
+
     def __getattr__(self, name, parsed: bool = None):
+        if name.startswith('__') and name.endswith('__'):
+            # e.g. __setstate__ or __deepcopy__ looked up by copy and pickle
+            raise AttributeError(name)
         proxy_name = self._name_proxy.get(name)
         if proxy_name:
             name = proxy_name
@@ -150,18 +445,35 @@ class ThreeCommasModel(ThreeCommasDict):
         if value is None:
             return None
         if parsed is False:
-            return value
+            return _to_unparsed(value)
 
         parser: Parser = self.__class__._parse_map.get(name)
         if parser is None:
             return value
+
+        cache_key = name if parsed is None else (name, parsed)
+        parsed_values = self.__dict__.get(ThreeCommasModel.PARSED_VALUES_KEY)
+        if parsed_values is not None and cache_key in parsed_values:
+            return parsed_values[cache_key]
+
         try:
             if parsed is None:
-                return parser.parse(value=value)
+                parsed_value = parser.parse(value=value)
             else:
-                return parser.parse(value=value, parsed=parsed)
+                parsed_value = parser.parse(value=value, parsed=parsed)
         except Exception:
-            return value
+            parsed_value = value
+        if parser.replaces_value:
+            self._replace_value(name, parsed_value)
+        if self._owned:
+            if parsed_values is None:
+                parsed_values = self.__dict__[ThreeCommasModel.PARSED_VALUES_KEY] = dict()
+            parsed_values[cache_key] = parsed_value
+        return parsed_value
+
+    def _replace_value(self, key, value):
+        # keeps the parsed values cached
+        dict.__setitem__(self, key, value)
 
     def __setattr__(self, name, value):
         proxy_name = self._name_proxy.get(name)
@@ -170,11 +482,153 @@ class ThreeCommasModel(ThreeCommasDict):
         else:
             self[name] = value
 
+    def _drop_parsed_value(self, name):
+        instance_dict = self.__dict__
+        if not instance_dict:
+            return
+        for field_name in self._parsed_field_names.get(name, ()):
+            instance_dict.pop(field_name, None)
+        parsed_values = instance_dict.get(ThreeCommasModel.PARSED_VALUES_KEY)
+        if parsed_values:
+            for cache_key in (name, (name, True)):
+                parsed_values.pop(cache_key, None)
+
+    def _drop_parsed_values(self):
+        self.__dict__.clear()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._drop_parsed_value(key)
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._drop_parsed_value(key)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._drop_parsed_values()
+
+    def __ior__(self, other):
+        self._drop_parsed_values()
+        return super().__ior__(other)
+
+    def pop(self, *args):
+        self._drop_parsed_values()
+        return super().pop(*args)
+
+    def popitem(self):
+        self._drop_parsed_values()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._drop_parsed_value(key)
+        return super().setdefault(key, default)
+
+    def clear(self):
+        super().clear()
+        self._drop_parsed_values()
+
+    def __reduce__(self):
+        # the dict only, without the parsed value cache of the instance __dict__
+        return self.__class__, (dict(self),)
+
+    @classmethod
+    def of_list(cls,
+                list_of_d: List[dict],
+                lazy: bool = None,
+                view: bool = None,
+                intern: bool = None) -> List[cls]:
+        """
+        :param lazy: None follows THREE_COMMAS_LAZY_MODEL_LISTS. A lazy list creates the model of an element
+        when the element is first read, an eager one creates all models at once
+        :param view: None follows THREE_COMMAS_MODEL_VIEWS. With view the elements are views of the dicts
+        instead of copies, see view
+        :param intern: None follows THREE_COMMAS_INTERN_STRINGS. Interns the low cardinality fields of the dicts
+        first, see intern_fields
+        """
+        if view is None:
+            view = configuration.THREE_COMMAS_MODEL_VIEWS
+        if intern is None:
+            intern = configuration.THREE_COMMAS_INTERN_STRINGS
+        return _of_list(cls.get_view_type() if view else cls, list_of_d, lazy, intern)
+
+    @classmethod
+    def intern_fields(cls, list_of_d: List[dict]) -> List[dict]:
+        """
+        Replaces the values of the _interned_fields of the dicts, in place, by equal interned strings.
+        A large result set then holds one string per distinct pair, status or currency instead of one per dict.
+        Returns list_of_d
+        """
+        _intern_fields(cls._interned_fields, list_of_d)
+        return list_of_d
+
+    @classmethod
+    def view(cls, d: Optional[dict]) -> ThreeCommasView:
+        """
+        View of d with the fields and parsing of this model, without copying d. See ThreeCommasView
+        """
+        return cls.get_view_type()(d)
+
+    @classmethod
+    def get_view_type(cls) -> Type[ThreeCommasView]:
+        view_type = getattr(cls, '_view_type', None)
+        # the view type of a base class is inherited
+        if view_type is None or view_type._entity_type is not cls:
+            annotations = dict()
+            for klass in reversed(cls.__mro__):
+                annotations.update(klass.__dict__.get('__annotations__', dict()))
+            view_type = type(f'{cls.__name__}View', (ThreeCommasView,), {
+                '__module__': cls.__module__,
+                '__annotations__': annotations,
+                '_parse_map': getattr(cls, '_parse_map', dict()),
+                '_name_proxy': getattr(cls, '_name_proxy', dict()),
+                '_record_type': getattr(cls, '_record_type', None),
+                '_interned_fields': getattr(cls, '_interned_fields', ()),
+                '_entity_type': cls,
+            })
+            cls._view_type = view_type
+        return view_type
+
+    def to_parsed_dict(self, datetimes: bool = True) -> dict:
+        """
+        Copy of the dict with all fields converted, see ParsePlan
+        """
+        return get_parse_plan(self.__class__, datetimes=datetimes).to_parsed_dict(self)
+
+    def to_row(self, row_type: type = None, datetimes: bool = True) -> tuple:
+        """
+        The converted fields as a namedtuple, e.g. to insert into a database. See ParsePlan
+        """
+        return get_parse_plan(self.__class__, datetimes=datetimes, row_type=row_type).to_row(self)
+
+    @classmethod
+    def parse_all(cls, list_of_d: List[dict], datetimes: bool = True) -> List[dict]:
+        """
+        to_parsed_dict of every dict or model of the list
+        """
+        return get_parse_plan(cls, datetimes=datetimes).parse_all(list_of_d)
+
+    @classmethod
+    def to_rows(cls, list_of_d: List[dict], row_type: type = None, datetimes: bool = True) -> list:
+        """
+        to_row of every dict or model of the list
+        """
+        return get_parse_plan(cls, datetimes=datetimes, row_type=row_type).to_rows(list_of_d)
+
     TP = TypeVar('TP')
 
     def parsed(self: TP, parsed: bool) -> TP:
         return ParsedProxy(model=self, parsed=parsed)
 
+    def to_record(self) -> ThreeCommasRecord:
+        """
+        The compact record of this model, e.g. a DealRecord of a DealEntity
+        """
+        record_type = getattr(self.__class__, '_record_type', None)
+        if record_type is None:
+            raise TypeError(f'{self.__class__.__name__} has no record type')
+        return record_type.of_dict(self)
+
 
 class ParsedProxy:
     MODEL_KEY = '_model'
@@ -191,19 +645,121 @@ class ParsedProxy:
         self.model.__setattr__(key, value)
 
 
+class ThreeCommasView(MutableMapping):
+    """
+    Model over a decoded dict by reference, e.g. DealEntity.view(d). It has the fields, parsing and parsed value
+    cache of its model, but it is not a dict: use to_entity for a model, or dict(view).
+    The view never changes the wrapped dict. The first change through the view copies the dict,
+    the view owns and changes the copy from then on. Changes of the wrapped dict by its owner are seen by the view,
+    the parsed values are therefore cached only once the view owns its copy.
+    """
+    __slots__ = ('_data', '_owned', '__dict__')
+    _parse_map: dict = dict()
+    _name_proxy: dict = dict()
+    _parsed_field_names: dict = dict()
+    _interned_fields: tuple = ()
+    _record_type: type = None
+    _entity_type: type = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _create_fields(cls)
+
+    def __init__(self, d: Optional[Mapping] = None):
+        object.__setattr__(self, '_data', dict() if d is None else d)
+        object.__setattr__(self, '_owned', d is None)
+
+    def _own(self) -> dict:
+        if not self._owned:
+            object.__setattr__(self, '_data', dict(self._data))
+            object.__setattr__(self, '_owned', True)
+        return self._data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __setitem__(self, key, value):
+        self._own()[key] = value
+        self._drop_parsed_value(key)
+
+    def __delitem__(self, key):
+        del self._own()[key]
+        self._drop_parsed_value(key)
+
+    def clear(self):
+        object.__setattr__(self, '_data', dict())
+        object.__setattr__(self, '_owned', True)
+        self._drop_parsed_values()
+
+    def __eq__(self, other):
+        if isinstance(other, ThreeCommasView):
+            other = other._data
+        elif not isinstance(other, Mapping):
+            return NotImplemented
+        return self._data == other
+
+    __hash__ = None
+
+    def copy(self) -> ThreeCommasView:
+        return self.__class__(dict(self._data))
+
+    def to_entity(self) -> ThreeCommasModel:
+        return self._entity_type(self._data)
+
+    def _replace_value(self, key, value):
+        # the submodel goes into the copy of the dict, so that its changes are seen through the view
+        self._own()[key] = value
+
+    def __reduce__(self):
+        return self._entity_type.view, (dict(self._data),)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._data!r})'
+
+    __getattr__ = ThreeCommasModel.__getattr__
+    __setattr__ = ThreeCommasModel.__setattr__
+    _drop_parsed_value = ThreeCommasModel._drop_parsed_value
+    _drop_parsed_values = ThreeCommasModel._drop_parsed_values
+    parsed = ThreeCommasModel.parsed
+    to_record = ThreeCommasModel.to_record
+    to_parsed_dict = ThreeCommasModel.to_parsed_dict
+    to_row = ThreeCommasModel.to_row
+
+
 class Parser:
+    # the conversion of parse with parsed=True
+    convert: Callable[[Any], Any] = None
+    # the parsed value replaces the value in the dict of the model
+    replaces_value: bool = False
+
     @staticmethod
     def parse(value: str, parsed: bool = None):
         raise NotImplemented("The method for parsing was not implemented")
 
 
 class IntParser(Parser):
+    convert = int
+
     @staticmethod
     def parse(value: str, parsed: bool = True) -> Union[str, int]:
         return int(value) if parsed else value
 
 
 class FloatParser(Parser):
+    convert = float
+
     @staticmethod
     def parse(value: str, parsed: bool = True) -> Union[str, float]:
         return float(value) if parsed else value
@@ -211,7 +767,235 @@ class FloatParser(Parser):
 
 class DatetimeParser(Parser):
     DATETIME_PATTERN = '%Y-%m-%dT%H:%M:%S.%fZ'
+    convert = staticmethod(parse_datetime)
 
     @staticmethod
     def parse(value, parsed: bool = False) -> Union[str, datetime]:
-        return datetime.datetime.strptime(value, DatetimeParser.DATETIME_PATTERN) if parsed else value
+        return parse_datetime(value) if parsed else value
+
+
+class ModelParser(Parser):
+    """
+    Parses a nested dict into its model. The model replaces the dict in the parent model, so it is created
+    on the first read only and changing it changes the parent. A view copies its dict first and replaces the
+    dict in the copy, the wrapped dict keeps the nested dict. parsed(False) returns a copy of the nested dict.
+    """
+    model_type: type = None
+    replaces_value = True
+
+    @classmethod
+    def of(cls, model_type: type) -> Type[ModelParser]:
+        def convert(value):
+            return value if type(value) is model_type else model_type(value)
+        return type(f'{model_type.__name__}Parser', (cls,), {'model_type': model_type, 'convert': staticmethod(convert)})
+
+    @classmethod
+    def parse(cls, value, parsed: bool = True):
+        return cls.convert(value) if parsed else value
+
+
+class ModelListParser(ModelParser):
+    """
+    Parses a nested list of dicts into a LazyModelList of their model
+    """
+    @classmethod
+    def of(cls, model_type: type) -> Type[ModelListParser]:
+        def convert(value):
+            return value if isinstance(value, LazyModelList) else LazyModelList(model_type, value)
+        return type(f'{model_type.__name__}ListParser', (cls,), {'model_type': model_type,
+                                                                 'convert': staticmethod(convert)})
+
+
+class ParsePlan:
+    """
+    The conversions of all fields of a model, derived once per model class from its _parse_map and _name_proxy.
+    Converts a dict or a model, or a list of them, in one loop instead of an attribute read per field.
+    Values that can not be converted are kept, like the attribute reads do.
+
+    :param datetimes: convert the datetime fields too, as with parsed(True)
+    :param row_type: the tuple type of to_row. A NamedTuple class takes the model fields of its field names,
+    None a namedtuple of all declared fields of the model
+    """
+    def __init__(self, model_type: type, datetimes: bool = True, row_type: type = None):
+        parse_map = getattr(model_type, '_parse_map', dict())
+        name_proxy = getattr(model_type, '_name_proxy', dict())
+        self.conversions = tuple((key, parser.convert) for key, parser in parse_map.items()
+                                 if parser.convert is not None and (datetimes or not issubclass(parser, DatetimeParser)))
+        conversion_of_key = dict(self.conversions)
+        if row_type is None:
+            names = dict()
+            for klass in reversed(model_type.__mro__):
+                names.update(klass.__dict__.get('__annotations__', dict()))
+            row_type = collections.namedtuple(f'{model_type.__name__}Row', list(names), rename=True)
+            row_names = list(names)
+        else:
+            row_names = getattr(row_type, '_fields', None)
+            if row_names is None:
+                raise TypeError(f'{row_type.__name__} is not a NamedTuple')
+        self.row_type = row_type
+        self.row_fields = tuple((name_proxy.get(name, name), conversion_of_key.get(name_proxy.get(name, name)))
+                                for name in row_names)
+
+    def to_parsed_dict(self, d: Mapping) -> dict:
+        result = dict(d)
+        for key, convert in self.conversions:
+            value = result.get(key)
+            if value is not None:
+                try:
+                    result[key] = convert(value)
+                except Exception:
+                    pass
+        return result
+
+    def parse_all(self, list_of_d: List[Mapping]) -> List[dict]:
+        to_parsed_dict = self.to_parsed_dict
+        return [to_parsed_dict(d) for d in list_of_d or ()]
+
+    def to_row(self, d: Mapping) -> tuple:
+        get = d.get
+        values = list()
+        for key, convert in self.row_fields:
+            value = get(key)
+            if convert is not None and value is not None:
+                try:
+                    value = convert(value)
+                except Exception:
+                    pass
+            values.append(value)
+        return tuple.__new__(self.row_type, values)
+
+    def to_rows(self, list_of_d: List[Mapping]) -> list:
+        to_row = self.to_row
+        return [to_row(d) for d in list_of_d or ()]
+
+
+_parse_plans = dict()
+
+
+def get_parse_plan(model_type: type, datetimes: bool = True, row_type: type = None) -> ParsePlan:
+    """
+    The cached ParsePlan of a model, or of the model of a view
+    """
+    model_type = getattr(model_type, '_entity_type', None) or model_type
+    plan_key = model_type, datetimes, row_type
+    plan = _parse_plans.get(plan_key)
+    if plan is None:
+        plan = _parse_plans[plan_key] = ParsePlan(model_type, datetimes=datetimes, row_type=row_type)
+    return plan
+
+
+def _loses_information(value, converted) -> bool:
+    """
+    Whether the converted value differs from the number sent by the api, not only in its formatting
+    """
+    if isinstance(value, str):
+        # a decimal string of at most 15 characters has at most 15 significant digits, which a float keeps
+        return len(value) > 15 and isinstance(converted, float) and decimal.Decimal(value) != decimal.Decimal(repr(converted))
+    return converted != value
+
+
+class ThreeCommasRecord:
+    """
+    Compact representation of a ThreeCommasModel for large histories. The subclasses declare
+    __slots__ with the fields of their _entity_type. The values are parsed once when the record is created,
+    the datetimes always. Fields of the dict that are not declared are dropped, to_dict returns the declared ones.
+    The rare values the conversion loses, e.g. a float with more digits than a float holds, are kept as sent
+    in _raw_values for to_dict. Only their formatting, e.g. '0' or 0 of a float field, is not kept.
+    """
+    __slots__ = ('_raw_values',)
+    _entity_type: type = None
+    # (attribute name, dict key, conversion of the parsed value, is a datetime) of every field
+    _fields: tuple = ()
+    _plain_fields: tuple = ()
+    _converted_fields: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        entity_type = cls._entity_type
+        parse_map = entity_type._parse_map
+        name_proxy = entity_type._name_proxy
+        fields = list()
+        for name in cls.__slots__:
+            key = name_proxy.get(name, name)
+            parser = parse_map.get(key)
+            is_datetime = parser is not None and issubclass(parser, DatetimeParser)
+            fields.append((name, key, parser and parser.convert, is_datetime))
+        cls._fields = tuple(fields)
+        cls._plain_fields = tuple((name, key) for name, key, convert, _ in fields if convert is None)
+        cls._converted_fields = tuple(field for field in fields if field[2] is not None)
+        entity_type._record_type = cls
+
+    @classmethod
+    def of_dict(cls: Type[TR], d: dict) -> TR:
+        record = cls.__new__(cls)
+        get = d.get
+        for name, key in cls._plain_fields:
+            setattr(record, name, get(key))
+        raw_values = None
+        for name, key, convert, is_datetime in cls._converted_fields:
+            value = get(key)
+            if value is not None:
+                try:
+                    converted = convert(value)
+                except (TypeError, ValueError):
+                    converted = value
+                else:
+                    if not is_datetime and _loses_information(value, converted):
+                        raw_values = (raw_values or ()) + ((key, value),)
+                value = converted
+            setattr(record, name, value)
+        record._raw_values = raw_values
+        return record
+
+    @classmethod
+    def of_list(cls: Type[TR], list_of_d: List[dict], intern: bool = None) -> List[TR]:
+        """
+        Records of the decoded json, without creating the models first
+        :param intern: None follows THREE_COMMAS_INTERN_STRINGS, see ThreeCommasModel.intern_fields
+        """
+        if list_of_d is None:
+            return list()
+        if intern is None:
+            intern = configuration.THREE_COMMAS_INTERN_STRINGS
+        if intern:
+            _intern_fields(cls._entity_type._interned_fields, list_of_d)
+        return [cls.of_dict(d) for d in list_of_d]
+
+    def to_dict(self) -> dict:
+        """
+        The dict of the declared fields, the parsed values formatted like the api sends them
+        """
+        d = dict()
+        for name, key, convert, _ in self._fields:
+            value = getattr(self, name)
+            if convert is not None:
+                if isinstance(value, datetime.datetime):
+                    value = format_datetime(value)
+                elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                    value = str(value)
+            d[key] = value
+        if self._raw_values:
+            d.update(self._raw_values)
+        return d
+
+    def to_entity(self):
+        return self._entity_type(self.to_dict())
+
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{self.__class__.__name__}({fields})'
+
+    def __getstate__(self):
+        return (*(getattr(self, name) for name in self.__slots__), self._raw_values)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            setattr(self, name, value)
+        self._raw_values = state[-1]
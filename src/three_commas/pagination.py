@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator
+from .error import ThreeCommasPaginationException
+
+
+logger = logging.getLogger(__name__)
+
+
+def offset_page_params(page_index: int, page_size: int) -> dict:
+    return {'offset': page_index * page_size, 'limit': page_size}
+
+
+def numbered_page_params(page_index: int, page_size: int) -> dict:
+    return {'page': page_index + 1, 'per_page': page_size}
+
+
+def clamp_page_size(page_size: int, max_page_size: int = None) -> int:
+    if page_size < 1:
+        raise ValueError(f'page_size must be positive, got {page_size}')
+    if max_page_size is not None and page_size > max_page_size:
+        logger.debug(f'page_size {page_size} is above the server maximum, using {max_page_size}')
+        return max_page_size
+    return page_size
+
+
+def _get_page(function: Callable, page_params: dict, kwargs: dict) -> list:
+    error, page = function(**{**kwargs, **page_params})
+    if error:
+        raise ThreeCommasPaginationException(error=error, page_params=page_params)
+    return page
+
+
+async def _aio_get_page(function: Callable, page_params: dict, kwargs: dict) -> list:
+    error, page = await function(**{**kwargs, **page_params})
+    if error:
+        raise ThreeCommasPaginationException(error=error, page_params=page_params)
+    return page
+
+
+def iter_pages(function: Callable,
+               page_params: Callable[[int, int], dict],
+               page_size: int,
+               prefetch: bool = True,
+               max_page_size: int = None,
+               **kwargs) -> Iterator:
+    """
+    Yields the elements of all pages of a list endpoint.
+    While a page is consumed the next one is fetched in a background thread, so at most two pages are held in memory.
+    The iteration stops at the first page with less than page_size elements.
+    :param function: the api function of the list endpoint
+    :param page_params: returns the query parameters of a page, from the page index and the page size
+    :param max_page_size: the largest page the server returns, a larger page_size is clamped to it
+    :param kwargs: the other arguments of function
+    """
+    page_size = clamp_page_size(page_size, max_page_size)
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='three_commas_prefetch') if prefetch else None
+    try:
+        page_index = 0
+        next_page = None
+        if prefetch:
+            next_page = executor.submit(_get_page, function, page_params(page_index, page_size), kwargs)
+        while True:
+            if prefetch:
+                page = next_page.result()
+            else:
+                page = _get_page(function, page_params(page_index, page_size), kwargs)
+            is_last_page = len(page) < page_size
+            page_index += 1
+            if prefetch and not is_last_page:
+                next_page = executor.submit(_get_page, function, page_params(page_index, page_size), kwargs)
+            yield from page
+            if is_last_page:
+                return
+    finally:
+        if executor is not None:
+            if next_page is not None:
+                next_page.cancel()
+            executor.shutdown(wait=False)
+
+
+async def aio_iter_pages(function: Callable,
+                         page_params: Callable[[int, int], dict],
+                         page_size: int,
+                         prefetch: bool = True,
+                         max_page_size: int = None,
+                         **kwargs) -> AsyncIterator:
+    """
+    Asyncio counterpart of iter_pages, the next page is fetched in a task
+    """
+    page_size = clamp_page_size(page_size, max_page_size)
+    page_index = 0
+    next_page = asyncio.ensure_future(_aio_get_page(function, page_params(page_index, page_size), kwargs))
+    try:
+        while True:
+            page = await next_page
+            is_last_page = len(page) < page_size
+            page_index += 1
+            if not is_last_page:
+                next_page = _aio_get_page(function, page_params(page_index, page_size), kwargs)
+                if prefetch:
+                    next_page = asyncio.ensure_future(next_page)
+            for element in page:
+                yield element
+            if is_last_page:
+                return
+    finally:
+        if isinstance(next_page, asyncio.Future):
+            next_page.cancel()
+        elif asyncio.iscoroutine(next_page):
+            next_page.close()
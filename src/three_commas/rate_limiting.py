@@ -0,0 +1,175 @@
+import asyncio
+import time
+import logging
+import threading
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Callable, Dict, Tuple
+from py3cw.config import API_METHODS
+from . import configuration
+from .metrics import metrics
+from .generated_endpoints import PUBLIC_ENDPOINTS
+
+
+logger = logging.getLogger(__name__)
+
+
+class EndpointClass(str, Enum):
+    PUBLIC = 'public'
+    READ = 'read'
+    WRITE = 'write'
+
+
+def get_endpoint_class(entity: str, action: str) -> EndpointClass:
+    if (entity, action) in PUBLIC_ENDPOINTS:
+        return EndpointClass.PUBLIC
+    method = API_METHODS.get(entity, dict()).get(action, ('GET', ''))[0]
+    return EndpointClass.READ if method == 'GET' else EndpointClass.WRITE
+
+
+@dataclass
+class BucketMetrics:
+    queue_depth: int = 0
+    acquired: int = 0
+    waited: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class TokenBucket:
+    """
+    Token bucket refilled with rate tokens per second, holding at most burst tokens.
+    A token is reserved on acquire even when the bucket is empty, the tokens go negative and
+    the caller waits until its token is refilled. This serves the waiting callers in order.
+    """
+    def __init__(self, rate: float, burst: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self.tokens = burst
+        self.updated_at = clock()
+        self.metrics = BucketMetrics()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token
+        :return: the seconds to wait until the token may be used
+        """
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            wait_seconds = max(0.0, -self.tokens / self.rate)
+
+            self.metrics.acquired += 1
+            if wait_seconds > 0:
+                self.metrics.waited += 1
+                self.metrics.queue_depth += 1
+                self.metrics.total_wait_seconds += wait_seconds
+                self.metrics.max_wait_seconds = max(self.metrics.max_wait_seconds, wait_seconds)
+            return wait_seconds
+
+    def _done_waiting(self):
+        with self._lock:
+            self.metrics.queue_depth -= 1
+
+    def acquire(self) -> float:
+        wait_seconds = self.reserve()
+        if wait_seconds > 0:
+            try:
+                time.sleep(wait_seconds)
+            finally:
+                self._done_waiting()
+        return wait_seconds
+
+    async def aio_acquire(self) -> float:
+        wait_seconds = self.reserve()
+        if wait_seconds > 0:
+            try:
+                await asyncio.sleep(wait_seconds)
+            finally:
+                self._done_waiting()
+        return wait_seconds
+
+
+class RateLimiter:
+    """
+    Keeps one token bucket per api key and endpoint class. Requests block (or await) until a token is free
+    instead of running into the 429 responses of 3commas.
+    """
+    def __init__(self, limits: Dict[EndpointClass, Tuple[float, float]] = None, enabled: bool = None):
+        """
+        :param limits: (requests per second, burst) for every endpoint class
+        """
+        self.enabled = configuration.THREE_COMMAS_RATE_LIMIT if enabled is None else enabled
+        self.limits = limits or {
+            EndpointClass.PUBLIC: (configuration.THREE_COMMAS_RATE_LIMIT_PUBLIC, configuration.THREE_COMMAS_RATE_LIMIT_PUBLIC),
+            EndpointClass.READ: (configuration.THREE_COMMAS_RATE_LIMIT_READ, configuration.THREE_COMMAS_RATE_LIMIT_READ),
+            EndpointClass.WRITE: (configuration.THREE_COMMAS_RATE_LIMIT_WRITE, configuration.THREE_COMMAS_RATE_LIMIT_WRITE),
+        }
+        self._buckets: Dict[Tuple[str, EndpointClass], TokenBucket] = dict()
+        self._lock = threading.Lock()
+
+    def configure(self, endpoint_class: EndpointClass, rate: float, burst: float = None):
+        """
+        Sets the requests per second of an endpoint class. Applies to the existing buckets too
+        """
+        burst = burst or rate
+        with self._lock:
+            self.limits[endpoint_class] = rate, burst
+            for (_, bucket_class), bucket in self._buckets.items():
+                if bucket_class == endpoint_class:
+                    bucket.rate, bucket.burst = rate, burst
+
+    def get_bucket(self, api_key: str, entity: str, action: str) -> TokenBucket:
+        endpoint_class = get_endpoint_class(entity, action)
+        # public endpoints are limited per ip, not per key. All keys share their bucket
+        key = (None if endpoint_class == EndpointClass.PUBLIC else api_key), endpoint_class
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    rate, burst = self.limits[endpoint_class]
+                    bucket = TokenBucket(rate=rate, burst=burst)
+                    self._buckets[key] = bucket
+        return bucket
+
+    def acquire(self, api_key: str, entity: str, action: str) -> float:
+        """
+        Blocks until the request may be sent
+        :return: the seconds waited
+        """
+        if not self.enabled:
+            return 0.0
+        wait_seconds = self.get_bucket(api_key, entity, action).acquire()
+        if wait_seconds:
+            metrics.rate_limit_waited(entity, action, wait_seconds)
+            logger.debug(f'Rate limited {entity}/{action} for {wait_seconds:.3f} seconds')
+        return wait_seconds
+
+    async def aio_acquire(self, api_key: str, entity: str, action: str) -> float:
+        if not self.enabled:
+            return 0.0
+        wait_seconds = await self.get_bucket(api_key, entity, action).aio_acquire()
+        if wait_seconds:
+            metrics.rate_limit_waited(entity, action, wait_seconds)
+            logger.debug(f'Rate limited {entity}/{action} for {wait_seconds:.3f} seconds')
+        return wait_seconds
+
+    def metrics(self) -> Dict[Tuple[str, str], BucketMetrics]:
+        """
+        :return: the metrics of every bucket, keyed by (blurred api key, endpoint class)
+        """
+        with self._lock:
+            return {(f'{api_key[:5]}...' if api_key else None, endpoint_class.value): replace(bucket.metrics)
+                    for (api_key, endpoint_class), bucket in self._buckets.items()}
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,61 @@
+"""
+Building, signing and decoding of the rest requests of the asyncio client, like py3cw does for the sync one
+"""
+import hmac
+import hashlib
+from typing import Tuple, Union
+from urllib.parse import urlencode, quote_plus
+from py3cw.config import API_VERSION_V1, API_VERSION_V2, API_VERSION_V2_ENTITIES, API_METHODS
+from . import codec
+
+
+def build_request(entity: str,
+                  action: str = '',
+                  action_id: str = None,
+                  action_sub_id: str = None,
+                  payload: any = None) -> Tuple[str, str, Union[str, None]]:
+    """
+    Builds the request exactly like py3cw does, so the signature is compatible
+    :return: http method, relative url, json body
+    """
+    if not entity or entity not in API_METHODS:
+        raise ValueError('Invalid entity')
+    if action not in API_METHODS[entity]:
+        raise ValueError('Invalid action')
+    method, api_path = API_METHODS[entity][action]
+    if '{id}' in api_path and not action_id:
+        raise ValueError(f'Missing ID for {action}')
+
+    api_path = api_path.replace('{id}', action_id or '').replace('{sub_id}', action_sub_id or '')
+    path = f"{entity}{'/' if api_path else ''}{api_path}"
+    if entity in API_VERSION_V2_ENTITIES:
+        relative_url = f"{API_VERSION_V2}{path.replace('_v2', '')}"
+    else:
+        relative_url = f"{API_VERSION_V1}{path}"
+
+    if method == 'GET' and payload:
+        relative_url += f"?{urlencode(payload, quote_via=quote_plus)}"
+    body = codec.dumps(payload) if method != 'GET' and payload else None
+    return method, relative_url, body
+
+
+def create_signature(payload, api_secret):
+    # the body is sent utf-8 encoded, as py3cw signs it
+    signature = hmac.new(bytes(api_secret, 'utf-8'),
+                         msg=bytes(payload, 'utf-8'),
+                         digestmod=hashlib.sha256).hexdigest()
+    return signature
+
+
+def to_response(response_json: any, status_code: int = None) -> Tuple[dict, Union[dict, list]]:
+    """
+    The (error, data) tuple of a decoded response
+    """
+    if isinstance(response_json, dict) and 'error' in response_json:
+        # same message format py3cw produces, ThreeCommasApiError parses it
+        return {'error': True,
+                'msg': 'Other error occurred: {} {} {}.'.format(response_json.get('error'),
+                                                                response_json.get('error_description'),
+                                                                response_json.get('error_attributes')),
+                'status_code': status_code}, {}
+    return {}, response_json
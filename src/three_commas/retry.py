@@ -0,0 +1,205 @@
+import asyncio
+import time
+import random
+import logging
+import threading
+import contextvars
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, FrozenSet, Optional, Tuple, Union
+from . import configuration
+from .rate_limiting import EndpointClass, get_endpoint_class
+from .metrics import metrics
+
+
+logger = logging.getLogger(__name__)
+_retry_after: contextvars.ContextVar = contextvars.ContextVar('retry_after', default=None)
+
+Response = Tuple[dict, Union[dict, list]]
+
+
+def parse_retry_after(retry_after: Optional[str], now: datetime = None) -> Optional[float]:
+    """
+    :param retry_after: value of the Retry-After header, either seconds or an http date
+    :return: the seconds to wait, None if the value is missing or invalid
+    """
+    if not retry_after:
+        return None
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - (now or datetime.now(timezone.utc))).total_seconds())
+
+
+def set_retry_after(retry_after: Optional[str]):
+    _retry_after.set(retry_after)
+
+
+def remember_retry_after(response, *args, **kwargs):
+    """
+    Response hook of the requests session, keeps the Retry-After header of the last response of this context
+    """
+    set_retry_after(response.headers.get('Retry-After'))
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter. The attempt n waits a random time between 0 and
+    min(max_delay, base_delay * 2 ** n), or the Retry-After of the response if it is given.
+    No retry is started that would end after budget seconds since the first attempt.
+    """
+    max_attempts: int = field(default_factory=lambda: configuration.THREE_COMMAS_RETRY_MAX_ATTEMPTS)
+    base_delay: float = field(default_factory=lambda: configuration.THREE_COMMAS_RETRY_BASE_DELAY)
+    max_delay: float = field(default_factory=lambda: configuration.THREE_COMMAS_RETRY_MAX_DELAY)
+    budget: float = field(default_factory=lambda: configuration.THREE_COMMAS_RETRY_BUDGET)
+    status_codes: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+
+    def is_retryable(self, error: dict) -> bool:
+        return bool(error) and error.get('status_code') in self.status_codes
+
+    def get_delay(self, attempt: int, retry_after: float = None) -> float:
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+default_retry_policy = RetryPolicy()
+
+
+def get_retry_policy(entity: str, action: str, retry: Union[bool, RetryPolicy] = None) -> Optional[RetryPolicy]:
+    """
+    :param retry: None retries the read endpoints with the default policy,
+    True retries every endpoint, False none. A RetryPolicy retries the endpoint with that policy.
+    """
+    if isinstance(retry, RetryPolicy):
+        return retry
+    if retry is False or (retry is None and not configuration.THREE_COMMAS_RETRY):
+        return None
+    if retry is None and get_endpoint_class(entity, action) == EndpointClass.WRITE:
+        return None
+    return default_retry_policy
+
+
+@dataclass
+class EndpointRetryCounter:
+    calls: int = 0
+    retries: int = 0
+    recovered: int = 0
+    exhausted: int = 0
+
+
+class RetryCounters:
+    """
+    Retry counters per endpoint. A call is recovered if it succeeded after a retry,
+    and exhausted if it still failed when the attempts or the budget ran out.
+    """
+    def __init__(self):
+        self._counters: Dict[str, EndpointRetryCounter] = dict()
+        self._lock = threading.Lock()
+
+    def count(self, endpoint: str, retries: int, failed: bool):
+        with self._lock:
+            counter = self._counters.setdefault(endpoint, EndpointRetryCounter())
+            counter.calls += 1
+            counter.retries += retries
+            if retries and not failed:
+                counter.recovered += 1
+            if retries and failed:
+                counter.exhausted += 1
+
+    def get(self) -> Dict[str, EndpointRetryCounter]:
+        with self._lock:
+            return {endpoint: replace(counter) for endpoint, counter in self._counters.items()}
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+
+
+retry_counters = RetryCounters()
+
+
+def get_endpoint_name(entity: str, action: str) -> str:
+    return f'{entity}.{action}' if action else entity
+
+
+class _Attempts:
+    """
+    Bookkeeping of the attempts of one call, shared by the sync and the asyncio retry loop
+    """
+    def __init__(self, policy: RetryPolicy, entity: str, action: str):
+        self.policy = policy
+        self.entity = entity
+        self.action = action
+        self.endpoint = get_endpoint_name(entity, action)
+        self.deadline = time.monotonic() + policy.budget
+        self.retries = 0
+
+    def get_delay(self, error: dict) -> Optional[float]:
+        """
+        :return: the seconds to wait before the next attempt, None if the call should not be retried
+        """
+        if not self.policy.is_retryable(error) or self.retries + 1 >= self.policy.max_attempts:
+            return None
+        delay = self.policy.get_delay(self.retries, retry_after=parse_retry_after(_retry_after.get()))
+        if time.monotonic() + delay > self.deadline:
+            logger.debug(f'Retry budget of {self.endpoint} is spent')
+            return None
+        self.retries += 1
+        metrics.retry_waited(self.entity, self.action, delay)
+        logger.debug(f"Retrying {self.endpoint} in {delay:.3f} seconds after status {error.get('status_code')}")
+        return delay
+
+    def done(self, error: dict):
+        retry_counters.count(self.endpoint, retries=self.retries, failed=bool(error))
+
+
+def retry_request(send: Callable[[], Response],
+                  entity: str,
+                  action: str = '',
+                  retry: Union[bool, RetryPolicy] = None) -> Response:
+    """
+    Calls send until it returns no retryable error
+    """
+    policy = get_retry_policy(entity, action, retry)
+    if policy is None:
+        return send()
+    attempts = _Attempts(policy, entity, action)
+    while True:
+        set_retry_after(None)
+        error, data = send()
+        delay = attempts.get_delay(error)
+        if delay is None:
+            attempts.done(error)
+            return error, data
+        time.sleep(delay)
+
+
+async def aio_retry_request(send: Callable[[], Awaitable[Response]],
+                            entity: str,
+                            action: str = '',
+                            retry: Union[bool, RetryPolicy] = None) -> Response:
+    """
+    Asyncio counterpart of retry_request
+    """
+    policy = get_retry_policy(entity, action, retry)
+    if policy is None:
+        return await send()
+    attempts = _Attempts(policy, entity, action)
+    while True:
+        set_retry_after(None)
+        error, data = await send()
+        delay = attempts.get_delay(error)
+        if delay is None:
+            attempts.done(error)
+            return error, data
+        await asyncio.sleep(delay)
@@ -0,0 +1,583 @@
+"""
+Local stand-in of the signed 3commas rest api, for load tests of the client without touching the real service.
+
+    from three_commas import api, configuration
+    from three_commas.stand_in_server import StandInServer, StandInConfig
+
+    with StandInServer(StandInConfig(deals=10_000, latency=0.005, error_rate=0.01)) as server:
+        configuration.THREE_COMMAS_API_URL = server.url
+        error, deals = api.ver1.deals.get(limit=1000)
+
+or as a separate process:
+
+    python -m src.three_commas.stand_in_server --port 8080 --deals 10000 --latency 0.005
+"""
+import re
+import math
+import time
+import random
+import logging
+import argparse
+import threading
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlsplit, parse_qsl
+from py3cw.config import API_METHODS, API_VERSION_V1, API_VERSION_V2, API_VERSION_V2_ENTITIES
+from . import codec
+from .rest import create_signature
+
+
+logger = logging.getLogger(__name__)
+
+PAIRS = ('USDT_BTC', 'USDT_ETH', 'USDT_ADA', 'USDT_SOL', 'USDT_DOT', 'BTC_ETH', 'BTC_LINK', 'BUSD_BNB')
+EXCHANGES = (('binance', 'Binance'), ('ftx', 'FTX'), ('kucoin', 'KuCoin'), ('paper_trading', 'Paper Account'))
+DEAL_STATUSES = ('bought', 'completed', 'stop_loss_finished', 'cancelled', 'failed', 'base_order_placed')
+FINISHED_DEAL_STATUSES = {'completed', 'stop_loss_finished', 'cancelled', 'failed'}
+LIST_DEFAULT_LIMIT = 50
+LIST_MAX_LIMIT = 1000
+
+
+@dataclass(frozen=True)
+class InjectedError:
+    """
+    Error response of the stand-in, in the body format of 3commas that py3cw turns into the message
+    ThreeCommasApiError parses
+    """
+    status: int
+    error: str
+    error_description: str
+    error_attributes: Optional[dict] = None
+
+    def to_json(self) -> dict:
+        return {'error': self.error, 'error_description': self.error_description,
+                'error_attributes': self.error_attributes}
+
+
+RATE_LIMITED = InjectedError(429, 'rate_limit_exceeded', 'Too many requests')
+NOT_FOUND = InjectedError(404, 'not_found', 'Not Found')
+SIGNATURE_INVALID = InjectedError(401, 'signature_invalid', 'Provided signature is invalid')
+API_KEY_INVALID = InjectedError(401, 'api_key_invalid_or_expired', 'Unauthorized. Invalid or expired api key.')
+NO_PERMISSION = InjectedError(403, 'access_denied', "Api key doesn't have enough permissions")
+BASE_ORDER_TOO_SMALL = InjectedError(422, 'record_invalid', 'Invalid parameters',
+                                     {'base_order_volume': ['Base order size is too small. Min: 10.0, USDT_BTC']})
+NO_MARKET_PAIR = InjectedError(422, 'record_invalid', 'Invalid parameters',
+                               {'pairs': ['No market data for this pair: USDT_XYZ']})
+SERVER_ERRORS = (InjectedError(500, 'internal_error', 'Internal Server Error'),
+                 InjectedError(502, 'bad_gateway', 'Bad Gateway'),
+                 InjectedError(503, 'service_unavailable', 'Service Unavailable'),
+                 InjectedError(504, 'gateway_timeout', 'Gateway Timeout'))
+
+
+@dataclass
+class StandInConfig:
+    """
+    :param bots, deals, accounts, smart_trades: number of synthetic records generated at start
+    :param latency: seconds every response is delayed, plus a random share of latency_jitter
+    :param error_rate: share of the requests answered with one of injected_errors instead
+    :param rate_limit: requests per second per api key before a 429 with Retry-After is sent, None for no limit
+    :param retry_after: seconds of the Retry-After header of the injected 429 errors, None to send none
+    :param secrets: secret of every accepted api key. The signature is verified like 3commas does,
+    None accepts any api key without verification
+    """
+    bots: int = 100
+    deals: int = 1000
+    accounts: int = 10
+    smart_trades: int = 100
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    error_rate: float = 0.0
+    injected_errors: Tuple[InjectedError, ...] = (RATE_LIMITED,) + SERVER_ERRORS
+    rate_limit: Optional[float] = None
+    rate_limit_burst: Optional[float] = None
+    retry_after: Optional[int] = 1
+    secrets: Optional[Dict[str, str]] = None
+    seed: int = 0
+
+
+@dataclass
+class StandInStats:
+    requests: int = 0
+    statuses: Dict[int, int] = field(default_factory=dict)
+    injected_errors: int = 0
+    rate_limited: int = 0
+    max_in_flight: int = 0
+
+
+def _format_time(t: datetime) -> str:
+    return t.strftime('%Y-%m-%dT%H:%M:%S.') + f'{t.microsecond // 1000:03d}Z'
+
+
+class SyntheticData:
+    """
+    Deterministic synthetic bots, deals, accounts and smart trades with the fields of the 3commas responses
+    """
+    def __init__(self, config: StandInConfig):
+        rnd = random.Random(config.seed)
+        start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+        self.accounts = [self._create_account(rnd, 30_000_000 + i, start) for i in range(config.accounts)]
+        account_ids = [account['id'] for account in self.accounts] or [30_000_000]
+        self.bots = [self._create_bot(rnd, 7_000_000 + i, rnd.choice(account_ids), start) for i in range(config.bots)]
+        bots = self.bots or [{'id': None, 'account_id': account_ids[0], 'name': None}]
+        self.deals = [self._create_deal(rnd, 1_200_000_000 + i, rnd.choice(bots), start) for i in range(config.deals)]
+        self.smart_trades = [self._create_smart_trade(rnd, 12_000_000 + i, rnd.choice(self.accounts or [None]), start)
+                             for i in range(config.smart_trades)]
+        self.accounts_by_id = {account['id']: account for account in self.accounts}
+        self.bots_by_id = {bot['id']: bot for bot in self.bots}
+        self.deals_by_id = {deal['id']: deal for deal in self.deals}
+        self.smart_trades_by_id = {smart_trade['id']: smart_trade for smart_trade in self.smart_trades}
+
+    @staticmethod
+    def _create_account(rnd: random.Random, account_id: int, start: datetime) -> dict:
+        market_code, market_name = rnd.choice(EXCHANGES)
+        usd_amount = round(rnd.uniform(100, 50_000), 2)
+        return {
+            'id': account_id,
+            'name': f'{market_name} {account_id}',
+            'market_code': market_code,
+            'exchange_name': market_name,
+            'auto_balance_period': 12,
+            'api_connected': True,
+            'supported_market_types': ['spot'],
+            'usd_amount': str(usd_amount),
+            'btc_amount': str(round(usd_amount / 40_000, 8)),
+            'day_profit_usd': str(round(rnd.uniform(-50, 50), 2)),
+            'created_at': _format_time(start),
+            'updated_at': _format_time(start + timedelta(days=rnd.randint(0, 300))),
+        }
+
+    @staticmethod
+    def _create_bot(rnd: random.Random, bot_id: int, account_id: int, start: datetime) -> dict:
+        created_at = start + timedelta(minutes=rnd.randint(0, 100_000))
+        return {
+            'id': bot_id,
+            'account_id': account_id,
+            'is_enabled': rnd.random() < 0.8,
+            'max_safety_orders': 5,
+            'active_safety_orders_count': 2,
+            'pairs': rnd.sample(PAIRS, 2),
+            'strategy_list': [{'strategy': 'nonstop'}],
+            'max_active_deals': rnd.randint(1, 10),
+            'active_deals_count': rnd.randint(0, 3),
+            'created_at': _format_time(created_at),
+            'updated_at': _format_time(created_at + timedelta(hours=rnd.randint(0, 1000))),
+            'trailing_enabled': False,
+            'take_profit': str(round(rnd.uniform(0.5, 3.0), 2)),
+            'base_order_volume': str(rnd.choice((10.0, 15.0, 25.0))),
+            'safety_order_volume': str(rnd.choice((20.0, 30.0, 50.0))),
+            'safety_order_step_percentage': '1.5',
+            'take_profit_type': 'total',
+            'name': f'bot {bot_id}',
+            'stop_loss_percentage': '0.0',
+            'martingale_volume_coefficient': '1.05',
+            'martingale_step_coefficient': '1.2',
+            'strategy': 'long',
+            'finished_deals_profit_usd': str(round(rnd.uniform(0, 1000), 2)),
+            'finished_deals_count': str(rnd.randint(0, 500)),
+        }
+
+    @staticmethod
+    def _create_deal(rnd: random.Random, deal_id: int, bot: dict, start: datetime) -> dict:
+        status = rnd.choice(DEAL_STATUSES)
+        finished = status in FINISHED_DEAL_STATUSES
+        created_at = start + timedelta(minutes=rnd.randint(0, 200_000))
+        updated_at = created_at + timedelta(minutes=rnd.randint(1, 5000))
+        pair = rnd.choice(bot.get('pairs') or PAIRS)
+        bought_volume = round(rnd.uniform(10, 200), 8)
+        profit = round(bought_volume * rnd.uniform(-0.05, 0.03), 8) if finished else 0.0
+        return {
+            'id': deal_id,
+            'type': 'Deal',
+            'bot_id': bot['id'],
+            'max_safety_orders': 5,
+            'deal_has_error': status == 'failed',
+            'account_id': bot['account_id'],
+            'active_safety_orders_count': 0 if finished else 2,
+            'created_at': _format_time(created_at),
+            'updated_at': _format_time(updated_at),
+            'closed_at': _format_time(updated_at) if finished else None,
+            'finished?': finished,
+            'completed_safety_orders_count': rnd.randint(0, 5),
+            'current_price': str(round(rnd.uniform(0.1, 40_000), 8)),
+            'pair': pair,
+            'status': status,
+            'take_profit': '1.5',
+            'base_order_volume': '10.0',
+            'safety_order_volume': '20.0',
+            'safety_order_step_percentage': '1.5',
+            'bought_amount': str(round(bought_volume / 100, 8)),
+            'bought_volume': str(bought_volume),
+            'bought_average_price': '100.0',
+            'sold_amount': str(round(bought_volume / 100, 8)) if finished else None,
+            'sold_volume': str(round(bought_volume + profit, 8)) if finished else None,
+            'final_profit': str(profit),
+            'final_profit_percentage': str(round(100 * profit / bought_volume, 2)),
+            'usd_final_profit': str(round(profit, 2)),
+            'actual_profit': str(profit),
+            'bot_name': bot['name'],
+            'from_currency': pair.split('_')[0],
+            'to_currency': pair.split('_')[1],
+            'strategy': 'long',
+            'reserved_base_funds': 0,
+            'reserved_quote_funds': 0,
+        }
+
+    @staticmethod
+    def _create_smart_trade(rnd: random.Random, smart_trade_id: int, account: Optional[dict], start: datetime) -> dict:
+        created_at = start + timedelta(minutes=rnd.randint(0, 200_000))
+        price = round(rnd.uniform(1, 40_000), 2)
+        units = round(rnd.uniform(0.001, 1), 6)
+        return {
+            'id': smart_trade_id,
+            'version': 2,
+            'account': {
+                'id': account and account['id'],
+                'type': 'Account::BinanceAccount',
+                'name': account and account['name'],
+                'market': account and account['exchange_name'],
+                'link': f"/accounts/{account and account['id']}",
+            },
+            'pair': rnd.choice(PAIRS),
+            'instant': False,
+            'status': {'type': 'waiting_targets', 'title': 'Waiting Targets'},
+            'leverage': {'enabled': False},
+            'position': {
+                'type': 'buy',
+                'editable': False,
+                'units': {'value': str(units), 'editable': False},
+                'price': {'value': str(price), 'value_without_commission': str(price), 'editable': True},
+                'total': {'value': str(round(units * price, 8))},
+                'order_type': 'limit',
+                'status': {'type': 'finished', 'title': 'Finished'},
+            },
+            'take_profit': {
+                'enabled': True,
+                'steps': [{'id': 1, 'order_type': 'market', 'editable': True, 'units': {'value': str(units)},
+                           'price': {'type': 'bid', 'value': str(round(price * 1.03, 2)), 'percent': '3.0'},
+                           'volume': '100.0', 'status': {'type': 'to_process', 'title': 'Pending'}}],
+            },
+            'stop_loss': {'enabled': False},
+            'note': '',
+            'skip_enter_step': False,
+            'data': {
+                'editable': True,
+                'current_price': {'bid': str(price), 'ask': str(price), 'last': str(price), 'quote_volume': '1000.0'},
+                'target_price_type': 'price',
+                'base_order_finished': True,
+                'closed': False,
+                'created_at': _format_time(created_at),
+                'updated_at': _format_time(created_at + timedelta(minutes=rnd.randint(1, 5000))),
+                'type': 'smart_trade',
+            },
+            'profit': {'volume': '0.0', 'usd': '0.0', 'percent': '0.0', 'roe': None},
+            'margin': {'amount': None, 'total': None},
+            'is_position_not_filled': False,
+        }
+
+
+class _Route:
+    def __init__(self, method: str, entity: str, action: str, pattern: Pattern):
+        self.method = method
+        self.entity = entity
+        self.action = action
+        self.pattern = pattern
+
+
+def _create_routes() -> List[_Route]:
+    """
+    One route for every endpoint py3cw knows. Routes without {id} come first, so e.g.
+    accounts/market_list is not taken for the id of accounts/{id}
+    """
+    routes = list()
+    for entity, actions in API_METHODS.items():
+        for action, (method, api_path) in actions.items():
+            path = f"{entity}{'/' if api_path else ''}{api_path}"
+            if entity in API_VERSION_V2_ENTITIES:
+                path = f"{API_VERSION_V2}{path.replace('_v2', '')}"
+            else:
+                path = f'{API_VERSION_V1}{path}'
+            pattern = re.escape(path).replace(r'\{id\}', '(?P<id>[^/]+)').replace(r'\{sub_id\}', '(?P<sub_id>[^/]+)')
+            routes.append(_Route(method, entity, action, re.compile(f'{pattern}/?$')))
+    routes.sort(key=lambda route: '{' in API_METHODS[route.entity][route.action][1])
+    return routes
+
+
+class _RateLimits:
+    """
+    Token bucket per api key. Unlike the client side TokenBucket, a request without a token is rejected
+    """
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: Dict[str, Tuple[float, float]] = dict()
+        self._lock = threading.Lock()
+
+    def take(self, api_key: str) -> Tuple[bool, float, float]:
+        """
+        :return: whether the request may pass, the tokens left and the seconds until the next token
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, updated_at = self._buckets.get(api_key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[api_key] = tokens, now
+            return allowed, tokens, max(0.0, (1 - tokens) / self.rate)
+
+
+class _ThreadingHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # the default backlog of 5 drops connections of concurrent clients, which wait a second for the syn retransmit
+    request_queue_size = 1024
+
+
+class StandInServer:
+    """
+    Threaded http server answering the endpoints of api/ver1 and api/v2 with synthetic data.
+    Bots, deals, accounts and smart trades are listed and shown, the other endpoints answer with an empty object.
+    """
+    def __init__(self, config: StandInConfig = None, host: str = '127.0.0.1', port: int = 0):
+        self.config = config or StandInConfig()
+        self.data = SyntheticData(self.config)
+        self.routes = _create_routes()
+        self.rate_limits = None
+        if self.config.rate_limit:
+            self.rate_limits = _RateLimits(self.config.rate_limit, self.config.rate_limit_burst or self.config.rate_limit)
+        self._stats = StandInStats()
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
+        self._random = random.Random(self.config.seed)
+        self._server = _ThreadingHTTPServer((host, port), _create_handler(self))
+        self._thread: threading.Thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def serve_forever(self):
+        try:
+            self._server.serve_forever()
+        finally:
+            self._server.server_close()
+
+    def start(self) -> 'StandInServer':
+        """
+        Serves in a background thread
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def stats(self) -> StandInStats:
+        with self._stats_lock:
+            return replace(self._stats, statuses=dict(self._stats.statuses))
+
+    def reset_stats(self):
+        with self._stats_lock:
+            self._stats = StandInStats()
+
+    def _started(self):
+        with self._stats_lock:
+            self._in_flight += 1
+            self._stats.max_in_flight = max(self._stats.max_in_flight, self._in_flight)
+
+    def _finished(self):
+        with self._stats_lock:
+            self._in_flight -= 1
+
+    def _count(self, status: int, injected: bool = False, rate_limited: bool = False):
+        with self._stats_lock:
+            self._stats.requests += 1
+            self._stats.statuses[status] = self._stats.statuses.get(status, 0) + 1
+            self._stats.injected_errors += injected
+            self._stats.rate_limited += rate_limited
+
+    def handle(self, method: str, path_qs: str, body: str, headers) -> Tuple[int, dict, any]:
+        """
+        :return: status, additional headers and json body of the response
+        """
+        config = self.config
+        response_headers = dict()
+        api_key = headers.get('APIKEY', '')
+
+        if config.secrets is not None:
+            if api_key not in config.secrets:
+                return self._error(API_KEY_INVALID)
+            if headers.get('Signature') != create_signature(path_qs + body, config.secrets[api_key]):
+                return self._error(SIGNATURE_INVALID)
+
+        if self.rate_limits is not None:
+            allowed, tokens, reset_seconds = self.rate_limits.take(api_key)
+            response_headers.update({'X-RateLimit-Limit': str(int(self.rate_limits.burst)),
+                                     'X-RateLimit-Remaining': str(int(tokens)),
+                                     'X-RateLimit-Reset': str(math.ceil(reset_seconds))})
+            if not allowed:
+                response_headers['Retry-After'] = str(math.ceil(reset_seconds))
+                return self._error(RATE_LIMITED, response_headers, rate_limited=True)
+
+        if config.latency or config.latency_jitter:
+            time.sleep(config.latency + self._random.random() * config.latency_jitter)
+
+        if config.error_rate and config.injected_errors and self._random.random() < config.error_rate:
+            injected_error = self._random.choice(config.injected_errors)
+            if injected_error.status == 429 and config.retry_after is not None:
+                response_headers['Retry-After'] = str(config.retry_after)
+            return self._error(injected_error, response_headers, injected=True)
+
+        url = urlsplit(path_qs)
+        for route in self.routes:
+            if route.method != method:
+                continue
+            match = route.pattern.match(url.path)
+            if match:
+                params = dict(parse_qsl(url.query))
+                if body:
+                    params.update(codec.loads(body))
+                data = self._answer(route.entity, route.action, match.groupdict().get('id'), params)
+                if data is None:
+                    return self._error(NOT_FOUND, response_headers)
+                self._count(200)
+                return 200, response_headers, data
+        return self._error(NOT_FOUND, response_headers)
+
+    def _error(self, error: InjectedError, response_headers: dict = None, injected: bool = False,
+               rate_limited: bool = False) -> Tuple[int, dict, dict]:
+        self._count(error.status, injected=injected, rate_limited=rate_limited)
+        return error.status, response_headers or dict(), error.to_json()
+
+    def _answer(self, entity: str, action: str, action_id: Optional[str], params: dict):
+        data = self.data
+        if entity == 'bots':
+            if action == '':
+                bots = [bot for bot in data.bots if _matches(bot, params, 'account_id')]
+                return _offset_page(bots, params)
+            if action in {'show', 'update', 'enable', 'disable'}:
+                return _get_by_id(data.bots_by_id, action_id)
+        if entity == 'deals':
+            if action == '':
+                deals = [deal for deal in data.deals
+                         if _matches(deal, params, 'account_id') and _matches(deal, params, 'bot_id')
+                         and _matches_scope(deal, params.get('scope'))]
+                return _offset_page(deals, params)
+            if action in {'show', 'update_deal', 'update_tp', 'update_max_safety_orders', 'cancel', 'panic_sell'}:
+                return _get_by_id(data.deals_by_id, action_id)
+        if entity == 'accounts':
+            if action == '':
+                return data.accounts
+            if action == 'account_info':
+                return _get_by_id(data.accounts_by_id, action_id)
+        if entity == 'smart_trades_v2':
+            if action == '':
+                smart_trades = [smart_trade for smart_trade in data.smart_trades
+                                if str(params.get('account_id', smart_trade['account']['id'])) == str(smart_trade['account']['id'])]
+                per_page = min(int(params.get('per_page', 10)), 100)
+                page = max(int(params.get('page', 1)), 1)
+                return smart_trades[(page - 1) * per_page:page * per_page]
+            if action in {'get_by_id', 'update', 'cancel', 'close_by_market'}:
+                return _get_by_id(data.smart_trades_by_id, action_id)
+        return dict()
+
+
+def _matches(record: dict, params: dict, name: str) -> bool:
+    return name not in params or str(record.get(name)) == str(params[name])
+
+
+def _matches_scope(deal: dict, scope: Optional[str]) -> bool:
+    if scope == 'active':
+        return not deal['finished?']
+    if scope == 'finished':
+        return deal['finished?']
+    if scope in {'completed', 'cancelled', 'failed'}:
+        return deal['status'] == scope
+    return True
+
+
+def _offset_page(records: list, params: dict) -> list:
+    limit = min(int(params.get('limit', LIST_DEFAULT_LIMIT)), LIST_MAX_LIMIT)
+    offset = int(params.get('offset', 0))
+    return records[offset:offset + limit]
+
+
+def _get_by_id(records_by_id: dict, action_id: Optional[str]) -> Optional[dict]:
+    try:
+        return records_by_id.get(int(action_id))
+    except (TypeError, ValueError):
+        return None
+
+
+def _create_handler(server: StandInServer):
+    class StandInHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def _handle(self):
+            length = int(self.headers.get('Content-Length') or 0)
+            body = self.rfile.read(length).decode('utf-8') if length else ''
+            server._started()
+            try:
+                status, headers, data = server.handle(self.command, self.path, body, self.headers)
+            except Exception as e:
+                logger.exception(f'Stand-in failed to answer {self.command} {self.path}')
+                status, headers, data = 500, dict(), {'error': 'internal_error', 'error_description': repr(e)}
+            finally:
+                server._finished()
+            raw = codec.dumps(data).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(raw)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(raw)
+
+        do_GET = do_POST = do_PATCH = do_PUT = do_DELETE = _handle
+
+        def log_message(self, *args):
+            pass
+
+    return StandInHandler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in of the 3commas rest api')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--bots', type=int, default=100)
+    parser.add_argument('--deals', type=int, default=1000)
+    parser.add_argument('--accounts', type=int, default=10)
+    parser.add_argument('--smart-trades', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--latency-jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=None)
+    args = parser.parse_args()
+
+    config = StandInConfig(bots=args.bots, deals=args.deals, accounts=args.accounts, smart_trades=args.smart_trades,
+                           latency=args.latency, latency_jitter=args.latency_jitter, error_rate=args.error_rate,
+                           rate_limit=args.rate_limit)
+    server = StandInServer(config, host=args.host, port=args.port)
+    print(f'Serving the 3commas stand-in on {server.url}, set THREE_COMMAS_API_URL={server.url}')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
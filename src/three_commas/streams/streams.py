@@ -1,7 +1,8 @@
 import asyncio
 import websockets
 import json
-from ..sys_utils import create_signature
+from .. import codec, configuration
+from ..rest import create_signature
 from ..model import DealEntity, SmartTradeV2Entity
 from ..error import ThreeCommasException
 import logging
@@ -77,11 +78,16 @@ class WebSocketMessage(dict):
     def is_stream_type(self, stream_type: StreamType):
         if not self._has_identifier():
             return False
-        identifier_dict = json.loads(self.get_identifier())
-        channel = identifier_dict.get('channel')
+        channel = get_channel_of_identifier(self.get_identifier())
         return channel and channel == stream_type.get_channel()
 
 
+@functools.lru_cache(maxsize=128)
+def get_channel_of_identifier(identifier: str) -> str:
+    # the identifier is the same string in every message of a subscription
+    return codec.loads(identifier).get('channel')
+
+
 def smart_trades_stream_decorator(*args, api_key=None, api_secret=None):
     return create_runner_for_stream_type(StreamType.SMART_TRADES, api_key, api_secret)
 
@@ -111,19 +117,27 @@ def create_runner_for_stream_type(stream_type: StreamType, api_key, api_secret):
             async with websockets.connect(full_url) as ws:
                 msg = await ws.send(json.dumps(initial_message))
                 async for ws_message in ws:
-                    ws_dict_message = WebSocketMessage(json.loads(ws_message))
-                    logger.debug(f'Websocket message {json.dumps(ws_dict_message)}')
+                    ws_dict_message = WebSocketMessage(codec.loads(ws_message))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f'Websocket message {ws_message}')
                     if ws_dict_message.is_stream_type(stream_type) and ws_dict_message.is_confirm_subscription():
                         logger.info(f'Confirmed subscription to {stream_type.get_channel()}')
                         break
 
                 async for ws_message in ws:
-                    ws_dict_message = WebSocketMessage(json.loads(ws_message))
-                    logger.debug(f'Websocket message {json.dumps(ws_dict_message)}')
+                    ws_dict_message = WebSocketMessage(codec.loads(ws_message))
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f'Websocket message {ws_message}')
                     if ws_dict_message.is_stream_type(stream_type):
                         tc_message = ws_dict_message.get_message()
                         if stream_type.has_parse_type():
-                            tc_message = stream_type.get_parse_type()(tc_message)
+                            parse_type = stream_type.get_parse_type()
+                            if configuration.THREE_COMMAS_INTERN_STRINGS and tc_message:
+                                parse_type.intern_fields((tc_message,))
+                            if configuration.THREE_COMMAS_MODEL_VIEWS:
+                                tc_message = parse_type.view(tc_message)
+                            else:
+                                tc_message = parse_type(tc_message)
                         function_to_wrap(tc_message)
 
         # loop = asyncio.get_event_loop()
@@ -1,17 +1,24 @@
 import sys
+import time
 import inspect
 import logging
 import functools
 from py3cw.request import Py3CW
 from typing import Callable, Union, Tuple
 import os
-import hmac
-import hashlib
+import contextvars
 from .model.generated_enums import Mode
 from . import configuration
-from .error import ThreeCommasApiError
+from .client_pool import client_pool, create_py3cw
+from .rate_limiting import rate_limiter
+from .coalescing import single_flight, get_request_key
+from .metrics import metrics, set_response_size
+from . import transport
+from .retry import RetryPolicy, retry_request
+from .error import ThreeCommasApiError, ThreeCommasException
 
 logger = logging.getLogger(__name__)
+_py3cw_closure: contextvars.ContextVar = contextvars.ContextVar('py3cw_closure', default=None)
 
 
 def get_parent_function_name() -> str:
@@ -24,23 +31,19 @@ def get_parent_function_name() -> str:
         logger.exception('Error occurred while fetching the name of the parent')
 
 
-def get_parent_module_name() -> str:
-    """
-    :return: The name of the module one level up the call stack
-    """
-    stack_frame = inspect.currentframe()
-    while stack_frame:
-        if stack_frame.f_code.co_name == '<module>':
-            return stack_frame.f_globals['__name__']
-        stack_frame = stack_frame.f_back
+# the credentials of the api and of the exchange accounts, only the first characters of the keys are kept
+BLURRED_KEYS = ('api_key',)
+SECRET_KEYS = ('api_secret', 'secret', 'passphrase', 'wallet_password', 'mnemonic_phrase', 'keystore')
 
 
 def blur_api_keys(initial_dict: dict):
     result = dict(initial_dict)
-    if 'api_key' in result:
-        result['api_key'] = f'{result.get("api_key")[:5]}...'
-    if 'api_secret' in result:
-        result['api_secret'] = f'{result.get("api_secret")[:5]}...'
+    for key in BLURRED_KEYS:
+        if result.get(key) is not None:
+            result[key] = f'{str(result.get(key))[:5]}...'
+    for key in SECRET_KEYS:
+        if result.get(key) is not None:
+            result[key] = '...'
     return result
 
 
@@ -52,7 +55,7 @@ def reduced_arg(arg):
 def transform_args_kwargs_for_logging(args: tuple, kwargs: dict, reduce_long_arguments: bool):
     if reduce_long_arguments:
         logging_args = ', '.join([reduced_arg(a) for a in args])
-        logging_kwargs = {k: reduced_arg(v) for k, v in kwargs}
+        logging_kwargs = {k: reduced_arg(v) for k, v in kwargs.items()}
     else:
         logging_args = args
         logging_kwargs = kwargs
@@ -67,40 +70,59 @@ def logged(*logged_args,
     """
     :param logged_args:
     :param with_logger: Uses the passed logger to log.
-    By default it will use the logger of the module where the annotation was called
+    By default it will use the logger of the module where the decorated function is defined
     :param log_return: If True, will log the return after the execution of the function
     :param reduce_long_arguments: If True and the wrapping function is called with long arguments, the the log will be trimmed
     :return:
     """
 
-    if with_logger is None:
-        parent_module_name = get_parent_module_name()
-        if parent_module_name is None:
-            with_logger = logger
-        else:
-            with_logger = logging.getLogger(parent_module_name)
-
     def inner(function_to_wrap):
-        @functools.wraps(function_to_wrap)
-        def wrapper(*wrapper_args, **wrapper_kwargs):
-            if not configuration.THREE_COMMAS_LOG_API:
-                return function_to_wrap(*wrapper_args, **wrapper_kwargs)
+        # resolved once when decorating, the calls only check if debug is enabled before formatting anything
+        function_logger = with_logger or logging.getLogger(function_to_wrap.__module__)
 
+        def log_call(wrapper_args, wrapper_kwargs):
             logging_args, logging_kwargs = transform_args_kwargs_for_logging(wrapper_args,
                                                                              wrapper_kwargs,
                                                                              reduce_long_arguments)
-            with_logger.debug(f"Called '{function_to_wrap.__name__}' with args={logging_args}, kwargs={logging_kwargs}")
+            function_logger.debug(f"Called '{function_to_wrap.__name__}' with args={logging_args}, kwargs={logging_kwargs}")
+
+        def log_exception(e: Exception):
+            function_logger.debug(f"Function '{function_to_wrap.__name__}' raised an exception {repr(e)}")
+
+        def log_executed(ret):
+            if log_return:
+                function_logger.debug(f"Function '{function_to_wrap.__name__}' was executed and returned: {ret}")
+            else:
+                function_logger.debug(f"Function '{function_to_wrap.__name__}' was executed")
+
+        if inspect.iscoroutinefunction(function_to_wrap):
+            @functools.wraps(function_to_wrap)
+            async def async_wrapper(*wrapper_args, **wrapper_kwargs):
+                if not (configuration.THREE_COMMAS_LOG_API and function_logger.isEnabledFor(logging.DEBUG)):
+                    return await function_to_wrap(*wrapper_args, **wrapper_kwargs)
+
+                log_call(wrapper_args, wrapper_kwargs)
+                try:
+                    ret = await function_to_wrap(*wrapper_args, **wrapper_kwargs)
+                except Exception as e:
+                    log_exception(e)
+                    raise e
+                log_executed(ret)
+                return ret
+            return async_wrapper
 
+        @functools.wraps(function_to_wrap)
+        def wrapper(*wrapper_args, **wrapper_kwargs):
+            if not (configuration.THREE_COMMAS_LOG_API and function_logger.isEnabledFor(logging.DEBUG)):
+                return function_to_wrap(*wrapper_args, **wrapper_kwargs)
+
+            log_call(wrapper_args, wrapper_kwargs)
             try:
                 ret = function_to_wrap(*wrapper_args, **wrapper_kwargs)
             except Exception as e:
-                with_logger.debug(f"Function '{function_to_wrap.__name__}' raised an exception {repr(e)}")
+                log_exception(e)
                 raise e
-
-            if log_return:
-                with_logger.debug(f"Function '{function_to_wrap.__name__}' was executed and returned: {ret}")
-            else:
-                with_logger.debug(f"Function '{function_to_wrap.__name__}' was executed")
+            log_executed(ret)
             return ret
         return wrapper
 
@@ -112,12 +134,44 @@ def logged(*logged_args,
 class Py3cwClosure:
     def __init__(self,
                  py3cw: Py3CW,
-                 additional_headers: dict = None):
+                 additional_headers: dict = None,
+                 retry: Union[bool, RetryPolicy] = None):
         self.py3cw = py3cw
         self.additional_headers = additional_headers
-
-    def request(self, *args, **kwargs) -> Tuple[dict, Union[dict, list]]:
-        return self.py3cw.request(*args, **kwargs, additional_headers=self.additional_headers)
+        self.retry = retry
+
+    def request(self,
+                entity: str,
+                action: str = '',
+                action_id: str = None,
+                action_sub_id: str = None,
+                payload: any = None) -> Tuple[dict, Union[dict, list]]:
+        def send():
+            request_transport = transport.get_transport()
+            if request_transport.sends_requests:
+                rate_limiter.acquire(api_key=self.py3cw.key, entity=entity, action=action)
+            set_response_size(None)
+            start = time.perf_counter()
+            response = request_transport.request(self.py3cw,
+                                                 entity=entity,
+                                                 action=action,
+                                                 action_id=action_id,
+                                                 action_sub_id=action_sub_id,
+                                                 payload=payload,
+                                                 additional_headers=self.additional_headers)
+            metrics.request_finished(entity, action, seconds=time.perf_counter() - start, error=response[0])
+            return response
+
+        def send_with_retries():
+            return retry_request(send, entity=entity, action=action, retry=self.retry)
+
+        if not single_flight.is_coalesced(entity, action):
+            return send_with_retries()
+        return single_flight.do(self.get_request_key(entity, action, action_id, action_sub_id, payload),
+                                send_with_retries)
+
+    def get_request_key(self, *args, **kwargs):
+        return get_request_key(self.py3cw.key, self.py3cw.secret, self.additional_headers, *args, **kwargs)
 
 
 def with_py3cw(func: Callable) -> Callable:
@@ -128,6 +182,7 @@ def with_py3cw(func: Callable) -> Callable:
                 api_key: str = None,
                 api_secret: str = None,
                 request_options: dict = None,
+                retry: Union[bool, RetryPolicy] = None,
                 **kwargs):
 
         # request options
@@ -135,24 +190,54 @@ def with_py3cw(func: Callable) -> Callable:
         if request_options:
             logger.debug(f"Setting {request_options=}")
 
-        # forced mode
-        additional_headers = additional_headers or dict()
-        additional_headers.update(get_forced_mode_headers(req_forced_mode=forced_mode))
-
         # py3cw
         py3cw = get_py3cw(req_api_key=api_key, req_api_secret=api_secret, request_options=request_options)
 
         # create buffer
-        py3cw_closure = Py3cwClosure(additional_headers=additional_headers, py3cw=py3cw)
+        py3cw_closure = create_py3cw_closure(py3cw=py3cw,
+                                             forced_mode=forced_mode,
+                                             additional_headers=additional_headers,
+                                             retry=retry)
+
+        # bind the closure to the current thread or asyncio task only
+        token = bind_py3cw_closure(py3cw_closure)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            unbind_py3cw_closure(token)
+    return wrapper
 
-        inject_py3cw_into_function(func=func, wrapper=py3cw_closure)
 
-        return func(*args, **kwargs)
-    return wrapper
+def create_py3cw_closure(py3cw: Py3CW,
+                         forced_mode: Union[str, Mode] = None,
+                         additional_headers: dict = None,
+                         retry: Union[bool, RetryPolicy] = None,
+                         closure_type: type = Py3cwClosure) -> Py3cwClosure:
+    # forced mode. Copied, the passed headers could be shared with other threads
+    additional_headers = dict(additional_headers or dict())
+    additional_headers.update(get_forced_mode_headers(req_forced_mode=forced_mode))
+    return closure_type(additional_headers=additional_headers, py3cw=py3cw, retry=retry)
+
+
+def bind_py3cw_closure(py3cw_closure: Py3cwClosure) -> contextvars.Token:
+    return _py3cw_closure.set(py3cw_closure)
+
 
+def unbind_py3cw_closure(token: contextvars.Token):
+    _py3cw_closure.reset(token)
 
-def inject_py3cw_into_function(func: Callable, wrapper: Union[Py3CW, Py3cwClosure]):
-    func.__globals__['wrapper'] = wrapper
+
+class Py3cwClosureProxy:
+    """
+    The module level wrapper of the api modules.
+    Forwards the requests to the Py3cwClosure that with_py3cw bound to the current context,
+    so concurrent calls with different keys or forced modes do not share a client.
+    """
+    def request(self, *args, **kwargs) -> Tuple[dict, Union[dict, list]]:
+        py3cw_closure = _py3cw_closure.get()
+        if py3cw_closure is None:
+            raise ThreeCommasException('No py3cw client is bound. The api function must be decorated with with_py3cw')
+        return py3cw_closure.request(*args, **kwargs)
 
 
 def get_forced_mode_headers(req_forced_mode: Union[str, Mode] = None) -> dict:
@@ -172,13 +257,27 @@ def get_forced_mode_headers(req_forced_mode: Union[str, Mode] = None) -> dict:
         return dict()
 
 
-def get_py3cw(req_api_key: str = None, req_api_secret: str = None, request_options: dict = None) -> Py3CW:
+def get_api_keys(req_api_key: str = None, req_api_secret: str = None) -> Tuple[str, str]:
     # request api keys has precedence over global api keys
     api_key = req_api_key or os.getenv("THREE_COMMAS_API_KEY")
     api_secret = req_api_secret or os.getenv("THREE_COMMAS_API_SECRET")
     if api_key is None or api_secret is None:
         raise RuntimeError("Please configure 'THREE_COMMAS_API_KEY' and 'THREE_COMMAS_API_SECRET'")
-    return Py3CW(key=api_key, secret=api_secret, request_options=request_options)
+    return api_key, api_secret
+
+
+def get_py3cw(req_api_key: str = None, req_api_secret: str = None, request_options: dict = None) -> Py3CW:
+    api_key, api_secret = get_api_keys(req_api_key=req_api_key, req_api_secret=req_api_secret)
+    if configuration.THREE_COMMAS_POOL_CLIENTS:
+        return client_pool.get(api_key=api_key, api_secret=api_secret, request_options=request_options)
+    return create_py3cw(api_key=api_key, api_secret=api_secret, request_options=request_options)
+
+
+def without_none_values(d: dict) -> dict:
+    """
+    Drops the parameters that were not passed, the api defaults apply for them
+    """
+    return {k: v for k, v in d.items() if v is not None}
 
 
 def verify_no_error(error, data):
@@ -192,13 +291,6 @@ def verify_no_error(error, data):
         raise ThreeCommasApiError(error={'msg': 'Data is None', 'function_name': calling_function_name})
 
 
-def create_signature(payload, api_secret):
-    signature = hmac.new(bytes(api_secret, 'latin-1'),
-                         msg=bytes(payload, 'latin-1'),
-                         digestmod=hashlib.sha256).hexdigest()
-    return signature
-
-
 def get_paper_headers():
     return {'Forced-Mode': 'paper'}
 
@@ -0,0 +1,249 @@
+import asyncio
+import contextlib
+import gzip
+import json
+import time
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Hashable, List, Tuple, Union
+from . import codec, sys_utils
+from .error import ThreeCommasException
+
+
+logger = logging.getLogger(__name__)
+
+Response = Tuple[dict, Union[dict, list]]
+
+
+class Transport:
+    """
+    Sends the requests of Py3cwClosure. The default transport sends them with the py3cw client,
+    the others record or replay them
+    """
+    # False for transports that answer without the network, their requests are not rate limited
+    sends_requests = True
+
+    def request(self, py3cw, entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                payload: any = None, additional_headers: dict = None) -> Response:
+        return py3cw.request(entity=entity,
+                             action=action,
+                             action_id=action_id,
+                             action_sub_id=action_sub_id,
+                             payload=payload,
+                             additional_headers=additional_headers)
+
+    async def aio_request(self, py3cw, entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                          payload: any = None, additional_headers: dict = None) -> Response:
+        return await py3cw.request(entity=entity,
+                                   action=action,
+                                   action_id=action_id,
+                                   action_sub_id=action_sub_id,
+                                   payload=payload,
+                                   additional_headers=additional_headers)
+
+
+def redact_payload(payload: any) -> any:
+    """
+    The payload without the credentials, e.g. the exchange api key and secret of accounts.post_new
+    """
+    return sys_utils.blur_api_keys(payload) if isinstance(payload, dict) else payload
+
+
+def get_interaction_key(entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                        payload: any = None) -> Hashable:
+    # the recorded payloads are redacted, the ones of the replayed requests are redacted alike to match them
+    payload = redact_payload(payload)
+    return entity, action or '', action_id, action_sub_id, json.dumps(payload, sort_keys=True, default=str)
+
+
+class Cassette:
+    """
+    Recorded request/response pairs, one json line per interaction. Paths ending with .gz are gzipped
+    """
+    def __init__(self, path: str = None, interactions: List[dict] = None):
+        self.path = path
+        self.interactions: List[dict] = list(interactions or list())
+        self._file = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _open(path: str, mode: str):
+        if path.endswith('.gz'):
+            return gzip.open(path, mode + 't', encoding='utf-8')
+        return open(path, mode, encoding='utf-8')
+
+    @classmethod
+    def load(cls, path: str) -> 'Cassette':
+        with cls._open(path, 'r') as f:
+            return cls(path=path, interactions=[codec.loads(line) for line in f if line.strip()])
+
+    def append(self, interaction: dict):
+        with self._lock:
+            self.interactions.append(interaction)
+            if self.path is not None:
+                if self._file is None:
+                    self._file = self._open(self.path, 'a')
+                self._file.write(codec.dumps(interaction) + '\n')
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __len__(self):
+        return len(self.interactions)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class RecordingTransport(Transport):
+    """
+    Sends the requests with the inner transport and records them in the cassette.
+    The api key is blurred, the secret and the signature are never recorded. The credentials in the payload
+    are redacted, see redact_payload
+    """
+    def __init__(self, cassette: Cassette, inner: Transport = None):
+        self.cassette = cassette
+        self.inner = inner or Transport()
+
+    @property
+    def sends_requests(self) -> bool:
+        return self.inner.sends_requests
+
+    def _record(self, py3cw, seconds: float, response: Response, additional_headers: dict, **request):
+        error, data = response
+        self.cassette.append({
+            **request,
+            'payload': redact_payload(request.get('payload')),
+            **sys_utils.blur_api_keys({'api_key': py3cw.key}),
+            'forced_mode': (additional_headers or dict()).get('Forced-Mode'),
+            'seconds': round(seconds, 6),
+            'error': error,
+            'data': data,
+        })
+
+    def request(self, py3cw, entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                payload: any = None, additional_headers: dict = None) -> Response:
+        request = dict(entity=entity, action=action, action_id=action_id, action_sub_id=action_sub_id, payload=payload)
+        start = time.perf_counter()
+        response = self.inner.request(py3cw, additional_headers=additional_headers, **request)
+        self._record(py3cw, time.perf_counter() - start, response, additional_headers, **request)
+        return response
+
+    async def aio_request(self, py3cw, entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                          payload: any = None, additional_headers: dict = None) -> Response:
+        request = dict(entity=entity, action=action, action_id=action_id, action_sub_id=action_sub_id, payload=payload)
+        start = time.perf_counter()
+        response = await self.inner.aio_request(py3cw, additional_headers=additional_headers, **request)
+        self._record(py3cw, time.perf_counter() - start, response, additional_headers, **request)
+        return response
+
+
+class ReplayTransport(Transport):
+    """
+    Answers the requests from a cassette, without any network.
+    The recorded responses of the same request are returned in the recorded order.
+    :param latency_factor: 0 replays at full speed, 1 with the recorded latency
+    :param repeat: start again with the first recorded response when all were replayed, instead of raising
+    """
+    sends_requests = False
+
+    def __init__(self, cassette: Cassette, latency_factor: float = 0.0, repeat: bool = True):
+        self.cassette = cassette
+        self.latency_factor = latency_factor
+        self.repeat = repeat
+        self._interactions: Dict[Hashable, List[dict]] = defaultdict(list)
+        for interaction in cassette.interactions:
+            self._interactions[get_interaction_key(interaction.get('entity'),
+                                                   interaction.get('action'),
+                                                   interaction.get('action_id'),
+                                                   interaction.get('action_sub_id'),
+                                                   interaction.get('payload'))].append(interaction)
+        self._cursors: Dict[Hashable, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _next_interaction(self, *request) -> dict:
+        key = get_interaction_key(*request)
+        with self._lock:
+            interactions = self._interactions.get(key)
+            cursor = self._cursors[key]
+            if not interactions or (cursor >= len(interactions) and not self.repeat):
+                raise ThreeCommasException(f'No recorded response for {key}')
+            self._cursors[key] = cursor + 1
+            return interactions[cursor % len(interactions)]
+
+    @staticmethod
+    def _to_response(interaction: dict) -> Response:
+        # copied, the caller may change the response
+        return codec.loads(codec.dumps(interaction.get('error') or dict())), \
+            codec.loads(codec.dumps(interaction.get('data')))
+
+    def request(self, py3cw, entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                payload: any = None, additional_headers: dict = None) -> Response:
+        interaction = self._next_interaction(entity, action, action_id, action_sub_id, payload)
+        if self.latency_factor:
+            time.sleep(interaction.get('seconds', 0) * self.latency_factor)
+        return self._to_response(interaction)
+
+    async def aio_request(self, py3cw, entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                          payload: any = None, additional_headers: dict = None) -> Response:
+        interaction = self._next_interaction(entity, action, action_id, action_sub_id, payload)
+        if self.latency_factor:
+            await asyncio.sleep(interaction.get('seconds', 0) * self.latency_factor)
+        return self._to_response(interaction)
+
+
+_transport: Transport = Transport()
+
+
+def get_transport() -> Transport:
+    return _transport
+
+
+def set_transport(transport: Transport = None):
+    """
+    Sets the transport of all requests, None restores the default one
+    """
+    global _transport
+    _transport = transport or Transport()
+
+
+@contextlib.contextmanager
+def use_transport(transport: Transport):
+    previous = get_transport()
+    set_transport(transport)
+    try:
+        yield transport
+    finally:
+        set_transport(previous)
+
+
+def record(path: str):
+    """
+    Records the requests made in the with block:
+
+        with transport.record('deals.jsonl.gz'):
+            api.ver1.deals.get()
+    """
+    cassette = Cassette(path=path)
+    return _closing(cassette, use_transport(RecordingTransport(cassette=cassette, inner=get_transport())))
+
+
+def replay(path: str, latency_factor: float = 0.0, repeat: bool = True):
+    """
+    Answers the requests made in the with block from a recorded cassette
+    """
+    return use_transport(ReplayTransport(cassette=Cassette.load(path), latency_factor=latency_factor, repeat=repeat))
+
+
+@contextlib.contextmanager
+def _closing(cassette: Cassette, transport_context):
+    with cassette, transport_context as transport:
+        yield transport
@@ -0,0 +1,28 @@
+from src.three_commas.rate_limiting import rate_limiter
+import json
+import pytest
+
+
+DEAL_FILE = 'test/sample_data/deals/usdt/deal_show_usdt.json'
+
+
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    # the tests fire thousands of requests against local stand-ins
+    monkeypatch.setattr(rate_limiter, 'enabled', False)
+
+
+@pytest.fixture
+def deal_dict() -> dict:
+    with open(DEAL_FILE, 'r') as f:
+        return json.load(f)
+
+
+@pytest.fixture
+def deal_dicts(deal_dict):
+    """
+    deal_dicts(n) returns n copies of deal_dict with the ids 0 to n - 1
+    """
+    def create(n: int) -> list:
+        return [{**deal_dict, 'id': i} for i in range(n)]
+    return create
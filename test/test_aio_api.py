@@ -0,0 +1,131 @@
+from src.three_commas import configuration, codec
+from src.three_commas.api.aio import ver1, v2
+from src.three_commas.aio_client import aio_client_pool, build_request, AioClientPool
+from src.three_commas.model import BotEntity, SmartTradeV2Entity
+from src.three_commas.stand_in_server import StandInServer, StandInConfig
+import asyncio
+import pytest
+
+
+SECRETS = {'key_a': 'secret_a', 'key_b': 'secret_b'}
+FIRST_BOT_ID = 7_000_000
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    servers = list()
+
+    def run(coroutine_function, config: StandInConfig = None):
+        server = StandInServer(config or StandInConfig(bots=100, secrets=SECRETS)).start()
+        servers.append(server)
+        monkeypatch.setattr(configuration, 'THREE_COMMAS_API_URL', server.url)
+
+        async def main():
+            try:
+                return await coroutine_function()
+            finally:
+                await aio_client_pool.close()
+        return server, asyncio.run(main())
+    yield run
+    for server in servers:
+        server.stop()
+
+
+def test_build_request_matches_py3cw_paths():
+    assert build_request(entity='bots', action='show', action_id='12') == ('GET', '/public/api/ver1/bots/12/show', None)
+    assert build_request(entity='smart_trades_v2', action='get_by_id', action_id='5') == ('GET', '/public/api/v2/smart_trades/5', None)
+    assert build_request(entity='deals', action='', payload={'limit': 10}) == ('GET', '/public/api/ver1/deals?limit=10', None)
+    assert build_request(entity='smart_trades_v2', action='new', payload={'pair': 'USDT_BTC'}) == \
+        ('POST', '/public/api/v2/smart_trades', codec.dumps({'pair': 'USDT_BTC'}))
+    with pytest.raises(ValueError):
+        build_request(entity='bots', action='show')
+
+
+def test_signed_requests_return_models(stand_in):
+    async def calls():
+        bots_response = await ver1.bots.get(limit=5, api_key='key_a', api_secret='secret_a')
+        bot_response = await ver1.bots.get_show_by_id(FIRST_BOT_ID + 42, api_key='key_a', api_secret='secret_a')
+        smart_trades_response = await v2.smart_trades.get(per_page=3, api_key='key_b', api_secret='secret_b')
+        return bots_response, bot_response, smart_trades_response
+
+    _, ((error, bots), (bot_error, bot), (st_error, smart_trades)) = stand_in(calls)
+
+    assert not error and not bot_error and not st_error
+    assert len(bots) == 5 and isinstance(bots[0], BotEntity)
+    assert isinstance(bot, BotEntity) and bot.id == FIRST_BOT_ID + 42
+    assert len(smart_trades) == 3 and isinstance(smart_trades[0], SmartTradeV2Entity)
+
+
+def test_errors_are_parsed(stand_in):
+    async def call():
+        return await ver1.bots.get(api_key='key_a', api_secret='wrong_secret')
+
+    _, (error, data) = stand_in(call)
+
+    assert error.get('status_code') == 401
+    assert 'signature_invalid' in error.get_msg()
+
+
+async def show_bots_with_mixed_keys(count: int = 100):
+    keys = ['key_a', 'key_b'] * (count // 2)
+    return await asyncio.gather(*[ver1.bots.get_show_by_id(FIRST_BOT_ID + i, api_key=key, api_secret=SECRETS[key])
+                                  for i, key in enumerate(keys)])
+
+
+def test_concurrent_tasks_with_mixed_keys(stand_in, monkeypatch):
+    monkeypatch.setattr(configuration, 'THREE_COMMAS_AIO_CONCURRENCY_LIMIT', 8)
+
+    server, results = stand_in(show_bots_with_mixed_keys, StandInConfig(bots=100, latency=0.01, secrets=SECRETS))
+
+    for i, (error, bot) in enumerate(results):
+        assert not error
+        assert bot.id == FIRST_BOT_ID + i
+    # every key has its own client, limited to 8 requests in flight
+    assert 8 < server.stats().max_in_flight <= 16
+
+
+def test_concurrency_limit_is_not_capped_by_the_pool_size(stand_in, monkeypatch):
+    monkeypatch.setattr(configuration, 'THREE_COMMAS_AIO_CONCURRENCY_LIMIT', 40)
+
+    async def show_bots():
+        return await asyncio.gather(*[ver1.bots.get_show_by_id(FIRST_BOT_ID + i, api_key='key_a', api_secret='secret_a')
+                                      for i in range(100)])
+
+    server, results = stand_in(show_bots, StandInConfig(bots=100, latency=0.05, secrets=SECRETS))
+
+    assert not any(error for error, _ in results)
+    # one client has more requests in flight than the connections the sync clients keep alive
+    assert server.stats().max_in_flight > configuration.THREE_COMMAS_POOL_SIZE
+
+
+def test_client_pool_evicts_and_closes_sessions():
+    pool = AioClientPool(max_clients=2, idle_timeout=60)
+
+    async def get_clients():
+        clients = [pool.get(api_key=f'key_{i}', api_secret='secret') for i in range(3)]
+        for client in clients:
+            client._get_session()
+        assert pool.get(api_key='key_2', api_secret='secret') is clients[2]
+        await asyncio.sleep(0)
+        closed = [client._session.closed for client in clients]
+        size = len(pool)
+        await pool.close()
+        return closed, size
+
+    closed, size = asyncio.run(get_clients())
+
+    assert size == 2
+    assert closed == [True, False, False]
+
+
+def test_client_pool_drops_the_clients_of_closed_loops():
+    pool = AioClientPool()
+
+    async def get_client():
+        return pool.get(api_key='key_a', api_secret='secret_a')
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+    assert len(pool) == 1
@@ -0,0 +1,46 @@
+from src.three_commas import api
+from src.three_commas.client_pool import PooledPy3cw
+import pytest
+
+
+@pytest.fixture
+def sent_payloads(monkeypatch):
+    payloads = list()
+
+    def request(self, entity, action='', action_id=None, action_sub_id=None, payload=None, additional_headers=None):
+        payloads.append((entity, action, action_id, payload))
+        return {}, []
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+    return payloads
+
+
+def test_query_parameters_are_forwarded(sent_payloads):
+    api.ver1.deals.get(scope='active', bot_id=12, from_='2022-01-01', api_key='key', api_secret='secret')
+    api.ver1.accounts.get_market_pairs(market_code='binance', api_key='key', api_secret='secret')
+
+    assert sent_payloads[0][3] == {'scope': 'active', 'bot_id': 12, 'from': '2022-01-01'}
+    assert sent_payloads[1][3] == {'market_code': 'binance'}
+
+
+def test_parameters_not_passed_are_not_sent(sent_payloads):
+    api.ver1.bots.post_disable_by_id(1, api_key='key', api_secret='secret')
+    api.ver1.deals.get(api_key='key', api_secret='secret')
+
+    assert sent_payloads[0][3] is None
+    assert sent_payloads[1][3] == {}
+
+
+def test_body_parameters_and_entity_are_merged(sent_payloads):
+    api.ver1.bots.patch_update_by_id(5, {'name': 'old', 'leverage[type]': 'cross'}, name='new', max_active_deals=3,
+                                     api_key='key', api_secret='secret')
+
+    entity, action, action_id, payload = sent_payloads[0]
+    assert (entity, action, action_id) == ('bots', 'update', '5')
+    assert payload == {'name': 'new', 'leverage[type]': 'cross', 'max_active_deals': 3}
+
+
+def test_wrapper_arguments_are_not_shadowed(sent_payloads):
+    # the api_key body parameter of accounts/new is passed in the entity, the keyword authenticates
+    api.ver1.accounts.post_new({'api_key': 'exchange_key'}, type='binance', api_key='key', api_secret='secret')
+
+    assert sent_payloads[0][3] == {'api_key': 'exchange_key', 'type': 'binance'}
@@ -0,0 +1,83 @@
+from src.three_commas import api
+from src.three_commas.bulk import aio_bulk_by_id
+from src.three_commas.error import ThreeCommasApiError
+from src.three_commas.model import BotEntity
+from src.three_commas.client_pool import PooledPy3cw
+import asyncio
+import threading
+import time
+import pytest
+
+
+@pytest.fixture
+def concurrency_tracking_py3cw(monkeypatch):
+    lock = threading.Lock()
+    tracker = {'in_flight': 0, 'max_in_flight': 0}
+
+    def request(self, entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                payload: any = None, additional_headers: dict = None):
+        with lock:
+            tracker['in_flight'] += 1
+            tracker['max_in_flight'] = max(tracker['max_in_flight'], tracker['in_flight'])
+        try:
+            time.sleep(0.005)
+            if int(action_id) % 10 == 3:
+                return {'error': True, 'msg': 'Other error occurred: not_found Not Found None.'}, {}
+            if int(action_id) % 10 == 7:
+                raise ConnectionError('connection reset')
+            return {}, {'id': int(action_id)}
+        finally:
+            with lock:
+                tracker['in_flight'] -= 1
+
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+    return tracker
+
+
+def test_bulk_get_show_keeps_order_and_partial_failures(concurrency_tracking_py3cw):
+    ids = list(range(100, 0, -1))
+
+    result = api.ver1.bots.bulk_get_show(ids, max_workers=5, api_key='key', api_secret='secret')
+
+    assert list(result.keys()) == ids
+    for bot_id, bot in result.items():
+        if bot_id % 10 in {3, 7}:
+            assert isinstance(bot, ThreeCommasApiError)
+        else:
+            assert isinstance(bot, BotEntity) and bot.id == bot_id
+    assert result[13].is_not_found_error()
+    assert 'connection reset' in result[17].get_msg()
+    assert len(result.errors()) == 20 and len(result.successes()) == 80
+    assert concurrency_tracking_py3cw['max_in_flight'] <= 5
+
+
+def test_bulk_stats(concurrency_tracking_py3cw):
+    result = api.ver1.deals.bulk_get_market_orders([1, 2, 3, 2], api_key='key', api_secret='secret')
+
+    assert list(result.keys()) == [1, 2, 3]
+    assert result.stats.calls == 3
+    assert result.stats.errors == 1
+    assert 0 < result.stats.min_call_seconds <= result.stats.mean_call_seconds <= result.stats.max_call_seconds
+    assert result.stats.total_seconds >= result.stats.max_call_seconds
+
+
+def test_aio_bulk_by_id_limits_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_by_id(id):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001)
+        in_flight -= 1
+        if id == 2:
+            return ThreeCommasApiError({'error': True, 'msg': 'failed'}), {}
+        return ThreeCommasApiError({}), {'id': id}
+
+    result = asyncio.run(aio_bulk_by_id(get_by_id, range(50), max_concurrency=4))
+
+    assert list(result.keys()) == list(range(50))
+    assert result[2].get_msg() == 'failed'
+    assert result[3] == {'id': 3}
+    assert max_in_flight == 4
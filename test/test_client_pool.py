@@ -0,0 +1,54 @@
+from src.three_commas.client_pool import ClientPool
+from src.three_commas import sys_utils, configuration
+import time
+
+
+def test_same_credentials_reuse_the_client():
+    pool = ClientPool(pool_size=4)
+
+    client = pool.get(api_key='key', api_secret='secret')
+
+    assert pool.get(api_key='key', api_secret='secret') is client
+    assert pool.get(api_key='other_key', api_secret='secret') is not client
+    assert pool.get(api_key='key', api_secret='secret', request_options={'request_timeout': 5}) is not client
+    assert len(pool) == 3
+
+
+def test_pool_size_is_mounted():
+    pool = ClientPool(pool_size=4)
+
+    client = pool.get(api_key='key', api_secret='secret')
+
+    assert client.session.get_adapter('https://api.3commas.io')._pool_maxsize == 4
+
+
+def test_idle_clients_are_evicted():
+    pool = ClientPool(idle_timeout=60)
+    client = pool.get(api_key='key', api_secret='secret')
+
+    assert pool.evict_idle(now=time.monotonic() + 30) == 0
+    assert pool.evict_idle(now=time.monotonic() + 61) == 1
+    assert len(pool) == 0
+    assert pool.get(api_key='key', api_secret='secret') is not client
+
+
+def test_least_recently_used_client_is_evicted():
+    pool = ClientPool(max_clients=2)
+    first = pool.get(api_key='first', api_secret='secret')
+    second = pool.get(api_key='second', api_secret='secret')
+    pool.get(api_key='first', api_secret='secret')
+
+    pool.get(api_key='third', api_secret='secret')
+
+    assert len(pool) == 2
+    assert pool.get(api_key='first', api_secret='secret') is first
+    assert pool.get(api_key='second', api_secret='secret') is not second
+
+
+def test_get_py3cw_uses_the_pool(monkeypatch):
+    monkeypatch.setattr(configuration, 'THREE_COMMAS_POOL_CLIENTS', True)
+    client = sys_utils.get_py3cw(req_api_key='pool_test_key', req_api_secret='secret')
+    assert sys_utils.get_py3cw(req_api_key='pool_test_key', req_api_secret='secret') is client
+
+    monkeypatch.setattr(configuration, 'THREE_COMMAS_POOL_CLIENTS', False)
+    assert sys_utils.get_py3cw(req_api_key='pool_test_key', req_api_secret='secret') is not client
@@ -0,0 +1,99 @@
+from src.three_commas import api
+from src.three_commas.coalescing import single_flight, SingleFlight
+from src.three_commas.client_pool import PooledPy3cw
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import threading
+import time
+import pytest
+
+
+@pytest.fixture
+def slow_py3cw(monkeypatch):
+    monkeypatch.setattr(single_flight, 'enabled', True)
+    single_flight.reset_stats()
+    sent = list()
+    lock = threading.Lock()
+
+    def request(self, entity, action='', action_id=None, action_sub_id=None, payload=None, additional_headers=None):
+        with lock:
+            sent.append((self.key, entity, action, action_id))
+        time.sleep(0.1)
+        return {}, {'id': int(action_id), 'api_key': self.key, 'nested': {'value': 1}}
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+    return sent
+
+
+def test_identical_gets_are_sent_once(slow_py3cw):
+    def call(i):
+        return api.ver1.bots.get_show_by_id(1, api_key='coalesce_key', api_secret='secret')
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(call, range(16)))
+
+    assert len(slow_py3cw) == 1
+    assert all(bot.id == 1 for error, bot in results)
+    assert single_flight.stats().calls == 16
+    assert single_flight.stats().coalesced == 15
+    # every caller gets its own copy
+    results[0][1]['nested']['value'] = 2
+    assert results[1][1]['nested']['value'] == 1
+
+
+def test_different_requests_are_not_coalesced(slow_py3cw):
+    calls = [(1, 'coalesce_key'), (2, 'coalesce_key'), (1, 'other_key')]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(lambda c: api.ver1.bots.get_show_by_id(c[0], api_key=c[1], api_secret='secret'), calls))
+
+    assert len(slow_py3cw) == 3
+    assert single_flight.stats().coalesced == 0
+
+
+def test_writes_are_not_coalesced(slow_py3cw):
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: api.ver1.bots.post_disable_by_id(1, api_key='coalesce_key', api_secret='secret'),
+                          range(4)))
+
+    assert len(slow_py3cw) == 4
+
+
+def test_exception_of_the_leader_is_raised_for_all():
+    flight = SingleFlight(enabled=True)
+    started = threading.Event()
+
+    def send():
+        started.set()
+        time.sleep(0.1)
+        raise ValueError('failed')
+
+    def follower():
+        started.wait()
+        with pytest.raises(ValueError):
+            flight.do('key', send)
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    with pytest.raises(ValueError):
+        flight.do('key', send)
+    thread.join()
+    assert flight.stats().coalesced == 1
+
+
+def test_aio_identical_gets_are_sent_once():
+    flight = SingleFlight(enabled=True)
+    sent = list()
+
+    async def send():
+        sent.append(1)
+        await asyncio.sleep(0.05)
+        return {}, {'id': 1}
+
+    async def run():
+        return await asyncio.gather(*[flight.aio_do('key', send) for _ in range(10)])
+
+    results = asyncio.run(run())
+
+    assert len(sent) == 1
+    assert all(data == {'id': 1} for error, data in results)
+    assert flight.stats().coalesced == 9
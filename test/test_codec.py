@@ -0,0 +1,48 @@
+from src.three_commas import codec
+from src.three_commas.streams.streams import WebSocketMessage, StreamType, get_message_for
+import json
+import pytest
+
+
+DEAL_FILE = 'test/sample_data/deals/usdt/deal_show_usdt.json'
+
+
+@pytest.mark.parametrize('name', ['orjson', 'ujson', 'json'])
+def test_codecs_round_trip(name):
+    try:
+        json_codec = codec.get_codec(name)
+    except ImportError:
+        pytest.skip(f'{name} is not installed')
+    with open(DEAL_FILE) as f:
+        text = f.read()
+
+    assert json_codec.loads(text) == json.loads(text)
+    assert json_codec.loads(text.encode()) == json.loads(text)
+    assert json.loads(json_codec.dumps(json.loads(text))) == json.loads(text)
+
+
+def test_fastest_installed_codec_is_the_default():
+    installed = list()
+    for name in codec.CODEC_FACTORIES:
+        try:
+            codec.get_codec(name)
+            installed.append(name)
+        except ImportError:
+            pass
+    assert codec.get_codec().name == installed[0]
+
+
+def test_set_codec(monkeypatch):
+    monkeypatch.setattr(codec, 'codec', codec.codec)
+    codec.set_codec('json')
+    assert codec.codec.name == 'json'
+    assert codec.dumps({'a': 1}) == '{"a": 1}'
+
+
+def test_stream_identifier():
+    identifier = get_message_for(StreamType.DEALS, 'key', 'secret')['identifier']
+    message = WebSocketMessage(codec.loads(json.dumps({'identifier': identifier, 'message': {'id': 1}})))
+
+    assert message.is_stream_type(StreamType.DEALS)
+    assert not message.is_stream_type(StreamType.SMART_TRADES)
+    assert not WebSocketMessage({'type': 'ping'}).is_stream_type(StreamType.DEALS)
@@ -0,0 +1,68 @@
+from src.three_commas import api
+from src.three_commas.api import aio
+from src.three_commas.aio_client import AioPy3cw
+from src.three_commas.error import ThreeCommasException
+from src.three_commas.sys_utils import Py3cwClosureProxy
+from src.three_commas.client_pool import PooledPy3cw
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import random
+import time
+import pytest
+
+
+CREDENTIALS = [(f'key_{i}', f'secret_{i}') for i in range(8)]
+FORCED_MODES = [None, 'paper', 'real']
+
+
+@pytest.fixture
+def echo_py3cw(monkeypatch):
+    def request(self, entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                payload: any = None, additional_headers: dict = None):
+        # give the other threads the chance to interleave
+        time.sleep(random.random() / 1000)
+        return {}, [{'id': action_id, 'api_key': self.key, 'forced_mode': additional_headers.get('Forced-Mode')}]
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+
+
+def call_bots_get(i: int):
+    api_key, api_secret = CREDENTIALS[i % len(CREDENTIALS)]
+    forced_mode = FORCED_MODES[i % len(FORCED_MODES)]
+    error, bots = api.ver1.bots.get(api_key=api_key, api_secret=api_secret, forced_mode=forced_mode)
+    return api_key, forced_mode, bots
+
+
+def test_no_cross_talk_between_threads(echo_py3cw):
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        results = list(executor.map(call_bots_get, range(2000)))
+
+    for api_key, forced_mode, bots in results:
+        assert bots[0].api_key == api_key
+        assert bots[0].forced_mode == forced_mode
+
+
+def test_no_cross_talk_between_asyncio_tasks(monkeypatch):
+    async def request(self, entity: str, action: str = '', action_id: str = None, action_sub_id: str = None,
+                      payload: any = None, additional_headers: dict = None):
+        # the other tasks run while this one waits
+        await asyncio.sleep(random.random() / 1000)
+        return {}, [{'id': action_id, 'api_key': self.key, 'forced_mode': additional_headers.get('Forced-Mode')}]
+    monkeypatch.setattr(AioPy3cw, 'request', request)
+
+    async def call_bots_get_async(i: int):
+        api_key, api_secret = CREDENTIALS[i % len(CREDENTIALS)]
+        forced_mode = FORCED_MODES[i % len(FORCED_MODES)]
+        error, bots = await aio.ver1.bots.get(api_key=api_key, api_secret=api_secret, forced_mode=forced_mode)
+        return api_key, forced_mode, bots
+
+    async def run():
+        return await asyncio.gather(*[call_bots_get_async(i) for i in range(500)])
+
+    for api_key, forced_mode, bots in asyncio.run(run()):
+        assert bots[0].api_key == api_key
+        assert bots[0].forced_mode == forced_mode
+
+
+def test_proxy_outside_of_with_py3cw_raises():
+    with pytest.raises(ThreeCommasException):
+        Py3cwClosureProxy().request(entity='bots', action='')
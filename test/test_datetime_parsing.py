@@ -0,0 +1,50 @@
+from src.three_commas import configuration
+from src.three_commas.model import DealEntity
+from src.three_commas.model.models import parse_datetime, parse_many, DatetimeParser, ISO_DATETIME_PATTERN
+import datetime
+import pytest
+
+
+UTC = datetime.timezone.utc
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2022-01-09T17:32:13.632Z', datetime.datetime(2022, 1, 9, 17, 32, 13, 632000)),
+    ('2022-01-09T17:32:13Z', datetime.datetime(2022, 1, 9, 17, 32, 13)),
+    ('2022-01-09T17:32:13.123456Z', datetime.datetime(2022, 1, 9, 17, 32, 13, 123456)),
+    ('2022-01-09T19:32:13.632+02:00', datetime.datetime(2022, 1, 9, 17, 32, 13, 632000)),
+    ('2022-01-09T17:32:13', datetime.datetime(2022, 1, 9, 17, 32, 13)),
+])
+def test_parse_datetime(value, expected):
+    assert parse_datetime(value, utc=False) == expected
+    assert parse_datetime(value, utc=True) == expected.replace(tzinfo=UTC)
+    assert parse_datetime(value, utc=True).tzinfo == UTC
+
+
+def test_pattern_of_older_pythons():
+    assert ISO_DATETIME_PATTERN.match('2022-01-09T17:32:13.6321234Z').groups() == \
+           ('2022', '01', '09', '17', '32', '13', '632123', 'Z')
+    assert ISO_DATETIME_PATTERN.match('2022-01-09T17:32:13-0130').group(8) == '-0130'
+
+
+def test_invalid_value_raises():
+    with pytest.raises(ValueError):
+        parse_datetime('yesterday')
+
+
+def test_utc_default_is_configurable(monkeypatch):
+    monkeypatch.setattr(configuration, 'THREE_COMMAS_AUTO_PARSE_DATETIME_UTC', True)
+
+    assert parse_datetime('2022-01-09T17:32:13Z').tzinfo == UTC
+    assert DatetimeParser.parse('2022-01-09T17:32:13Z', parsed=True).tzinfo == UTC
+
+
+def test_parse_many():
+    assert parse_many(['2022-01-09T17:32:13Z', None, '2022-01-09T17:32:13Z'], utc=False) == \
+           [datetime.datetime(2022, 1, 9, 17, 32, 13), None, datetime.datetime(2022, 1, 9, 17, 32, 13)]
+
+
+def test_timestamp_without_fraction_is_parsed_by_the_model():
+    deal = DealEntity({'closed_at': '2022-01-09T17:32:13Z'})
+
+    assert deal.parsed(True).closed_at == datetime.datetime(2022, 1, 9, 17, 32, 13)
@@ -0,0 +1,98 @@
+from src.three_commas.frames import DealFrame
+from src.three_commas.model import DealEntity
+import datetime
+import math
+import pytest
+
+
+@pytest.fixture
+def deals(deal_dict):
+    return [
+        {**deal_dict, 'id': 1, 'bot_id': 10, 'pair': 'USDT_BTC', 'status': 'completed',
+         'usd_final_profit': '1.5', 'closed_at': '2022-01-09T17:32:13.632Z'},
+        {**deal_dict, 'id': 2, 'bot_id': 10, 'pair': 'USDT_ETH', 'status': 'completed',
+         'usd_final_profit': '2.5', 'closed_at': '2022-01-09T23:59:59.000Z'},
+        {**deal_dict, 'id': 3, 'bot_id': 20, 'pair': 'USDT_BTC', 'status': 'completed',
+         'usd_final_profit': '-1.0', 'closed_at': '2022-01-10T00:00:00.000Z'},
+        {**deal_dict, 'id': 4, 'bot_id': 20, 'pair': 'USDT_BTC', 'status': 'bought',
+         'usd_final_profit': None, 'closed_at': None},
+    ]
+
+
+@pytest.fixture(params=[False, True], ids=['array', 'numpy'])
+def use_numpy(request):
+    if request.param:
+        pytest.importorskip('numpy')
+    return request.param
+
+
+def test_columns(deals, use_numpy):
+    frame = DealFrame.of_deals((DealEntity(deal) for deal in deals), use_numpy=use_numpy)
+
+    assert len(frame) == 4
+    assert list(frame['id']) == [1, 2, 3, 4]
+    assert frame['pair'] == ['USDT_BTC', 'USDT_ETH', 'USDT_BTC', 'USDT_BTC']
+    assert list(frame['usd_final_profit'])[:3] == [1.5, 2.5, -1.0]
+    assert math.isnan(frame['usd_final_profit'][3])
+    assert frame['closed_at'][2] == datetime.datetime(2022, 1, 10, tzinfo=datetime.timezone.utc).timestamp()
+    with pytest.raises(KeyError):
+        frame['unknown']
+
+
+def test_aggregates_skip_missing_values(deals, use_numpy):
+    frame = DealFrame.of_deals(deals, use_numpy=use_numpy)
+
+    assert frame.sum('usd_final_profit') == 3.0
+    assert frame.mean('usd_final_profit') == 1.0
+    assert frame.aggregate('usd_final_profit', 'count') == 3.0
+    assert frame.aggregate('usd_final_profit', 'max') == 2.5
+
+
+def test_group_by(deals, use_numpy):
+    frame = DealFrame.of_deals(deals, use_numpy=use_numpy)
+
+    assert frame.group_by('bot_id', 'usd_final_profit') == {10: 4.0, 20: -1.0}
+    assert frame.group_by('pair', 'usd_final_profit', 'mean') == {'USDT_BTC': 0.25, 'USDT_ETH': 2.5}
+    assert frame.group_by('status', 'usd_final_profit', 'count') == {'completed': 3.0}
+    assert frame.group_by('pair', 'usd_final_profit', 'min') == {'USDT_BTC': -1.0, 'USDT_ETH': 2.5}
+    with pytest.raises(ValueError):
+        frame.group_by('pair', 'usd_final_profit', 'median')
+    with pytest.raises(KeyError):
+        frame.group_by('usd_final_profit', 'usd_final_profit')
+
+
+def test_group_by_time(deals, use_numpy):
+    frame = DealFrame.of_deals(deals, use_numpy=use_numpy)
+
+    assert frame.group_by_time('usd_final_profit') == {
+        datetime.datetime(2022, 1, 9, tzinfo=datetime.timezone.utc): 4.0,
+        datetime.datetime(2022, 1, 10, tzinfo=datetime.timezone.utc): -1.0,
+    }
+    hourly = frame.group_by_time('usd_final_profit', period=datetime.timedelta(hours=1), aggregation='count')
+    assert list(hourly.values()) == [1.0, 1.0, 1.0]
+
+
+def test_filter(deals, use_numpy):
+    frame = DealFrame.of_deals(deals, use_numpy=use_numpy)
+
+    completed_btc = frame.filter(frame.where(status='completed', pair='USDT_BTC'))
+    assert list(completed_btc['id']) == [1, 3]
+    assert completed_btc.group_by('bot_id', 'usd_final_profit') == {10: 1.5, 20: -1.0}
+
+    assert list(frame.filter(frame.where(pair=['USDT_ETH', 'USDT_XRP']))['id']) == [2]
+
+    on_the_9th = frame.between('closed_at',
+                               datetime.datetime(2022, 1, 9),
+                               datetime.datetime(2022, 1, 10))
+    assert list(frame.filter(on_the_9th)['id']) == [1, 2]
+    assert list(frame.filter(on_the_9th, frame.where(bot_id=10), frame.between('usd_final_profit', 2))['id']) == [2]
+    assert len(frame.filter(frame.where(status='failed'))) == 0
+
+
+def test_filter_without_conditions_keeps_all_rows(deals, use_numpy):
+    frame = DealFrame.of_deals(deals, use_numpy=use_numpy)
+
+    assert list(frame.where()) == [True] * 4
+    assert list(frame.filter(frame.where())['id']) == [1, 2, 3, 4]
+    assert frame.filter() is frame
+    assert len(DealFrame.of_deals([], use_numpy=use_numpy).where()) == 0
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+from typing import Dict
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = {'websockets', 'aiohttp', 'cachetools', 'requests', 'py3cw'}
+# far above the ~1 ms of the lazy package, far below the ~200 ms of importing everything
+IMPORT_BUDGET_US = 50_000
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """
+    :return: cumulative import time in microseconds of every module imported by code, from python -X importtime
+    """
+    process = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+    times = dict()
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_package_import_is_lazy():
+    times = import_times('import src.three_commas')
+
+    assert not HEAVY_MODULES.intersection(times)
+    assert 'src.three_commas.api' not in times
+    assert times['src.three_commas'] < IMPORT_BUDGET_US
+
+
+def test_one_endpoint_imports_only_what_it_needs():
+    times = import_times('import src.three_commas as three_commas; three_commas.api.ver1.bots')
+
+    assert 'src.three_commas.api.ver1.bots' in times
+    assert not {'websockets', 'aiohttp', 'cachetools'}.intersection(times)
+    assert not {'src.three_commas.api.ver1.deals', 'src.three_commas.streams', 'src.three_commas.cached_api'}.intersection(times)
+
+
+def test_lazy_attributes():
+    import src.three_commas as three_commas
+
+    assert three_commas.api.ver1.bots.get_show_by_id
+    assert 'bots' in dir(three_commas.api.ver1)
@@ -0,0 +1,80 @@
+from src.three_commas.model import DealEntity
+from src.three_commas.model.models import LazyModelList
+from src.three_commas import codec
+import pickle
+import json
+import pytest
+
+
+@pytest.fixture
+def raw_deals(deal_dicts):
+    return [{**deal, 'bought_volume': str(deal['id'])} for deal in deal_dicts(5)]
+
+
+def built(deals: LazyModelList) -> list:
+    return [type(item) is DealEntity for item in list.__iter__(deals)]
+
+
+def test_models_are_built_on_access(raw_deals):
+    deals = DealEntity.of_list(raw_deals)
+
+    assert isinstance(deals, list)
+    assert len(deals) == 5
+    assert not any(built(deals))
+
+    assert deals[1].bought_volume == 1.0
+    assert deals[-1].id == 4
+    assert built(deals) == [False, True, False, False, True]
+    assert deals[1] is deals[1]
+
+
+def test_iteration_and_slicing(raw_deals):
+    deals = DealEntity.of_list(raw_deals)
+
+    subset = deals[1:4:2]
+    assert isinstance(subset, LazyModelList)
+    assert [deal.id for deal in subset] == [1, 3]
+    assert not any(built(deals))
+
+    assert [deal.id for deal in reversed(deals)] == [4, 3, 2, 1, 0]
+    assert all(isinstance(deal, DealEntity) for deal in deals)
+    assert all(built(deals))
+
+
+def test_list_operations(raw_deals):
+    deals = DealEntity.of_list(raw_deals)
+
+    assert deals == raw_deals
+    assert raw_deals[2] in deals
+    assert deals.index(raw_deals[3]) == 3
+    assert not any(built(deals))
+
+    assert isinstance(deals.pop(), DealEntity)
+    deals.sort(key=lambda deal: deal.bought_volume, reverse=True)
+    assert [deal.id for deal in deals] == [3, 2, 1, 0]
+
+    extended = deals[:1] + DealEntity.of_list(raw_deals[4:])
+    assert isinstance(extended[1], DealEntity)
+    assert [deal.id for deal in extended] == [3, 4]
+    assert isinstance(deals.copy(), LazyModelList)
+
+
+def test_encoding_and_pickling(raw_deals):
+    deals = DealEntity.of_list(raw_deals)
+    deals[0]['bought_volume'] = '7'
+
+    assert json.loads(codec.dumps(deals)) == [{**raw_deals[0], 'bought_volume': '7'}, *raw_deals[1:]]
+    unpickled = pickle.loads(pickle.dumps(deals))
+    assert isinstance(unpickled, LazyModelList)
+    assert unpickled[0].bought_volume == 7.0
+
+
+def test_eager_opt_out(raw_deals, monkeypatch):
+    deals = DealEntity.of_list(raw_deals, lazy=False)
+    assert type(deals) is list
+    assert all(isinstance(deal, DealEntity) for deal in list.__iter__(deals))
+
+    from src.three_commas import configuration
+    monkeypatch.setattr(configuration, 'THREE_COMMAS_LAZY_MODEL_LISTS', False)
+    assert type(DealEntity.of_list(raw_deals)) is list
+    assert DealEntity.of_list(None) == []
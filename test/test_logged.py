@@ -0,0 +1,42 @@
+from src.three_commas import sys_utils
+from src.three_commas.sys_utils import logged
+import logging
+import pytest
+
+
+@logged(reduce_long_arguments=True, log_return=True)
+def echo(*args, **kwargs):
+    return args, kwargs
+
+
+def test_nothing_is_formatted_without_debug(monkeypatch, caplog):
+    def fail(*args, **kwargs):
+        raise AssertionError('formatted without debug logging')
+    monkeypatch.setattr(sys_utils, 'transform_args_kwargs_for_logging', fail)
+    caplog.set_level(logging.INFO, logger=__name__)
+
+    assert echo(1, api_key='key') == ((1,), {'api_key': 'key'})
+    assert not caplog.records
+
+
+def test_debug_logs_reduced_and_blurred_arguments_to_the_module_logger(caplog):
+    caplog.set_level(logging.DEBUG, logger=__name__)
+
+    echo('x' * 1000, api_key='secret_key', note='y' * 1000)
+
+    called, executed = [r.getMessage() for r in caplog.records if r.name == __name__]
+    assert "'api_key': 'secre...'" in called
+    assert len(called) < 1000
+    assert executed.startswith("Function 'echo' was executed and returned")
+
+
+def test_exceptions_are_logged_and_raised(caplog):
+    caplog.set_level(logging.DEBUG, logger=__name__)
+
+    @logged
+    def fail():
+        raise ValueError('failed')
+
+    with pytest.raises(ValueError):
+        fail()
+    assert 'raised an exception' in caplog.records[-1].getMessage()
@@ -0,0 +1,121 @@
+from src.three_commas import api, retry
+from src.three_commas.metrics import metrics, registry, MetricsRegistry, MetricsSink, Histogram, get_error_category, \
+    set_response_size, get_response_size, remember_response_size
+from src.three_commas.retry import RetryPolicy
+from src.three_commas.client_pool import PooledPy3cw
+import pytest
+
+
+@pytest.fixture
+def measured_py3cw(monkeypatch):
+    monkeypatch.setattr(metrics, 'enabled', True)
+    monkeypatch.setattr(retry, 'default_retry_policy', RetryPolicy(base_delay=0.0, max_delay=0.0))
+    registry.reset()
+    responses = list()
+
+    def request(self, entity, action='', action_id=None, action_sub_id=None, payload=None, additional_headers=None):
+        error = responses.pop(0) if responses else None
+        set_response_size(120)
+        if error:
+            return error, {}
+        return {}, {'id': 1}
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+    return responses
+
+
+def test_error_categories():
+    assert get_error_category({}) is None
+    assert get_error_category({'error': True, 'msg': 'Other error occurred: not_found Not Found None.'}) == 'not_found'
+    assert get_error_category({'error': True, 'msg': 'x', 'status_code': 429}) == 'rate_limited'
+    assert get_error_category({'error': True, 'msg': 'x', 'status_code': 502}) == 'server_error'
+    assert get_error_category({'error': True, 'msg': "access_denied Api key doesn't have enough permissions"}) == 'no_permission'
+    assert get_error_category({'error': True, 'msg': 'something else'}) == 'other'
+
+
+def test_histogram_buckets():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative_counts() == [('0.1', 2), ('1.0', 3), ('+Inf', 4)]
+    assert histogram.count == 4 and histogram.sum == pytest.approx(5.65)
+
+
+def test_requests_are_measured(measured_py3cw):
+    measured_py3cw.extend([None, {'error': True, 'msg': 'Other error occurred: not_found Not Found None.', 'status_code': 404}])
+
+    api.ver1.bots.get_show_by_id(1, api_key='metrics_key', api_secret='secret')
+    api.ver1.bots.get_show_by_id(2, api_key='metrics_key', api_secret='secret')
+
+    assert registry.get_request_count('bots', 'show') == 2
+    assert registry.get_error_counts('bots', 'show') == {'not_found': 1}
+
+
+def test_retries_are_measured(measured_py3cw):
+    measured_py3cw.extend([{'error': True, 'msg': 'x', 'status_code': 503}, None])
+
+    api.ver1.bots.get_show_by_id(1, api_key='metrics_key', api_secret='secret')
+
+    text = registry.render_prometheus()
+    assert 'three_commas_retries_total{entity="bots",action="show"} 1' in text
+    assert 'three_commas_request_errors_total{entity="bots",action="show",category="server_error"} 1' in text
+
+
+def test_render_prometheus(measured_py3cw):
+    api.ver1.bots.get_show_by_id(1, api_key='metrics_key', api_secret='secret')
+
+    text = registry.render_prometheus()
+
+    assert '# TYPE three_commas_request_duration_seconds histogram' in text
+    assert 'three_commas_request_duration_seconds_bucket{entity="bots",action="show",le="+Inf"} 1' in text
+    assert 'three_commas_request_duration_seconds_count{entity="bots",action="show"} 1' in text
+    assert 'three_commas_requests_total{entity="bots",action="show"} 1' in text
+    assert 'three_commas_response_bytes_total{entity="bots",action="show"} 120' in text
+
+
+def test_custom_sink(measured_py3cw):
+    class ListSink(MetricsSink):
+        def __init__(self):
+            self.requests = list()
+
+        def request_finished(self, entity, action, seconds, error_category, response_bytes):
+            self.requests.append((entity, action, error_category, response_bytes))
+
+    sink = ListSink()
+    metrics.add_sink(sink)
+    try:
+        api.ver1.bots.get_show_by_id(1, api_key='metrics_key', api_secret='secret')
+    finally:
+        metrics.remove_sink(sink)
+
+    assert sink.requests == [('bots', 'show', None, 120)]
+
+
+def test_disabled_metrics_are_not_recorded(monkeypatch):
+    sink = MetricsRegistry()
+    monkeypatch.setattr(metrics, 'sinks', [sink])
+    monkeypatch.setattr(metrics, 'enabled', False)
+
+    metrics.request_finished('bots', 'show', seconds=0.1, error={})
+
+    assert sink.get_request_count('bots', 'show') == 0
+
+
+class UnreadResponse:
+    def __init__(self, headers: dict):
+        self.headers = headers
+
+    @property
+    def content(self):
+        raise AssertionError('the body must not be read')
+
+
+def test_response_size_hook(monkeypatch):
+    monkeypatch.setattr(metrics, 'enabled', False)
+    set_response_size(None)
+    remember_response_size(UnreadResponse({}))
+    assert get_response_size() is None
+
+    monkeypatch.setattr(metrics, 'enabled', True)
+    remember_response_size(UnreadResponse({'Content-Length': '2048'}))
+    assert get_response_size() == 2048
@@ -0,0 +1,44 @@
+from src.three_commas.model import DealEntity, BotEntity
+from src.three_commas.model.models import Field, ParsedField, FloatParser
+
+
+def test_declared_fields_are_descriptors():
+    assert isinstance(DealEntity.__dict__['pair'], Field)
+    assert isinstance(DealEntity.__dict__['bought_volume'], ParsedField)
+    assert DealEntity.__dict__['finished'].key == 'finished?'
+
+
+def test_fields_read_the_dict():
+    deal = DealEntity({'pair': 'USDT_BTC', 'bought_volume': '1.5', 'finished?': True, 'undeclared': 'x'})
+
+    assert deal.pair == 'USDT_BTC'
+    assert deal.bought_volume == 1.5
+    assert deal.finished is True
+    assert deal.undeclared == 'x'
+    assert deal.bot_id is None
+    assert deal.parsed(False).bought_volume == '1.5'
+
+
+def test_subclass_parse_map_is_used():
+    class StringVolumeDeal(DealEntity):
+        _parse_map = {k: v for k, v in DealEntity._parse_map.items() if k != 'bought_volume'}
+
+    class FloatPairDeal(DealEntity):
+        _parse_map = {**DealEntity._parse_map, 'pair': FloatParser}
+
+    assert StringVolumeDeal({'bought_volume': '1.5'}).bought_volume == '1.5'
+    assert FloatPairDeal({'pair': '2'}).pair == 2.0
+
+
+def test_methods_keep_precedence():
+    class BotWithMethod(BotEntity):
+        name: str
+
+        def pairs(self):
+            return 'method'
+
+    bot = BotWithMethod({'pairs': ['USDT_BTC'], 'name': 'bot'})
+
+    assert bot.pairs() == 'method'
+    assert bot.name == 'bot'
+    assert bot.items
@@ -0,0 +1,76 @@
+from src.three_commas.model import DealEntity, DealRecord
+from src.three_commas.model.models import ThreeCommasView, LazyModelList
+from src.three_commas import configuration
+import datetime
+import pickle
+
+
+def test_view_reads_like_the_model(deal_dict):
+    view = DealEntity.view(deal_dict)
+    entity = DealEntity(deal_dict)
+
+    assert isinstance(view, ThreeCommasView)
+    assert type(view) is DealEntity.get_view_type()
+    assert view._data is deal_dict
+    assert view.bought_volume == entity.bought_volume == float(deal_dict['bought_volume'])
+    assert view.parsed(False).bought_volume == deal_dict['bought_volume']
+    assert view.parsed(True).closed_at == datetime.datetime(2022, 1, 9, 17, 32, 13, 632000)
+    assert view['id'] == view.id == deal_dict['id']
+    assert view.not_a_field is None
+    assert view == deal_dict == entity
+    assert dict(view) == deal_dict
+    assert view.to_entity() == entity and isinstance(view.to_entity(), DealEntity)
+    assert view.to_record() == DealRecord.of_dict(deal_dict)
+
+
+def test_copy_on_write(deal_dict):
+    original = dict(deal_dict)
+    view = DealEntity.view(deal_dict)
+    assert view.bought_volume == float(original['bought_volume'])
+
+    view.bought_volume = '3'
+    view['new_key'] = 1
+    del view['bot_events']
+    assert deal_dict == original
+    assert view.bought_volume == 3.0
+    assert view['new_key'] == 1
+    assert 'bot_events' not in view
+
+    view.clear()
+    assert len(view) == 0 and deal_dict == original
+
+
+def test_pickle_and_copy(deal_dict):
+    view = DealEntity.view(deal_dict)
+
+    unpickled = pickle.loads(pickle.dumps(view))
+    assert type(unpickled) is type(view)
+    assert unpickled == view
+
+    copied = view.copy()
+    copied['id'] = 1
+    assert view.id == deal_dict['id']
+
+
+def test_of_list_with_views(deal_dict, monkeypatch):
+    views = DealEntity.of_list([deal_dict], view=True)
+    assert isinstance(views, LazyModelList)
+    assert views[0]._data is deal_dict
+
+    assert isinstance(DealEntity.of_list([deal_dict], lazy=False, view=True)[0], ThreeCommasView)
+
+    monkeypatch.setattr(configuration, 'THREE_COMMAS_MODEL_VIEWS', True)
+    assert isinstance(DealEntity.of_list([deal_dict])[0], ThreeCommasView)
+
+
+def test_changes_of_the_wrapped_dict_are_seen(deal_dict):
+    view = DealEntity.view(deal_dict)
+    assert view.final_profit == float(deal_dict['final_profit'])
+
+    deal_dict['final_profit'] = '123'
+    assert view.final_profit == 123.0
+    assert view.parsed(True).final_profit == 123.0
+
+    view['bought_volume'] = '1.5'
+    assert view.final_profit == 123.0
+    assert view.bought_volume == 1.5
@@ -0,0 +1,94 @@
+from src.three_commas import api
+from src.three_commas.api import aio
+from src.three_commas.model import DealEntity, SmartTradeV2Entity
+from src.three_commas.error import ThreeCommasPaginationException
+from src.three_commas.client_pool import PooledPy3cw
+import asyncio
+import pytest
+
+
+TOTAL_DEALS = 2500
+
+
+@pytest.fixture
+def deals_py3cw(monkeypatch):
+    requested_pages = list()
+
+    def request(self, entity, action='', action_id=None, action_sub_id=None, payload=None, additional_headers=None):
+        requested_pages.append(dict(payload))
+        if payload.get('bot_id') == 13:
+            return {'error': True, 'msg': 'Other error occurred: not_found Not Found None.', 'status_code': 404}, {}
+        # like the server, a larger page is cut to the maximum page size
+        if entity == 'smart_trades_v2':
+            start = (payload['page'] - 1) * payload['per_page']
+            return {}, [{'id': i} for i in range(start, min(start + min(payload['per_page'], 100), 250))]
+        start = payload['offset']
+        limit = min(payload['limit'], 1000)
+        return {}, [{'id': i, 'bot_id': payload.get('bot_id')} for i in range(start, min(start + limit, TOTAL_DEALS))]
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+    return requested_pages
+
+
+def test_deals_are_yielded_lazily_over_all_pages(deals_py3cw):
+    deals = api.ver1.deals.iter_all(bot_id=7, scope='finished', api_key='page_key', api_secret='secret')
+
+    first = next(deals)
+    assert isinstance(first, DealEntity) and first.id == 0 and first.bot_id == 7
+    # the first page is consumed, the second one is prefetched
+    assert len(deals_py3cw) <= 2
+
+    ids = [first.id] + [deal.id for deal in deals]
+    assert ids == list(range(TOTAL_DEALS))
+    assert [p['offset'] for p in deals_py3cw] == [0, 1000, 2000]
+    assert all(p['limit'] == 1000 and p['scope'] == 'finished' for p in deals_py3cw)
+
+
+def test_without_prefetch(deals_py3cw):
+    deals = api.ver1.deals.iter_all(page_size=500, prefetch=False, api_key='page_key', api_secret='secret')
+
+    next(deals)
+    assert len(deals_py3cw) == 1
+    assert len(list(deals)) == TOTAL_DEALS - 1
+
+
+def test_page_size_above_the_server_maximum_is_clamped(deals_py3cw):
+    deals = list(api.ver1.deals.iter_all(page_size=2000, api_key='page_key', api_secret='secret'))
+
+    assert [deal.id for deal in deals] == list(range(TOTAL_DEALS))
+    assert [(p['offset'], p['limit']) for p in deals_py3cw] == [(0, 1000), (1000, 1000), (2000, 1000)]
+
+    deals_py3cw.clear()
+    smart_trades = list(api.v2.smart_trades.iter_all(page_size=250, api_key='page_key', api_secret='secret'))
+    assert len(smart_trades) == 250
+    assert [p['per_page'] for p in deals_py3cw] == [100, 100, 100]
+
+
+def test_page_size_must_be_positive(deals_py3cw):
+    with pytest.raises(ValueError):
+        next(api.ver1.deals.iter_all(page_size=0, api_key='page_key', api_secret='secret'))
+
+
+def test_smart_trades_use_page_numbers(deals_py3cw):
+    smart_trades = list(api.v2.smart_trades.iter_all(api_key='page_key', api_secret='secret'))
+
+    assert len(smart_trades) == 250 and isinstance(smart_trades[0], SmartTradeV2Entity)
+    assert [(p['page'], p['per_page']) for p in deals_py3cw] == [(1, 100), (2, 100), (3, 100)]
+
+
+def test_failing_page_raises(deals_py3cw):
+    with pytest.raises(ThreeCommasPaginationException) as e:
+        list(api.ver1.deals.iter_all(bot_id=13, api_key='page_key', api_secret='secret'))
+    assert e.value.error.is_not_found_error()
+
+
+def test_aio_iter_all(monkeypatch):
+    async def request(self, entity, action='', action_id=None, action_sub_id=None, payload=None, additional_headers=None):
+        start = payload['offset']
+        return {}, [{'id': i} for i in range(start, min(start + min(payload['limit'], 1000), 2500))]
+    monkeypatch.setattr('src.three_commas.aio_client.AioPy3cw.request', request)
+
+    async def run(page_size):
+        return [deal.id async for deal in aio.ver1.deals.iter_all(page_size=page_size, api_key='page_key', api_secret='secret')]
+
+    assert asyncio.run(run(100)) == list(range(2500))
+    assert asyncio.run(run(2000)) == list(range(2500))
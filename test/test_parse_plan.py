@@ -0,0 +1,65 @@
+from src.three_commas.model import DealEntity, BotEntity
+from src.three_commas.model.models import get_parse_plan
+from typing import NamedTuple, Optional
+import datetime
+import pytest
+
+
+def test_to_parsed_dict(deal_dict):
+    deal = DealEntity(deal_dict)
+    parsed = deal.to_parsed_dict()
+
+    assert type(parsed) is dict
+    assert parsed.keys() == deal_dict.keys()
+    assert parsed['bought_volume'] == deal.bought_volume == float(deal_dict['bought_volume'])
+    assert parsed['closed_at'] == deal.parsed(True).closed_at == datetime.datetime(2022, 1, 9, 17, 32, 13, 632000)
+    assert parsed['pair'] == deal_dict['pair']
+    assert deal.to_parsed_dict(datetimes=False)['closed_at'] == deal_dict['closed_at']
+    assert deal['bought_volume'] == deal_dict['bought_volume']
+
+
+def test_values_that_can_not_be_converted_are_kept(deal_dict):
+    parsed = DealEntity({**deal_dict, 'bought_volume': 'n/a', 'sold_volume': None}).to_parsed_dict()
+
+    assert parsed['bought_volume'] == 'n/a'
+    assert parsed['sold_volume'] is None
+
+
+def test_parse_all(deal_dict):
+    deals = [deal_dict, {**deal_dict, 'id': 2}]
+
+    assert DealEntity.parse_all(deals) == [DealEntity(deal).to_parsed_dict() for deal in deals]
+    assert DealEntity.parse_all(None) == []
+
+
+def test_to_row(deal_dict):
+    deal = DealEntity(deal_dict)
+    row = deal.to_row()
+
+    assert type(row).__name__ == 'DealEntityRow'
+    assert row.id == deal.id
+    assert row.bought_volume == deal.bought_volume
+    assert row.finished == deal.finished == deal_dict['finished?']
+    assert row.closed_at == deal.parsed(True).closed_at
+    assert len(row) == len(DealEntity.__annotations__)
+    assert DealEntity.view(deal_dict).to_row() == row
+
+
+def test_to_rows_with_own_named_tuple(deal_dict):
+    class ProfitRow(NamedTuple):
+        id: int
+        usd_final_profit: Optional[float]
+        closed_at: Optional[datetime.datetime]
+
+    rows = DealEntity.to_rows([deal_dict, {**deal_dict, 'id': 2}], row_type=ProfitRow, datetimes=False)
+
+    assert rows == [ProfitRow(deal_dict['id'], float(deal_dict['usd_final_profit']), deal_dict['closed_at']),
+                    ProfitRow(2, float(deal_dict['usd_final_profit']), deal_dict['closed_at'])]
+    with pytest.raises(TypeError):
+        DealEntity.to_rows([deal_dict], row_type=tuple)
+
+
+def test_plans_are_cached():
+    assert get_parse_plan(DealEntity) is get_parse_plan(DealEntity.get_view_type())
+    assert get_parse_plan(DealEntity) is not get_parse_plan(DealEntity, datetimes=False)
+    assert get_parse_plan(BotEntity) is not get_parse_plan(DealEntity)
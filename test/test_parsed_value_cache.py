@@ -0,0 +1,90 @@
+from src.three_commas.model import DealEntity, BotEntity
+from src.three_commas.model.models import FloatParser
+import datetime
+import copy
+import pickle
+import pytest
+
+
+class CountingFloatParser(FloatParser):
+    calls = 0
+
+    @staticmethod
+    def parse(value: str, parsed: bool = True):
+        CountingFloatParser.calls += 1
+        return FloatParser.parse(value, parsed)
+
+
+class CountingDeal(DealEntity):
+    _parse_map = {**DealEntity._parse_map, 'bought_volume': CountingFloatParser}
+
+
+def test_value_is_parsed_once():
+    CountingFloatParser.calls = 0
+    deal = CountingDeal({'bought_volume': '12.5'})
+
+    assert [deal.bought_volume for _ in range(5)] == [12.5] * 5
+    assert CountingFloatParser.calls == 1
+
+
+def test_setting_a_value_drops_the_cached_one():
+    deal = DealEntity({'bought_volume': '12.5', 'finished?': False})
+    assert deal.bought_volume == 12.5
+
+    deal.bought_volume = '13.5'
+    assert deal.bought_volume == 13.5
+
+    deal['bought_volume'] = '14.5'
+    assert deal.bought_volume == 14.5
+
+    deal.update({'bought_volume': '15.5'})
+    assert deal.bought_volume == 15.5
+
+    deal |= {'bought_volume': '16.5'}
+    assert deal.bought_volume == 16.5
+
+    del deal['bought_volume']
+    assert deal.bought_volume is None
+
+    deal.finished = True
+    assert deal.finished is True
+
+
+def test_parsed_override_is_cached_apart():
+    bot = BotEntity({'base_order_volume': '1.1', 'created_at': '2019-01-01T00:00:00.000Z'})
+
+    assert bot.created_at == '2019-01-01T00:00:00.000Z'
+    assert bot.parsed(True).created_at == datetime.datetime(2019, 1, 1)
+    assert bot.created_at == '2019-01-01T00:00:00.000Z'
+    assert bot.parsed(False).base_order_volume == '1.1'
+    assert bot.base_order_volume == 1.1
+
+    bot.created_at = '2020-01-01T00:00:00.000Z'
+    assert bot.parsed(True).created_at == datetime.datetime(2020, 1, 1)
+
+
+def test_cache_is_not_part_of_the_dict():
+    deal = DealEntity({'bought_volume': '12.5'})
+    deal.bought_volume
+
+    assert deal == {'bought_volume': '12.5'}
+    assert list(deal.keys()) == ['bought_volume']
+
+
+def test_copy_and_pickle_after_read():
+    deal = DealEntity({'bought_volume': '12.5', 'created_at': '2019-01-01T00:00:00.000Z'})
+    deal.bought_volume
+    deal.parsed(True).created_at
+
+    for copied in (copy.copy(deal), copy.deepcopy(deal), pickle.loads(pickle.dumps(deal))):
+        assert type(copied) is DealEntity
+        assert copied == deal
+        assert not copied.__dict__
+        assert copied.bought_volume == 12.5
+
+
+def test_dunder_names_are_not_fields():
+    deal = DealEntity({'bought_volume': '12.5'})
+
+    with pytest.raises(AttributeError):
+        deal.__deepcopy__
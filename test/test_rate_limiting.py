@@ -0,0 +1,116 @@
+from src.three_commas.rate_limiting import TokenBucket, RateLimiter, EndpointClass, get_endpoint_class
+from src.three_commas import api
+from src.three_commas.api.aio import ver1 as aio_ver1
+from src.three_commas.client_pool import PooledPy3cw
+from src.three_commas.transport import Cassette, ReplayTransport, use_transport
+import asyncio
+import threading
+import pytest
+import time
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_endpoint_classes():
+    assert get_endpoint_class('accounts', 'market_pairs') == EndpointClass.PUBLIC
+    assert get_endpoint_class('marketplace', 'items') == EndpointClass.PUBLIC
+    assert get_endpoint_class('marketplace', 'signals') == EndpointClass.PUBLIC
+    assert get_endpoint_class('bots', 'show') == EndpointClass.READ
+    assert get_endpoint_class('bots', 'update') == EndpointClass.WRITE
+    assert get_endpoint_class('smart_trades_v2', 'new') == EndpointClass.WRITE
+
+
+def test_bucket_allows_burst_then_spaces_requests():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    # the waiting callers are served in order, half a second apart
+    assert bucket.reserve() == 0.5
+    assert bucket.reserve() == 1.0
+
+    clock.now = 10.0
+    assert bucket.reserve() == 0.0
+    assert bucket.metrics.acquired == 6
+    assert bucket.metrics.waited == 2
+    assert bucket.metrics.max_wait_seconds == 1.0
+
+
+def test_buckets_per_key_and_class():
+    limiter = RateLimiter(enabled=True)
+
+    read_a = limiter.get_bucket('key_a', 'bots', 'show')
+    assert limiter.get_bucket('key_a', 'deals', 'show') is read_a
+    assert limiter.get_bucket('key_b', 'bots', 'show') is not read_a
+    assert limiter.get_bucket('key_a', 'bots', 'update') is not read_a
+    assert limiter.get_bucket('key_a', 'accounts', 'market_list') is limiter.get_bucket('key_b', 'accounts', 'market_list')
+
+
+def test_configure_applies_to_existing_buckets():
+    limiter = RateLimiter(enabled=True)
+    bucket = limiter.get_bucket('key_a', 'bots', 'show')
+
+    limiter.configure(EndpointClass.READ, rate=1, burst=2)
+
+    assert (bucket.rate, bucket.burst) == (1, 2)
+    assert limiter.get_bucket('key_b', 'bots', 'show').rate == 1
+
+
+def test_blocking_acquire_from_threads():
+    limiter = RateLimiter(limits={c: (20, 1) for c in EndpointClass}, enabled=True)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=limiter.acquire, args=('key', 'bots', 'show')) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # one token right away, the other 5 at 20 per second
+    assert time.perf_counter() - start >= 0.24
+    metrics = limiter.metrics()[('key...', 'read')]
+    assert metrics.acquired == 6 and metrics.waited == 5 and metrics.queue_depth == 0
+
+
+def test_aio_acquire():
+    limiter = RateLimiter(limits={c: (50, 1) for c in EndpointClass}, enabled=True)
+
+    async def run():
+        return await asyncio.gather(*[limiter.aio_acquire('key', 'bots', 'show') for _ in range(5)])
+
+    waits = asyncio.run(run())
+
+    assert sorted(waits) == pytest.approx([0.0, 0.02, 0.04, 0.06, 0.08], abs=0.005)
+
+
+def test_api_calls_are_limited(monkeypatch):
+    limiter = RateLimiter(limits={c: (1000, 1) for c in EndpointClass}, enabled=True)
+    monkeypatch.setattr('src.three_commas.sys_utils.rate_limiter', limiter)
+    monkeypatch.setattr(PooledPy3cw, 'request', lambda self, **kwargs: ({}, []))
+
+    for _ in range(3):
+        api.ver1.bots.get(api_key='limited_key', api_secret='secret')
+    api.ver1.bots.post_disable_by_id(1, api_key='limited_key', api_secret='secret')
+
+    assert limiter.metrics()[('limit...', 'read')].acquired == 3
+    assert limiter.metrics()[('limit...', 'write')].acquired == 1
+
+
+def test_replayed_calls_are_not_limited(monkeypatch):
+    limiter = RateLimiter(limits={c: (1000, 1) for c in EndpointClass}, enabled=True)
+    monkeypatch.setattr('src.three_commas.sys_utils.rate_limiter', limiter)
+    monkeypatch.setattr('src.three_commas.aio_client.rate_limiter', limiter)
+    cassette = Cassette(interactions=[{'entity': 'bots', 'action': '', 'payload': {}, 'error': {}, 'data': []}])
+
+    with use_transport(ReplayTransport(cassette)):
+        for _ in range(3):
+            api.ver1.bots.get(api_key='limited_key', api_secret='secret')
+        asyncio.run(aio_ver1.bots.get(api_key='limited_key', api_secret='secret'))
+
+    assert limiter.metrics() == dict()
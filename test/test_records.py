@@ -0,0 +1,77 @@
+from src.three_commas.model import DealEntity, DealRecord, BotEntity, BotRecord
+import datetime
+import pickle
+
+
+def test_record_values_are_parsed(deal_dict):
+    record = DealRecord.of_dict(deal_dict)
+
+    assert record.id == deal_dict['id']
+    assert record.bought_volume == float(deal_dict['bought_volume'])
+    assert record.closed_at == datetime.datetime(2022, 1, 9, 17, 32, 13, 632000)
+    assert record.finished is True
+    assert record.take_profit_price is None
+    assert not hasattr(record, '__dict__')
+
+
+def test_entity_to_record(deal_dict):
+    assert DealEntity(deal_dict).to_record() == DealRecord.of_dict(deal_dict)
+    assert isinstance(BotEntity({'id': 1}).to_record(), BotRecord)
+
+
+def test_of_list(deal_dict):
+    records = DealRecord.of_list([deal_dict, {**deal_dict, 'id': 2}])
+
+    assert [record.id for record in records] == [deal_dict['id'], 2]
+    assert DealRecord.of_list(None) == []
+
+
+def test_round_trip(deal_dict):
+    entity = DealEntity(deal_dict)
+    recreated = DealRecord.of_dict(deal_dict).to_entity()
+
+    assert isinstance(recreated, DealEntity)
+    for name in DealRecord.__slots__:
+        assert getattr(recreated.parsed(True), name) == getattr(entity.parsed(True), name), name
+    assert recreated['closed_at'] == deal_dict['closed_at']
+    assert recreated['bought_volume'] == deal_dict['bought_volume']
+    assert DealRecord.of_dict(recreated) == DealRecord.of_dict(deal_dict)
+
+
+def test_to_dict_returns_the_declared_fields(deal_dict):
+    record = DealRecord.of_dict(deal_dict)
+    d = record.to_dict()
+
+    assert set(d) == {key for _, key, _, _ in DealRecord._fields}
+    assert 'bot_events' in deal_dict and 'bot_events' not in d
+    assert d['closed_at'] == deal_dict['closed_at']
+    assert d['bought_volume'] == deal_dict['bought_volume']
+    # only formatted differently, the sample sends 0 and '0'
+    assert d['reserved_quote_funds'] == '0.0' and d['actual_profit_percentage'] == '0.0'
+    assert DealRecord.of_dict(d) == record
+    assert record._raw_values is None
+
+
+def test_values_the_conversion_loses_are_kept_as_sent(deal_dict):
+    sent = {**deal_dict, 'bought_volume': '0.10000000000000000001', 'sold_volume': '12.34567890123456'}
+    record = DealRecord.of_dict(sent)
+
+    assert record.bought_volume == 0.1
+    assert record.to_dict()['bought_volume'] == '0.10000000000000000001'
+    assert record.to_dict()['sold_volume'] == '12.34567890123456'
+    assert record._raw_values == (('bought_volume', '0.10000000000000000001'),)
+    assert pickle.loads(pickle.dumps(record)).to_dict() == record.to_dict()
+
+
+def test_values_that_can_not_be_converted_are_kept(deal_dict):
+    record = DealRecord.of_dict({**deal_dict, 'bought_volume': 'n/a', 'sold_volume': ['0']})
+
+    assert record.bought_volume == 'n/a'
+    assert record.to_dict()['bought_volume'] == 'n/a'
+    assert record.to_dict()['sold_volume'] == ['0']
+
+
+def test_pickle(deal_dict):
+    record = DealRecord.of_dict(deal_dict)
+
+    assert pickle.loads(pickle.dumps(record)) == record
@@ -0,0 +1,129 @@
+from src.three_commas import api, retry, configuration
+from src.three_commas.retry import RetryPolicy, parse_retry_after, retry_counters, remember_retry_after, get_retry_policy
+from src.three_commas.client_pool import create_py3cw
+from src.three_commas.client_pool import PooledPy3cw
+from datetime import datetime, timezone
+import pytest
+import time
+
+
+NO_DELAY = RetryPolicy(max_attempts=4, base_delay=0.0, max_delay=0.0, budget=10.0)
+
+
+@pytest.fixture
+def failing_py3cw(monkeypatch):
+    monkeypatch.setattr(retry, 'default_retry_policy', NO_DELAY)
+    retry_counters.reset()
+    responses = list()
+    calls = list()
+
+    def request(self, entity, action='', action_id=None, action_sub_id=None, payload=None, additional_headers=None):
+        calls.append((entity, action))
+        status_code, retry_after = responses.pop(0)
+        retry.set_retry_after(retry_after)
+        if status_code == 200:
+            return {}, [{'id': 1}]
+        return {'error': True, 'msg': 'Other error occurred: server_error None None.', 'status_code': status_code}, {}
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+    return responses, calls
+
+
+def test_parse_retry_after():
+    now = datetime(2022, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    assert parse_retry_after('3') == 3.0
+    assert parse_retry_after('Sat, 01 Jan 2022 12:00:05 GMT', now=now) == 5.0
+    assert parse_retry_after('Sat, 01 Jan 2022 11:00:00 GMT', now=now) == 0.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+def test_full_jitter_delays():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    for attempt in range(6):
+        assert 0 <= policy.get_delay(attempt) <= min(5.0, 2 ** attempt)
+    assert policy.get_delay(0, retry_after=3.0) == 3.0
+    assert policy.get_delay(0, retry_after=60.0) == 5.0
+
+
+def test_only_reads_are_retried_by_default():
+    assert get_retry_policy('bots', 'show') is retry.default_retry_policy
+    assert get_retry_policy('accounts', 'currency_rates') is retry.default_retry_policy
+    assert get_retry_policy('bots', 'disable') is None
+    assert get_retry_policy('bots', 'disable', retry=True) is retry.default_retry_policy
+    assert get_retry_policy('bots', 'disable', retry=NO_DELAY) is NO_DELAY
+    assert get_retry_policy('bots', 'show', retry=False) is None
+
+
+def test_get_is_retried_until_success(failing_py3cw):
+    responses, calls = failing_py3cw
+    responses.extend([(503, None), (429, '0'), (200, None)])
+
+    error, bots = api.ver1.bots.get(api_key='retry_key', api_secret='secret')
+
+    assert not error and bots[0].id == 1
+    assert len(calls) == 3
+    assert retry_counters.get()['bots'].retries == 2
+    assert retry_counters.get()['bots'].recovered == 1
+
+
+def test_attempts_are_limited(failing_py3cw):
+    responses, calls = failing_py3cw
+    responses.extend([(500, None)] * 10)
+
+    error, _ = api.ver1.bots.get(api_key='retry_key', api_secret='secret')
+
+    assert error.get('status_code') == 500
+    assert len(calls) == NO_DELAY.max_attempts
+    assert retry_counters.get()['bots'].exhausted == 1
+
+
+def test_client_errors_are_not_retried(failing_py3cw):
+    responses, calls = failing_py3cw
+    responses.extend([(404, None), (200, None)])
+
+    error, _ = api.ver1.bots.get_show_by_id(1, api_key='retry_key', api_secret='secret')
+
+    assert error.get('status_code') == 404
+    assert len(calls) == 1
+
+
+def test_writes_opt_in(failing_py3cw):
+    responses, calls = failing_py3cw
+    responses.extend([(503, None), (503, None), (200, None)])
+
+    error, _ = api.ver1.bots.post_disable_by_id(1, api_key='retry_key', api_secret='secret')
+    assert error.get('status_code') == 503 and len(calls) == 1
+
+    error, _ = api.ver1.bots.post_disable_by_id(1, api_key='retry_key', api_secret='secret', retry=True)
+    assert not error and len(calls) == 3
+
+
+def test_retry_after_outside_of_the_budget_is_not_awaited(failing_py3cw):
+    responses, calls = failing_py3cw
+    responses.extend([(429, '30'), (200, None)])
+
+    start = time.monotonic()
+    error, _ = api.ver1.bots.get(api_key='retry_key', api_secret='secret',
+                                 retry=RetryPolicy(max_delay=60.0, budget=1.0))
+
+    assert error.get('status_code') == 429
+    assert time.monotonic() - start < 1.0
+
+
+def test_response_hook_keeps_retry_after():
+    class Response:
+        headers = {'Retry-After': '7'}
+
+    remember_retry_after(Response())
+
+    assert parse_retry_after(retry._retry_after.get()) == 7.0
+
+
+def test_adapter_leaves_the_status_retries_to_the_policy(monkeypatch):
+    monkeypatch.setattr(configuration, 'THREE_COMMAS_RETRY', True)
+
+    adapter_retries = create_py3cw('key', 'secret').session.get_adapter('https://api.3commas.io').max_retries
+    assert not adapter_retries.status_forcelist
+
+    py3cw = create_py3cw('key', 'secret', request_options={'nr_of_retries': 2})
+    assert py3cw.session.get_adapter('https://api.3commas.io').max_retries.status_forcelist
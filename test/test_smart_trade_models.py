@@ -0,0 +1,142 @@
+from src.three_commas.model import SmartTradeV2Entity, SmartTradeV2Position, SmartTradeV2PositionPrice, \
+    TakeProfitStep, SmartTradeV2Data
+from src.three_commas.model.models import LazyModelList
+from src.three_commas import codec
+import datetime
+import copy
+import pytest
+
+
+SMART_TRADE = {
+    'id': 9999999,
+    'version': 2,
+    'account': {'id': 31337, 'type': 'binance', 'name': 'Binance', 'market': 'Binance Spot', 'link': '/accounts/31337'},
+    'pair': 'USDT_BTC',
+    'instant': False,
+    'status': {'type': 'waiting_targets', 'title': 'Waiting Targets'},
+    'leverage': {'enabled': False},
+    'position': {
+        'type': 'buy',
+        'editable': False,
+        'units': {'value': '0.001', 'editable': False},
+        'price': {'value': '42000.5', 'value_without_commission': '41958.5', 'editable': False},
+        'total': {'value': '42.0005'},
+        'order_type': 'limit',
+        'status': {'type': 'finished', 'title': 'Finished'},
+    },
+    'take_profit': {
+        'enabled': True,
+        'steps': [
+            {'id': 1, 'version': 2, 'position': 1, 'order_type': 'limit', 'editable': True,
+             'units': {'value': '0.0005'}, 'price': {'type': 'bid', 'value': '44000.0', 'percent': None},
+             'volume': '50.0', 'total': '22.0', 'trailing': {'enabled': False, 'percent': None},
+             'status': {'type': 'to_process', 'title': 'Pending'},
+             'data': {'cancelable': True, 'panic_sell_available': True}},
+            {'id': 2, 'version': 2, 'position': 2, 'order_type': 'limit', 'editable': True,
+             'units': {'value': '0.0005'}, 'price': {'type': 'bid', 'value': '46000.0', 'percent': None},
+             'volume': '50.0', 'total': '23.0', 'trailing': {'enabled': False, 'percent': None},
+             'status': {'type': 'to_process', 'title': 'Pending'},
+             'data': {'cancelable': True, 'panic_sell_available': True}},
+        ],
+    },
+    'stop_loss': {'enabled': False},
+    'note': '',
+    'skip_enter_step': False,
+    'data': {
+        'editable': True,
+        'current_price': {'quote_volume': '1234567.8', 'last': '42500.1'},
+        'average_enter_price': '42000.5',
+        'created_at': '2022-01-09T17:32:13.632Z',
+        'type': 'smart_trade',
+    },
+    'profit': {'volume': '0.5', 'usd': '0.5', 'percent': '1.19', 'roe': None},
+    'margin': {'amount': None, 'total': None},
+    'is_position_not_filled': False,
+}
+
+
+@pytest.fixture
+def smart_trade():
+    return SmartTradeV2Entity(copy.deepcopy(SMART_TRADE))
+
+
+def test_nested_fields_are_models(smart_trade):
+    assert isinstance(smart_trade.position, SmartTradeV2Position)
+    assert isinstance(smart_trade.position.price, SmartTradeV2PositionPrice)
+    assert smart_trade.position.price.value == 42000.5
+    assert smart_trade.position.units.value == 0.001
+    assert smart_trade.data.current_price.last == 42500.1
+    assert smart_trade.data.average_enter_price == 42000.5
+    assert smart_trade.data.parsed(True).created_at == datetime.datetime(2022, 1, 9, 17, 32, 13, 632000)
+    assert smart_trade.profit.percent == 1.19
+    assert smart_trade.profit.roe is None
+    assert smart_trade.status.type == 'waiting_targets'
+
+
+def test_take_profit_steps(smart_trade):
+    steps = smart_trade.take_profit.steps
+
+    assert isinstance(steps, LazyModelList)
+    assert all(isinstance(step, TakeProfitStep) for step in steps)
+    assert [step.price.value for step in steps] == [44000.0, 46000.0]
+    assert steps[0].volume == 50.0
+    assert steps[0].price.percent is None
+    assert steps[1].status.title == 'Pending'
+
+
+def test_submodels_are_created_once_and_replace_the_dicts(smart_trade):
+    position = smart_trade.position
+
+    assert smart_trade.position is position
+    assert smart_trade['position'] is position
+    assert smart_trade.parsed(False).position == SMART_TRADE['position']
+    assert smart_trade == SMART_TRADE
+    assert codec.loads(codec.dumps(smart_trade)) == SMART_TRADE
+
+    position['order_type'] = 'market'
+    assert smart_trade['position']['order_type'] == 'market'
+
+
+def test_setting_a_nested_dict_drops_the_submodel(smart_trade):
+    data = smart_trade.data
+    smart_trade.data = {'average_enter_price': '1.5'}
+
+    assert isinstance(smart_trade.data, SmartTradeV2Data)
+    assert smart_trade.data is not data
+    assert smart_trade.data.average_enter_price == 1.5
+
+
+def test_views_do_not_change_the_wrapped_dict():
+    raw = copy.deepcopy(SMART_TRADE)
+    view = SmartTradeV2Entity.view(raw)
+
+    assert view.position.price.value == 42000.5
+    assert view.position is view.position
+    assert type(raw['position']) is dict
+    assert raw == SMART_TRADE
+
+
+def test_changes_of_submodels_are_seen_through_views():
+    raw = copy.deepcopy(SMART_TRADE)
+    view = SmartTradeV2Entity.view(raw)
+    view.position['type'] = 'sell'
+    view.take_profit.steps[0]['volume'] = '100.0'
+
+    assert view.position.type == 'sell'
+    assert view['position']['type'] == 'sell'
+    assert view.take_profit.steps[0].volume == 100.0
+    assert view.to_entity().position.type == 'sell'
+    assert raw == SMART_TRADE
+
+
+def test_parsed_false_returns_the_unparsed_value(smart_trade):
+    smart_trade.position.price.value
+    smart_trade.take_profit.steps[0].price.value
+    position = smart_trade.parsed(False).position
+    take_profit = smart_trade.parsed(False).take_profit
+
+    assert type(position) is dict and type(position['price']) is dict
+    assert position == SMART_TRADE['position']
+    assert type(take_profit['steps']) is list and type(take_profit['steps'][0]) is dict
+    assert take_profit == SMART_TRADE['take_profit']
+    assert SmartTradeV2Entity.view(copy.deepcopy(SMART_TRADE)).parsed(False).position == SMART_TRADE['position']
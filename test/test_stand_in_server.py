@@ -0,0 +1,123 @@
+from src.three_commas import api, codec, configuration, retry
+from src.three_commas.client_pool import client_pool, ApiUrlSession
+from src.three_commas.retry import RetryPolicy
+from src.three_commas.model import BotEntity, DealEntity
+from src.three_commas.stand_in_server import StandInServer, StandInConfig, BASE_ORDER_TOO_SMALL, SERVER_ERRORS
+from py3cw.request import Py3CW
+import json
+import pytest
+
+
+KEY = 'stand_in_key'
+SECRET = 'stand_in_secret'
+
+
+@pytest.fixture
+def start_stand_in(monkeypatch):
+    servers = list()
+
+    def start(config: StandInConfig) -> StandInServer:
+        server = StandInServer(config).start()
+        servers.append(server)
+        monkeypatch.setattr(configuration, 'THREE_COMMAS_API_URL', server.url)
+        client_pool.clear()
+        return server
+    yield start
+    client_pool.clear()
+    for server in servers:
+        server.stop()
+
+
+def test_lists_and_shows_synthetic_records(start_stand_in):
+    start_stand_in(StandInConfig(bots=5, deals=30, accounts=2, secrets={KEY: SECRET}))
+
+    error, deals = api.ver1.deals.get(limit=20, offset=20, api_key=KEY, api_secret=SECRET)
+    assert not error
+    assert len(deals) == 10 and isinstance(deals[0], DealEntity)
+
+    error, bot = api.ver1.bots.get_show_by_id(deals[0].bot_id, api_key=KEY, api_secret=SECRET)
+    assert not error and isinstance(bot, BotEntity)
+    assert bot.id == deals[0].bot_id
+
+    error, accounts = api.ver1.accounts.get(api_key=KEY, api_secret=SECRET)
+    assert not error and len(accounts) == 2
+
+
+def test_wrong_signature_is_rejected(start_stand_in):
+    start_stand_in(StandInConfig(secrets={KEY: SECRET}))
+
+    error, _ = api.ver1.bots.get_show_by_id(7_000_000, api_key=KEY, api_secret='wrong_secret')
+
+    assert error.get('status_code') == 401
+    assert 'signature_invalid' in error.get_msg()
+
+
+def test_unknown_id_is_not_found(start_stand_in):
+    start_stand_in(StandInConfig())
+
+    error, _ = api.ver1.deals.get_show_by_id(1, api_key=KEY, api_secret=SECRET)
+
+    assert error.is_not_found_error()
+
+
+def test_injected_errors_are_parsed(start_stand_in):
+    start_stand_in(StandInConfig(error_rate=1.0, injected_errors=(BASE_ORDER_TOO_SMALL,)))
+
+    error, _ = api.ver1.bots.post_enable_by_id(7_000_000, api_key=KEY, api_secret=SECRET)
+
+    assert error.is_base_order_to_small_error()
+    assert error.get_base_order_to_small_error()[0].amount == 10.0
+
+
+def test_injected_server_errors_are_retried(start_stand_in, monkeypatch):
+    monkeypatch.setattr(retry, 'default_retry_policy', RetryPolicy(max_attempts=20, base_delay=0.0, max_delay=0.0))
+    server = start_stand_in(StandInConfig(error_rate=0.5, injected_errors=SERVER_ERRORS))
+
+    for i in range(10):
+        error, bot = api.ver1.bots.get_show_by_id(7_000_000 + i, api_key=KEY, api_secret=SECRET)
+        assert not error and bot.id == 7_000_000 + i
+
+    assert server.stats().injected_errors > 0
+
+
+def test_rate_limit_headers(start_stand_in, monkeypatch):
+    monkeypatch.setattr(retry, 'default_retry_policy', RetryPolicy(max_attempts=1))
+    server = start_stand_in(StandInConfig(rate_limit=0.001, rate_limit_burst=2))
+
+    errors = [api.ver1.bots.get_show_by_id(7_000_000, api_key=KEY, api_secret=SECRET)[0] for _ in range(3)]
+
+    assert not errors[0] and not errors[1]
+    assert errors[2].get('status_code') == 429
+    assert server.stats().rate_limited == 1
+
+
+def test_signed_body_with_non_ascii_characters(start_stand_in, monkeypatch):
+    start_stand_in(StandInConfig(deals=5, secrets={KEY: SECRET}))
+    error, deals = api.ver1.deals.get(api_key=KEY, api_secret=SECRET)
+
+    decoded = list()
+    monkeypatch.setattr(codec, 'loads', lambda data: decoded.append(data) or json.loads(data))
+    error, deal = api.ver1.deals.patch_update_deal_by_id(deals[0].id, entity={'note': 'take profit 🚀 über'},
+                                                         api_key=KEY, api_secret=SECRET)
+
+    assert not error
+    assert deal['id'] == deals[0].id
+    assert decoded, 'the sync responses are decoded with the codec'
+
+
+def test_pooled_client_answers_like_py3cw(start_stand_in):
+    server = start_stand_in(StandInConfig(deals=5, secrets={KEY: SECRET}))
+    pooled = client_pool.get(api_key=KEY, api_secret=SECRET)
+    py3cw = Py3CW(key=KEY, secret=SECRET)
+    py3cw.session = ApiUrlSession(api_url=server.url)
+
+    requests = [dict(entity='deals', action='', payload={'limit': 2}),
+                dict(entity='deals', action='show', action_id='1'),
+                # py3cw signs the json.dumps of the payload, which turns the int key into a str
+                dict(entity='deals', action='update_deal', action_id='1200000000', payload={1: 'one', 'note': 'über'})]
+    for request in requests:
+        assert pooled.request(**request) == py3cw.request(**request)
+    assert pooled.request(**requests[1])[0].get('status_code') == 404
+
+    with pytest.raises(ValueError):
+        pooled.request(entity='deals', action='show')
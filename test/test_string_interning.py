@@ -0,0 +1,55 @@
+from src.three_commas.model import DealEntity, BotEntity, DealRecord
+from src.three_commas import configuration
+import pytest
+
+
+def distinct(value: str) -> str:
+    # an equal str that is not the same object, as json decoding returns them
+    return ''.join(list(value))
+
+
+@pytest.fixture
+def completed_deals(deal_dicts):
+    return [{**deal, 'pair': distinct('USDT_BTC'), 'status': distinct('completed')} for deal in deal_dicts(3)]
+
+
+@pytest.mark.parametrize('lazy', [True, False])
+@pytest.mark.parametrize('view', [True, False])
+def test_of_list_interns_the_fields(completed_deals, lazy, view):
+    deals = DealEntity.of_list(completed_deals, lazy=lazy, view=view, intern=True)
+
+    assert deals == completed_deals
+    assert all(deal.pair is deals[0].pair for deal in deals)
+    assert all(deal.status is deals[0].status for deal in deals)
+    assert deals[0].pair == 'USDT_BTC'
+
+
+def test_of_list_follows_the_configuration(completed_deals, monkeypatch):
+    deals = DealEntity.of_list(completed_deals, lazy=False)
+    assert deals[0].pair is not deals[1].pair
+
+    monkeypatch.setattr(configuration, 'THREE_COMMAS_INTERN_STRINGS', True)
+    deals = DealEntity.of_list(completed_deals, lazy=False)
+    assert deals[0].pair is deals[1].pair
+
+
+def test_only_str_values_are_interned():
+    deals = DealEntity.intern_fields([{'pair': None, 'status': 1, 'bot_name': distinct('my bot')},
+                                      {'bot_name': distinct('my bot')}])
+
+    assert deals[0]['pair'] is None
+    assert deals[0]['status'] == 1
+    assert deals[0]['bot_name'] is deals[1]['bot_name']
+    assert DealEntity.intern_fields([]) == []
+
+
+def test_records_intern_the_fields(completed_deals):
+    records = DealRecord.of_list(completed_deals, intern=True)
+
+    assert records[0].pair is records[2].pair
+
+
+def test_interned_fields_are_declared():
+    for model_type in (DealEntity, BotEntity):
+        assert model_type._interned_fields
+        assert set(model_type._interned_fields) <= set(model_type.__annotations__)
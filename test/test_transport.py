@@ -0,0 +1,113 @@
+from src.three_commas import api, transport
+from src.three_commas.api.aio import ver1 as aio_ver1
+from src.three_commas.model import DealEntity
+from src.three_commas.error import ThreeCommasException
+from src.three_commas.transport import Cassette, ReplayTransport, use_transport
+from src.three_commas.client_pool import PooledPy3cw
+import asyncio
+import time
+import json
+import pytest
+
+
+@pytest.fixture
+def deals_data(deal_dicts):
+    return deal_dicts(10)
+
+
+@pytest.fixture
+def recorded_deals(monkeypatch, tmp_path, deals_data):
+    def request(self, entity, action='', action_id=None, action_sub_id=None, payload=None, additional_headers=None):
+        return {}, deals_data
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+
+    path = str(tmp_path / 'deals.jsonl.gz')
+    with transport.record(path):
+        api.ver1.deals.get(limit=10, api_key='transport_key_1234567890', api_secret='transport_secret')
+    monkeypatch.undo()
+    return path
+
+
+def test_recorded_api_key_is_blurred(recorded_deals):
+    cassette = Cassette.load(recorded_deals)
+
+    assert len(cassette) == 1
+    interaction = cassette.interactions[0]
+    assert interaction['entity'] == 'deals'
+    assert interaction['payload'] == {'limit': 10}
+    assert interaction['api_key'] != 'transport_key_1234567890'
+    assert 'transport_secret' not in json.dumps(interaction)
+
+
+def test_recorded_payload_credentials_are_redacted(monkeypatch, tmp_path):
+    def request(self, entity, action='', action_id=None, action_sub_id=None, payload=None, additional_headers=None):
+        return {}, {'id': 1}
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+    new_account = dict(entity={'api_key': 'exchange_key_1234567890'}, type='binance', name='Binance',
+                       secret='exchange_secret_value', passphrase='exchange_passphrase')
+
+    path = str(tmp_path / 'accounts.jsonl')
+    with transport.record(path):
+        api.ver1.accounts.post_new(**new_account, api_key='transport_key_1234567890', api_secret='transport_secret')
+    monkeypatch.undo()
+
+    with open(path, 'r') as f:
+        recorded = f.read()
+    assert 'exchange_key_1234567890' not in recorded
+    assert 'exchange_secret_value' not in recorded
+    assert 'exchange_passphrase' not in recorded
+    assert 'transport_secret' not in recorded
+    assert Cassette.load(path).interactions[0]['payload']['name'] == 'Binance'
+
+    with transport.replay(path):
+        error, account = api.ver1.accounts.post_new(**new_account, api_key='transport_key_1234567890',
+                                                    api_secret='transport_secret')
+    assert account == {'id': 1}
+
+
+def test_replay_parses_recorded_responses(recorded_deals, monkeypatch, deals_data):
+    def request(*args, **kwargs):
+        raise AssertionError('replay must not reach py3cw')
+    monkeypatch.setattr(PooledPy3cw, 'request', request)
+
+    with transport.replay(recorded_deals):
+        error, deals = api.ver1.deals.get(limit=10, api_key='transport_key_1234567890', api_secret='transport_secret')
+
+    assert not error
+    assert len(deals) == len(deals_data)
+    assert isinstance(deals[0], DealEntity)
+    assert deals[0].id == deals_data[0]['id']
+
+
+def test_replay_of_unknown_request_raises(recorded_deals):
+    with transport.replay(recorded_deals):
+        with pytest.raises(ThreeCommasException):
+            api.ver1.deals.get(limit=20, api_key='transport_key_1234567890', api_secret='transport_secret')
+
+
+def test_replay_without_repeat_runs_out():
+    cassette = Cassette(interactions=[{'entity': 'bots', 'action': 'show', 'action_id': '1', 'error': {}, 'data': {'id': 1}}])
+    replay_transport = ReplayTransport(cassette, repeat=False)
+
+    assert replay_transport.request(None, entity='bots', action='show', action_id='1') == ({}, {'id': 1})
+    with pytest.raises(ThreeCommasException):
+        replay_transport.request(None, entity='bots', action='show', action_id='1')
+
+
+def test_replay_latency_factor():
+    cassette = Cassette(interactions=[{'entity': 'bots', 'action': 'show', 'action_id': '1', 'seconds': 0.2,
+                                       'error': {}, 'data': {'id': 1}}])
+
+    start = time.perf_counter()
+    ReplayTransport(cassette, latency_factor=0.25).request(None, entity='bots', action='show', action_id='1')
+    assert time.perf_counter() - start >= 0.05
+
+
+def test_replay_through_the_asyncio_api(recorded_deals):
+    with use_transport(ReplayTransport(Cassette.load(recorded_deals))):
+        error, deals = asyncio.run(aio_ver1.deals.get(limit=10,
+                                                      api_key='transport_key_1234567890',
+                                                      api_secret='transport_secret'))
+
+    assert not error
+    assert isinstance(deals[0], DealEntity)
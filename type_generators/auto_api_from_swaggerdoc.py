@@ -6,12 +6,27 @@ import os
 from py3cw.config import API_METHODS as PY3CW_API_METHODS
 import datetime
 import re
-from parsing_and_return_mapping import PARSING_MAPPING, endpoint_returns, endpoint_consumes
+import keyword
+from parsing_and_return_mapping import PARSING_MAPPING, RECORD_MODELS, DEFINITION_OVERRIDES, INTERNED_FIELDS, \
+    endpoint_returns, endpoint_consumes, endpoint_paginates
 
 
 INDENT = ' ' * 4
 PARENT_FOLDER_NAME = '../src/three_commas/api'
+AIO_FOLDER_NAME = 'aio'
 MODEL_FILE_NAME = '../src/three_commas/model/generated_models.py'
+ENDPOINTS_FILE_NAME = '../src/three_commas/generated_endpoints.py'
+# keyword arguments of the api wrappers, parameters with these names are only passed in the entity dict
+RESERVED_PARAMETER_NAMES = {'id', 'sub_id', 'entity', 'forced_mode', 'additional_headers', 'api_key', 'api_secret',
+                            'request_options', 'retry'}
+SWAGGER_TYPE_2_PY_TYPE = {
+    'number': 'float',
+    'string': 'str',
+    'integer': 'int',
+    'object': 'dict',
+    'array': 'list',
+    'boolean': 'bool',
+}
 
 
 def get_path_variables(path: str):
@@ -21,7 +36,8 @@ def get_path_variables(path: str):
     return path_variable_1, path_variable_2
 
 
-def create_docstring(verb: str, path: str, parameters: list, description, return_type=None):
+def create_docstring(verb: str, path: str, parameters: list, description, return_type=None, keyword_parameters: List[tuple] = None):
+    parameters = [p for p in parameters or list() if p.get('in') != 'path']
     if not parameters and not description:
         return None
 
@@ -32,27 +48,29 @@ def create_docstring(verb: str, path: str, parameters: list, description, return
         code.append(f'{INDENT}{description}')
         code.append(f'')
 
-    # if parameters:
-    #     parameters.sort(key=lambda p: p.get('required'), reverse=True)
-    #     for p in parameters:
-    #         _in = p.get('in')
-    #         param_name = p.get('name')
-    #         param_type = p.get('type')
-    #         required = p.get('required')
-    #         param_description = p.get('description')
-    #         enum = p.get('enum')
-    #
-    #         param_docstring = list()
-    #         if required:
-    #             param_docstring.append('REQUIRED')
-    #         if param_type:
-    #             param_docstring.append(param_type)
-    #         if enum:
-    #             param_docstring.append("values: " + str(enum))
-    #         if param_description:
-    #             param_docstring.append(param_description)
-    #
-    #         code.append(f'{INDENT}:param {param_name}: ' + ', '.join(param_docstring))
+    if parameters:
+        python_names = {name: python_name for python_name, name, _ in keyword_parameters or list()}
+        if any(p.get('in') == 'formData' for p in parameters):
+            code.append(f'{INDENT}:param entity: the body. Pass the parameters below without a keyword argument in it')
+        parameters = sorted(parameters, key=lambda p: bool(p.get('required')), reverse=True)
+        for p in parameters:
+            param_name = python_names.get(p.get('name'), p.get('name'))
+            param_type = p.get('type')
+            required = p.get('required')
+            param_description = ' '.join(p.get('description', '').split())
+            enum = p.get('enum')
+
+            param_docstring = list()
+            if required:
+                param_docstring.append('REQUIRED')
+            if param_type:
+                param_docstring.append(param_type)
+            if enum:
+                param_docstring.append("values: " + str(enum))
+            if param_description:
+                param_docstring.append(param_description)
+
+            code.append(f'{INDENT}:param {param_name}: ' + ', '.join(param_docstring))
 
     if return_type:
         code.append(f'{INDENT}:return:{str(return_type)}')
@@ -61,6 +79,37 @@ def create_docstring(verb: str, path: str, parameters: list, description, return
     return '\n'.join(code)
 
 
+def to_python_name(param_name: str) -> str:
+    return f'{param_name}_' if keyword.iskeyword(param_name) else param_name
+
+
+def get_keyword_parameters(parameters: List[dict]) -> List[tuple]:
+    """
+    The query and body parameters that are passed as keyword arguments.
+    Nested body parameters like 'leverage[enabled]' and names used by the api wrappers are only passed in the entity dict
+    :return: (python name, parameter name, python type) of every parameter
+    """
+    return [(to_python_name(p.get('name')), p.get('name'), SWAGGER_TYPE_2_PY_TYPE.get(p.get('type'), 'str'))
+            for p in parameters or list()
+            if p.get('in') in {'query', 'formData'}
+            and p.get('name').isidentifier()
+            and p.get('name') not in RESERVED_PARAMETER_NAMES]
+
+
+def has_body_parameters(parameters: List[dict]) -> bool:
+    return any(p.get('in') == 'formData' for p in parameters or list())
+
+
+def create_function_signature(function_name: str, function_parameters: str, keyword_parameters: List[tuple],
+                              return_type_statement: str, asynchronous: bool = False) -> str:
+    prefix = f'{"async " if asynchronous else ""}def {function_name}('
+    if not keyword_parameters:
+        return f'{prefix}{function_parameters}){return_type_statement}:'
+    arguments = [a for a in function_parameters.split(', ') if a]
+    arguments.extend(f'{python_name}: {py_type} = None' for python_name, _, py_type in keyword_parameters)
+    return f'{prefix}' + f',\n{" " * len(prefix)}'.join(arguments) + f'){return_type_statement}:'
+
+
 def get_api_version_from_path(path: str):
     return path.split('/')[1]
 
@@ -78,9 +127,7 @@ def make_ids_uniform_for_path(sub_path):
     return re.sub(r'\{[^}]*\}', '{id}', second_replaced, 1)
 
 
-def create_function_logic(verb: str, path: str, parameters: List[dict], return_type: str = None, function_has_payload: bool = None) -> str:
-    path_variable_1, path_variable_2 = get_path_variables(path)
-
+def get_py3cw_entity_and_action(verb: str, path: str) -> tuple:
     version = get_api_version_from_path(path)
     endpoint = get_major_endpoint_from_path(path)
     sub_path = get_sub_path(path)
@@ -101,10 +148,23 @@ def create_function_logic(verb: str, path: str, parameters: List[dict], return_t
         for k, v in py3cw_endpoint.items():
             if verb.upper() == v[0] and py3cw_parsed_sub_path == v[1]:
                 py3cw_action = k
+    return py3cw_entity, py3cw_action
+
+
+def is_public_endpoint(endpoint_definition: dict) -> bool:
+    # the swagger doc states the security in the description, e.g. (Permission: NONE, Security: NONE)
+    if endpoint_definition.get('security') == []:
+        return True
+    return 'Security: NONE' in (endpoint_definition.get('description') or '')
+
+
+def create_function_logic(verb: str, path: str, parameters: List[dict], return_type: str = None, function_has_payload: bool = None, asynchronous: bool = False, keyword_parameters: List[tuple] = None) -> str:
+    path_variable_1, path_variable_2 = get_path_variables(path)
+    py3cw_entity, py3cw_action = get_py3cw_entity_and_action(verb, path)
 
     code = list()
 
-    code.append(f'{INDENT}error, data = wrapper.request(')
+    code.append(f'{INDENT}error, data = {"await " if asynchronous else ""}wrapper.request(')
     code.append(f"{INDENT*2}entity='{py3cw_entity}',")
     code.append(f"{INDENT*2}action='{py3cw_action}',")
     if path_variable_1:
@@ -113,7 +173,15 @@ def create_function_logic(verb: str, path: str, parameters: List[dict], return_t
     if path_variable_2:
         # code.append(f"{INDENT*2}action_sub_id=str({path_variable_2}),")
         code.append(f"{INDENT*2}action_sub_id=str(sub_id),")
-    if function_has_payload:
+    if keyword_parameters:
+        if function_has_payload:
+            code.append(f"{INDENT*2}payload={{**(entity or dict()), **without_none_values({{")
+        else:
+            code.append(f"{INDENT*2}payload=without_none_values({{")
+        for python_name, parameter_name, _ in keyword_parameters:
+            code.append(f"{INDENT*3}'{parameter_name}': {python_name},")
+        code.append(f"{INDENT*2}}})}}," if function_has_payload else f"{INDENT*2}}}),")
+    elif function_has_payload:
         code.append(f"{INDENT*2}payload=entity,")
     code.append(f"{INDENT})")
     if return_type:
@@ -128,6 +196,44 @@ def create_function_logic(verb: str, path: str, parameters: List[dict], return_t
     return '\n'.join(code)
 
 
+def create_bulk_function(verb: str, path: str, function_name: str, asynchronous: bool = False) -> str:
+    bulk_function_name = 'bulk_' + function_name[:-len('_by_id')]
+    code = list()
+    code.append(f'@logged')
+    if asynchronous:
+        code.append(f'async def {bulk_function_name}(ids: Iterable, max_concurrency: int = None, **kwargs) -> BulkResult:')
+    else:
+        code.append(f'def {bulk_function_name}(ids: Iterable, max_workers: int = None, **kwargs) -> BulkResult:')
+    code.append(f'{INDENT}"""')
+    code.append(f'{INDENT}{verb.upper()} {path} for every id in parallel')
+    code.append(f'{INDENT}:return: the result or the ThreeCommasApiError for every id, in the order of the ids')
+    code.append(f'{INDENT}"""')
+    if asynchronous:
+        code.append(f'{INDENT}return await aio_bulk_by_id({function_name}, ids, max_concurrency=max_concurrency, **kwargs)')
+    else:
+        code.append(f'{INDENT}return bulk_by_id({function_name}, ids, max_workers=max_workers, **kwargs)')
+    return '\n'.join(code)
+
+
+def create_iter_all_function(verb: str, path: str, function_name: str, return_type: str, asynchronous: bool = False) -> str:
+    page_params_function, max_page_size = endpoint_paginates(verb, path)
+    iter_function_name = 'iter_all' + function_name[len(verb):]
+    element_type = return_type.split('[')[1].split(']')[0]
+    code = list()
+    code.append(f'@logged')
+    if asynchronous:
+        code.append(f'def {iter_function_name}(page_size: int = {max_page_size}, prefetch: bool = True, **kwargs) -> AsyncIterator[{element_type}]:')
+    else:
+        code.append(f'def {iter_function_name}(page_size: int = {max_page_size}, prefetch: bool = True, **kwargs) -> Iterator[{element_type}]:')
+    code.append(f'{INDENT}"""')
+    code.append(f'{INDENT}{verb.upper()} {path} page by page. The next page is fetched while the current one is consumed')
+    code.append(f'{INDENT}:param kwargs: the arguments of {function_name}')
+    code.append(f'{INDENT}"""')
+    iter_pages_function = 'aio_iter_pages' if asynchronous else 'iter_pages'
+    code.append(f'{INDENT}return {iter_pages_function}({function_name}, page_params={page_params_function}, page_size=page_size, prefetch=prefetch, max_page_size={max_page_size}, **kwargs)')
+    return '\n'.join(code)
+
+
 def get_str_repr_for_type(parsed_type: type):
     if parsed_type in {str, float, int, bool}:
         return parsed_type.__name__
@@ -139,95 +245,203 @@ def get_str_repr_for_type(parsed_type: type):
     return parsed_type.__name__
 
 
+def create_record(model_name: str, record_name: str, fields: List[tuple]) -> List[str]:
+    code = list()
+    code.append(f'class {record_name}(ThreeCommasRecord):')
+    code.append(f'{INDENT}_entity_type = {model_name}')
+    code.append(f'{INDENT}__slots__ = (')
+    for attribute_name, _ in fields:
+        code.append(f"{INDENT*2}'{attribute_name}',")
+    code.append(f'{INDENT})')
+    code.append(f'')
+    for attribute_name, attribute_type in fields:
+        code.append(f'{INDENT}{attribute_name}: Optional[{attribute_type}]')
+    code.append(f'')
+    code.append(f'')
+    return code
+
+
+PROXY_PARSE_TYPE_MAPPING = {
+    float: 'FloatParser',
+    int: 'IntParser',
+    datetime.datetime: 'DatetimeParser',
+}
+DATETIME_EXAMPLE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.\d{3}Z')
+# the examples of the nested objects also have datetimes without T and milliseconds
+NESTED_DATETIME_EXAMPLE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}')
+
+
+def to_class_name(attribute_name: str) -> str:
+    return ''.join(part.capitalize() for part in attribute_name.replace('?', '').split('_'))
+
+
+def get_ref_model_name(attribute_definition: dict, nested: bool) -> str:
+    """
+    The model an attribute refers to. Only the references of the nested objects are parsed into their model
+    """
+    ref = attribute_definition.get('$ref') or attribute_definition.get('items', dict()).get('$ref')
+    return ref.split('/')[-1] if ref and nested else None
+
+
+def is_nested_object(attribute_definition: dict) -> bool:
+    return attribute_definition.get('type') == 'object' and bool(attribute_definition.get('properties'))
+
+
+def get_parsed_type(model_name: str, json_attribute_name: str, attribute_definition: dict, nested: bool):
+    example = attribute_definition.get('example')
+    datetime_pattern = NESTED_DATETIME_EXAMPLE_PATTERN if nested else DATETIME_EXAMPLE_PATTERN
+    if example and isinstance(example, str) and datetime_pattern.match(example) is not None:
+        # '2019-01-01T00:00:00.000Z'
+        # TODO the formats are messed up, the top level ones are only annotated
+        return datetime.datetime if nested else 'datetime.datetime'
+
+    model_parsings = PARSING_MAPPING.get(model_name)
+    if model_parsings and json_attribute_name in model_parsings:
+        return model_parsings.get(json_attribute_name)
+
+    # the numbers of the nested objects are sent as strings too
+    swagger_type = attribute_definition.get('type')
+    if nested and (swagger_type == 'number'
+                   or swagger_type == 'string' and isinstance(example, (int, float)) and not isinstance(example, bool)):
+        return float
+    return None
+
+
+def create_model(model_name: str,
+                 properties: Dict[str, dict],
+                 definitions: Dict[str, dict],
+                 emitted: set,
+                 code: list,
+                 record_fields: dict,
+                 nested: bool = False):
+    """
+    Appends the model class, after the classes of its nested objects and of the models it refers to
+    """
+    emitted.add(model_name)
+    class_name_prefix = model_name[:-len('Entity')] if model_name.endswith('Entity') else model_name
+    for json_attribute_name, attribute_definition in properties.items():
+        ref_model_name = get_ref_model_name(attribute_definition, nested)
+        if ref_model_name and ref_model_name not in emitted and ref_model_name in definitions:
+            create_model(ref_model_name, definitions[ref_model_name].get('properties'), definitions, emitted, code,
+                         record_fields)
+        if is_nested_object(attribute_definition):
+            create_model(f'{class_name_prefix}{to_class_name(json_attribute_name)}',
+                         attribute_definition.get('properties'), definitions, emitted, code, record_fields,
+                         nested=True)
+
+    _parse_map = dict()
+    _name_proxy = dict()
+    code.append(f'class {model_name}(ThreeCommasModel):')
+    for json_attribute_name, attribute_definition in properties.items():
+        swagger_type = attribute_definition.get('type')
+        py_type = SWAGGER_TYPE_2_PY_TYPE.get(swagger_type)
+        model_attribute_name = json_attribute_name.replace('?', '')
+        ref_model_name = get_ref_model_name(attribute_definition, nested)
+
+        if is_nested_object(attribute_definition):
+            nested_model_name = f'{class_name_prefix}{to_class_name(json_attribute_name)}'
+            parse_type = f'ModelParser.of({nested_model_name})'
+            parsed_type = nested_model_name
+        elif ref_model_name and swagger_type == 'array':
+            parse_type = f'ModelListParser.of({ref_model_name})'
+            parsed_type = f'List[{ref_model_name}]'
+        elif ref_model_name:
+            parse_type = f'ModelParser.of({ref_model_name})'
+            parsed_type = ref_model_name
+        else:
+            parsed_type = get_parsed_type(model_name, json_attribute_name, attribute_definition, nested)
+            parse_type = PROXY_PARSE_TYPE_MAPPING.get(parsed_type)
+
+        if parse_type:
+            _parse_map[model_attribute_name] = parse_type
+        if json_attribute_name.endswith('?'):
+            _name_proxy[model_attribute_name] = json_attribute_name
+
+        record_type = get_str_repr_for_type(parsed_type) if parse_type else f'{py_type}'
+        attribute_type = f'Union[{py_type}, {record_type}]' if parse_type and record_type != py_type else f'{py_type}'
+        record_fields.setdefault(model_name, list()).append((model_attribute_name, record_type))
+        code.append(f'{INDENT}{model_attribute_name}: {attribute_type}')
+
+    code.append(f'')
+    code.append(f'{INDENT}_parse_map = {"{"}')
+    for model_attribute_name, parse_type in _parse_map.items():
+        code.append(f"{INDENT*2}'{model_attribute_name}': {parse_type},")
+    code.append(f'{INDENT}{"}"}')
+
+    code.append(f'{INDENT}_name_proxy = {"{"}')
+    for model_attribute_name, json_name in _name_proxy.items():
+        code.append(f"{INDENT*2}'{model_attribute_name}': '{json_name}',")
+    code.append(f'{INDENT}{"}"}')
+
+    interned_fields = [name for name in INTERNED_FIELDS.get(model_name, ()) if name in properties]
+    if interned_fields:
+        code.append(f'{INDENT}_interned_fields = {"("}')
+        for json_attribute_name in interned_fields:
+            code.append(f"{INDENT*2}'{json_attribute_name}',")
+        code.append(f'{INDENT}{")"}')
+
+    code.append(f'')
+    code.append(f'')
+
+
 def create_models(swaggerdoc: Dict[str, dict]):
-    swagger_type_2_py_type = {
-        'number': 'float',
-        'string': 'str',
-        'integer': 'int',
-        'object': 'dict',
-        'array': 'list',
-        'boolean': 'bool',
-    }
-    proxy_parse_type_mapping = {
-        float: 'FloatParser',
-        int: 'IntParser',
-        datetime.datetime: 'DatetimeParser',
-    }
-    superclass = 'ThreeCommasModel'
     code = list()
     code.append(f'from __future__ import annotations')
-    code.append('from .models import ThreeCommasModel, FloatParser, IntParser, DatetimeParser, ParsedProxy')
+    code.append('from .models import ThreeCommasModel, ThreeCommasRecord, FloatParser, IntParser, DatetimeParser, '
+                'ModelParser, \\\n    ModelListParser, ParsedProxy')
     code.append('import datetime')
-    code.append('from typing import Union')
+    code.append('from typing import List, Optional, Union')
     code.append(f'')
     code.append(f'')
 
-    for model_name, model_definition in swaggerdoc.get('definitions').items():
-        _parse_map = dict()
-        _name_proxy = dict()
-        # proxy_parse_type_parsing_map = dict()
-        code.append(f'class {model_name}({superclass}):')
-        # code.append(f'{INDENT}def __init__(self, d: dict = None):')
-        # code.append(f'{INDENT*2}super().__init__(d)')
-        for json_attribute_name, attribute_definition in model_definition.get('properties').items():
-            swagger_type = attribute_definition.get('type')
-            py_type = swagger_type_2_py_type.get(swagger_type)
-            example = attribute_definition.get('example')
-            model_attribute_name = json_attribute_name.replace('?', '')
-            parsed_type = None
-
-            if example and isinstance(example, str):
-                # '2019-01-01T00:00:00.000Z'
-                # TODO the formats are messed up
-                pat = re.compile(r'\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}.\d{3}Z')
-                if pat.match(example) is not None:
-                    parsed_type = 'datetime.datetime'
-
-            if parsed_type is None:
-                model_parsings = PARSING_MAPPING.get(model_name)
-                if model_parsings and json_attribute_name in model_parsings:
-                    parsed_type = model_parsings.get(json_attribute_name)
-
-            parse_type = proxy_parse_type_mapping.get(parsed_type)
-            if parse_type:
-                _parse_map[model_attribute_name] = parse_type
-                # proxy_parse_type_parsing_map[model_attribute_name] = proxy_type
-            if json_attribute_name.endswith('?'):
-                # proxy_parse_type_parsing_map[model_attribute_name] = 'QuestionMarkProxy'
-                _name_proxy[model_attribute_name] = json_attribute_name
-
-            attribute_type = f'Union[{py_type}, {get_str_repr_for_type(parsed_type)}]' if parse_type else f'{py_type}'
-            codeline = f'{INDENT}{model_attribute_name}: {attribute_type}'
-
-            code.append(codeline)
-
-        # code.append(f'')
-        # code.append(f'{INDENT}def parsed(self, parsed: bool) -> {model_name}:')
-        # code.append(f'{INDENT*2}return ParsedProxy(model=self, parsed=parsed)')
-
-        code.append(f'')
-        code.append(f'{INDENT}_parse_map = {"{"}')
-        for model_attribute_name, parse_type in _parse_map.items():
-            code.append(f"{INDENT*2}'{model_attribute_name}': {parse_type},")
-        code.append(f'{INDENT}{"}"}')
-
-        code.append(f'{INDENT}_name_proxy = {"{"}')
-        for model_attribute_name, json_name in _name_proxy.items():
-            code.append(f"{INDENT*2}'{model_attribute_name}': '{json_name}',")
-        code.append(f'{INDENT}{"}"}')
+    definitions = {**swaggerdoc.get('definitions'), **DEFINITION_OVERRIDES}
+    record_fields = dict()
+    emitted = set()
+    for model_name, model_definition in definitions.items():
+        if model_name not in emitted:
+            create_model(model_name, model_definition.get('properties'), definitions, emitted, code, record_fields)
 
-        code.append(f'')
-        code.append(f'')
+    for model_name, record_name in RECORD_MODELS.items():
+        code.extend(create_record(model_name, record_name, record_fields[model_name]))
     code_str = '\n'.join(code)
 
     with open(MODEL_FILE_NAME, 'w') as f:
         f.write(code_str)
 
 
+def create_endpoints(public_endpoints: set):
+    code = list()
+    code.append('# generated from the swagger doc by type_generators/auto_api_from_swaggerdoc.py')
+    code.append('')
+    code.append('# (py3cw entity, py3cw action) of the endpoints with Security: NONE')
+    code.append('PUBLIC_ENDPOINTS = {')
+    for entity, action in sorted(public_endpoints):
+        code.append(f"{INDENT}('{entity}', '{action}'),")
+    code.append('}')
+    with open(ENDPOINTS_FILE_NAME, 'w') as f:
+        f.write('\n'.join(code) + '\n')
+
+
+def create_lazy_init(package_depth: int, modules: List[str]) -> str:
+    """
+    __init__ of a generated package, the modules are imported on first access
+    """
+    code = list()
+    code.append('from typing import TYPE_CHECKING')
+    code.append(f"from {'.' * package_depth}lazy_imports import lazy_submodules")
+    code.append('')
+    code.append('if TYPE_CHECKING:')
+    code.append(f"{INDENT}from . import {', '.join(modules)}")
+    code.append('')
+    code.append(f"__getattr__, __dir__ = lazy_submodules(__name__, [{', '.join(repr(m) for m in modules)}])")
+    return '\n'.join(code) + '\n'
+
+
 def generate():
     with open('./3commas_swaggerdoc.json', 'r') as f:
         swaggerdoc: Dict[str, dict] = json.loads(f.read())
         structured_code: Dict[str, list] = defaultdict(list)
+        public_endpoints = set()
 
         for path, definition in swaggerdoc.get('paths').items():
             split: list = path.split('/')
@@ -246,61 +460,96 @@ def generate():
                 function_parameters += f', sub_id'
 
             for verb in http_verbs:
-                function_has_payload = endpoint_consumes(verb, path)
-                if function_has_payload:
-                    function_parameters += f'{", " if function_parameters else ""}entity: dict'
+                parameters = definition.get(verb).get('parameters')
+                verb_function_parameters = function_parameters
+                function_has_payload = endpoint_consumes(verb, path) or has_body_parameters(parameters)
+                if endpoint_consumes(verb, path):
+                    verb_function_parameters += f'{", " if verb_function_parameters else ""}entity: dict'
+                elif function_has_payload:
+                    verb_function_parameters += f'{", " if verb_function_parameters else ""}entity: dict = None'
+                keyword_parameters = get_keyword_parameters(parameters)
 
                 description = definition.get(verb).get('description')
                 # operationId = definition.get(verb).get('operationId')
-                parameters = definition.get(verb).get('parameters')
 
                 function_name = f'{verb}{"_" + sub_endpoint if sub_endpoint else ""}{"_by_id" if path_variable_1 else ""}'
                 return_type = endpoint_returns(verb, path)
-
-                code = list()
-                function_logic = create_function_logic(verb, path, parameters, return_type, function_has_payload)
-
-                endpoint_found_in_py3cw = True
-                if '<py3cw_entity>' in function_logic or '<py3cw_action>' in function_logic:
-                    endpoint_found_in_py3cw = False
-                if not endpoint_found_in_py3cw:
-                    code.append("''' This endpoint was not present in the py3cw module")
-
-                return_type_statement = ''
-                if return_type:
-                    return_type_statement = f' -> Tuple[ThreeCommasApiError, {return_type}]'
-
-                code.append(f'@logged')
-                code.append(f'@with_py3cw')
-                code.append(f'def {function_name}({function_parameters}){return_type_statement}:')
-                docstring = create_docstring(verb, path, parameters, description)
-                if docstring:
-                    code.append(docstring)
-                code.append(function_logic)
-
-                if not endpoint_found_in_py3cw:
-                    code.append("'''")
-
-                code.append('')
-                code.append('')
-                code.append('')
-
-                structured_code[f'{version}/{endpoint}'].append('\n'.join(code))
+                paginated = endpoint_paginates(verb, path)
+                py3cw_entity, py3cw_action = get_py3cw_entity_and_action(verb, path)
+                if is_public_endpoint(definition.get(verb)) and '<' not in py3cw_entity + py3cw_action:
+                    public_endpoints.add((py3cw_entity, py3cw_action))
+
+                for asynchronous in (False, True):
+                    code = list()
+                    function_logic = create_function_logic(verb, path, parameters, return_type, function_has_payload, asynchronous, keyword_parameters)
+
+                    endpoint_found_in_py3cw = True
+                    if '<py3cw_entity>' in function_logic or '<py3cw_action>' in function_logic:
+                        endpoint_found_in_py3cw = False
+                    if not endpoint_found_in_py3cw:
+                        code.append("''' This endpoint was not present in the py3cw module")
+
+                    return_type_statement = ''
+                    if return_type:
+                        return_type_statement = f' -> Tuple[ThreeCommasApiError, {return_type}]'
+
+                    code.append(f'@logged')
+                    code.append(f'@with_aio_py3cw' if asynchronous else f'@with_py3cw')
+                    code.append(create_function_signature(function_name, verb_function_parameters, keyword_parameters, return_type_statement, asynchronous))
+                    docstring = create_docstring(verb, path, parameters, description, keyword_parameters=keyword_parameters)
+                    if docstring:
+                        code.append(docstring)
+                    code.append(function_logic)
+
+                    if not endpoint_found_in_py3cw:
+                        code.append("'''")
+
+                    code.append('')
+                    code.append('')
+                    code.append('')
+
+                    if endpoint_found_in_py3cw and verb == 'get' and path_variable_1 and not path_variable_2:
+                        code[-1] = create_bulk_function(verb, path, function_name, asynchronous)
+                        code.append('')
+                        code.append('')
+                        code.append('')
+
+                    if endpoint_found_in_py3cw and paginated:
+                        code[-1] = create_iter_all_function(verb, path, function_name, return_type, asynchronous)
+                        code.append('')
+                        code.append('')
+                        code.append('')
+
+                    module_path = f'{version}/{endpoint}'
+                    if asynchronous:
+                        module_path = f'{AIO_FOLDER_NAME}/{module_path}'
+                    structured_code[module_path].append('\n'.join(code))
 
         create_models(swaggerdoc)
+        create_endpoints(public_endpoints)
 
         for k, v in structured_code.items():
+            # the asyncio modules are one package level deeper
+            parent = '....' if k.startswith(f'{AIO_FOLDER_NAME}/') else '...'
             imports = list()
             imports.append("from py3cw.request import Py3CW")
-            imports.append("from ...model import *")
-            imports.append("from ...error import ThreeCommasApiError")
-            imports.append("from typing import Tuple, List")
+            imports.append(f"from {parent}model import *")
+            imports.append(f"from {parent}error import ThreeCommasApiError")
+            imports.append("from typing import Tuple, List, Iterable, Iterator, AsyncIterator")
             imports.append("import logging")
-            imports.append("from ...sys_utils import logged, with_py3cw, Py3cwClosure")
+            if k.startswith(f'{AIO_FOLDER_NAME}/'):
+                imports.append(f"from {parent}sys_utils import logged, Py3cwClosureProxy, without_none_values")
+                imports.append(f"from {parent}aio_client import with_aio_py3cw")
+                imports.append(f"from {parent}bulk import aio_bulk_by_id, BulkResult")
+                imports.append(f"from {parent}pagination import aio_iter_pages, offset_page_params, numbered_page_params")
+            else:
+                imports.append(f"from {parent}sys_utils import logged, with_py3cw, Py3cwClosureProxy, without_none_values")
+                imports.append(f"from {parent}bulk import bulk_by_id, BulkResult")
+                imports.append(f"from {parent}pagination import iter_pages, offset_page_params, numbered_page_params")
             imports.append("")
             imports.append("")
             imports.append("logger = logging.getLogger(__name__)")
-            imports.append("wrapper: Py3cwClosure = None")
+            imports.append("wrapper = Py3cwClosureProxy()")
             imports.append("")
             imports.append("")
             imports.append("")
@@ -313,16 +562,18 @@ def generate():
             with open(full_path, 'w') as f2:
                 f2.write(''.join(c))
 
-        with open(f'{PARENT_FOLDER_NAME}/__init__.py', 'w') as f3:
-            f3.write('from . import ver1, v2')
-            f3.write('\n')
-        with open(f'{PARENT_FOLDER_NAME}/v2/__init__.py', 'w') as f4:
-            f4.write('from . import smart_trades')
-            f4.write('\n')
-        with open(f'{PARENT_FOLDER_NAME}/ver1/__init__.py', 'w') as f5:
-            f5.write('from . import accounts, bots, deals, grid_bots, marketplace, users')
-            f5.write('\n')
-
+        ver1_modules = ['accounts', 'bots', 'deals', 'grid_bots', 'marketplace', 'users']
+        init_modules = {
+            '': ['ver1', 'v2', AIO_FOLDER_NAME],
+            'v2/': ['smart_trades'],
+            'ver1/': ver1_modules,
+            f'{AIO_FOLDER_NAME}/': ['ver1', 'v2'],
+            f'{AIO_FOLDER_NAME}/v2/': ['smart_trades'],
+            f'{AIO_FOLDER_NAME}/ver1/': ver1_modules,
+        }
+        for folder, modules in init_modules.items():
+            with open(f'{PARENT_FOLDER_NAME}/{folder}__init__.py', 'w') as f3:
+                f3.write(create_lazy_init(folder.count('/') + 2, modules))
 
 if __name__ == '__main__':
     generate()
@@ -6,6 +6,7 @@ from typing import *
 ENDPOINT_PRODUCTION_MAP = {
     'get /ver1/bots/{bot_id}/show': 'BotEntity',
     'get /ver1/bots': 'List[BotEntity]',
+    'get /ver1/deals': 'List[DealEntity]',
     'get /v2/smart_trades': 'List[SmartTradeV2Entity]',
     'get /v2/smart_trades/{id}': 'SmartTradeV2Entity',
 }
@@ -25,6 +26,89 @@ def endpoint_consumes(verb, endpoint):
     return ENDPOINT_CONSUMPTION_MAP.get(f'{verb} {endpoint}')
 
 
+# {endpoint_path : (function_returning_the_page_params, max_page_size)}
+PAGINATED_ENDPOINT_MAP = {
+    'get /ver1/deals': ('offset_page_params', 1000),
+    'get /v2/smart_trades': ('numbered_page_params', 100),
+}
+
+
+def endpoint_paginates(verb, endpoint):
+    return PAGINATED_ENDPOINT_MAP.get(f'{verb} {endpoint}')
+
+
+# compact __slots__ records generated for the models of large histories, {name_of_model: name_of_record}
+RECORD_MODELS = {
+    'DealEntity': 'DealRecord',
+    'BotEntity': 'BotRecord',
+}
+
+
+# low cardinality str fields of the models returned in large lists and streams, interned with
+# THREE_COMMAS_INTERN_STRINGS, {name_of_model: json attribute names}
+INTERNED_FIELDS = {
+    'DealEntity': ('type', 'pair', 'status', 'localized_status', 'profit_currency', 'from_currency', 'to_currency',
+                   'account_name', 'bot_name', 'strategy', 'take_profit_type', 'stop_loss_type', 'leverage_type',
+                   'base_order_volume_type', 'safety_order_volume_type'),
+    'BotEntity': ('type', 'strategy', 'profit_currency', 'account_name', 'take_profit_type', 'stop_loss_type',
+                  'leverage_type', 'base_order_volume_type', 'safety_order_volume_type', 'start_order_type'),
+    'SmartTradeV2Entity': ('pair',),
+}
+
+
+# definitions replacing the ones of the swaggerdoc, {name_of_model: swagger definition}
+DEFINITION_OVERRIDES = {
+    # the swaggerdoc repeats the SmartTradeV2Entity schema for the steps
+    'TakeProfitStep': {
+        'type': 'object',
+        'properties': {
+            'id': {'type': 'integer'},
+            'version': {'type': 'integer'},
+            'position': {'type': 'integer'},
+            'order_type': {'type': 'string'},
+            'editable': {'type': 'boolean'},
+            'units': {
+                'type': 'object',
+                'properties': {
+                    'value': {'type': 'string', 'example': 0.5},
+                },
+            },
+            'price': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string'},
+                    'value': {'type': 'number', 'example': 1223.32},
+                    'percent': {'type': 'number', 'example': 2.5},
+                },
+            },
+            'volume': {'type': 'string', 'example': 50.0},
+            'total': {'type': 'string', 'example': 611.66},
+            'trailing': {
+                'type': 'object',
+                'properties': {
+                    'enabled': {'type': 'boolean'},
+                    'percent': {'type': 'number', 'example': 1.0},
+                },
+            },
+            'status': {
+                'type': 'object',
+                'properties': {
+                    'type': {'type': 'string'},
+                    'title': {'type': 'string'},
+                },
+            },
+            'data': {
+                'type': 'object',
+                'properties': {
+                    'cancelable': {'type': 'boolean'},
+                    'panic_sell_available': {'type': 'boolean'},
+                },
+            },
+        },
+    },
+}
+
+
 # {name_of_model : {name_of_attr: parse_to}}
 PARSING_MAPPING = {
     'DealEntity': {
@@ -109,6 +193,14 @@ PARSING_MAPPING = {
         'total_btc_profit': float,
         'total_usd_profit': float,
     },
+    'TakeProfitStep': {
+        'volume': float,
+        'total': float,
+    },
+    'SmartTradeV2DataCurrentPrice': {
+        'quote_volume': float,
+        'last': float,
+    },
     'SmartTradeV2Trade': {
         'average_price': float,
         'initial_amount': float,